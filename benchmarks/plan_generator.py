@@ -0,0 +1,106 @@
+"""Synthetic plans for benchmarking task generation at scale."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SECTION_SLUGS = ["core", "models", "api", "cli", "storage", "auth", "docs", "tests"]
+
+# Sections per block sharing one __init__.py per package
+SHARED_BLOCK = 240
+
+CONTEXT_VALUES = {
+    "plugin_root": "/bench/plugin",
+    "sections_dir": "/bench/planning/sections",
+    "target_dir": "/bench/target",
+    "state_dir": "/bench/planning/implementation",
+    "runtime": "python-uv",
+    "test_command": "uv run pytest",
+}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SyntheticPlan:
+    """Inputs to generate_implementation_tasks() for a plan of a given size."""
+
+    sections: list[str]
+    completed_sections: list[str] = field(default_factory=list)
+    resume_section: str | None = None
+    resume_section_state: dict | None = None
+
+
+def section_names(count: int) -> list[str]:
+    """Section names like section-0001-core (zero-padded to sort correctly)."""
+    width = max(2, len(str(count)))
+    return [
+        f"section-{i:0{width}d}-{SECTION_SLUGS[(i - 1) % len(SECTION_SLUGS)]}"
+        for i in range(1, count + 1)
+    ]
+
+
+def synthetic_plan(count: int, state: str) -> SyntheticPlan:
+    """Build a plan of `count` sections.
+
+    Args:
+        count: Number of sections
+        state: "fresh" (nothing done) or "resume" (first half complete,
+            the next section interrupted during review)
+
+    Raises:
+        ValueError: If state is unknown
+    """
+    sections = section_names(count)
+    if state == "fresh":
+        return SyntheticPlan(sections=sections)
+    if state == "resume":
+        half = count // 2
+        return SyntheticPlan(
+            sections=sections,
+            completed_sections=sections[:half],
+            resume_section=sections[half] if half < count else None,
+            resume_section_state={"resume_step": "review"},
+        )
+    raise ValueError(f"Unknown plan state: {state}")
+
+
+def section_content(index: int, name: str) -> str:
+    """Plan text for a section, with file mentions for conflict analysis.
+
+    Every 10th section mentions no files (its overlap is unknown); every
+    3rd section also edits a shared __init__.py, one per package and block
+    of SHARED_BLOCK sections, so overlaps grow linearly with the plan.
+    """
+    slug = SECTION_SLUGS[(index - 1) % len(SECTION_SLUGS)]
+    lines = [f"# {name}", "", "## Implementation", ""]
+    if index % 10 == 0:
+        lines.append("Update the prose documentation.")
+        return "\n".join(lines) + "\n"
+    lines += ["| File | Change |", "|------|--------|", f"| src/{slug}/module_{index}.py | new |"]
+    if index % 3 == 0:
+        lines.append(f"| src/{slug}/part_{(index - 1) // SHARED_BLOCK}/__init__.py | edit |")
+    return "\n".join(lines) + "\n"
+
+
+def write_plan(planning_dir: Path, plan: SyntheticPlan, project_config: dict[str, str]) -> Path:
+    """Write a plan as a sections directory (index.md plus section files).
+
+    Returns:
+        Path of the sections directory
+    """
+    sections_dir = Path(planning_dir) / "sections"
+    sections_dir.mkdir(parents=True, exist_ok=True)
+    config = {"runtime": "python-uv", "test_command": "uv run pytest", **project_config}
+    index = [
+        "<!-- PROJECT_CONFIG",
+        *(f"{key}: {value}" for key, value in config.items()),
+        "END_PROJECT_CONFIG -->",
+        "",
+        "<!-- SECTION_MANIFEST",
+        *plan.sections,
+        "END_MANIFEST -->",
+        "",
+        "# Implementation Sections Index",
+    ]
+    (sections_dir / "index.md").write_text("\n".join(index) + "\n")
+    for i, name in enumerate(plan.sections, start=1):
+        (sections_dir / f"{name}.md").write_text(section_content(i, name))
+    return sections_dir
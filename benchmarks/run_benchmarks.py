@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""Benchmark task generation, dependency graph building, task writing and setup.
+
+Usage:
+    uv run benchmarks/run_benchmarks.py [--sizes 10,100,1000] [--large]
+        [--repeat 3] [--threshold 0.5] [--compare-times] [--update-baseline]
+
+Each plan size runs in a fresh and a resume state. The default sizes run
+in a couple of minutes; --large adds the 5,000-section plans, whose write
+and setup stages take many minutes more. Per stage it records
+the best wall time over --repeat runs, the peak traced allocation size
+(tracemalloc, the smaller of two runs after an untraced warm-up run,
+measured before the timing runs so it does not depend on --repeat) and
+the number of task files written. The "setup" stage runs the whole
+setup script in-process on the plan written to disk, with the options
+that turn on conflict analysis and lane scheduling.
+
+Results are compared with benchmarks/baseline.json; the run fails when a
+metric grows by more than --threshold over its baseline. Peak allocation
+and file counts are compared by default. Wall times depend on the
+machine, so they are only compared with --compare-times, against a
+baseline recorded on the same machine.
+"""
+
+import argparse
+import gc
+import io
+import itertools
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.plan_generator import CONTEXT_VALUES, synthetic_plan, write_plan
+from scripts.checks import setup_implementation_session
+from scripts.lib.config import create_session_config, save_session_config
+from scripts.lib.session_tasks import build_impl_dependency_graph, generate_implementation_tasks
+from scripts.lib.task_storage import FileTaskStore, write_tasks
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_SIZES = [10, 100, 1000]
+# Opt-in (--large): too slow to run on every local check
+LARGE_SIZES = [5000]
+STATES = ["fresh", "resume"]
+
+# Timings below this many milliseconds are compared as if they took this
+# long, so scheduler noise on tiny plans does not fail the run
+TIME_FLOOR_MS = 5.0
+
+# Metrics compared across machines; time_ms needs --compare-times
+PORTABLE_METRICS = ("peak_kib", "files_written")
+
+# PROJECT_CONFIG for the setup stage: every option that makes setup run
+# the conflict analysis and the lane schedule
+SETUP_PROJECT_CONFIG = {"infer_dependencies": "true", "pipelined_review": "true", "lanes": "4"}
+SETUP_SESSION_ID = "bench"
+
+
+class CountingFileTaskStore(FileTaskStore):
+    """FileTaskStore that counts the task files it writes."""
+
+    def __init__(self, tasks_dir: Path) -> None:
+        super().__init__(tasks_dir)
+        self.writes = 0
+
+    def write_task(self, position: int, data: dict) -> None:
+        super().write_task(position, data)
+        self.writes += 1
+
+
+def _best_time_ms(
+    run: Callable[[], object],
+    repeat: int,
+    prepare: Callable[[], object] | None = None,
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _traced_peak(run: Callable[[], object], prepare: Callable[[], object] | None) -> int:
+    if prepare is not None:
+        prepare()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _peak_kib(run: Callable[[], object], prepare: Callable[[], object] | None = None) -> float:
+    # An untraced warm-up run fills import and memoization caches. Of two
+    # traced runs the smaller peak is kept: a process-wide table growing
+    # mid-run (such as the interned string table, which doubles) lands in
+    # at most one of them
+    if prepare is not None:
+        prepare()
+    run()
+    return min(_traced_peak(run, prepare) for _ in range(2)) / 1024
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _run_setup(sections_dir: Path, repo: Path, tasks_root: Path) -> dict:
+    """Run the setup script's main() in-process and return its output."""
+    argv = [
+        "setup_implementation_session.py",
+        "--sections-dir", str(sections_dir),
+        "--target-dir", str(repo),
+        "--plugin-root", str(Path(__file__).parent.parent),
+        "--session-id", SETUP_SESSION_ID,
+        "--tasks-root", str(tasks_root),
+    ]
+    buffer = io.StringIO()
+    with mock.patch.object(sys, "argv", argv), redirect_stdout(buffer):
+        setup_implementation_session.main()
+    output = json.loads(buffer.getvalue())
+    if not output["success"]:
+        raise RuntimeError(f"Setup failed: {output['error']}")
+    return output
+
+
+def benchmark_setup(plan, state: str, repeat: int) -> dict:
+    """Measure the full setup path on a plan written to disk.
+
+    Fresh runs start without a session; resume runs start from a session
+    whose completed sections point at a real commit.
+
+    Returns:
+        {"time_ms", "peak_kib", "files_written"}
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        repo = root / "repo"
+        repo.mkdir()
+        _git(repo, "init", "--quiet")
+        _git(repo, "-c", "user.name=bench", "-c", "user.email=bench@example.com",
+             "commit", "--quiet", "--allow-empty", "-m", "Initial commit")
+        head = _git(repo, "rev-parse", "HEAD")
+        sections_dir = write_plan(root / "planning", plan, SETUP_PROJECT_CONFIG)
+        state_dir = sections_dir.parent / "implementation"
+        tasks_root = root / "tasks"
+
+        def prepare():
+            shutil.rmtree(state_dir, ignore_errors=True)
+            shutil.rmtree(tasks_root, ignore_errors=True)
+            if state == "resume":
+                config = create_session_config(
+                    plugin_root=Path(__file__).parent.parent,
+                    sections_dir=sections_dir,
+                    target_dir=repo,
+                    state_dir=state_dir,
+                    git_root=repo,
+                    commit_style="simple",
+                    sections=plan.sections,
+                )
+                config["sections_state"] = {
+                    section: {"status": "complete", "commit_hash": head}
+                    for section in plan.completed_sections
+                }
+                save_session_config(state_dir, config)
+
+        def run():
+            return _run_setup(sections_dir, repo, tasks_root)
+
+        peak_kib = _peak_kib(run, prepare)
+        time_ms = _best_time_ms(run, repeat, prepare)
+        return {
+            "time_ms": time_ms,
+            "peak_kib": peak_kib,
+            "files_written": len(list((tasks_root / SETUP_SESSION_ID).glob("*.json"))),
+        }
+
+
+def benchmark_plan(size: int, state: str, repeat: int) -> dict[str, dict]:
+    """Measure every stage for one plan size and state.
+
+    Returns:
+        Dict of stage -> {"time_ms", "peak_kib", "files_written"}
+    """
+    plan = synthetic_plan(size, state)
+
+    def generate():
+        return generate_implementation_tasks(
+            plan.sections,
+            plan.completed_sections,
+            plan.resume_section,
+            plan.resume_section_state,
+            CONTEXT_VALUES,
+        )
+
+    tasks = generate()
+    graph = build_impl_dependency_graph(tasks, plan.sections)
+
+    results: dict[str, dict] = {}
+    for stage, run in [
+        ("generate", generate),
+        ("graph", lambda: build_impl_dependency_graph(tasks, plan.sections)),
+    ]:
+        peak_kib = _peak_kib(run)
+        results[stage] = {
+            "time_ms": _best_time_ms(run, repeat),
+            "peak_kib": peak_kib,
+            "files_written": 0,
+        }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        counter = itertools.count()
+
+        def write():
+            # Each run writes a new task list, like a first setup run
+            store = CountingFileTaskStore(Path(tmp) / f"run-{next(counter)}")
+            write_tasks("bench", tasks, dependency_graph=graph, store=store)
+            return store
+
+        peak_kib = _peak_kib(write)
+        time_ms = _best_time_ms(write, repeat)
+        results["write"] = {
+            "time_ms": time_ms,
+            "peak_kib": peak_kib,
+            "files_written": write().writes,
+        }
+    results["setup"] = benchmark_setup(plan, state, repeat)
+    return results
+
+
+def run_suite(sizes: list[int], repeat: int) -> dict:
+    """Benchmark every size and state.
+
+    Returns:
+        Nested dict: str(size) -> state -> stage -> metrics
+    """
+    return {
+        str(size): {state: benchmark_plan(size, state, repeat) for state in STATES}
+        for size in sizes
+    }
+
+
+def find_regressions(
+    results: dict,
+    baseline: dict,
+    threshold: float,
+    *,
+    compare_times: bool = False,
+) -> list[str]:
+    """Metrics that grew by more than threshold over the baseline.
+
+    Only sizes, states and stages present in both are compared. Wall times
+    are only compared with compare_times (same machine as the baseline),
+    and no lower than TIME_FLOOR_MS.
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions: list[str] = []
+    for size, states in results.items():
+        for state, stages in states.items():
+            for stage, metrics in stages.items():
+                reference = baseline.get(size, {}).get(state, {}).get(stage)
+                if reference is None:
+                    continue
+                for metric, value in metrics.items():
+                    if metric not in reference:
+                        continue
+                    if metric not in PORTABLE_METRICS and not (compare_times and metric == "time_ms"):
+                        continue
+                    base = reference[metric]
+                    if metric == "time_ms":
+                        value, base = max(value, TIME_FLOOR_MS), max(base, TIME_FLOOR_MS)
+                    if value > base * (1 + threshold):
+                        regressions.append(
+                            f"{size} sections/{state}/{stage}: {metric} {value:.1f} vs baseline {base:.1f}"
+                        )
+    return regressions
+
+
+def _round(results: dict) -> dict:
+    return {
+        size: {
+            state: {
+                stage: {metric: round(value, 2) for metric, value in metrics.items()}
+                for stage, metrics in stages.items()
+            }
+            for state, stages in states.items()
+        }
+        for size, states in results.items()
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark task generation at plan scale")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(s) for s in DEFAULT_SIZES),
+        help="Comma-separated plan sizes in sections",
+    )
+    parser.add_argument(
+        "--large",
+        action="store_true",
+        help=f"Also run the {', '.join(str(s) for s in LARGE_SIZES)}-section plans (slow)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per stage (best is kept)")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Allowed growth over the baseline before failing (0.5 = 50%%)",
+    )
+    parser.add_argument(
+        "--compare-times",
+        action="store_true",
+        help="Also compare wall times (only meaningful against a baseline from this machine)",
+    )
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    if args.large:
+        sizes += [s for s in LARGE_SIZES if s not in sizes]
+    results = _round(run_suite(sizes, args.repeat))
+    print(json.dumps(results, indent=2))
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        # Sizes not run this time (e.g. the --large ones) keep their entries
+        baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        baseline.update(results)
+        baseline = dict(sorted(baseline.items(), key=lambda item: int(item[0])))
+        baseline_path.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline written to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path} (run with --update-baseline)")
+        return 0
+
+    regressions = find_regressions(
+        results,
+        json.loads(baseline_path.read_text()),
+        args.threshold,
+        compare_times=args.compare_times,
+    )
+    if regressions:
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"No regressions over {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,18 +21,47 @@ from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.lib.config import load_session_config, save_session_config, create_session_config
-from scripts.lib.sections import parse_manifest_block, parse_project_config_block, validate_section_file, get_completed_sections
-from scripts.lib.task_storage import TaskToWrite, write_tasks, build_dependency_graph, TaskStatus
+from scripts.lib.config import load_session_config, update_session_config, create_session_config
+from scripts.lib.sections import validate_sections_dir
+from scripts.lib.task_storage import (
+    TaskToWrite,
+    write_tasks,
+    FileTaskStore,
+)
 from scripts.lib.task_reconciliation import TaskListContext
+from scripts.lib.section_conflicts import write_conflict_report
+from scripts.lib.worktrees import lane_dependencies, provision_lane_worktrees, worktrees_dir
+from scripts.lib.task_graph import DependencyGraphError, chain_lanes
+from scripts.lib.hook_config import cached_inspection, commit_hooks, hooks_dir
+from scripts.lib.hook_profile import profile_pre_commit_hooks
+from scripts.lib.review_state import scan_review_artifacts
+from scripts.lib.leases import section_claims
+from scripts.lib.scheduler import (
+    allows_parallel_work,
+    calibrate_costs,
+    historical_durations,
+    schedule_sections,
+    sequential_dependencies,
+)
+from scripts.lib.session_tasks import (
+    DEFAULT_LOCK_WAIT,
+    SetupInProgressError,
+    budget_compaction_points,
+    infer_session_state,
+    pipeline_breaks,
+    plan_session_tasks,
+    recorded_commit_hashes,
+    resolve_plan_dependencies,
+    resolve_section_profiles,
+    section_cost_estimates,
+    summary_membership,
+    task_list_lock,
+)
 from scripts.lib.impl_tasks import (
-    SECTION_STEP_IDS,
-    SECTION_STEP_DEFINITIONS,
-    COMPACTION_TASK,
-    FINALIZATION_TASK,
-    RESUME_STEP_COMPLETE_MAPPING,
-    CONTEXT_ITEM_KEYS,
-    format_display_name,
+    COMPACTION_STEP_ID,
+    DEFAULT_SECTION_PROFILE,
+    TaskOptions,
+    section_steps,
 )
 
 
@@ -58,80 +87,8 @@ FORMATTER_PATTERNS = [
     "rustfmt", "gofmt", "goimports", "ruff",
 ]
 
-
-def validate_sections_dir(sections_dir: Path) -> dict:
-    """
-    Validate sections directory structure.
-
-    Checks:
-    1. Path exists and is a directory
-    2. index.md exists
-    3. index.md has valid PROJECT_CONFIG block
-    4. index.md has valid SECTION_MANIFEST block
-    5. All manifest sections have corresponding files
-    6. All section files have content
-
-    Args:
-        sections_dir: Path to sections directory
-
-    Returns:
-        {"valid": bool, "error": str | None, "sections": list[str], "project_config": dict}
-    """
-    sections_dir = Path(sections_dir)
-
-    if not sections_dir.exists():
-        return {"valid": False, "error": f"Sections directory does not exist: {sections_dir}", "sections": [], "project_config": {}}
-
-    if not sections_dir.is_dir():
-        return {"valid": False, "error": f"Path is not a directory: {sections_dir}", "sections": [], "project_config": {}}
-
-    index_path = sections_dir / "index.md"
-    if not index_path.exists():
-        return {"valid": False, "error": f"index.md not found in {sections_dir}", "sections": [], "project_config": {}}
-
-    # Parse index.md
-    index_content = index_path.read_text()
-
-    # Parse project config
-    project_config = parse_project_config_block(index_content)
-    if not project_config:
-        example = """<!-- PROJECT_CONFIG
-runtime: python-uv
-test_command: uv run pytest
-END_PROJECT_CONFIG -->"""
-        return {
-            "valid": False,
-            "error": f"No valid PROJECT_CONFIG block found.\n\nFile: {index_path}\n\nAdd this block at the top of index.md (before SECTION_MANIFEST):\n\n{example}",
-            "sections": [],
-            "project_config": {}
-        }
-
-    # Validate required config fields
-    required_fields = ["runtime", "test_command"]
-    missing_fields = [f for f in required_fields if f not in project_config]
-    if missing_fields:
-        example_fields = "\n".join(f"{f}: <value>" for f in missing_fields)
-        return {
-            "valid": False,
-            "error": f"PROJECT_CONFIG missing required fields: {', '.join(missing_fields)}\n\nFile: {index_path}\n\nAdd these fields to the PROJECT_CONFIG block:\n\n{example_fields}",
-            "sections": [],
-            "project_config": project_config
-        }
-
-    # Parse manifest
-    sections = parse_manifest_block(index_content)
-
-    if not sections:
-        return {"valid": False, "error": "No valid SECTION_MANIFEST block found in index.md", "sections": [], "project_config": project_config}
-
-    # Validate each section file
-    for section in sections:
-        section_path = sections_dir / f"{section}.md"
-        result = validate_section_file(section_path)
-        if not result["valid"]:
-            return {"valid": False, "error": result["error"], "sections": sections, "project_config": project_config}
-
-    return {"valid": True, "error": None, "sections": sections, "project_config": project_config}
+# Hook args that make a linter rewrite files
+FIX_ARGS = {"--fix", "--write", "-w", "--in-place", "-i"}
 
 
 def check_git_repo(target_dir: Path) -> dict:
@@ -194,16 +151,25 @@ def check_current_branch(git_root: Path) -> dict:
     return {"branch": None, "is_protected": False}
 
 
-def check_working_tree_status(git_root: Path) -> dict:
+def check_working_tree_status(git_root: Path, ignore_paths: list[Path] | None = None) -> dict:
     """
     Check if working tree is clean.
 
     Args:
         git_root: Git repository root
+        ignore_paths: Directories whose entries do not count as dirty
+            (e.g. lane worktrees under the state directory)
 
     Returns:
         {"clean": bool, "dirty_files": list[str]}
     """
+    ignored: list[str] = []
+    for path in ignore_paths or []:
+        try:
+            ignored.append(Path(path).resolve().relative_to(Path(git_root).resolve()).as_posix())
+        except ValueError:
+            continue  # Outside the repository, never reported anyway
+
     try:
         result = subprocess.run(
             ["git", "status", "--porcelain"],
@@ -223,6 +189,10 @@ def check_working_tree_status(git_root: Path) -> dict:
                 elif len(parts) == 1 and len(line) > 2:
                     # Fallback: just strip the status chars
                     dirty_files.append(line[3:].strip())
+            dirty_files = [
+                f for f in dirty_files
+                if not any(f.rstrip("/") == p or f.startswith(f"{p}/") for p in ignored)
+            ]
             return {"clean": len(dirty_files) == 0, "dirty_files": dirty_files}
     except Exception:
         pass
@@ -291,17 +261,29 @@ def validate_path_safety(path: Path, allowed_root: Path) -> bool:
         return False
 
 
-def check_pre_commit_hooks(git_root: Path) -> dict:
+def is_formatter_hook(hook: dict) -> bool:
+    """Whether a pre-commit framework hook rewrites files."""
+    hook_id = hook["id"]
+    if hook_id in KNOWN_FORMATTERS or any(p in hook_id.lower() for p in FORMATTER_PATTERNS):
+        return True
+    # Linters that fix in place when asked to (eslint --fix, prettier --write)
+    return any(arg in FIX_ARGS for arg in hook["args"])
+
+
+def check_pre_commit_hooks(git_root: Path, cache_dir: Path | None = None) -> dict:
     """
     Detect pre-commit hook configuration.
 
     Checks:
-    1. .pre-commit-config.yaml (pre-commit framework)
-    2. .git/hooks/pre-commit (native hook)
-    3. Parses YAML for known formatters
+    1. .pre-commit-config.yaml (pre-commit framework), parsed for hooks that
+       run on commit and are known formatters
+    2. The native pre-commit hook in the hooks dir git actually uses
+       (core.hooksPath, or the common git dir of a linked worktree),
+       scanned for commands that rewrite or re-stage files
 
     Args:
         git_root: Git repository root
+        cache_dir: Directory for the parse cache (keyed by file hash)
 
     Returns:
         {
@@ -309,52 +291,47 @@ def check_pre_commit_hooks(git_root: Path) -> dict:
             "type": "pre-commit-framework" | "native-hook" | "both" | "none",
             "config_file": str | None,
             "native_hook": str | None,
+            "hooks_dir": str,
             "may_modify_files": bool,
-            "detected_formatters": list[str]
+            "detected_formatters": list[str],  # framework hook IDs
+            "native_formatters": list[str],  # commands found in the native hook
+            "native_unresolved": list[str]  # native hook commands the scan cannot see into
         }
     """
     git_root = Path(git_root)
 
     pre_commit_config = git_root / ".pre-commit-config.yaml"
-    native_hook = git_root / ".git" / "hooks" / "pre-commit"
+    hooks_path = hooks_dir(git_root)
+    native_hook = hooks_path / "pre-commit"
 
     has_framework = pre_commit_config.exists()
-    has_native = native_hook.exists() and bool(native_hook.stat().st_mode & 0o111)  # executable
+    has_native = native_hook.is_file() and bool(native_hook.stat().st_mode & 0o111)  # executable
 
     detected_formatters = []
+    native_formatters = []
+    native_unresolved = []
     may_modify_files = False
 
-    # Parse pre-commit config for formatters
     if has_framework:
         try:
-            content = pre_commit_config.read_text()
-            # Simple YAML parsing for hook IDs
-            # Look for "- id: <hook_id>" patterns
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('- id:'):
-                    hook_id = line.replace('- id:', '').strip()
-                    # Check if this is a known formatter
-                    if hook_id in KNOWN_FORMATTERS:
-                        detected_formatters.append(hook_id)
-                        may_modify_files = True
-                    else:
-                        # Check partial matches
-                        for pattern in FORMATTER_PATTERNS:
-                            if pattern in hook_id.lower():
-                                detected_formatters.append(hook_id)
-                                may_modify_files = True
-                                break
-
-                # Also check repo URLs for formatter patterns
-                if line.startswith('- repo:'):
-                    repo_url = line.replace('- repo:', '').strip()
-                    for pattern in FORMATTER_PATTERNS:
-                        if pattern in repo_url.lower():
-                            # This repo likely has formatters
-                            pass  # Will be caught by hook ID check
-        except Exception:
-            pass
+            config, _ = cached_inspection("config", pre_commit_config.read_text(), cache_dir)
+        except (OSError, UnicodeDecodeError):
+            config = None
+        if config is not None:
+            detected_formatters = list(dict.fromkeys(
+                hook["id"] for hook in commit_hooks(config) if is_formatter_hook(hook)
+            ))
+            may_modify_files = bool(detected_formatters)
+
+    if has_native:
+        try:
+            scan, _ = cached_inspection("native", native_hook.read_text(), cache_dir)
+            native_formatters = scan["formatters"]
+            native_unresolved = scan["unresolved"]
+            may_modify_files = may_modify_files or scan["may_modify_files"]
+        except (OSError, UnicodeDecodeError):
+            # A compiled or unreadable hook cannot be scanned
+            may_modify_files = True
 
     # Determine type
     if has_framework and has_native:
@@ -363,7 +340,6 @@ def check_pre_commit_hooks(git_root: Path) -> dict:
         hook_type = "pre-commit-framework"
     elif has_native:
         hook_type = "native-hook"
-        may_modify_files = True  # Unknown, assume it might
     else:
         hook_type = "none"
 
@@ -372,326 +348,102 @@ def check_pre_commit_hooks(git_root: Path) -> dict:
         "type": hook_type,
         "config_file": str(pre_commit_config) if has_framework else None,
         "native_hook": str(native_hook) if has_native else None,
+        "hooks_dir": str(hooks_path),
         "may_modify_files": may_modify_files,
-        "detected_formatters": detected_formatters
+        "detected_formatters": detected_formatters,
+        "native_formatters": native_formatters,
+        "native_unresolved": native_unresolved,
     }
 
 
-def detect_section_review_state(state_dir: Path, section_name: str) -> dict:
-    """
-    Detect the code review state for a specific section.
-
-    Checks for existence of code review files:
-    - section-NN-diff.md: Diff generated for review
-    - section-NN-review.md: Review findings from subagent
-    - section-NN-interview.md: Interview transcript (decisions recorded)
-
-    Recovery logic is simple and robust:
-    - Interview exists → apply fixes from beginning (Claude will notice already-applied fixes)
-    - No interview but review exists → start interview
-    - No review but diff exists → run review subagent
-    - Nothing exists → start implementation
-
-    The commit is the definitive checkpoint - if section has a valid commit,
-    it's in completed_sections and won't reach this function.
-
-    Args:
-        state_dir: Path to implementation/state directory
-        section_name: Section name (e.g., "section-01-foundation")
-
-    Returns:
-        {
-            "has_diff": bool,
-            "has_review": bool,
-            "has_interview": bool,
-            "resume_step": str  # Which step to resume from
-        }
-    """
-    code_review_dir = state_dir / "code_review"
-
-    # Extract section number for file naming (e.g., "section-01-foundation" -> "01")
-    section_num = section_name.split("-")[1] if "-" in section_name else "00"
-
-    diff_file = code_review_dir / f"section-{section_num}-diff.md"
-    review_file = code_review_dir / f"section-{section_num}-review.md"
-    interview_file = code_review_dir / f"section-{section_num}-interview.md"
-
-    has_diff = diff_file.exists()
-    has_review = review_file.exists()
-    has_interview = interview_file.exists()
-
-    # Determine which step to resume from based on file existence
-    # No Status field introspection - files are the source of truth
-    if has_interview:
-        # Interview recorded, apply fixes from beginning
-        # Claude will notice already-applied fixes as it works
-        resume_step = "apply_fixes"
-    elif has_review:
-        resume_step = "interview"
-    elif has_diff:
-        resume_step = "review"
-    else:
-        resume_step = "implement"
-
-    return {
-        "has_diff": has_diff,
-        "has_review": has_review,
-        "has_interview": has_interview,
-        "resume_step": resume_step
-    }
-
-
-def infer_session_state(
-    sections_dir: Path,
-    implementation_dir: Path,
-    git_root: Path
-) -> dict:
-    """
-    Determine if this is a new or resume session.
-
-    Args:
-        sections_dir: Path to sections directory
-        implementation_dir: Path to implementation directory
-        git_root: Git repository root
+def _compaction_points(
+    tasks: list[TaskToWrite],
+    sections: list[str],
+    compaction_after: set[str] | None,
+) -> list[str]:
+    """Sections followed by a compaction prompt, in manifest order.
 
-    Returns:
-        {
-            "mode": "new" | "resume" | "complete",
-            "completed_sections": list[str],
-            "resume_from": str | None,
-            "resume_section_state": dict | None  # Code review state for resume section
-        }
+    An explicit schedule covers the whole plan; otherwise the points are
+    read from the generated compaction tasks.
     """
-    implementation_dir = Path(implementation_dir)
-
-    # Check for existing config
-    config = load_session_config(implementation_dir)
-    if config is None:
-        return {
-            "mode": "new",
-            "completed_sections": [],
-            "resume_from": None,
-            "resume_section_state": None
+    if compaction_after is None:
+        compaction_after = {
+            t.semantic_id.split(":", 1)[0]
+            for t in tasks
+            if t.semantic_id.endswith(f":{COMPACTION_STEP_ID}")
         }
+    return [s for s in sections if s in compaction_after]
 
-    # Get completed sections
-    completed = get_completed_sections(implementation_dir, git_root)
-    all_sections = config.get("sections", [])
-
-    if len(completed) >= len(all_sections) and all_sections:
-        return {
-            "mode": "complete",
-            "completed_sections": completed,
-            "resume_from": None,
-            "resume_section_state": None
-        }
 
-    # Find first incomplete section
-    resume_from = None
-    for section in all_sections:
-        if section not in completed:
-            resume_from = section
-            break
+def _deferred_sections(tasks: list[TaskToWrite], sections: list[str]) -> list[str]:
+    """Sections collapsed into the window placeholder (not materialized)."""
+    semantic_ids = [t.semantic_id for t in tasks if t.semantic_id]
+    materialized = {sid.split(":", 1)[0] for sid in semantic_ids}
+    materialized.update(summary_membership(semantic_ids, sections))
+    return [s for s in sections if s not in materialized]
 
-    # Detect code review state for the section being resumed
-    resume_section_state = None
-    if resume_from:
-        resume_section_state = detect_section_review_state(implementation_dir, resume_from)
-
-    return {
-        "mode": "resume" if completed else "new",
-        "completed_sections": completed,
-        "resume_from": resume_from,
-        "resume_section_state": resume_section_state
-    }
 
-
-def generate_implementation_tasks(
+def estimate_step_savings(
     sections: list[str],
     completed_sections: list[str],
-    resume_section: str | None,
-    resume_section_state: dict | None,
-    context_values: dict[str, str],
-) -> list[TaskToWrite]:
-    """Generate implementation tasks for direct file write.
-
-    Args:
-        sections: List of section names from manifest
-        completed_sections: List of already completed section names
-        resume_section: Section name being resumed (if any)
-        resume_section_state: Code review state for resume section
-        context_values: Dict of context values to persist (paths, settings)
+    section_profiles: dict[str, str],
+) -> dict:
+    """Estimate the work saved by lighter profiles on the remaining sections.
 
     Returns:
-        List of TaskToWrite ready for write_tasks()
+        {"steps_skipped": int, "review_rounds_skipped": int}, where a review
+        round is one code review subagent run plus its interview
     """
-    tasks: list[TaskToWrite] = []
-    position = 1
-
-    # Context tasks (at start, with values in subject for recovery)
-    # Status is PENDING so they stay in context window until finalization completes
-    for key in CONTEXT_ITEM_KEYS:
-        if key in context_values:
-            value = context_values[key]
-            tasks.append(TaskToWrite(
-                position=position,
-                subject=f"{key}={value}",
-                status=TaskStatus.PENDING,
-                description=f"Session context: {key}",
-                active_form=f"Context: {key}",
-            ))
-            position += 1
-
-    # Determine completed steps for resume section
-    resume_steps_complete: set[str] = set()
-    if resume_section and resume_section_state:
-        resume_step = resume_section_state.get("resume_step", "implement")
-        resume_steps_complete = RESUME_STEP_COMPLETE_MAPPING.get(resume_step, set())
-
-    # Section tasks
-    for section_index, section in enumerate(sections):
-        display_name = format_display_name(section)
-        is_completed = section in completed_sections
-        is_resume = section == resume_section
-
-        for step_id in SECTION_STEP_IDS:
-            defn = SECTION_STEP_DEFINITIONS[step_id]
-
-            # Determine status
-            if is_completed:
-                status = TaskStatus.COMPLETED
-            elif is_resume and step_id in resume_steps_complete:
-                status = TaskStatus.COMPLETED
-            else:
-                status = TaskStatus.PENDING
-
-            tasks.append(TaskToWrite(
-                position=position,
-                subject=defn.subject.format(section=section, display_name=display_name),
-                status=status,
-                description=defn.description.format(section=section, display_name=display_name),
-                active_form=defn.active_form.format(section=section, display_name=display_name),
-            ))
-            position += 1
-
-        # Compaction prompt every 2nd section (after sections 2, 4, 6, etc.)
-        if (section_index + 1) % 2 == 0:
-            if is_completed:
-                status = TaskStatus.COMPLETED
-            else:
-                status = TaskStatus.PENDING
-
-            tasks.append(TaskToWrite(
-                position=position,
-                subject=COMPACTION_TASK.subject.format(section=section, display_name=display_name),
-                status=status,
-                description=COMPACTION_TASK.description.format(section=section, display_name=display_name),
-                active_form=COMPACTION_TASK.active_form.format(section=section, display_name=display_name),
-            ))
-            position += 1
-
-    # Finalization task
-    all_complete = all(s in completed_sections for s in sections) if sections else False
-    tasks.append(TaskToWrite(
-        position=position,
-        subject=FINALIZATION_TASK.subject,
-        status=TaskStatus.COMPLETED if all_complete else TaskStatus.PENDING,
-        description=FINALIZATION_TASK.description,
-        active_form=FINALIZATION_TASK.active_form,
-    ))
-
-    return tasks
+    full_steps = section_steps(DEFAULT_SECTION_PROFILE)
+    steps_skipped = 0
+    review_rounds_skipped = 0
+    for section in sections:
+        if section in completed_sections:
+            continue
+        steps = section_steps(section_profiles.get(section, DEFAULT_SECTION_PROFILE))
+        steps_skipped += len(full_steps) - len(steps)
+        if "review_subagent" not in steps:
+            review_rounds_skipped += 1
+    return {"steps_skipped": steps_skipped, "review_rounds_skipped": review_rounds_skipped}
 
 
-def build_impl_dependency_graph(
-    tasks: list[TaskToWrite],
+def plan_section_schedule(
     sections: list[str],
-) -> dict[int, tuple[list[str], list[str]]]:
-    """Build dependency graph for implementation tasks.
-
-    Dependencies:
-    - Each section's steps are sequential (implement -> review -> interview -> docs -> commit)
-    - First step of each section blocked by commit of previous section
-    - Compaction tasks blocked by previous section's commit
-    - Finalization blocked by last section's commit
+    completed_sections: list[str],
+    costs: dict[str, float],
+    section_dependencies: dict[str, list[str]] | None,
+    lane_count: int,
+    durations: dict[str, float],
+) -> dict:
+    """Schedule the remaining sections across lanes and predict the makespan.
 
     Args:
-        tasks: List of tasks with positions
-        sections: List of section names (for counting)
+        sections: Section names in manifest order
+        completed_sections: Sections already done (not scheduled)
+        costs: Dict of section name -> estimated cost (section_cost_estimates())
+        section_dependencies: Declared section dependencies, or None for a
+            sequential plan (each section waits for the previous)
+        lane_count: Number of concurrent lanes
+        durations: Observed durations of completed sections in seconds,
+            used to convert costs to seconds
 
     Returns:
-        Dict of position -> (blocks, blockedBy) as lists of position strings
+        Schedule summary for the setup output
     """
-    blocks: dict[int, list[str]] = {t.position: [] for t in tasks}
-    blocked_by: dict[int, list[str]] = {t.position: [] for t in tasks}
-
-    # Count context tasks (they have "=" in subject)
-    context_count = sum(1 for t in tasks if "=" in t.subject)
-
-    # Steps per section (without compaction)
-    steps_per_section = len(SECTION_STEP_IDS)
-
-    for section_index, section in enumerate(sections):
-        # Calculate section start position accounting for compaction tasks
-        # Each section has 6 steps, compaction added after every 2nd section
-        compaction_tasks_before = section_index // 2
-        section_start = context_count + 1 + (section_index * steps_per_section) + compaction_tasks_before
-
-        # Link steps within section (sequential)
-        for step_offset in range(steps_per_section - 1):
-            current_pos = section_start + step_offset
-            next_pos = section_start + step_offset + 1
-            blocks[current_pos].append(str(next_pos))
-            blocked_by[next_pos].append(str(current_pos))
-
-        # Link first step to previous section's commit (if not first section)
-        if section_index > 0:
-            # Previous section's commit position
-            prev_compaction_tasks = (section_index - 1) // 2
-            prev_section_start = context_count + 1 + ((section_index - 1) * steps_per_section) + prev_compaction_tasks
-            prev_commit_pos = prev_section_start + steps_per_section - 1
-
-            # Add compaction position if this section is at a 3-boundary (e.g., section 3, 6, 9)
-            # The compaction task comes AFTER the commit of section 3, 6, 9, etc.
-            if section_index % 2 == 0:
-                # There's a compaction task between the previous commit and this section's first step
-                compaction_pos = prev_commit_pos + 1
-                blocked_by[section_start].append(str(compaction_pos))
-                blocks[compaction_pos].append(str(section_start))
-                # The compaction itself is blocked by the previous commit
-                blocked_by[compaction_pos].append(str(prev_commit_pos))
-                blocks[prev_commit_pos].append(str(compaction_pos))
-            else:
-                # No compaction, link directly to previous commit
-                blocked_by[section_start].append(str(prev_commit_pos))
-                blocks[prev_commit_pos].append(str(section_start))
-
-    # Finalization task (last position)
-    if tasks and sections:
-        final_pos = tasks[-1].position
-        # Find last section's commit position
-        last_section_index = len(sections) - 1
-        last_compaction_tasks = last_section_index // 2
-        last_section_start = context_count + 1 + (last_section_index * steps_per_section) + last_compaction_tasks
-        last_commit_pos = last_section_start + steps_per_section - 1
-
-        # Check if last section has a compaction task after it
-        if (last_section_index + 1) % 2 == 0:
-            # Compaction after last commit, finalization blocked by compaction
-            last_compaction_pos = last_commit_pos + 1
-            blocked_by[final_pos].append(str(last_compaction_pos))
-            blocks[last_compaction_pos].append(str(final_pos))
-        else:
-            # No compaction, finalization blocked by last commit
-            blocked_by[final_pos].append(str(last_commit_pos))
-            blocks[last_commit_pos].append(str(final_pos))
-
-        # Context tasks blockedBy finalization (keeps them pending until workflow completes)
-        for context_pos in range(1, context_count + 1):
-            blocked_by[context_pos].append(str(final_pos))
-            blocks[final_pos].append(str(context_pos))
-
-    return {pos: (blocks[pos], blocked_by[pos]) for pos in blocks}
+    if section_dependencies is None:
+        section_dependencies = sequential_dependencies(sections)
+    calibrated, unit = calibrate_costs(costs, durations)
+    remaining = [s for s in sections if s not in completed_sections]
+    schedule = schedule_sections(remaining, calibrated, section_dependencies, lane_count)
+    return {
+        "lanes": lane_count,
+        "unit": unit,
+        "makespan": round(schedule["makespan"], 1),
+        "serial_total": round(sum(calibrated[s] for s in remaining), 1),
+        "order": schedule["order"],
+        "lane_assignments": schedule["lanes"],
+        "critical_path": schedule["critical_path"],
+    }
 
 
 def main():
@@ -700,6 +452,23 @@ def main():
     parser.add_argument("--target-dir", required=True, help="Path to target directory for implementation")
     parser.add_argument("--plugin-root", required=True, help="Path to plugin root")
     parser.add_argument("--session-id", help="Session ID from hook context (takes precedence over env var)")
+    parser.add_argument("--tasks-root", help="Alternative root for task lists (default: ~/.claude/tasks)")
+    parser.add_argument(
+        "--lane-worktrees",
+        action="store_true",
+        help="Provision a git worktree and branch per parallel lane under the state directory",
+    )
+    parser.add_argument(
+        "--profile-pre-commit",
+        action="store_true",
+        help="Run the pre-commit hooks once in a scratch worktree and record per-hook timings",
+    )
+    parser.add_argument(
+        "--lock-wait",
+        type=float,
+        default=DEFAULT_LOCK_WAIT,
+        help=f"Seconds to wait for a concurrent setup on the same task list (default: {DEFAULT_LOCK_WAIT})",
+    )
     args = parser.parse_args()
 
     sections_dir = Path(args.sections_dir).resolve()
@@ -718,6 +487,24 @@ def main():
     sections = validation["sections"]
     project_config = validation["project_config"]
 
+    try:
+        task_options = TaskOptions.from_project_config(project_config)
+        section_profiles = resolve_section_profiles(
+            sections_dir,
+            sections,
+            validation["section_annotations"],
+            infer=task_options.infer_profiles,
+        )
+        section_dependencies, conflict_report = resolve_plan_dependencies(
+            sections_dir, sections, validation["section_annotations"], task_options
+        )
+    except ValueError as e:
+        print(json.dumps({
+            "success": False,
+            "error": str(e)
+        }))
+        return
+
     # State directory (sibling to sections) for session config and reviews
     state_dir = sections_dir.parent / "implementation"
 
@@ -736,21 +523,28 @@ def main():
     # Check current branch
     branch_info = check_current_branch(git_root)
 
-    # Check working tree
-    working_tree = check_working_tree_status(git_root)
+    # Check working tree (lane worktrees live under the state dir)
+    working_tree = check_working_tree_status(git_root, ignore_paths=[worktrees_dir(state_dir)])
 
     # Detect commit style
     commit_style = detect_commit_style(git_root)
 
     # Check pre-commit hooks
-    pre_commit = check_pre_commit_hooks(git_root)
-
-    # Infer session state
-    state = infer_session_state(sections_dir, state_dir, git_root)
+    pre_commit = check_pre_commit_hooks(git_root, cache_dir=state_dir)
+    if args.profile_pre_commit and pre_commit["present"]:
+        pre_commit["profile"] = profile_pre_commit_hooks(git_root, pre_commit)
+
+    # Infer session state (one scan of code_review/ serves resume
+    # detection and the diff history used for compaction budgets); setup
+    # is where a cached review of the resume section is restored
+    review_index = scan_review_artifacts(state_dir)
+    state = infer_session_state(
+        sections_dir, state_dir, git_root, review_index=review_index, restore_cached=True
+    )
 
     # Create or update session config
     if state["mode"] == "new":
-        config = create_session_config(
+        fresh = create_session_config(
             plugin_root=plugin_root,
             sections_dir=sections_dir,
             target_dir=target_dir,
@@ -760,7 +554,66 @@ def main():
             sections=sections,
             pre_commit=pre_commit
         )
-        save_session_config(state_dir, config)
+
+        def start_session(existing: dict | None) -> dict:
+            if existing is None:
+                return fresh
+            # Nothing is committed yet, but earlier runs may have recorded
+            # review diffs, lanes or the task list; only refresh detection
+            return {
+                **existing,
+                **fresh,
+                "sections_state": existing.get("sections_state", {}),
+                "created_at": existing.get("created_at", fresh["created_at"]),
+            }
+
+        update_session_config(state_dir, start_session)
+    elif "profile" in pre_commit:
+        def save_profile(config: dict | None) -> dict | None:
+            if config is not None:
+                config.setdefault("pre_commit", {})["profile"] = pre_commit["profile"]
+            return config
+
+        update_session_config(state_dir, save_profile)
+
+    # One worktree and branch per parallel lane
+    lane_worktrees = None
+    if args.lane_worktrees:
+        if section_dependencies is None:
+            print(json.dumps({
+                "success": False,
+                "error": "--lane-worktrees needs parallel lanes: add depends= annotations to the manifest or set infer_dependencies: true",
+            }))
+            return
+        if task_options.lanes is not None:
+            # Balance the whole plan over the configured number of lanes
+            section_costs = section_cost_estimates(sections_dir, sections, section_profiles)
+            lanes = schedule_sections(
+                sections, section_costs, section_dependencies, task_options.lanes
+            )["lanes"]
+        else:
+            lanes = chain_lanes(sections, section_dependencies)
+        try:
+            lane_worktrees = provision_lane_worktrees(git_root, state_dir, lanes)
+        except RuntimeError as e:
+            print(json.dumps({
+                "success": False,
+                "error": str(e),
+            }))
+            return
+        needs = lane_dependencies(lane_worktrees, section_dependencies)
+
+        def save_lanes(config: dict | None) -> dict | None:
+            previous = {lane["branch"]: lane for lane in (config or {}).get("lanes", [])}
+            for lane in lane_worktrees:
+                lane["needs_lanes"] = needs[lane["lane"]]
+                if "merged_commit" in previous.get(lane["branch"], {}):
+                    lane["merged_commit"] = previous[lane["branch"]]["merged_commit"]
+            if config is not None:
+                config["lanes"] = lane_worktrees
+            return config
+
+        update_session_config(state_dir, save_lanes)
 
     # Get task list context
     # Priority: --session-id (from hook context) > env vars
@@ -794,31 +647,98 @@ def main():
         "test_command": project_config["test_command"],
     }
 
-    # Generate implementation tasks
-    tasks_to_write = generate_implementation_tasks(
-        sections=sections,
-        completed_sections=state["completed_sections"],
-        resume_section=state.get("resume_from"),
-        resume_section_state=state.get("resume_section_state"),
-        context_values=context_values,
-    )
+    # Machine-readable file-overlap analysis for parallel scheduling
+    conflict_report_path = None
+    if conflict_report is not None:
+        conflict_report_path = write_conflict_report(state_dir, conflict_report)
+
+    # Sections that cannot overlap with the previous section's review
+    # (pipelining only applies to sequential plans)
+    pipelined = task_options.pipelined_review and section_dependencies is None
+    serial_sections = pipeline_breaks(sections, conflict_report)
+
+    # Compaction schedule from token estimates (default: every 2nd section)
+    compaction_after = None
+    section_token_estimates = None
+    if task_options.compaction_budget is not None:
+        points, section_token_estimates = budget_compaction_points(
+            sections_dir, state_dir, sections, section_profiles, task_options.compaction_budget,
+            review_index=review_index,
+        )
+        compaction_after = set(points)
+
+    # Critical-path schedule of the remaining sections across the lanes
+    # (only meaningful with several lanes or dependencies that allow them)
+    section_schedule = None
+    if (task_options.lanes or 1) > 1 or allows_parallel_work(sections, section_dependencies):
+        section_schedule = plan_section_schedule(
+            sections,
+            state["completed_sections"],
+            section_cost_estimates(sections_dir, sections, section_profiles),
+            section_dependencies,
+            task_options.lanes or 1,
+            historical_durations(git_root, recorded_commit_hashes(load_session_config(state_dir))),
+        )
 
-    # Build dependency graph
-    dependency_graph = build_impl_dependency_graph(tasks_to_write, sections)
+    # Task store (only known when a session ID is available)
+    store = None
+    if session_id:
+        tasks_root = Path(args.tasks_root).expanduser() if args.tasks_root else None
+        store = FileTaskStore.for_task_list(session_id, root=tasks_root)
 
-    # Write tasks to disk
+    # Generate and write the task list, one run per task list at a time
     write_result = None
     task_write_error = None
-    if session_id:
-        write_result = write_tasks(
-            session_id,
-            tasks_to_write,
-            dependency_graph=dependency_graph,
-        )
-        if not write_result.success:
-            task_write_error = write_result.error
-    else:
-        task_write_error = "No session ID available (neither --session-id nor env vars set)"
+    try:
+        with task_list_lock(store, wait=args.lock_wait):
+            tasks_to_write, dependency_graph = plan_session_tasks(
+                sections,
+                state,
+                context_values,
+                task_options,
+                config=load_session_config(state_dir),
+                store=store,
+                section_profiles=section_profiles,
+                compaction_after=compaction_after,
+                section_dependencies=section_dependencies,
+                pipeline_breaks=serial_sections,
+                claims=section_claims(state_dir),
+            )
+
+            if store is not None:
+                # Remember where tasks live so tools can refresh them later
+                def save_task_list(config: dict | None) -> dict | None:
+                    if config is not None:
+                        config["task_list_id"] = session_id
+                        config["tasks_root"] = str(tasks_root) if tasks_root else None
+                    return config
+
+                update_session_config(state_dir, save_task_list)
+
+                write_result = write_tasks(
+                    session_id,
+                    tasks_to_write,
+                    dependency_graph=dependency_graph,
+                    store=store,
+                    skip_unchanged=task_options.stable_ids,
+                )
+                if not write_result.success:
+                    task_write_error = write_result.error
+            else:
+                task_write_error = "No session ID available (neither --session-id nor env vars set)"
+    except SetupInProgressError as e:
+        print(json.dumps({
+            "success": False,
+            "error": str(e),
+            "setup_in_progress": True,
+        }))
+        return
+    except DependencyGraphError as e:
+        print(json.dumps({
+            "success": False,
+            "error": str(e),
+        }))
+        return
 
     # Output result
     result = {
@@ -840,6 +760,33 @@ def main():
         "resume_from": state["resume_from"],
         "resume_section_state": state.get("resume_section_state"),
         "tasks_written": write_result.tasks_written if write_result else 0,
+        "task_window": task_options.window,
+        "collapse_completed": task_options.collapse_completed,
+        "stable_task_ids": task_options.stable_ids,
+        "tasks_unchanged": write_result.tasks_unchanged if write_result else 0,
+        "deferred_sections": _deferred_sections(tasks_to_write, sections),
+        "section_profiles": {
+            section: profile
+            for section, profile in section_profiles.items()
+            if profile != DEFAULT_SECTION_PROFILE
+        },
+        "step_savings": estimate_step_savings(
+            sections, state["completed_sections"], section_profiles
+        ),
+        "compaction_budget": task_options.compaction_budget,
+        "compaction_points": _compaction_points(tasks_to_write, sections, compaction_after),
+        "section_token_estimates": section_token_estimates,
+        "section_dependencies": section_dependencies,
+        "parallel_lanes": (
+            chain_lanes(sections, section_dependencies) if section_dependencies is not None else None
+        ),
+        "pipelined_review": pipelined,
+        "pipeline_breaks": [s for s in sections if s in serial_sections] if pipelined else [],
+        "schedule": section_schedule,
+        "lane_worktrees": lane_worktrees,
+        "conflict_report": str(conflict_report_path) if conflict_report_path else None,
+        "conflict_groups": conflict_report["groups"] if conflict_report else None,
+        "tasks_dir": str(write_result.tasks_dir) if write_result and write_result.success else None,
         "task_write_error": task_write_error,
         # Session ID diagnostics
         "session_id": session_id,
@@ -7,11 +7,21 @@ per-section completion state with commit hashes for reliable resume.
 
 from pathlib import Path
 import json
+import os
+import tempfile
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
+from scripts.lib.leases import hold_lease, lock_owner
+
 CONFIG_FILE = "deep_implement_config.json"
 
+# Lease serializing config updates (kept in the state directory)
+SECTION_STATE_LOCK_NAME = ".section_state"
+SECTION_STATE_LOCK_TTL = 30  # Seconds before a crashed writer's lock is reclaimed
+SECTION_STATE_LOCK_WAIT = 30  # Seconds to wait for a concurrent update
+
 
 def load_session_config(implementation_dir: Path) -> dict | None:
     """
@@ -35,7 +45,8 @@ def save_session_config(implementation_dir: Path, config: dict) -> None:
     """
     Save session config to implementation directory.
 
-    Creates the directory if it doesn't exist.
+    Creates the directory if it doesn't exist. The file is replaced
+    atomically, so concurrent readers never see a partial config.
 
     Args:
         implementation_dir: Path to implementation directory
@@ -45,8 +56,14 @@ def save_session_config(implementation_dir: Path, config: dict) -> None:
     impl_dir.mkdir(parents=True, exist_ok=True)
 
     config_path = impl_dir / CONFIG_FILE
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    fd, tmp_path = tempfile.mkstemp(dir=impl_dir, prefix=f".{CONFIG_FILE}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(config, f, indent=2)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
 
 
 def create_session_config(
@@ -139,3 +156,70 @@ def update_section_state(
 
     config["sections_state"][section_name] = state
     save_session_config(implementation_dir, config)
+
+
+def update_session_config(
+    implementation_dir: Path,
+    update: Callable[[dict | None], dict | None],
+) -> dict | None:
+    """
+    Load, change and save the session config as one step.
+
+    The load, update and save run under a lease in the state directory, so
+    concurrent writers (setup, lane merges, section state updates) are
+    applied one after the other instead of overwriting each other.
+
+    Args:
+        implementation_dir: Path to implementation directory
+        update: Called with the current config (None if there is none yet);
+            returns the config to save, or None to leave the file untouched
+
+    Returns:
+        The saved config, or None if nothing was saved
+
+    Raises:
+        LeaseBusyError: If another update held the lock for the whole wait
+    """
+    with hold_lease(
+        implementation_dir,
+        SECTION_STATE_LOCK_NAME,
+        lock_owner(),
+        ttl=SECTION_STATE_LOCK_TTL,
+        wait=SECTION_STATE_LOCK_WAIT,
+    ):
+        config = update(load_session_config(implementation_dir))
+        if config is not None:
+            save_session_config(implementation_dir, config)
+    return config
+
+
+def merge_section_state(
+    implementation_dir: Path,
+    section_name: str,
+    updates: dict[str, Any],
+) -> dict:
+    """
+    Merge fields into one section's state, keeping fields not being updated.
+
+    Runs through update_session_config(), so concurrent updates (e.g. from
+    agents working other lanes) do not overwrite each other.
+
+    Args:
+        implementation_dir: Path to implementation directory
+        section_name: Name of section to update
+        updates: Fields to set on the section state
+
+    Returns:
+        The section's merged state
+
+    Raises:
+        ValueError: If no config exists
+        LeaseBusyError: If another update held the lock for the whole wait
+    """
+    def merge(config: dict | None) -> dict:
+        if config is None:
+            raise ValueError(f"No config found in {implementation_dir}")
+        config.setdefault("sections_state", {}).setdefault(section_name, {}).update(updates)
+        return config
+
+    return update_session_config(implementation_dir, merge)["sections_state"][section_name]
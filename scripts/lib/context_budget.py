@@ -0,0 +1,138 @@
+"""Context budget estimation for compaction scheduling.
+
+Estimates how many tokens each section adds to the conversation and
+places compaction prompts so the running total stays under a budget,
+instead of prompting after every 2nd section regardless of size.
+"""
+
+import math
+import re
+from pathlib import Path
+
+from scripts.lib.review_state import ReviewIndex, scan_review_artifacts, section_number
+
+# Rough characters-per-token ratio for English prose and source code
+CHARS_PER_TOKEN = 4
+
+# Conversation overhead per workflow step (tool calls, test output, summaries)
+STEP_OVERHEAD_TOKENS = 1500
+
+# Diff characters produced per character of code in the section plan,
+# used until the session has its own history
+DEFAULT_DIFF_RATIO = 1.5
+
+CODE_BLOCK_PATTERN = re.compile(r'```[^\n]*\n(.*?)```', re.DOTALL)
+
+
+def code_block_chars(section_content: str) -> int:
+    """Total characters inside fenced code blocks."""
+    return sum(len(block) for block in CODE_BLOCK_PATTERN.findall(section_content))
+
+
+def historical_diff_sizes(
+    state_dir: Path,
+    sections: list[str],
+    index: ReviewIndex | None = None,
+) -> dict[str, int]:
+    """Size of each review diff written so far.
+
+    Args:
+        state_dir: Path to implementation/state directory
+        sections: Section names to look up
+        index: Review artifact index already scanned by the caller
+            (scanned here if not given)
+
+    Returns:
+        Dict of section name -> diff size in characters, for sections
+        whose code_review/section-NN-diff.md exists
+    """
+    if index is None:
+        index = scan_review_artifacts(state_dir)
+    return {
+        section: index[section_number(section)]["diff"].size
+        for section in sections
+        if "diff" in index.get(section_number(section), {})
+    }
+
+
+def diff_ratio(section_contents: dict[str, str], diff_sizes: dict[str, int]) -> float:
+    """Average diff size per character of planned code across reviewed sections.
+
+    Args:
+        section_contents: Dict of section name -> section markdown
+        diff_sizes: Dict of section name -> diff size (historical_diff_sizes())
+
+    Returns:
+        Observed ratio, or DEFAULT_DIFF_RATIO without usable history
+    """
+    planned = 0
+    actual = 0
+    for section, size in diff_sizes.items():
+        code = code_block_chars(section_contents.get(section, ""))
+        if code == 0:
+            continue
+        planned += code
+        actual += size
+    if planned == 0:
+        return DEFAULT_DIFF_RATIO
+    return actual / planned
+
+
+def estimate_section_tokens(
+    section_content: str,
+    *,
+    step_count: int,
+    ratio: float = DEFAULT_DIFF_RATIO,
+    diff_size: int | None = None,
+) -> int:
+    """Estimate the tokens a section adds to the conversation.
+
+    Counts reading the section file, writing the code (the diff, predicted
+    from the section's code blocks unless the real size is known) and a
+    fixed overhead per workflow step.
+
+    Args:
+        section_content: Content of section markdown file
+        step_count: Number of workflow steps the section runs
+        ratio: Diff characters per planned code character
+        diff_size: Actual diff size in characters, if already generated
+
+    Returns:
+        Estimated token count
+    """
+    if diff_size is None:
+        diff_size = int(code_block_chars(section_content) * ratio)
+    chars = len(section_content) + diff_size
+    return math.ceil(chars / CHARS_PER_TOKEN) + step_count * STEP_OVERHEAD_TOKENS
+
+
+def schedule_compactions(
+    sections: list[str],
+    estimates: dict[str, int],
+    budget: int,
+) -> list[str]:
+    """Choose the sections after which to prompt for compaction.
+
+    Greedy: keep adding sections to the current context and compact after
+    the last section that still fits, i.e. whenever the next section would
+    push the running total over the budget. A section larger than the
+    budget on its own gets a compaction right after it.
+
+    Args:
+        sections: Section names in execution order
+        estimates: Dict of section name -> estimated tokens
+        budget: Token budget between compactions
+
+    Returns:
+        Section names followed by a compaction prompt, in order
+    """
+    points: list[str] = []
+    used = 0
+    for section, following in zip(sections, sections[1:] + [None]):
+        used += estimates.get(section, 0)
+        if following is None:
+            break
+        if used + estimates.get(following, 0) > budget:
+            points.append(section)
+            used = 0
+    return points
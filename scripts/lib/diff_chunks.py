@@ -0,0 +1,286 @@
+"""Split a section's review diff into chunks for parallel reviewers.
+
+A unified diff is split into per-file diffs, grouped by file or by module
+(parent directory), and packed in order into chunks that stay under a
+token budget. A file whose diff alone exceeds the budget is split at hunk
+boundaries, repeating its file header in every piece. Each chunk is
+reviewed by its own code-reviewer subagent; merge_chunk_reviews() joins
+their JSON outputs into the section's single review file.
+"""
+
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from scripts.lib.context_budget import CHARS_PER_TOKEN
+from scripts.lib.review_findings import parse_findings, save_findings
+from scripts.lib.review_state import code_review_dir, section_number
+
+# Token budget per chunk, sized so one reviewer reads its chunk plus the
+# section plan comfortably
+DEFAULT_CHUNK_TOKENS = 12000
+
+GROUP_MODES = ("file", "module")
+
+FILE_HEADER_PATTERN = re.compile(r"^diff --git a/(.*) b/(.*)$")
+
+
+@dataclass(slots=True)
+class FileDiff:
+    """The part of a diff that changes one file."""
+
+    path: str
+    text: str
+
+
+@dataclass(slots=True)
+class DiffChunk:
+    """Consecutive file diffs (or hunks of one file) reviewed together."""
+
+    files: list[str] = field(default_factory=list)
+    text: str = ""
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of diff text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_file_diffs(diff_text: str) -> list[FileDiff]:
+    """Split a unified diff (git diff output) into per-file diffs.
+
+    Text before the first file header is kept with the first file.
+    """
+    files: list[FileDiff] = []
+    preamble: list[str] = []
+    for line in diff_text.splitlines(keepends=True):
+        match = FILE_HEADER_PATTERN.match(line.rstrip("\n"))
+        if match is not None:
+            files.append(FileDiff(path=match.group(2), text="".join(preamble) + line))
+            preamble = []
+        elif files:
+            files[-1].text += line
+        else:
+            preamble.append(line)
+    if preamble:
+        if files:
+            files[0].text = "".join(preamble) + files[0].text
+        elif "".join(preamble).strip():
+            files.append(FileDiff(path="", text="".join(preamble)))
+    return files
+
+
+def split_hunks(file_diff: FileDiff, max_tokens: int) -> list[FileDiff]:
+    """Split one file's diff at hunk boundaries into pieces under max_tokens.
+
+    Every piece repeats the file header (the lines before the first hunk).
+    A single hunk larger than max_tokens stays whole.
+    """
+    lines = file_diff.text.splitlines(keepends=True)
+    first_hunk = next((i for i, line in enumerate(lines) if line.startswith("@@")), None)
+    if first_hunk is None:
+        return [file_diff]
+
+    header = "".join(lines[:first_hunk])
+    hunks: list[str] = []
+    for line in lines[first_hunk:]:
+        if line.startswith("@@") or not hunks:
+            hunks.append(line)
+        else:
+            hunks[-1] += line
+
+    pieces: list[FileDiff] = []
+    body = ""
+    for hunk in hunks:
+        if body and estimate_tokens(header + body + hunk) > max_tokens:
+            pieces.append(FileDiff(path=file_diff.path, text=header + body))
+            body = ""
+        body += hunk
+    pieces.append(FileDiff(path=file_diff.path, text=header + body))
+    return pieces
+
+
+def group_key(path: str, group_by: str) -> str:
+    """Group a file belongs to: itself, or its parent directory."""
+    if group_by == "file":
+        return path
+    return path.rsplit("/", 1)[0] if "/" in path else "."
+
+
+def chunk_diff(
+    diff_text: str,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    group_by: str = "module",
+) -> list[DiffChunk]:
+    """Pack a diff into chunks of at most max_tokens (best effort).
+
+    Files of one group stay in the same chunk when the group fits the
+    budget; otherwise the group is split per file, and oversized files per
+    hunk. Chunks follow the order of the diff.
+
+    Args:
+        diff_text: Unified diff (git diff --staged output)
+        max_tokens: Token budget per chunk
+        group_by: "module" (parent directory) or "file"
+
+    Returns:
+        Chunks in diff order; empty for an empty diff
+
+    Raises:
+        ValueError: If max_tokens is not positive or group_by is unknown
+    """
+    if max_tokens < 1:
+        raise ValueError(f"Chunk token budget must be positive, got {max_tokens}")
+    if group_by not in GROUP_MODES:
+        raise ValueError(f"Unknown grouping {group_by!r} (expected one of {', '.join(GROUP_MODES)})")
+
+    groups: dict[str, list[FileDiff]] = {}
+    for file_diff in split_file_diffs(diff_text):
+        groups.setdefault(group_key(file_diff.path, group_by), []).append(file_diff)
+
+    units: list[list[FileDiff]] = []
+    for files in groups.values():
+        if estimate_tokens("".join(f.text for f in files)) <= max_tokens:
+            units.append(files)
+            continue
+        for file_diff in files:
+            units.extend([piece] for piece in split_hunks(file_diff, max_tokens))
+
+    chunks: list[DiffChunk] = []
+    current = DiffChunk()
+    for unit in units:
+        text = "".join(f.text for f in unit)
+        if current.text and estimate_tokens(current.text + text) > max_tokens:
+            chunks.append(current)
+            current = DiffChunk()
+        current.text += text
+        for file_diff in unit:
+            if file_diff.path not in current.files:
+                current.files.append(file_diff.path)
+    if current.text:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_path(state_dir: Path, section: str, index: int) -> Path:
+    """Diff file of one chunk (section-NN-diff-chunk-KK.md)."""
+    return code_review_dir(state_dir) / f"section-{section_number(section)}-diff-chunk-{index:02d}.md"
+
+
+def chunk_review_path(state_dir: Path, section: str, index: int) -> Path:
+    """Reviewer output of one chunk (section-NN-review-chunk-KK.json)."""
+    return code_review_dir(state_dir) / f"section-{section_number(section)}-review-chunk-{index:02d}.json"
+
+
+def manifest_path(state_dir: Path, section: str) -> Path:
+    """Chunk manifest of a section (section-NN-chunks.json)."""
+    return code_review_dir(state_dir) / f"section-{section_number(section)}-chunks.json"
+
+
+def write_diff_chunks(
+    state_dir: Path,
+    section: str,
+    diff_text: str,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    group_by: str = "module",
+) -> dict:
+    """Write a section's diff chunks and their manifest.
+
+    Chunk files from an earlier run of the same section are removed first.
+
+    Returns:
+        The manifest: {"section", "token_budget", "group_by", "total_tokens",
+        "chunks": [{"index", "diff", "review", "files", "tokens"}]}
+    """
+    chunks = chunk_diff(diff_text, max_tokens, group_by)
+    directory = code_review_dir(state_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    number = section_number(section)
+    for stale in [
+        *directory.glob(f"section-{number}-diff-chunk-*.md"),
+        *directory.glob(f"section-{number}-review-chunk-*.json"),
+    ]:
+        stale.unlink()
+
+    entries = []
+    for index, chunk in enumerate(chunks, start=1):
+        path = chunk_path(state_dir, section, index)
+        path.write_text(chunk.text)
+        entries.append({
+            "index": index,
+            "diff": str(path),
+            "review": str(chunk_review_path(state_dir, section, index)),
+            "files": chunk.files,
+            "tokens": chunk.tokens,
+        })
+
+    manifest = {
+        "section": section,
+        "token_budget": max_tokens,
+        "group_by": group_by,
+        "total_tokens": estimate_tokens(diff_text),
+        "chunks": entries,
+    }
+    manifest_path(state_dir, section).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def section_title(section: str) -> str:
+    """Review heading for a section ("section-02-api-layer" -> "Section 02 - Api Layer")."""
+    parts = section.split("-")
+    if len(parts) < 3:
+        return section
+    return f"Section {parts[1]} - {' '.join(parts[2:]).title()}"
+
+
+def merge_chunk_reviews(state_dir: Path, section: str) -> Path:
+    """Join the chunk reviewers' JSON outputs into section-NN-review.md.
+
+    Each chunk review is the code-reviewer's JSON object
+    ({"section", "review", "findings"}), saved to the chunk's "review"
+    path. The chunks' findings are numbered in chunk order and saved as
+    the section's findings.
+
+    Returns:
+        Path of the written review file
+
+    Raises:
+        ValueError: If the manifest or a chunk review is missing or unreadable,
+            or a finding is invalid
+    """
+    try:
+        manifest = json.loads(manifest_path(state_dir, section).read_text())
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"No readable chunk manifest for {section}: {e}") from e
+
+    chunks = manifest.get("chunks", [])
+    reviews: list[str] = []
+    findings: list[dict] = []
+    missing: list[str] = []
+    for chunk in chunks:
+        try:
+            output = json.loads(Path(chunk["review"]).read_text())
+            review = output["review"]
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            missing.append(Path(chunk["review"]).name)
+            continue
+        chunk_findings = output.get("findings", [])
+        if not isinstance(chunk_findings, list):
+            raise ValueError(f"Findings in {Path(chunk['review']).name} must be a list")
+        findings.extend(chunk_findings)
+        heading = f"## Chunk {chunk['index']} of {len(chunks)}: {', '.join(chunk['files'])}"
+        reviews.append(f"{heading}\n\n{str(review).strip()}\n")
+    if missing:
+        raise ValueError(f"Missing or unreadable chunk reviews: {', '.join(missing)}")
+
+    parsed = parse_findings(findings)
+    path = code_review_dir(state_dir) / f"section-{section_number(section)}-review.md"
+    path.write_text(f"# Code Review: {section_title(section)}\n\n" + "\n".join(reviews))
+    save_findings(state_dir, section, parsed)
+    return path
@@ -0,0 +1,96 @@
+"""Pre-emptive formatter pass over a section's staged files.
+
+Formatter hooks (black, ruff-format, prettier, ...) make the first commit
+attempt fail when they rewrite files, forcing a re-stage and a second
+commit, and leave the reviewed diff out of date. Running the detected
+formatter hooks on the staged files before the review diff is captured
+means the formatted code is what gets reviewed and committed, in one pass.
+
+Hooks run through the pre-commit framework (`pre-commit run <id> --files
+...`) so they use the same versions and arguments as the commit.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+
+def staged_files(git_root: Path) -> list[str]:
+    """Staged files that still exist (added, copied, modified or renamed).
+
+    New files count as soon as they are staged, even if HEAD has never
+    seen them.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(git_root), "diff", "--cached", "--name-only", "--diff-filter=ACMR", "-z"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git diff --cached failed: {result.stderr.strip()}")
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def unstaged_changes(git_root: Path, files: list[str]) -> list[str]:
+    """Files whose working tree content differs from the index."""
+    if not files:
+        return []
+    result = subprocess.run(
+        ["git", "-C", str(git_root), "diff", "--name-only", "-z", "--", *files],
+        capture_output=True,
+        text=True,
+    )
+    return [path for path in result.stdout.split("\0") if path]
+
+
+def run_formatters(git_root: Path, hook_ids: list[str], files: list[str]) -> dict:
+    """Run formatter hooks on files and re-stage them.
+
+    Files with unstaged changes before the run are left alone, so the pass
+    never stages edits that were not meant for this commit. Every other
+    file is added again afterwards by path, so newly added files get their
+    formatted content staged too.
+
+    Args:
+        git_root: Repository root
+        hook_ids: pre-commit hook IDs to run, in order
+        files: Paths relative to git_root
+
+    Returns:
+        {"ran": [hook ids], "formatted_files": [paths rewritten],
+        "skipped_files": [paths with unstaged edits], "failed": [{"id", "output"}]}
+
+    Raises:
+        RuntimeError: If pre-commit is not installed
+        subprocess.CalledProcessError: If re-staging the files fails
+    """
+    if shutil.which("pre-commit") is None:
+        raise RuntimeError("pre-commit is not installed")
+
+    skipped = unstaged_changes(git_root, files)
+    targets = [f for f in files if f not in skipped]
+    result = {"ran": [], "formatted_files": [], "skipped_files": skipped, "failed": []}
+    if not targets:
+        return result
+
+    for hook_id in dict.fromkeys(hook_ids):
+        before = set(unstaged_changes(git_root, targets))
+        run = subprocess.run(
+            ["pre-commit", "run", hook_id, "--files", *targets],
+            cwd=git_root,
+            capture_output=True,
+            text=True,
+        )
+        result["ran"].append(hook_id)
+        changed = set(unstaged_changes(git_root, targets)) - before
+        # A formatter exits non-zero when it rewrote files; only a failure
+        # without rewrites is a real error
+        if run.returncode != 0 and not changed:
+            output = (run.stdout + run.stderr).strip().splitlines()
+            result["failed"].append({"id": hook_id, "output": "\n".join(output[-20:])})
+
+    result["formatted_files"] = unstaged_changes(git_root, targets)
+    subprocess.run(
+        ["git", "-C", str(git_root), "add", "--", *targets], capture_output=True, text=True, check=True
+    )
+    return result
@@ -0,0 +1,490 @@
+"""Static inspection of a repository's pre-commit hooks.
+
+Parses .pre-commit-config.yaml into its hooks (id, args, stages,
+pass_filenames, always_run) and scans native hook scripts for formatter
+invocations, so setup can tell whether a commit may rewrite files without
+running anything.
+
+The config is parsed with PyYAML when it is installed. Without it a
+fallback parser reads the subset of YAML pre-commit configs use: block
+and flow collections at any indentation, anchors, aliases and merge keys.
+
+Parsed configs and hook scans are cached by the SHA-256 of the file in
+{state_dir}/pre_commit_cache.json, so re-running setup on an unchanged
+repository skips the work.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import tempfile
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:  # Optional: the fallback parser covers common configs
+    yaml = None
+
+PRE_COMMIT_CACHE_FILE = "pre_commit_cache.json"
+
+# Stage names a hook runs at on `git commit` ("commit" is the legacy name)
+COMMIT_STAGES = ("pre-commit", "commit")
+
+# Marker line of the shim `pre-commit install` writes to the hooks dir
+FRAMEWORK_SHIM_MARKER = "File generated by pre-commit"
+
+# Commands a native hook may run that rewrite files. Formatters that only
+# rewrite with a flag list it in the second pattern.
+NATIVE_FORMATTER_COMMANDS = (
+    ("black", r"\bblack\b", None),
+    ("isort", r"\bisort\b", None),
+    ("autopep8", r"\bautopep8\b", r"(?:^|\s)(?:-i|--in-place)\b"),
+    ("yapf", r"\byapf\b", r"(?:^|\s)(?:-i|--in-place)\b"),
+    ("ruff format", r"\bruff\s+format\b", None),
+    ("ruff --fix", r"\bruff\b", r"--fix\b"),
+    ("prettier", r"\bprettier\b", r"(?:^|\s)(?:--write|-w)\b"),
+    ("eslint --fix", r"\beslint\b", r"--fix\b"),
+    ("gofmt", r"\bgofmt\b", r"(?:^|\s)-w\b"),
+    ("goimports", r"\bgoimports\b", r"(?:^|\s)-w\b"),
+    ("go fmt", r"\bgo\s+fmt\b", None),
+    ("rustfmt", r"\brustfmt\b", None),
+    ("cargo fmt", r"\bcargo\s+fmt\b", None),
+    ("clang-format", r"\bclang-format\b", r"(?:^|\s)-i\b"),
+    ("lint-staged", r"\blint-staged\b", None),
+)
+
+# Flags that make a formatter only report what it would change
+CHECK_ONLY_FLAGS = re.compile(r"(?:^|\s)--(?:check|diff|dry-run|list-different)\b")
+RESTAGE_COMMAND = re.compile(r"\bgit\s+(?:add|update-index)\b")
+FRAMEWORK_COMMAND = re.compile(r"\bpre-commit\s+run\b")
+
+# Commands that hand off to something the scan cannot see into: build
+# targets, task runners, package scripts and other shell scripts. Matched
+# only in command position (line start, after ;, &&, ||, | or a keyword).
+DELEGATED_COMMAND = re.compile(
+    r"(?:^|[;&|]\s*|\b(?:then|do|else|exec|if|while|until)\s+)"
+    r"(?P<command>"
+    r"(?:make|just|task|tox|nox)(?:\s+[\w:.-]+)?"
+    r"|(?:npm|pnpm|yarn|bun)\s+run(?:\s+[\w:.-]+)?"
+    r"|(?:ba|z)?sh\s+[^\s;&|]+"
+    r"|(?:source|\.)\s+[^\s;&|]+"
+    r"|\.{1,2}/[^\s;&|]+"
+    r"|[^\s;&|]*/[\w.-]+\.(?:sh|bash)"
+    r")(?=$|[\s;&|])"
+)
+
+# Bumped when scan_native_hook() reports more, so cached scans are redone
+NATIVE_SCAN_VERSION = 2
+
+# Bumped when the fallback parser reads configs differently, so cached
+# fallback parses are redone
+FALLBACK_PARSER_VERSION = 2
+
+BLOCK_KEY = re.compile(
+    r"^(?:&(?P<anchor>[\w.-]+)\s+)?"
+    r"(?P<key>[\w.-]+|<<|\"[^\"]*\"|'[^']*'):(?:\s+(?P<value>.*))?$"
+)
+ANCHOR = re.compile(r"^&(?P<name>[\w.-]+)(?:\s+|$)")
+
+
+def hooks_dir(git_root: Path) -> Path:
+    """Directory git runs hooks from.
+
+    Uses `git rev-parse --git-path hooks`, which honours core.hooksPath
+    and resolves a linked worktree's hooks to the common git dir.
+    """
+    git_root = Path(git_root)
+    result = subprocess.run(
+        ["git", "-C", str(git_root), "rev-parse", "--git-path", "hooks"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return git_root / ".git" / "hooks"
+    return git_root / result.stdout.strip()
+
+
+def file_hash(text: str) -> str:
+    """SHA-256 of a file's content (cache key)."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _strip_comment(line: str) -> str:
+    # A "#" starts a comment at line start or after whitespace, outside quotes
+    quote = None
+    for i, char in enumerate(line):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#" and (i == 0 or line[i - 1].isspace()):
+            return line[:i]
+    return line
+
+
+def _split_flow(text: str) -> list[str]:
+    """Split flow-collection items on commas outside brackets and quotes."""
+    items, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append(text[start:i])
+            start = i + 1
+    items.append(text[start:])
+    return [item.strip() for item in items if item.strip()]
+
+
+def _flow_depth(text: str) -> int:
+    """Brackets a line leaves open, outside quotes."""
+    depth, quote = 0, None
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "[{":
+            depth += 1
+        elif char in "]}":
+            depth -= 1
+    return depth
+
+
+def _scalar(value: str):
+    if value in ("true", "True", "false", "False"):
+        return value.lower() == "true"
+    if value in ("", "~", "null"):
+        return None
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        return value[1:-1]
+    return value
+
+
+class _FallbackParser:
+    """Block-style YAML reader for pre-commit configs, without a YAML library.
+
+    Each mapping's keys are read at the column its first key starts, so
+    `-   id: eslint` items keep their later keys. Anchors, aliases and
+    merge keys are resolved; flow collections may span lines.
+    """
+
+    def __init__(self, text: str):
+        self.anchors: dict = {}
+        self.lines: list[list] = []
+        for raw in text.expandtabs().splitlines():
+            body = _strip_comment(raw).rstrip()
+            if not body.strip() or body in ("---", "..."):
+                continue
+            indent = len(body) - len(body.lstrip())
+            self.lines.append([indent, body.strip()])
+        self.i = 0
+
+    def parse(self):
+        if not self.lines:
+            return None
+        return self._node(self.lines[0][0])
+
+    def _anchor(self, value: str) -> tuple[str | None, str]:
+        match = ANCHOR.match(value)
+        if match is None:
+            return None, value
+        return match.group("name"), value[match.end():].strip()
+
+    def _node(self, indent: int):
+        """Block node starting at the current line."""
+        if self._is_item(self.lines[self.i][1]):
+            return self._sequence(indent)
+        return self._mapping(indent)
+
+    def _child(self, indent: int, allow_sequence: bool):
+        """Nested node under a key or item at `indent`, if any."""
+        if self.i >= len(self.lines):
+            return None
+        next_indent, body = self.lines[self.i]
+        if next_indent > indent or (allow_sequence and next_indent == indent and self._is_item(body)):
+            return self._node(next_indent)
+        return None
+
+    @staticmethod
+    def _is_item(body: str) -> bool:
+        return body == "-" or body.startswith("- ")
+
+    def _sequence(self, indent: int) -> list:
+        items = []
+        while self.i < len(self.lines):
+            line_indent, body = self.lines[self.i]
+            if line_indent != indent or not self._is_item(body):
+                break
+            rest = body[1:].lstrip()
+            anchor, value = self._anchor(rest)
+            if not value:
+                self.i += 1
+                node = self._child(indent, allow_sequence=False)
+            elif BLOCK_KEY.match(rest) is not None or self._is_item(rest):
+                # Inline mapping or nested sequence: its keys start at the
+                # column of the first one, wherever the dash left it
+                anchor = None
+                self.lines[self.i] = [indent + len(body) - len(rest), rest]
+                node = self._node(indent + len(body) - len(rest))
+            else:
+                node = self._value(value, indent)
+            if anchor:
+                self.anchors[anchor] = node
+            items.append(node)
+        return items
+
+    def _mapping(self, indent: int) -> dict:
+        mapping: dict = {}
+        merges: list = []
+        while self.i < len(self.lines):
+            line_indent, body = self.lines[self.i]
+            if line_indent < indent or self._is_item(body) and line_indent == indent:
+                break
+            entry = BLOCK_KEY.match(body)
+            if line_indent > indent or entry is None:
+                # Continuation of a plain multi-line scalar; nothing to read
+                self.i += 1
+                continue
+            key = _scalar(entry.group("key"))
+            if entry.group("anchor"):
+                self.anchors[entry.group("anchor")] = key
+            anchor, value = self._anchor((entry.group("value") or "").strip())
+            if value:
+                node = self._value(value, indent)
+            else:
+                self.i += 1
+                node = self._child(indent, allow_sequence=True)
+            if anchor:
+                self.anchors[anchor] = node
+            if key == "<<":
+                merges.extend(node if isinstance(node, list) else [node])
+            else:
+                mapping[key] = node
+        for merged in merges:
+            if isinstance(merged, dict):
+                for key, value in merged.items():
+                    mapping.setdefault(key, value)
+        return mapping
+
+    def _value(self, value: str, indent: int):
+        """Inline value of the current line; consumes the lines it spans."""
+        self.i += 1
+        if value[0] in "|>":
+            # Block scalar: the more-indented lines that follow
+            parts = []
+            while self.i < len(self.lines) and self.lines[self.i][0] > indent:
+                parts.append(self.lines[self.i][1])
+                self.i += 1
+            return ("\n" if value[0] == "|" else " ").join(parts)
+        if value[0] in "[{":
+            while _flow_depth(value) > 0 and self.i < len(self.lines):
+                value += " " + self.lines[self.i][1]
+                self.i += 1
+        return self._flow(value)
+
+    def _flow(self, value: str):
+        anchor, value = self._anchor(value.strip())
+        if value.startswith("*"):
+            node = self.anchors.get(value[1:].strip())
+        elif value.startswith("[") and value.endswith("]"):
+            node = [self._flow(item) for item in _split_flow(value[1:-1])]
+        elif value.startswith("{") and value.endswith("}"):
+            node = {}
+            for item in _split_flow(value[1:-1]):
+                key, sep, item_value = item.partition(":")
+                if sep:
+                    node[_scalar(key.strip())] = self._flow(item_value)
+        else:
+            node = _scalar(value)
+        if anchor:
+            self.anchors[anchor] = node
+        return node
+
+
+def _config_hooks(data) -> tuple[list[dict], list | None]:
+    """Hooks and default_stages of a loaded config."""
+    if not isinstance(data, dict):
+        return [], None
+    hooks = [
+        hook
+        for repo in data.get("repos") or []
+        if isinstance(repo, dict)
+        for hook in repo.get("hooks") or []
+        if isinstance(hook, dict) and "id" in hook
+    ]
+    default_stages = data.get("default_stages")
+    return hooks, default_stages if isinstance(default_stages, list) else None
+
+
+def _normalize_hook(hook: dict) -> dict:
+    def as_list(value) -> list[str] | None:
+        if value is None or value == "":
+            return None
+        return [str(v) for v in value] if isinstance(value, list) else [str(value)]
+
+    return {
+        "id": str(hook["id"]),
+        "args": as_list(hook.get("args")) or [],
+        "stages": as_list(hook.get("stages")),
+        "pass_filenames": hook.get("pass_filenames", True) is not False,
+        "always_run": hook.get("always_run", False) is True,
+    }
+
+
+def parse_pre_commit_config(text: str) -> dict:
+    """Hooks of a .pre-commit-config.yaml.
+
+    Returns:
+        {"parser": "yaml" | "fallback", "default_stages": list | None,
+        "hooks": [{"id", "args", "stages", "pass_filenames", "always_run"}]}
+    """
+    if yaml is not None:
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict):
+            hooks, default_stages = _config_hooks(data)
+            return {
+                "parser": "yaml",
+                "default_stages": default_stages,
+                "hooks": [_normalize_hook(h) for h in hooks],
+            }
+    hooks, default_stages = _config_hooks(_FallbackParser(text).parse())
+    return {
+        "parser": "fallback",
+        "default_stages": default_stages,
+        "hooks": [_normalize_hook(h) for h in hooks],
+    }
+
+
+def commit_hooks(config: dict) -> list[dict]:
+    """Hooks of a parsed config that run on `git commit`.
+
+    Hooks limited to other stages (pre-push, manual, ...) are left out.
+    """
+    selected = []
+    for hook in config["hooks"]:
+        stages = hook["stages"] or config["default_stages"]
+        if not stages or any(stage in COMMIT_STAGES for stage in stages):
+            selected.append(hook)
+    return selected
+
+
+def scan_native_hook(text: str) -> dict:
+    """Statically scan a native hook script for commands that rewrite files.
+
+    Commands the scan cannot see into (make, just, npm run, other scripts)
+    are listed as "unresolved" and count as possibly modifying files.
+
+    Returns:
+        {"framework_shim": bool, "delegates_to_framework": bool,
+        "formatters": [names], "unresolved": [commands], "restages": bool,
+        "may_modify_files": bool}
+    """
+    if FRAMEWORK_SHIM_MARKER in text:
+        return {
+            "framework_shim": True,
+            "delegates_to_framework": True,
+            "formatters": [],
+            "unresolved": [],
+            "restages": False,
+            "may_modify_files": False,
+        }
+
+    formatters: list[str] = []
+    unresolved: list[str] = []
+    restages = delegates = False
+    for raw in text.splitlines():
+        line = _strip_comment(raw).strip()
+        if not line:
+            continue
+        restages = restages or RESTAGE_COMMAND.search(line) is not None
+        delegates = delegates or FRAMEWORK_COMMAND.search(line) is not None
+        for match in DELEGATED_COMMAND.finditer(line):
+            command = " ".join(match["command"].split())
+            if command not in unresolved:
+                unresolved.append(command)
+        if CHECK_ONLY_FLAGS.search(line):
+            continue
+        for name, command, write_flag in NATIVE_FORMATTER_COMMANDS:
+            if name in formatters or not re.search(command, line):
+                continue
+            if write_flag is None or re.search(write_flag, line):
+                formatters.append(name)
+    return {
+        "framework_shim": False,
+        "delegates_to_framework": delegates,
+        "formatters": formatters,
+        "unresolved": unresolved,
+        "restages": restages,
+        "may_modify_files": bool(formatters) or bool(unresolved) or restages,
+    }
+
+
+def _load_cache(cache_dir: Path | None) -> dict:
+    if cache_dir is None:
+        return {}
+    try:
+        cache = json.loads((Path(cache_dir) / PRE_COMMIT_CACHE_FILE).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache_dir: Path, cache: dict) -> None:
+    directory = Path(cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / PRE_COMMIT_CACHE_FILE
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def cached_inspection(kind: str, text: str, cache_dir: Path | None) -> tuple[dict, bool]:
+    """Parse a config ("config") or scan a native hook ("native"), via the cache.
+
+    Config entries are keyed by parser too, so installing PyYAML later
+    re-parses configs the fallback read; native entries are keyed by scan
+    version.
+
+    Returns:
+        (result, whether it came from the cache)
+    """
+    if kind == "config":
+        parser = "yaml" if yaml is not None else f"fallback{FALLBACK_PARSER_VERSION}"
+        key = f"{parser}:{file_hash(text)}"
+        inspect = parse_pre_commit_config
+    elif kind == "native":
+        key = f"v{NATIVE_SCAN_VERSION}:{file_hash(text)}"
+        inspect = scan_native_hook
+    else:
+        raise ValueError(f"Unknown inspection kind: {kind!r}")
+
+    cache = _load_cache(cache_dir)
+    entries = cache.get(kind) if isinstance(cache.get(kind), dict) else {}
+    if key in entries:
+        return entries[key], True
+    result = inspect(text)
+    if cache_dir is not None:
+        # Only the current files matter; drop entries for older versions
+        cache[kind] = {key: result}
+        _save_cache(cache_dir, cache)
+    return result, False
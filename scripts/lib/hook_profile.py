@@ -0,0 +1,261 @@
+"""Timing profile of a repository's pre-commit hooks.
+
+Runs the hooks once in a scratch worktree (a detached checkout of HEAD
+with its own index), so formatters that rewrite files never touch the
+user's working tree. A .pre-commit-config.yaml that is untracked or edited
+since HEAD is copied into the scratch worktree, so the profile times the
+hooks the next commit will actually run. The pre-commit framework runs with
+`pre-commit run --all-files --verbose`, which reports per-hook durations
+and whether a hook modified files. A native hook is timed as a whole, with
+the files HEAD changed staged so hooks that read the staged files have a
+real commit's worth of work.
+
+The profile lets the workflow predict commit cost and flags slow hooks
+that run on the whole repository instead of the staged files.
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from scripts.lib.hook_config import parse_pre_commit_config
+
+# Hooks slower than this many seconds are reported as slow
+SLOW_HOOK_SECONDS = 5.0
+
+# Default limit for the whole profiling run (first runs install hook
+# environments, which can take minutes)
+DEFAULT_PROFILE_TIMEOUT = 600
+
+STATUS_LINE = re.compile(r"^(?P<name>.+?)\.{2,}(?:\(.*\))?(?P<status>Passed|Failed|Skipped)\s*$")
+DETAIL_LINE = re.compile(r"^- (?P<key>[a-z ]+?)(?::\s*(?P<value>.*))?$")
+
+
+def whole_repo_hooks(config_text: str) -> set[str]:
+    """IDs of hooks that ignore the staged files.
+
+    A hook with `pass_filenames: false` or `always_run: true` checks the
+    whole repository on every commit, however small the change.
+    """
+    return {
+        hook["id"]
+        for hook in parse_pre_commit_config(config_text)["hooks"]
+        if not hook["pass_filenames"] or hook["always_run"]
+    }
+
+
+def parse_pre_commit_output(output: str) -> list[dict]:
+    """Per-hook results from `pre-commit run --verbose` output.
+
+    Returns:
+        List of {"id", "name", "status", "duration", "modifies_files"};
+        duration is None for skipped hooks
+    """
+    hooks: list[dict] = []
+    for line in output.splitlines():
+        status = STATUS_LINE.match(line.strip())
+        if status is not None:
+            name = status.group("name").strip()
+            hooks.append({
+                "id": name,
+                "name": name,
+                "status": status.group("status").lower(),
+                "duration": None,
+                "modifies_files": False,
+            })
+            continue
+        detail = DETAIL_LINE.match(line.strip())
+        if detail is None or not hooks:
+            continue
+        key, value = detail.group("key"), detail.group("value")
+        if key == "hook id" and value:
+            hooks[-1]["id"] = value.strip()
+        elif key == "duration" and value:
+            try:
+                hooks[-1]["duration"] = float(value.strip().rstrip("s"))
+            except ValueError:
+                pass
+        elif key == "files were modified by this hook":
+            hooks[-1]["modifies_files"] = True
+    return hooks
+
+
+def _git(worktree: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], cwd=worktree, capture_output=True, text=True)
+
+
+def _tree_state(worktree: Path) -> str:
+    """Staged and unstaged changes plus untracked files, to spot rewrites."""
+    return "\0".join(
+        _git(worktree, *args).stdout
+        for args in (
+            ("diff", "--cached", "--binary"),
+            ("diff", "--binary"),
+            ("ls-files", "--others", "--exclude-standard"),
+        )
+    )
+
+
+def _stage_head_changes(worktree: Path) -> int | None:
+    """Stage the files HEAD changed, as if HEAD were about to be committed.
+
+    The scratch worktree's HEAD moves to HEAD's parent (or an unborn
+    branch for a root commit) while its index and files stay at HEAD, so
+    hooks reading `git diff --cached` see a real commit's staged set.
+
+    Returns:
+        Number of staged files, or None if they could not be staged
+    """
+    if _git(worktree, "rev-parse", "--verify", "--quiet", "HEAD^").returncode == 0:
+        moved = _git(worktree, "reset", "--soft", "--quiet", "HEAD^")
+    else:
+        # Never written as a ref: the branch is unborn until a commit
+        moved = _git(worktree, "checkout", "--quiet", "--orphan", f"deep-implement-profile-{os.getpid()}")
+    if moved.returncode != 0:
+        return None
+    return len(_git(worktree, "diff", "--cached", "--name-only").stdout.splitlines())
+
+
+def _sync_config(git_root: Path, worktree: Path, config_file: Path) -> bool:
+    """Copy the working-tree config into the worktree if HEAD's differs.
+
+    The copy is staged in the worktree's own index, as pre-commit expects.
+
+    Returns:
+        Whether the working-tree config was copied
+    """
+    try:
+        relative = config_file.resolve().relative_to(git_root.resolve())
+    except ValueError:
+        relative = Path(config_file.name)
+    target = worktree / relative
+    text = config_file.read_text()
+    if target.is_file() and target.read_text() == text:
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text)
+    subprocess.run(["git", "add", "--", str(relative)], cwd=worktree, capture_output=True)
+    return True
+
+
+def _run_timed(command: list[str], worktree: Path, timeout: float) -> tuple[float, str, int | None]:
+    env = {k: v for k, v in os.environ.items() if not k.startswith("GIT_")}
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            command,
+            cwd=worktree,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=env,
+        )
+        output, code = result.stdout + result.stderr, result.returncode
+    except subprocess.TimeoutExpired as e:
+        output, code = str(e.stdout or ""), None
+    return time.perf_counter() - start, output, code
+
+
+def _summarize(tool: str, hooks: list[dict], total: float, whole_repo: set[str]) -> dict:
+    for hook in hooks:
+        hook["whole_repo"] = hook["id"] in whole_repo
+    slow = [h["id"] for h in hooks if (h["duration"] or 0) >= SLOW_HOOK_SECONDS]
+    return {
+        "tool": tool,
+        "total_seconds": round(total, 2),
+        "hooks": hooks,
+        "slow_hooks": slow,
+        "modifying_hooks": [h["id"] for h in hooks if h["modifies_files"]],
+        # Every commit pays at least this; file-based hooks scale with the change
+        "whole_repo_seconds": round(sum(h["duration"] or 0 for h in hooks if h["whole_repo"]), 2),
+        "scope_to_staged": [h["id"] for h in hooks if h["whole_repo"] and h["id"] in slow],
+    }
+
+
+def profile_pre_commit_hooks(
+    git_root: Path,
+    pre_commit: dict,
+    *,
+    timeout: float = DEFAULT_PROFILE_TIMEOUT,
+) -> dict:
+    """Run the hooks once in a scratch worktree and time them.
+
+    Args:
+        git_root: Repository root
+        pre_commit: Detection result from check_pre_commit_hooks()
+        timeout: Seconds before the hook run is abandoned
+
+    Returns:
+        {"tool", "total_seconds", "hooks": [{"id", "name", "status",
+        "duration", "modifies_files", "whole_repo"}], "slow_hooks",
+        "modifying_hooks", "whole_repo_seconds", "scope_to_staged"}, plus
+        "uncommitted_config": true when the working-tree config was used;
+        a native hook's profile adds "staged_files" (how many of HEAD's
+        changes were staged for it), or "approximate": true if none could
+        be. {"error": str} if the hooks could not be run
+    """
+    if not pre_commit.get("present"):
+        return {"error": "No pre-commit hooks detected"}
+    use_framework = pre_commit.get("config_file") is not None
+    if use_framework and shutil.which("pre-commit") is None:
+        return {"error": "pre-commit is not installed"}
+
+    scratch = Path(tempfile.mkdtemp(prefix="deep-implement-hooks-")) / "worktree"
+    added = subprocess.run(
+        ["git", "-C", str(git_root), "worktree", "add", "--detach", "--quiet", str(scratch), "HEAD"],
+        capture_output=True,
+        text=True,
+    )
+    if added.returncode != 0:
+        shutil.rmtree(scratch.parent, ignore_errors=True)
+        return {"error": f"Could not create scratch worktree: {added.stderr.strip()}"}
+
+    uncommitted_config = False
+    staged_files = None
+    try:
+        if use_framework:
+            config_file = Path(pre_commit["config_file"])
+            uncommitted_config = _sync_config(Path(git_root), scratch, config_file)
+            total, output, code = _run_timed(
+                ["pre-commit", "run", "--all-files", "--verbose"], scratch, timeout
+            )
+            hooks = parse_pre_commit_output(output)
+            whole_repo = whole_repo_hooks(config_file.read_text())
+            tool = "pre-commit"
+        else:
+            staged_files = _stage_head_changes(scratch)
+            before = _tree_state(scratch)
+            total, output, code = _run_timed([pre_commit["native_hook"]], scratch, timeout)
+            modified = _tree_state(scratch) != before
+            hooks = [{
+                "id": "pre-commit",
+                "name": "native pre-commit hook",
+                "status": "passed" if code == 0 else "failed",
+                "duration": round(total, 2),
+                "modifies_files": modified,
+            }]
+            # A native hook cannot be scoped per file from outside
+            whole_repo = {"pre-commit"}
+            tool = "native-hook"
+        if code is None:
+            return {"error": f"Hooks did not finish within {timeout:g}s"}
+        profile = _summarize(tool, hooks, total, whole_repo)
+        if uncommitted_config:
+            profile["uncommitted_config"] = True
+        if tool == "native-hook":
+            if staged_files is None:
+                # Nothing was staged, so the run says little about a commit
+                profile["approximate"] = True
+            else:
+                profile["staged_files"] = staged_files
+        return profile
+    finally:
+        subprocess.run(
+            ["git", "-C", str(git_root), "worktree", "remove", "--force", str(scratch)],
+            capture_output=True,
+        )
+        shutil.rmtree(scratch.parent, ignore_errors=True)
@@ -5,8 +5,9 @@ implementation workflow. Tasks are generated based on these definitions
 and written directly to the task storage.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
+from typing import Self
 
 
 class TaskStatus(StrEnum):
@@ -39,6 +40,21 @@ SECTION_STEP_IDS = [
     "record_completion",
 ]
 
+# Optional step used by pipelined review: capture the section's staged diff
+# so the next section can start implementing while this one is reviewed
+CAPTURE_DIFF_STEP_ID = "capture_diff"
+
+# Execution order of every step a section can have
+STEP_ORDER = [
+    "implement",
+    CAPTURE_DIFF_STEP_ID,
+    "review_subagent",
+    "review_interview",
+    "update_docs",
+    "commit",
+    "record_completion",
+]
+
 # Template definitions for each step type
 # {section} is replaced with section name (e.g., "section-01-foundation")
 # {display_name} is replaced with human-readable name (e.g., "section 01: foundation")
@@ -48,6 +64,14 @@ SECTION_STEP_DEFINITIONS: dict[str, TaskDefinition] = {
         description="Implement the code changes described in {section}",
         active_form="Implementing {display_name}",
     ),
+    CAPTURE_DIFF_STEP_ID: TaskDefinition(
+        subject="Capture {section} diff",
+        description=(
+            "Stage only this section's files and write its diff "
+            "(git diff --staged -- <section files>) for review"
+        ),
+        active_form="Capturing {display_name} diff",
+    ),
     "review_subagent": TaskDefinition(
         subject="Run code review subagent for {section}",
         description="Run the code review subagent on implemented changes",
@@ -75,6 +99,50 @@ SECTION_STEP_DEFINITIONS: dict[str, TaskDefinition] = {
     ),
 }
 
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SectionProfile:
+    """Step pipeline used for a kind of section."""
+
+    steps: tuple[str, ...]  # Subset of SECTION_STEP_IDS, in execution order
+    overrides: dict[str, TaskDefinition] = field(default_factory=dict)  # Merged steps
+
+
+# Per-section pipelines, selected with "profile=<name>" in the manifest
+# (or inferred from the files a section touches).
+# light: small config changes - no review subagent or interview
+# docs: documentation-only sections - the docs update is the implementation
+DEFAULT_SECTION_PROFILE = "full"
+SECTION_PROFILES: dict[str, SectionProfile] = {
+    "full": SectionProfile(steps=tuple(SECTION_STEP_IDS)),
+    "light": SectionProfile(
+        steps=("implement", "update_docs", "commit", "record_completion"),
+        overrides={
+            "implement": TaskDefinition(
+                subject="Implement {section}",
+                description=(
+                    "Implement the changes described in {section} and self-review the diff "
+                    "(light profile: no review subagent or interview)"
+                ),
+                active_form="Implementing {display_name}",
+            ),
+        },
+    ),
+    "docs": SectionProfile(
+        steps=("implement", "commit", "record_completion"),
+        overrides={
+            "implement": TaskDefinition(
+                subject="Write {section} documentation",
+                description=(
+                    "Write the documentation described in {section} "
+                    "(docs profile: this step includes the documentation update)"
+                ),
+                active_form="Writing {display_name} documentation",
+            ),
+        },
+    ),
+}
+
 # Compaction prompt task - added only every 2nd section
 COMPACTION_TASK = TaskDefinition(
     subject="Prompt user for compaction after {section}",
@@ -89,6 +157,23 @@ FINALIZATION_TASK = TaskDefinition(
     active_form="Reading finalization.md and generating usage documentation",
 )
 
+# Placeholder standing in for sections beyond the task window
+WINDOW_PLACEHOLDER_TASK = TaskDefinition(
+    subject="Implement remaining {count} sections ({first} .. {last})",
+    description=(
+        "Placeholder for sections not yet materialized: {sections}. "
+        "The task window advances when setup is re-run or a section completion is recorded."
+    ),
+    active_form="Implementing remaining sections",
+)
+
+# Summary standing in for a run of consecutive completed sections
+COMPLETED_SUMMARY_TASK = TaskDefinition(
+    subject="Completed {count} sections ({first} .. {last})",
+    description="Completed and committed: {commits}",
+    active_form="Summarizing completed sections",
+)
+
 # Maps resume_step from detect_section_review_state to which steps are complete
 # Key: resume_step value
 # Value: set of step_ids that are complete when resuming at this step
@@ -98,10 +183,10 @@ FINALIZATION_TASK = TaskDefinition(
 # commit was made but record_completion wasn't run (crash between commit and record).
 RESUME_STEP_COMPLETE_MAPPING: dict[str, set[str]] = {
     "implement": set(),  # Nothing complete yet
-    "review": {"implement"},  # Implementation done, starting review
-    "interview": {"implement", "review_subagent"},  # Review done, starting interview
-    "apply_fixes": {"implement", "review_subagent"},  # Interview recorded, restart applying fixes
-    "commit": {"implement", "review_subagent", "review_interview", "update_docs"},  # Commit done, need to record
+    "review": {"implement", CAPTURE_DIFF_STEP_ID},  # Diff captured, starting review
+    "interview": {"implement", CAPTURE_DIFF_STEP_ID, "review_subagent"},  # Review done, starting interview
+    "apply_fixes": {"implement", CAPTURE_DIFF_STEP_ID, "review_subagent"},  # Interview recorded, restart applying fixes
+    "commit": {"implement", CAPTURE_DIFF_STEP_ID, "review_subagent", "review_interview", "update_docs"},  # Commit done, need to record
 }
 
 # Context items stored at the start of the task list (as completed tasks)
@@ -116,6 +201,155 @@ CONTEXT_ITEM_KEYS = [
 ]
 
 
+# Semantic IDs identify tasks independently of their list position.
+# Section steps use "<section>:<step_id>", so compaction after a section
+# is "<section>:compaction".
+COMPACTION_STEP_ID = "compaction"
+CONTEXT_ID_PREFIX = "context:"
+FINALIZATION_ID = "finalization"
+WINDOW_PLACEHOLDER_ID = "window:remaining"
+SUMMARY_ID_PREFIX = "summary:"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TaskOptions:
+    """Optional task list settings read from the PROJECT_CONFIG block.
+
+    Recognized keys:
+        task_window: Fully materialize only the current section and the
+            next N; later sections collapse into one placeholder task
+        collapse_completed: Render each run of completed sections as a
+            single completed summary task
+        stable_task_ids: Keep each task at the position its semantic ID
+            held last run, so adding or removing sections only rewrites
+            the affected task files
+        infer_section_profiles: Pick a light or docs step pipeline for
+            sections that only touch config or documentation files
+        compaction_budget: Token budget between compaction prompts;
+            compaction is scheduled from per-section token estimates
+            instead of every 2nd section
+        infer_dependencies: Without depends= annotations, derive section
+            dependencies from file overlaps so non-conflicting sections
+            run in parallel lanes
+        pipelined_review: Let the next section start implementing once
+            this section's diff is captured, overlapping its review
+        lanes: Number of agents working concurrently; sections are
+            scheduled across this many lanes, longest critical path first
+    """
+
+    window: int | None = None
+    collapse_completed: bool = False
+    stable_ids: bool = False
+    infer_profiles: bool = False
+    compaction_budget: int | None = None
+    infer_dependencies: bool = False
+    pipelined_review: bool = False
+    lanes: int | None = None
+
+    @classmethod
+    def from_project_config(cls, project_config: dict[str, str]) -> Self:
+        """Parse task options from PROJECT_CONFIG values.
+
+        Raises:
+            ValueError: If a value is malformed
+        """
+        window = None
+        raw_window = project_config.get("task_window", "").strip()
+        if raw_window:
+            if not raw_window.isdigit():
+                raise ValueError(
+                    f"PROJECT_CONFIG task_window must be a non-negative integer, got: {raw_window}"
+                )
+            window = int(raw_window)
+        compaction_budget = None
+        raw_budget = project_config.get("compaction_budget", "").strip().replace("_", "")
+        if raw_budget:
+            if not raw_budget.isdigit() or int(raw_budget) == 0:
+                raise ValueError(
+                    f"PROJECT_CONFIG compaction_budget must be a positive integer, got: {raw_budget}"
+                )
+            compaction_budget = int(raw_budget)
+        lanes = None
+        raw_lanes = project_config.get("lanes", "").strip()
+        if raw_lanes:
+            if not raw_lanes.isdigit() or int(raw_lanes) == 0:
+                raise ValueError(
+                    f"PROJECT_CONFIG lanes must be a positive integer, got: {raw_lanes}"
+                )
+            lanes = int(raw_lanes)
+        return cls(
+            window=window,
+            collapse_completed=_parse_bool(project_config, "collapse_completed"),
+            stable_ids=_parse_bool(project_config, "stable_task_ids"),
+            infer_profiles=_parse_bool(project_config, "infer_section_profiles"),
+            compaction_budget=compaction_budget,
+            infer_dependencies=_parse_bool(project_config, "infer_dependencies"),
+            pipelined_review=_parse_bool(project_config, "pipelined_review"),
+            lanes=lanes,
+        )
+
+
+def _parse_bool(project_config: dict[str, str], key: str) -> bool:
+    """Parse a yes/no PROJECT_CONFIG value (missing means False).
+
+    Raises:
+        ValueError: If the value is not a recognized boolean
+    """
+    raw = project_config.get(key, "").strip().lower()
+    if raw in ("", "false", "no", "off", "0"):
+        return False
+    if raw in ("true", "yes", "on", "1"):
+        return True
+    raise ValueError(f"PROJECT_CONFIG {key} must be true or false, got: {raw}")
+
+
+def section_steps(profile: str) -> tuple[str, ...]:
+    """Step IDs of a section profile.
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile not in SECTION_PROFILES:
+        raise ValueError(
+            f"Unknown section profile: {profile} (expected one of {', '.join(SECTION_PROFILES)})"
+        )
+    return SECTION_PROFILES[profile].steps
+
+
+def pipelined_steps(steps: tuple[str, ...]) -> tuple[str, ...]:
+    """Insert the capture_diff step after implement for reviewed sections."""
+    if "review_subagent" not in steps or CAPTURE_DIFF_STEP_ID in steps:
+        return steps
+    index = steps.index("implement") + 1
+    return steps[:index] + (CAPTURE_DIFF_STEP_ID,) + steps[index:]
+
+
+def section_task_id(section: str, step_id: str) -> str:
+    """Semantic ID for one step of a section (e.g. "section-01-foundation:commit")."""
+    return f"{section}:{step_id}"
+
+
+def summary_task_id(first: str) -> str:
+    """Semantic ID for the summary of the completed run starting at first.
+
+    The run's last section is left out, so the summary keeps its ID (and
+    its stable position) as more sections of the run complete.
+    """
+    return f"{SUMMARY_ID_PREFIX}{first}"
+
+
+def parse_summary_task_id(semantic_id: str) -> str | None:
+    """First section of the run a summary semantic ID stands for."""
+    if not semantic_id.startswith(SUMMARY_ID_PREFIX):
+        return None
+    return semantic_id[len(SUMMARY_ID_PREFIX):]
+
+
+def context_task_id(key: str) -> str:
+    """Semantic ID for a context item task."""
+    return f"{CONTEXT_ID_PREFIX}{key}"
+
+
 def format_display_name(section: str) -> str:
     """Convert section name to human-readable display name.
 
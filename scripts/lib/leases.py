@@ -0,0 +1,396 @@
+"""Lease files for coordinating several sessions on one plan.
+
+A lease is a small JSON file created with O_CREAT | O_EXCL, so exactly one
+session can hold it. Holders renew it with heartbeats; a lease whose last
+heartbeat is older than its TTL is stale and can be reclaimed by another
+session. Section claims live in {state_dir}/leases.
+"""
+
+import json
+import os
+import socket
+import tempfile
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+LEASES_DIRNAME = "leases"
+LEASE_SUFFIX = ".lease"
+
+# Seconds without a heartbeat before a lease can be reclaimed
+DEFAULT_LEASE_TTL = 30 * 60
+
+# Seconds between attempts while waiting for a held lease
+POLL_INTERVAL = 0.1
+
+# Create-or-reclaim rounds in one acquire_lease call
+RECLAIM_ATTEMPTS = 3
+
+
+class LeaseBusyError(Exception):
+    """A lease stayed held by another owner for the whole wait."""
+
+    def __init__(self, name: str, holder: dict | None) -> None:
+        self.name = name
+        self.holder = holder
+        owner = holder.get("owner", "unknown") if holder else "unknown"
+        super().__init__(f"Lease {name} is held by {owner}")
+
+
+def leases_dir(state_dir: Path) -> Path:
+    """Directory holding the section claim leases."""
+    return Path(state_dir) / LEASES_DIRNAME
+
+
+def lease_path(directory: Path, name: str) -> Path:
+    """Path of the lease file for a name."""
+    return Path(directory) / f"{name}{LEASE_SUFFIX}"
+
+
+def read_lease(directory: Path, name: str) -> dict | None:
+    """Read a lease, or None if it does not exist or cannot be parsed."""
+    try:
+        return json.loads(lease_path(directory, name).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def is_expired(lease: dict, now: float | None = None) -> bool:
+    """Whether a lease's last heartbeat is older than its TTL."""
+    now = time.time() if now is None else now
+    return now > lease.get("heartbeat_at", 0) + lease.get("ttl", DEFAULT_LEASE_TTL)
+
+
+def acquire_lease(
+    directory: Path,
+    name: str,
+    owner: str,
+    *,
+    ttl: float = DEFAULT_LEASE_TTL,
+    now: float | None = None,
+) -> dict | None:
+    """Take a lease, reclaiming it if the current holder went stale.
+
+    Re-acquiring a lease the owner already holds renews it.
+
+    Args:
+        directory: Directory holding lease files
+        name: Lease name (e.g. a section name)
+        owner: Identifier of the claiming session
+        ttl: Seconds the lease stays valid without a heartbeat
+        now: Current time (for tests)
+
+    Returns:
+        The lease, or None if another owner holds a live lease
+    """
+    now = time.time() if now is None else now
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    lease = {"name": name, "owner": owner, "acquired_at": now, "heartbeat_at": now, "ttl": ttl}
+
+    # Reclaiming and re-creating take separate attempts; a reclaim lost to
+    # another session is simply retried against whatever is there now
+    for _ in range(RECLAIM_ATTEMPTS):
+        if _create_exclusive(lease_path(directory, name), lease):
+            return lease
+        current = read_lease(directory, name)
+        if current is None:
+            # Unreadable lease: treat as stale once it is older than a TTL
+            try:
+                age = now - lease_path(directory, name).stat().st_mtime
+            except OSError:
+                continue
+            if age <= ttl:
+                return None
+            _reclaim(directory, name, None)
+            continue
+        if current.get("owner") == owner:
+            return renew_lease(directory, name, owner, now=now)
+        if not is_expired(current, now):
+            return None
+        _reclaim(directory, name, current)
+    return None
+
+
+def renew_lease(
+    directory: Path,
+    name: str,
+    owner: str,
+    *,
+    now: float | None = None,
+) -> dict | None:
+    """Record a heartbeat on a lease held by owner.
+
+    The heartbeat is written to a temporary file that replaces the lease
+    file atomically, so the lease path exists throughout and no other
+    session can create it mid-renewal. The lease file is checked to be the
+    one that was read just before it is replaced, so a lease another
+    session reclaimed and re-created in the meantime is not overwritten.
+
+    Returns:
+        The renewed lease, or None if owner does not hold it
+    """
+    path = lease_path(directory, name)
+    inspected = _inspect(path)
+    if inspected is None:
+        return None
+    stat, content, current = inspected
+    if current is None or current.get("owner") != owner:
+        return None
+    current["heartbeat_at"] = time.time() if now is None else now
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(current, f)
+        if not _is_same_file(path, stat, content):
+            # Another session reclaimed the lease since it was read
+            return None
+        os.replace(tmp_path, path)
+    finally:
+        _unlink_quietly(Path(tmp_path))
+    return current
+
+
+def release_lease(directory: Path, name: str, owner: str | None = None) -> bool:
+    """Delete a lease.
+
+    The lease file is pinned (see _pin) before it is deleted, so a lease
+    another session reclaimed and re-created in the meantime is kept.
+
+    Args:
+        directory: Directory holding lease files
+        name: Lease name
+        owner: Only release if held by this owner (None releases any holder)
+
+    Returns:
+        True if a lease was removed
+    """
+    pinned = _pin(
+        directory,
+        name,
+        lambda lease: lease is not None and (owner is None or lease.get("owner") == owner),
+    )
+    if pinned is None:
+        return False
+    _unlink_quietly(pinned[0])
+    return True
+
+
+def active_leases(directory: Path, now: float | None = None) -> dict[str, dict]:
+    """Live (unexpired) leases in a directory.
+
+    Returns:
+        Dict of lease name -> lease
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return {}
+    leases: dict[str, dict] = {}
+    for path in sorted(directory.glob(f"*{LEASE_SUFFIX}")):
+        name = path.name.removesuffix(LEASE_SUFFIX)
+        lease = read_lease(directory, name)
+        if lease is not None and not is_expired(lease, now):
+            leases[name] = lease
+    return leases
+
+
+def process_owner() -> str:
+    """Owner identifier unique to this process ("host:pid")."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def lock_owner() -> str:
+    """Owner identifier unique to one lock acquisition ("host:pid:token").
+
+    Re-acquiring a lease as the same owner renews it, so a lock held with
+    process_owner() would let a nested acquisition in the same process (or
+    another thread) through, and release the lock under the outer holder.
+    """
+    return f"{process_owner()}:{uuid.uuid4().hex}"
+
+
+@contextmanager
+def hold_lease(
+    directory: Path,
+    name: str,
+    owner: str,
+    *,
+    ttl: float,
+    wait: float,
+) -> Iterator[dict]:
+    """Hold a lease for the duration of a with-block.
+
+    Polls until the lease is free (or its holder went stale), giving up
+    after `wait` seconds. The lease is released when the block exits.
+
+    Raises:
+        LeaseBusyError: If the lease is still held after waiting
+    """
+    deadline = time.monotonic() + wait
+    while (lease := acquire_lease(directory, name, owner, ttl=ttl)) is None:
+        if time.monotonic() >= deadline:
+            raise LeaseBusyError(name, read_lease(directory, name))
+        time.sleep(POLL_INTERVAL)
+    try:
+        yield lease
+    finally:
+        release_lease(directory, name, owner)
+
+
+def section_claims(state_dir: Path, now: float | None = None) -> dict[str, str]:
+    """Sections currently claimed by a session.
+
+    Returns:
+        Dict of section name -> owner of its live lease
+    """
+    return {
+        name: lease["owner"]
+        for name, lease in active_leases(leases_dir(state_dir), now).items()
+    }
+
+
+def claim_next_section(
+    state_dir: Path,
+    candidates: list[str],
+    owner: str,
+    *,
+    ttl: float = DEFAULT_LEASE_TTL,
+    now: float | None = None,
+) -> dict | None:
+    """Claim the first candidate section no other session holds.
+
+    A section the owner already holds is returned first, so repeating a
+    claim is idempotent.
+
+    Args:
+        state_dir: Path to state directory
+        candidates: Claimable sections in preference order
+        owner: Identifier of the claiming session
+        ttl: Seconds the claim stays valid without a heartbeat
+        now: Current time (for tests)
+
+    Returns:
+        The acquired lease, or None if every candidate is claimed
+    """
+    directory = leases_dir(state_dir)
+    held = [s for s, holder in section_claims(state_dir, now).items() if holder == owner]
+    for section in [s for s in candidates if s in held] + candidates:
+        lease = acquire_lease(directory, section, owner, ttl=ttl, now=now)
+        if lease is not None:
+            return lease
+    return None
+
+
+def _create_exclusive(path: Path, lease: dict) -> bool:
+    """Create the lease file only if it does not exist yet."""
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w") as f:
+        json.dump(lease, f)
+    return True
+
+
+def _inspect(path: Path) -> tuple[os.stat_result, str, dict | None] | None:
+    """Stat, raw content and parsed lease (None if unparsable) of a lease file.
+
+    Returns:
+        The tuple, or None if the file does not exist
+    """
+    try:
+        with open(path) as f:
+            stat = os.fstat(f.fileno())
+            content = f.read()
+    except OSError:
+        return None
+    try:
+        lease = json.loads(content)
+    except json.JSONDecodeError:
+        lease = None
+    return stat, content, lease
+
+
+def _is_same_file(path: Path, inspected: os.stat_result, content: str) -> bool:
+    """Whether path is still the file inspected earlier.
+
+    Inodes can be reused by a re-created lease, so the content is compared
+    too.
+    """
+    try:
+        current = os.stat(path)
+        if (current.st_dev, current.st_ino) != (inspected.st_dev, inspected.st_ino):
+            return False
+        return path.read_text() == content
+    except OSError:
+        return False
+
+
+def _pin(
+    directory: Path,
+    name: str,
+    accept: Callable[[dict | None], bool],
+) -> tuple[Path, dict | None] | None:
+    """Move a lease file to a private name if its content is accepted.
+
+    The file is inspected (inode and content, None if unparsable), checked
+    with accept(), then renamed to a unique private name, which only one
+    session can do. If the file that got moved is not the one inspected
+    (another session reclaimed and re-created the lease in between; inodes
+    can be reused, so the content is compared too), it is linked back into
+    place. Losing any of these races means another session got there
+    first.
+
+    Returns:
+        Tuple of (private path, lease), or None if the lease was not
+        accepted or the race was lost. The caller unlinks the private path.
+    """
+    path = lease_path(directory, name)
+    inspected = _inspect(path)
+    if inspected is None:
+        return None
+    stat, content, lease = inspected
+    if not accept(lease):
+        return None
+
+    private = path.with_name(f".{path.name}.{os.getpid()}.{time.monotonic_ns()}.pinned")
+    try:
+        os.rename(path, private)
+    except OSError:
+        return None
+    if not _is_same_file(private, stat, content):
+        try:
+            os.link(private, path)
+        except OSError:
+            # A third session already re-created the lease; its file wins
+            pass
+        _unlink_quietly(private)
+        return None
+    return private, lease
+
+
+def _reclaim(directory: Path, name: str, stale: dict | None) -> bool:
+    """Move a stale lease out of the way so it can be re-created.
+
+    The file judged stale is pinned (see _pin) and deleted only if it
+    still holds the stale content; None accepts any content, for
+    unreadable leases. Losing the race means another session got there
+    first, so the caller retries.
+
+    Returns:
+        True if the stale lease was removed
+    """
+    pinned = _pin(directory, name, lambda lease: stale is None or lease == stale)
+    if pinned is None:
+        return False
+    _unlink_quietly(pinned[0])
+    return True
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except OSError:
+        pass
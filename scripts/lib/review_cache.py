@@ -0,0 +1,142 @@
+"""Content-addressed cache of code-reviewer outputs.
+
+A review depends only on the diff it read and the section plan it
+compared against, so it is cached under the SHA-256 of both. When a
+session crashes after the reviewer finished, or a section is re-run with
+an identical diff, the cached review is restored as section-NN-review.md
+and the workflow continues at the interview instead of re-running the
+reviewer. Entries live in {state_dir}/review_cache/<key>.md, with the
+structured findings (if any) in <key>.findings.json.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from scripts.lib.review_findings import findings_path, restore_findings, save_findings
+from scripts.lib.review_state import code_review_dir, section_number
+
+REVIEW_CACHE_DIRNAME = "review_cache"
+
+
+def review_cache_dir(state_dir: Path) -> Path:
+    """Directory holding cached reviews."""
+    return Path(state_dir) / REVIEW_CACHE_DIRNAME
+
+
+def review_cache_key(diff_text: str, plan_text: str) -> str:
+    """Cache key of a review: SHA-256 over the hashes of diff and plan."""
+    digest = hashlib.sha256()
+    for part in (diff_text, plan_text):
+        digest.update(hashlib.sha256(part.encode()).digest())
+    return digest.hexdigest()
+
+
+def review_file(state_dir: Path, section: str) -> Path:
+    """The section's review file (section-NN-review.md)."""
+    return code_review_dir(state_dir) / f"section-{section_number(section)}-review.md"
+
+
+def section_cache_key(state_dir: Path, sections_dir: Path, section: str) -> str | None:
+    """Cache key for a section's current diff and plan.
+
+    Returns:
+        The key, or None if the diff or the section plan is missing
+    """
+    diff_path = code_review_dir(state_dir) / f"section-{section_number(section)}-diff.md"
+    plan_path = Path(sections_dir) / f"{section}.md"
+    try:
+        return review_cache_key(diff_path.read_text(), plan_path.read_text())
+    except FileNotFoundError:
+        return None
+
+
+def cached_review(state_dir: Path, key: str) -> str | None:
+    """Cached review text for a key, or None on a miss (or unreadable entry)."""
+    try:
+        return (review_cache_dir(state_dir) / f"{key}.md").read_text()
+    except (OSError, ValueError):
+        return None
+
+
+def cached_findings(state_dir: Path, key: str) -> str | None:
+    """Cached findings JSON for a key, or None if none were stored."""
+    try:
+        return (review_cache_dir(state_dir) / f"{key}.findings.json").read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def store_review(state_dir: Path, key: str, review_text: str, findings_json: str | None = None) -> Path:
+    """Atomically store a review (and its findings JSON) under its key."""
+    directory = review_cache_dir(state_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{key}.md"
+    if findings_json is not None:
+        _write_atomic(directory / f"{key}.findings.json", findings_json)
+    _write_atomic(path, review_text)
+    return path
+
+
+def cache_section_review(state_dir: Path, sections_dir: Path, section: str) -> str | None:
+    """Store the section's written review and findings under its diff and plan key.
+
+    Returns:
+        The key, or None if the diff, plan or review file is missing
+    """
+    key = section_cache_key(state_dir, sections_dir, section)
+    path = review_file(state_dir, section)
+    if key is None or not path.exists():
+        return None
+    findings = findings_path(state_dir, section)
+    store_review(state_dir, key, path.read_text(), findings.read_text() if findings.exists() else None)
+    return key
+
+
+def restore_cached_review(state_dir: Path, sections_dir: Path, section: str) -> bool:
+    """Write a cached review as section-NN-review.md if the diff and plan match.
+
+    Cached findings are restored too (and indexed), all open again: triage
+    decisions from the earlier run are not carried over. An existing review
+    file is never overwritten, and a corrupt cache entry counts as a miss.
+
+    Returns:
+        True if a cached review was restored
+    """
+    path = review_file(state_dir, section)
+    if path.exists():
+        return False
+    key = section_cache_key(state_dir, sections_dir, section)
+    review = cached_review(state_dir, key) if key is not None else None
+    if review is None:
+        return False
+    restored = None
+    try:
+        findings = cached_findings(state_dir, key)
+        if findings is not None:
+            data = json.loads(findings)
+            if not isinstance(data, dict):
+                return False
+            restored = restore_findings(data.get("findings", []))
+    except (OSError, ValueError):
+        return False
+    if restored is not None:
+        for finding in restored:
+            finding.status = "open"
+            finding.note = ""
+        save_findings(state_dir, section, restored)
+    path.write_text(review)
+    return True
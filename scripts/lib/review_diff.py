@@ -0,0 +1,230 @@
+"""Lean staged diffs for the code-reviewer subagent.
+
+Builds the review diff of a section from `git diff --staged` with rename
+and copy detection, leaving out files that only add noise to the
+reviewer's context:
+
+- files matching exclude globs (lockfiles, snapshots, generated code)
+- binary files
+- files whose changes are whitespace-only (formatter churn)
+
+Every staged file, including the omitted ones, is listed in a --numstat
+header at the top of the diff so the reviewer still sees the full scope.
+
+The index tree (`git write-tree`) is recorded at each capture. A later
+delta diff against that tree shows only what changed since the review,
+e.g. the fixes applied after the interview.
+"""
+
+import subprocess
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+
+# Globs left out of review diffs unless --no-default-excludes is given.
+# A pattern without "/" matches the file name in any directory.
+DEFAULT_REVIEW_EXCLUDES = (
+    "*.lock",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "go.sum",
+    "*.snap",
+    "__snapshots__/*",
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*_pb2.py",
+    "*_pb2_grpc.py",
+    "*.pb.go",
+    "*.generated.*",
+)
+
+RENAME_FLAGS = ("-M", "-C")
+
+
+@dataclass(slots=True)
+class NumstatEntry:
+    """One line of `git diff --numstat`."""
+
+    path: str
+    added: int | None  # None for binary files
+    deleted: int | None
+    old_path: str | None = None  # Set for renames and copies
+    omitted: str | None = None  # Why the file is left out of the diff body
+
+    @property
+    def binary(self) -> bool:
+        return self.added is None
+
+    @property
+    def changed_lines(self) -> int:
+        return (self.added or 0) + (self.deleted or 0)
+
+
+@dataclass(slots=True)
+class ReviewDiff:
+    """A lean review diff with its numstat summary."""
+
+    entries: list[NumstatEntry] = field(default_factory=list)
+    body: str = ""
+
+    @property
+    def omitted(self) -> list[NumstatEntry]:
+        return [e for e in self.entries if e.omitted]
+
+    def render(self, section: str, base: str | None = None) -> str:
+        """Diff file content: numstat header followed by the diff body."""
+        return render_header(section, self.entries, base) + "\n" + self.body
+
+    def metrics(self, rendered: str) -> dict:
+        """Size metrics recorded in section state."""
+        kept = [e for e in self.entries if not e.omitted]
+        return {
+            "files": len(self.entries),
+            "files_reviewed": len(kept),
+            "insertions": sum(e.added or 0 for e in kept),
+            "deletions": sum(e.deleted or 0 for e in kept),
+            "omitted_lines": sum(e.changed_lines for e in self.omitted),
+            "omitted": {e.path: e.omitted for e in self.omitted},
+            "renames": sum(1 for e in self.entries if e.old_path),
+            "bytes": len(rendered.encode()),
+        }
+
+
+def _git(git_root: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-C", str(git_root), *args],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def write_tree(git_root: Path) -> str:
+    """Object id of the tree in the index (what a review just saw)."""
+    return _git(git_root, "write-tree").strip()
+
+
+def parse_numstat(output: str) -> list[NumstatEntry]:
+    """Parse `git diff --numstat -z` output.
+
+    Renamed and copied files appear as "added\\tdeleted\\t\\0old\\0new\\0".
+    """
+    entries: list[NumstatEntry] = []
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields) and fields[i]:
+        added, deleted, path = fields[i].split("\t", 2)
+        old_path = None
+        if not path:
+            old_path, path = fields[i + 1], fields[i + 2]
+            i += 2
+        entries.append(NumstatEntry(
+            path=path,
+            added=None if added == "-" else int(added),
+            deleted=None if deleted == "-" else int(deleted),
+            old_path=old_path,
+        ))
+        i += 1
+    return entries
+
+
+def matching_exclude(path: str, excludes: list[str]) -> str | None:
+    """First exclude glob matching a path.
+
+    Globs without "/" match the file name; globs with "/" match the path
+    or any trailing part of it ("__snapshots__/*" matches
+    "tests/__snapshots__/app.snap").
+    """
+    name = path.rsplit("/", 1)[-1]
+    for pattern in excludes:
+        if "/" in pattern:
+            if fnmatch(path, pattern) or fnmatch(path, f"*/{pattern}"):
+                return pattern
+        elif fnmatch(name, pattern):
+            return pattern
+    return None
+
+
+def generate_review_diff(
+    git_root: Path,
+    excludes: list[str],
+    paths: list[str] | None = None,
+    base: str | None = None,
+) -> ReviewDiff:
+    """Build the lean review diff of the staged changes.
+
+    Args:
+        git_root: Repository root
+        excludes: Globs for files to leave out of the diff body
+        paths: Limit the diff to these paths (e.g. one section's files)
+        base: Tree or commit to diff the index against (default: HEAD)
+
+    Returns:
+        ReviewDiff with one numstat entry per staged file
+
+    Raises:
+        RuntimeError: If a git command fails
+    """
+    against = [base] if base else []
+    scope = ["--", *paths] if paths else []
+    entries = parse_numstat(
+        _git(git_root, "diff", "--staged", "--numstat", "-z", *RENAME_FLAGS, *against, *scope)
+    )
+    # Files with whitespace-only changes drop out of the -w numstat
+    ignoring_whitespace = {
+        e.path: e.changed_lines
+        for e in parse_numstat(
+            _git(git_root, "diff", "--staged", "--numstat", "-z", "-w", *RENAME_FLAGS, *against, *scope)
+        )
+    }
+
+    for entry in entries:
+        # A rename or copy is excluded if either of its paths is
+        pattern = matching_exclude(entry.path, excludes)
+        if pattern is None and entry.old_path:
+            pattern = matching_exclude(entry.old_path, excludes)
+        if pattern is not None:
+            entry.omitted = f"excluded ({pattern})"
+        elif entry.binary:
+            entry.omitted = "binary"
+        elif entry.changed_lines and not ignoring_whitespace.get(entry.path):
+            entry.omitted = "whitespace-only"
+
+    review = ReviewDiff(entries=entries)
+    if len(review.omitted) < len(entries):
+        # Pathspecs apply before rename detection, so an omitted rename's
+        # old path is excluded too; otherwise it would show up as a full
+        # deletion. A copy source with changes of its own stays in.
+        kept_paths = {e.path for e in entries if not e.omitted}
+        omitted_paths = [e.path for e in review.omitted] + [
+            e.old_path for e in review.omitted if e.old_path and e.old_path not in kept_paths
+        ]
+        pathspec = [*(paths or ["."]), *(f":(exclude,literal){path}" for path in omitted_paths)]
+        review.body = _git(
+            git_root, "diff", "--staged", "--no-ext-diff", *RENAME_FLAGS, *against, "--", *pathspec
+        )
+    return review
+
+
+def render_header(section: str, entries: list[NumstatEntry], base: str | None = None) -> str:
+    """Numstat summary listing every staged file and why any were omitted."""
+    kept = [e for e in entries if not e.omitted]
+    omitted = len(entries) - len(kept)
+    title = f"Review delta: {section} (since reviewed tree {base[:12]})" if base else f"Review diff: {section}"
+    lines = [
+        f"# {title}",
+        f"# {len(entries)} files changed, +{sum(e.added or 0 for e in kept)} "
+        f"-{sum(e.deleted or 0 for e in kept)} reviewed"
+        + (f", {omitted} omitted from the diff below" if omitted else ""),
+        "#",
+    ]
+    for entry in entries:
+        added = "-" if entry.added is None else str(entry.added)
+        deleted = "-" if entry.deleted is None else str(entry.deleted)
+        path = f"{entry.old_path} => {entry.path}" if entry.old_path else entry.path
+        note = f"  [{entry.omitted}]" if entry.omitted else ""
+        lines.append(f"# {added:>6} {deleted:>6}  {path}{note}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,262 @@
+"""Structured code review findings with a per-section index.
+
+The code-reviewer returns a list of findings next to its prose review:
+
+    {"severity": "high", "file": "src/api.py", "line": 42,
+     "category": "correctness", "summary": "Missing 404 for unknown id"}
+
+Findings are stored in code_review/section-NN-findings.json with an ID
+and a status (open until triage resolves them). code_review/findings_index.json
+holds per-section counts by severity and status, so triage can load only
+the findings that matter and a resumed interview can skip resolved ones.
+Index updates hold a lease in code_review/, so sessions recording
+findings for different sections at once do not drop each other's entries.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Self
+
+from scripts.lib.leases import hold_lease, lock_owner
+from scripts.lib.review_state import code_review_dir, section_number
+
+# Most severe first
+SEVERITIES = ("critical", "high", "medium", "low")
+# Suggested to the reviewer; other categories are kept as given
+CATEGORIES = ("correctness", "security", "performance", "plan", "design", "testing", "style")
+STATUSES = ("open", "fixed", "wont_fix", "deferred")
+
+FINDINGS_INDEX_FILE = "findings_index.json"
+
+# Lease serializing findings index updates (kept in code_review/)
+FINDINGS_INDEX_LOCK_NAME = ".findings_index"
+FINDINGS_INDEX_LOCK_TTL = 30  # Seconds before a crashed writer's lock is reclaimed
+FINDINGS_INDEX_LOCK_WAIT = 30  # Seconds to wait for a concurrent update
+
+
+@dataclass(slots=True)
+class Finding:
+    """One review finding."""
+
+    id: str
+    severity: str
+    summary: str
+    file: str = ""
+    line: int | None = None
+    category: str = "design"
+    status: str = "open"
+    note: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict, finding_id: str | None = None) -> Self:
+        """Validate a finding.
+
+        Args:
+            data: Finding as recorded in a findings file or by the reviewer
+            finding_id: ID to give the finding; None keeps the "id" in data
+
+        Raises:
+            ValueError: If severity, status, line or summary is invalid,
+                or finding_id is None and data has no ID
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Finding must be an object, got: {data!r}")
+        if finding_id is None:
+            finding_id = str(data.get("id") or "").strip()
+            if not finding_id:
+                raise ValueError(f"Finding needs an id, got: {data!r}")
+        severity = str(data.get("severity", "")).lower()
+        if severity not in SEVERITIES:
+            raise ValueError(f"Finding severity must be one of {', '.join(SEVERITIES)}, got: {severity!r}")
+        category = str(data.get("category") or "design").strip().lower()
+        status = str(data.get("status") or "open")
+        if status not in STATUSES:
+            raise ValueError(f"Finding status must be one of {', '.join(STATUSES)}, got: {status!r}")
+        summary = str(data.get("summary", "")).strip()
+        if not summary:
+            raise ValueError("Finding needs a summary")
+        line = data.get("line")
+        if line is not None and (not isinstance(line, int) or isinstance(line, bool) or line < 1):
+            raise ValueError(f"Finding line must be a positive integer, got: {line!r}")
+        return cls(
+            id=finding_id,
+            severity=severity,
+            summary=summary,
+            file=str(data.get("file") or ""),
+            line=line,
+            category=category,
+            status=status,
+            note=str(data.get("note") or ""),
+        )
+
+
+def parse_findings(items: list) -> list[Finding]:
+    """Validate reviewer findings, numbering them F1, F2, ... in order.
+
+    Raises:
+        ValueError: If items is not a list or a finding is invalid
+    """
+    if not isinstance(items, list):
+        raise ValueError(f"Findings must be a list, got: {type(items).__name__}")
+    return [Finding.from_dict(item, f"F{i}") for i, item in enumerate(items, start=1)]
+
+
+def restore_findings(items: list) -> list[Finding]:
+    """Validate findings read back from a findings file, keeping their IDs.
+
+    Triage refers to findings by ID, so a reordered or hand-edited file
+    must not renumber them. Findings without an ID, or repeating one,
+    get the next number after the highest ID in use.
+
+    Raises:
+        ValueError: If items is not a list or a finding is invalid
+    """
+    if not isinstance(items, list):
+        raise ValueError(f"Findings must be a list, got: {type(items).__name__}")
+    stored = [str(item.get("id") or "").strip() if isinstance(item, dict) else "" for item in items]
+    next_number = max((_id_order(i)[0] for i in stored if i), default=0) + 1
+    findings = []
+    seen: set[str] = set()
+    for item, finding_id in zip(items, stored):
+        if not finding_id or finding_id in seen:
+            finding_id = f"F{next_number}"
+            next_number += 1
+        seen.add(finding_id)
+        findings.append(Finding.from_dict(item, finding_id))
+    return findings
+
+
+def findings_path(state_dir: Path, section: str) -> Path:
+    """Findings file of a section (section-NN-findings.json)."""
+    return code_review_dir(state_dir) / f"section-{section_number(section)}-findings.json"
+
+
+def findings_index_path(state_dir: Path) -> Path:
+    """Index of findings counts for every section."""
+    return code_review_dir(state_dir) / FINDINGS_INDEX_FILE
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def summarize_findings(findings: list[Finding]) -> dict:
+    """Counts for the index: total, open, and per severity (all and open)."""
+    return {
+        "total": len(findings),
+        "open": sum(1 for f in findings if f.status == "open"),
+        "by_severity": {s: sum(1 for f in findings if f.severity == s) for s in SEVERITIES},
+        "open_by_severity": {
+            s: sum(1 for f in findings if f.severity == s and f.status == "open") for s in SEVERITIES
+        },
+    }
+
+
+def load_findings_index(state_dir: Path) -> dict[str, dict]:
+    """Per-section findings counts (empty if no findings were recorded)."""
+    try:
+        return json.loads(findings_index_path(state_dir).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_findings(state_dir: Path, section: str, findings: list[Finding]) -> Path:
+    """Write a section's findings and update its index entry.
+
+    Returns:
+        Path of the findings file
+
+    Raises:
+        LeaseBusyError: If another update held the index lock for the whole wait
+    """
+    path = findings_path(state_dir, section)
+    _write_json(path, {"section": section, "findings": [asdict(f) for f in findings]})
+    with hold_lease(
+        path.parent,
+        FINDINGS_INDEX_LOCK_NAME,
+        lock_owner(),
+        ttl=FINDINGS_INDEX_LOCK_TTL,
+        wait=FINDINGS_INDEX_LOCK_WAIT,
+    ):
+        index = load_findings_index(state_dir)
+        index[section] = summarize_findings(findings)
+        _write_json(findings_index_path(state_dir), index)
+    return path
+
+
+def load_findings(
+    state_dir: Path,
+    section: str,
+    *,
+    min_severity: str | None = None,
+    open_only: bool = False,
+) -> list[Finding]:
+    """Read a section's findings, most severe first.
+
+    Args:
+        state_dir: Path to state directory
+        section: Section name
+        min_severity: Only findings at least this severe
+        open_only: Skip findings triage already resolved
+
+    Raises:
+        ValueError: If min_severity is unknown or the findings file is invalid
+    """
+    if min_severity is not None and min_severity not in SEVERITIES:
+        raise ValueError(f"Severity must be one of {', '.join(SEVERITIES)}, got: {min_severity!r}")
+    try:
+        data = json.loads(findings_path(state_dir, section).read_text())
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid findings file for {section}: {e}") from e
+
+    findings = restore_findings(data.get("findings", []))
+    cutoff = SEVERITIES.index(min_severity) if min_severity else len(SEVERITIES) - 1
+    selected = [
+        f for f in findings
+        if SEVERITIES.index(f.severity) <= cutoff and (not open_only or f.status == "open")
+    ]
+    return sorted(selected, key=lambda f: SEVERITIES.index(f.severity))
+
+
+def resolve_finding(
+    state_dir: Path,
+    section: str,
+    finding_id: str,
+    status: str,
+    note: str = "",
+) -> Finding:
+    """Record how triage resolved a finding.
+
+    Raises:
+        ValueError: If the status is unknown or the finding does not exist
+    """
+    if status not in STATUSES:
+        raise ValueError(f"Status must be one of {', '.join(STATUSES)}, got: {status!r}")
+    findings = load_findings(state_dir, section)
+    findings.sort(key=lambda f: _id_order(f.id))
+    for finding in findings:
+        if finding.id == finding_id:
+            finding.status = status
+            finding.note = note
+            save_findings(state_dir, section, findings)
+            return finding
+    raise ValueError(f"No finding {finding_id} for {section}")
+
+
+def _id_order(finding_id: str) -> tuple[int, str]:
+    digits = finding_id.lstrip("F")
+    return (int(digits), "") if digits.isdigit() else (0, finding_id)
@@ -0,0 +1,137 @@
+"""Index of the code review artifacts of every section.
+
+One os.scandir of {state_dir}/code_review finds every section's diff,
+review and interview files (section-NN-diff.md, section-NN-review.md,
+section-NN-interview.md) with their sizes and modification times, so the
+review state of a whole plan costs a single directory read.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+CODE_REVIEW_DIRNAME = "code_review"
+ARTIFACT_KINDS = ("diff", "review", "interview")
+ARTIFACT_PATTERN = re.compile(r"^section-(\d+)-(diff|review|interview)\.md$")
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewArtifact:
+    """One code review file on disk."""
+
+    path: Path
+    size: int
+    mtime: float
+
+
+# Section number -> artifact kind -> artifact
+ReviewIndex = dict[str, dict[str, ReviewArtifact]]
+
+
+def code_review_dir(state_dir: Path) -> Path:
+    """Directory holding the code review artifacts."""
+    return Path(state_dir) / CODE_REVIEW_DIRNAME
+
+
+def section_number(section: str) -> str:
+    """Number used in review file names ("section-01-foundation" -> "01")."""
+    return section.split("-")[1] if "-" in section else "00"
+
+
+def scan_review_artifacts(state_dir: Path) -> ReviewIndex:
+    """Index every section's review artifacts with one directory scan.
+
+    Args:
+        state_dir: Path to implementation/state directory
+
+    Returns:
+        Dict of section number -> {"diff" | "review" | "interview" -> ReviewArtifact}.
+        Empty if the code_review directory does not exist.
+    """
+    index: ReviewIndex = {}
+    try:
+        entries = os.scandir(code_review_dir(state_dir))
+    except FileNotFoundError:
+        return index
+    with entries:
+        for entry in entries:
+            match = ARTIFACT_PATTERN.match(entry.name)
+            if match is None or not entry.is_file():
+                continue
+            stat = entry.stat()
+            number, kind = match.groups()
+            index.setdefault(number, {})[kind] = ReviewArtifact(
+                path=Path(entry.path), size=stat.st_size, mtime=stat.st_mtime
+            )
+    return index
+
+
+def resume_step(artifacts: dict[str, ReviewArtifact]) -> str:
+    """Step to resume a section from, given its review artifacts.
+
+    - Interview exists → apply fixes from the beginning
+    - No interview but review exists → start interview
+    - No review but diff exists → run review subagent
+    - Nothing exists → start implementation
+    """
+    if "interview" in artifacts:
+        return "apply_fixes"
+    if "review" in artifacts:
+        return "interview"
+    if "diff" in artifacts:
+        return "review"
+    return "implement"
+
+
+def section_review_state(index: ReviewIndex, section: str) -> dict:
+    """Review state of one section (see detect_section_review_state()).
+
+    Returns:
+        {"has_diff", "has_review", "has_interview": bool, "resume_step": str}
+    """
+    artifacts = index.get(section_number(section), {})
+    return {
+        "has_diff": "diff" in artifacts,
+        "has_review": "review" in artifacts,
+        "has_interview": "interview" in artifacts,
+        "resume_step": resume_step(artifacts),
+    }
+
+
+def review_status(
+    index: ReviewIndex,
+    sections: list[str],
+    completed_sections: list[str],
+) -> dict[str, dict]:
+    """Review status of every section in a plan.
+
+    Args:
+        index: Index from scan_review_artifacts()
+        sections: Section names in manifest order
+        completed_sections: Sections with a recorded, reachable commit
+
+    Returns:
+        Dict of section name -> {"status", "resume_step", "artifacts"},
+        where status is "complete", "in_review" (some artifacts written) or
+        "pending", and artifacts maps kind -> {"size", "mtime"}
+    """
+    status: dict[str, dict] = {}
+    for section in sections:
+        artifacts = index.get(section_number(section), {})
+        if section in completed_sections:
+            state = "complete"
+        elif artifacts:
+            state = "in_review"
+        else:
+            state = "pending"
+        status[section] = {
+            "status": state,
+            "resume_step": None if state == "complete" else resume_step(artifacts),
+            "artifacts": {
+                kind: {"size": artifacts[kind].size, "mtime": artifacts[kind].mtime}
+                for kind in ARTIFACT_KINDS
+                if kind in artifacts
+            },
+        }
+    return status
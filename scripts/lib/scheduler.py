@@ -0,0 +1,252 @@
+"""Critical-path scheduling of sections across parallel lanes.
+
+Estimates a cost for each section (plan size, files touched, workflow
+steps), calibrates the estimates against how long completed sections
+actually took, and list-schedules the dependency DAG onto N lanes: among
+the sections whose dependencies are done, the one heading the longest
+remaining chain of work goes first. With no dependencies between sections
+this is longest-processing-time-first (LPT) scheduling.
+"""
+
+import heapq
+import subprocess
+from pathlib import Path
+
+# Cost units per character of section plan and per file the section touches
+SIZE_UNIT_CHARS = 1000
+FILE_COST = 2.0
+
+# Cost units per workflow step (reading output, tests, review round-trips)
+STEP_COST = 1.0
+
+
+def estimate_section_cost(section_content: str, *, file_count: int, step_count: int) -> float:
+    """Relative cost of implementing a section.
+
+    Args:
+        section_content: Content of section markdown file
+        file_count: Number of files the section mentions
+        step_count: Number of workflow steps the section runs
+
+    Returns:
+        Cost in abstract units (only meaningful relative to other sections)
+    """
+    return len(section_content) / SIZE_UNIT_CHARS + FILE_COST * file_count + STEP_COST * step_count
+
+
+def historical_durations(git_root: Path, commit_hashes: dict[str, str]) -> dict[str, float]:
+    """How long completed sections took, from their commit timestamps.
+
+    A section's duration is the time between its commit and the session's
+    previous section commit, so the first committed section has none.
+    Durations are only approximate when lanes committed concurrently.
+
+    Args:
+        git_root: Repository root
+        commit_hashes: Dict of section name -> commit hash
+
+    Returns:
+        Dict of section name -> duration in seconds
+    """
+    if len(commit_hashes) < 2:
+        return {}
+    result = subprocess.run(
+        ["git", "show", "-s", "--format=%H %ct", *commit_hashes.values()],
+        cwd=git_root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return {}
+    # git show prints the commits in argument order
+    committed: list[tuple[int, str]] = []
+    for section, line in zip(commit_hashes, result.stdout.splitlines()):
+        _, _, timestamp = line.partition(" ")
+        if timestamp.isdigit():
+            committed.append((int(timestamp), section))
+    committed.sort()
+
+    return {
+        section: float(time - previous)
+        for (previous, _), (time, section) in zip(committed, committed[1:])
+        if time > previous
+    }
+
+
+def calibrate_costs(
+    costs: dict[str, float],
+    durations: dict[str, float],
+) -> tuple[dict[str, float], str]:
+    """Convert cost estimates to seconds using observed durations.
+
+    Args:
+        costs: Dict of section name -> estimated cost for every section
+        durations: Dict of section name -> observed duration in seconds
+
+    Returns:
+        Tuple of (costs, unit): costs in "seconds" scaled by the observed
+        seconds per cost unit, or the estimates unchanged in "units"
+        without usable history
+    """
+    observed = [section for section in durations if costs.get(section, 0) > 0]
+    if not observed:
+        return dict(costs), "units"
+    rate = sum(durations[s] for s in observed) / sum(costs[s] for s in observed)
+    return {section: cost * rate for section, cost in costs.items()}, "seconds"
+
+
+def sequential_dependencies(sections: list[str]) -> dict[str, list[str]]:
+    """Dependencies of a sequential plan: each section waits for the previous."""
+    return {
+        section: [previous] if previous else []
+        for previous, section in zip([None] + sections[:-1], sections)
+    }
+
+
+def allows_parallel_work(sections: list[str], dependencies: dict[str, list[str]] | None) -> bool:
+    """Whether any section could run next to another (not a plain chain)."""
+    if dependencies is None:
+        return False
+    return any(
+        list(dependencies.get(section, [])) != expected
+        for section, expected in sequential_dependencies(sections).items()
+    )
+
+
+def ready_sections(
+    sections: list[str],
+    completed_sections: list[str],
+    dependencies: dict[str, list[str]],
+) -> list[str]:
+    """Unfinished sections whose dependencies are all complete, in manifest order."""
+    done = set(completed_sections)
+    return [
+        section
+        for section in sections
+        if section not in done and all(d in done for d in dependencies.get(section, []))
+    ]
+
+
+def critical_path_lengths(
+    sections: list[str],
+    costs: dict[str, float],
+    dependencies: dict[str, list[str]],
+) -> dict[str, float]:
+    """Longest chain of work starting at each section (its own cost included).
+
+    Sections must be in a topological order (dependencies first), which
+    manifest order guarantees.
+    """
+    dependents: dict[str, list[str]] = {section: [] for section in sections}
+    for section in sections:
+        for dependency in dependencies.get(section, []):
+            if dependency in dependents:
+                dependents[dependency].append(section)
+
+    lengths: dict[str, float] = {}
+    for section in reversed(sections):
+        tail = max((lengths[d] for d in dependents[section]), default=0.0)
+        lengths[section] = costs[section] + tail
+    return lengths
+
+
+def schedule_sections(
+    sections: list[str],
+    costs: dict[str, float],
+    dependencies: dict[str, list[str]],
+    lane_count: int,
+) -> dict:
+    """Assign sections to lanes, longest remaining chain first.
+
+    Repeatedly takes the ready section (all dependencies scheduled) with
+    the longest critical path, breaking ties by larger cost and then
+    manifest order, and puts it on the lane where it can start earliest.
+    Dependencies on sections outside `sections` (e.g. already completed)
+    count as satisfied.
+
+    Args:
+        sections: Section names in manifest order
+        costs: Dict of section name -> cost
+        dependencies: Dict of section -> sections it depends on
+        lane_count: Number of lanes (agents) working concurrently
+
+    Returns:
+        Dict with "order" (the order to pick up sections in), "lanes" (section names
+        per lane), "start"/"finish" (section -> time), "makespan" and
+        "critical_path" (the chain that bounds the makespan)
+    """
+    if lane_count < 1:
+        raise ValueError(f"lane_count must be at least 1, got: {lane_count}")
+
+    pending = set(sections)
+    order = {section: i for i, section in enumerate(sections)}
+    deps = {
+        section: list(dict.fromkeys(d for d in dependencies.get(section, []) if d in pending))
+        for section in sections
+    }
+    priority = critical_path_lengths(sections, costs, deps)
+
+    # Ready heap fed by in-degree counts: a section is pushed once its last
+    # dependency is placed, so each pick is O(log N)
+    waiting_on = {section: len(deps[section]) for section in sections}
+    dependents: dict[str, list[str]] = {section: [] for section in sections}
+    for section in sections:
+        for dependency in deps[section]:
+            dependents[dependency].append(section)
+
+    def entry(section: str) -> tuple[float, float, int, str]:
+        return (-priority[section], -costs[section], order[section], section)
+
+    ready = [entry(s) for s in sections if not waiting_on[s]]
+    heapq.heapify(ready)
+
+    lane_free = [0.0] * lane_count
+    lanes: list[list[str]] = [[] for _ in range(lane_count)]
+    start: dict[str, float] = {}
+    finish: dict[str, float] = {}
+    dispatched: list[str] = []
+    while ready:
+        section = heapq.heappop(ready)[-1]
+        earliest = max((finish[d] for d in deps[section]), default=0.0)
+        lane = min(range(lane_count), key=lambda i: (max(lane_free[i], earliest), i))
+        start[section] = max(lane_free[lane], earliest)
+        finish[section] = start[section] + costs[section]
+        lane_free[lane] = finish[section]
+        lanes[lane].append(section)
+        dispatched.append(section)
+        for dependent in dependents[section]:
+            waiting_on[dependent] -= 1
+            if not waiting_on[dependent]:
+                heapq.heappush(ready, entry(dependent))
+
+    return {
+        "order": dispatched,
+        "lanes": [lane for lane in lanes if lane],
+        "start": start,
+        "finish": finish,
+        "makespan": max(finish.values(), default=0.0),
+        "critical_path": _critical_path(sections, priority, deps),
+    }
+
+
+def _critical_path(
+    sections: list[str],
+    lengths: dict[str, float],
+    dependencies: dict[str, list[str]],
+) -> list[str]:
+    """Follow the longest chain from its head to its end."""
+    if not sections:
+        return []
+    order = {section: i for i, section in enumerate(sections)}
+    dependents: dict[str, list[str]] = {section: [] for section in sections}
+    for section in sections:
+        for dependency in dependencies[section]:
+            dependents[dependency].append(section)
+
+    def longest(candidates: list[str]) -> str:
+        return max(candidates, key=lambda s: (lengths[s], -order[s]))
+
+    path = [longest(sections)]
+    while dependents[path[-1]]:
+        path.append(longest(dependents[path[-1]]))
+    return path
@@ -0,0 +1,201 @@
+"""File-overlap conflict analysis across plan sections.
+
+Builds a section x file incidence index from the file paths each section
+mentions, finds section pairs that touch the same files, and proposes
+groups of sections that can be implemented concurrently without merge
+collisions.
+
+Sections that mention no file paths cannot be analyzed, so they are
+treated as conflicting with every other section. They are listed once as
+"unknown" rather than expanded into a pair with every other section,
+which keeps the report linear in the plan size.
+"""
+
+import json
+from collections.abc import Iterable
+from itertools import combinations
+from pathlib import Path
+
+from scripts.lib.sections import extract_file_paths_from_section
+
+CONFLICTS_FILENAME = "section_conflicts.json"
+CONFLICTS_VERSION = 2
+
+
+def section_files(sections_dir: Path, sections: list[str]) -> dict[str, list[str]]:
+    """File paths mentioned by each section, sorted.
+
+    Args:
+        sections_dir: Path to sections directory
+        sections: Section names in manifest order
+
+    Returns:
+        Dict of section name -> sorted file paths
+    """
+    return {
+        section: sorted(
+            extract_file_paths_from_section((Path(sections_dir) / f"{section}.md").read_text())
+        )
+        for section in sections
+    }
+
+
+def build_file_index(files_by_section: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Invert section -> files into file -> sections (the incidence index).
+
+    Returns:
+        Dict of file path -> sections touching it, in section order
+    """
+    index: dict[str, list[str]] = {}
+    for section, files in files_by_section.items():
+        for path in files:
+            index.setdefault(path, []).append(section)
+    return dict(sorted(index.items()))
+
+
+def conflict_pairs(
+    sections: list[str],
+    files_by_section: dict[str, list[str]],
+) -> dict[tuple[str, str], list[str]]:
+    """Section pairs that share files.
+
+    Pairs are found per file from the incidence index, so the cost is
+    proportional to the number of overlaps rather than all section pairs.
+    Sections without files are not paired (see unknown_sections()).
+
+    Args:
+        sections: Section names in manifest order
+        files_by_section: Dict of section name -> file paths
+
+    Returns:
+        Dict of (earlier, later) section pair -> shared file paths
+    """
+    order = {section: i for i, section in enumerate(sections)}
+    pairs: dict[tuple[str, str], list[str]] = {}
+
+    for path, touching in build_file_index(files_by_section).items():
+        for a, b in combinations(sorted(set(touching), key=order.__getitem__), 2):
+            pairs.setdefault((a, b), []).append(path)
+
+    return dict(sorted(pairs.items(), key=lambda item: (order[item[0][0]], order[item[0][1]])))
+
+
+def unknown_sections(sections: list[str], files_by_section: dict[str, list[str]]) -> list[str]:
+    """Sections that mention no files and so conflict with every other section."""
+    return [s for s in sections if not files_by_section.get(s)]
+
+
+def independent_groups(
+    sections: list[str],
+    pairs: dict[tuple[str, str], list[str]],
+    unknown: Iterable[str] = (),
+) -> list[list[str]]:
+    """Partition sections into groups with no conflicts inside a group.
+
+    First-fit in manifest order: each section joins the first group none
+    of whose members it conflicts with. Every section in group N conflicts
+    with some section of each earlier group, so no section could move to
+    an earlier group. Unknown sections conflict with everything, so each
+    gets a group of its own.
+
+    Returns:
+        Groups of section names, each in manifest order
+    """
+    conflicts: dict[str, set[str]] = {section: set() for section in sections}
+    for a, b in pairs:
+        conflicts[a].add(b)
+        conflicts[b].add(a)
+    unknown = set(unknown)
+
+    groups: list[list[str]] = []
+    open_groups: list[list[str]] = []  # Groups without an unknown section
+    for section in sections:
+        if section in unknown:
+            groups.append([section])
+            continue
+        for group in open_groups:
+            if conflicts[section].isdisjoint(group):
+                group.append(section)
+                break
+        else:
+            groups.append([section])
+            open_groups.append(groups[-1])
+    return groups
+
+
+def inferred_dependencies(report: dict) -> dict[str, list[str]]:
+    """Dependencies that serialize every conflicting pair in manifest order.
+
+    An unknown section depends on the sections since the previous unknown
+    section (inclusive), and every later section on the latest unknown
+    section. Transitively that orders it against every other section
+    without listing all of them.
+
+    Args:
+        report: Report from analyze_section_conflicts()
+
+    Returns:
+        Dict of section -> earlier sections it must wait for
+    """
+    sections = report["sections"]
+    unknown = set(report.get("unknown", []))
+    dependencies: dict[str, list[str]] = {section: [] for section in sections}
+    for pair in report["pairs"]:
+        earlier, later = pair["sections"]
+        dependencies[later].append(earlier)
+
+    order = {section: i for i, section in enumerate(sections)}
+    barrier = 0  # Index of the latest unknown section
+    latest_unknown = None
+    for i, section in enumerate(sections):
+        if section in unknown:
+            dependencies[section] = sections[barrier:i]
+            barrier, latest_unknown = i, section
+        elif latest_unknown is not None and latest_unknown not in dependencies[section]:
+            dependencies[section].append(latest_unknown)
+            dependencies[section].sort(key=order.__getitem__)
+    return dependencies
+
+
+def analyze_section_conflicts(sections_dir: Path, sections: list[str]) -> dict:
+    """Run the full conflict analysis for a plan.
+
+    Args:
+        sections_dir: Path to sections directory
+        sections: Section names in manifest order
+
+    Returns:
+        Machine-readable report with the incidence index of shared files,
+        conflicting pairs, the sections without files and independent groups
+    """
+    files_by_section = section_files(sections_dir, sections)
+    pairs = conflict_pairs(sections, files_by_section)
+    unknown = unknown_sections(sections, files_by_section)
+    return {
+        "version": CONFLICTS_VERSION,
+        "sections": sections,
+        "files": files_by_section,
+        "shared_files": {
+            path: touching
+            for path, touching in build_file_index(files_by_section).items()
+            if len(touching) > 1
+        },
+        "pairs": [
+            {"sections": [a, b], "files": files} for (a, b), files in pairs.items()
+        ],
+        "unknown": unknown,
+        "groups": independent_groups(sections, pairs, unknown),
+    }
+
+
+def write_conflict_report(state_dir: Path, report: dict) -> Path:
+    """Write the conflict report to the state directory as compact JSON.
+
+    Returns:
+        Path of the written file
+    """
+    state_dir = Path(state_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    path = state_dir / CONFLICTS_FILENAME
+    path.write_text(json.dumps(report, separators=(",", ":")) + "\n")
+    return path
@@ -45,10 +45,32 @@ def parse_project_config_block(index_content: str) -> dict[str, str]:
     return config
 
 
+def _manifest_lines(index_content: str) -> list[str]:
+    """Non-empty, non-comment lines of the SECTION_MANIFEST block."""
+    pattern = r'<!--\s*SECTION_MANIFEST\s*\n(.*?)\nEND_MANIFEST\s*-->'
+    match = re.search(pattern, index_content, re.DOTALL)
+
+    if not match:
+        return []
+
+    lines = []
+    for line in match.group(1).split('\n'):
+        line = line.strip()
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            continue
+        lines.append(line)
+
+    return lines
+
+
 def parse_manifest_block(index_content: str) -> list[str]:
     """
     Extract section names from SECTION_MANIFEST block.
 
+    Annotations after a colon on a manifest line are ignored here (see
+    parse_manifest_annotations).
+
     Args:
         index_content: Content of index.md file
 
@@ -56,24 +78,46 @@ def parse_manifest_block(index_content: str) -> list[str]:
         List of section names, e.g., ["section-01-foundation", "section-02-models"]
         Returns empty list if no valid manifest found.
     """
-    # Match the manifest block
-    pattern = r'<!--\s*SECTION_MANIFEST\s*\n(.*?)\nEND_MANIFEST\s*-->'
-    match = re.search(pattern, index_content, re.DOTALL)
+    return [line.split(':', 1)[0].strip() for line in _manifest_lines(index_content)]
 
-    if not match:
-        return []
 
-    manifest_content = match.group(1)
-    sections = []
+def parse_manifest_annotations(index_content: str) -> dict[str, dict[str, str]]:
+    """
+    Extract per-section annotations from SECTION_MANIFEST lines.
 
-    for line in manifest_content.split('\n'):
-        line = line.strip()
-        # Skip empty lines and comments
-        if not line or line.startswith('#'):
-            continue
-        sections.append(line)
+    Annotations follow the section name after a colon, as space-separated
+    key=value pairs:
 
-    return sections
+        section-05-readme: profile=docs
+
+    Args:
+        index_content: Content of index.md file
+
+    Returns:
+        Dict of section name -> {key: value}, for annotated sections only
+
+    Raises:
+        ValueError: If an annotation is not a key=value pair
+    """
+    annotations: dict[str, dict[str, str]] = {}
+
+    for line in _manifest_lines(index_content):
+        if ':' not in line:
+            continue
+        section, raw = line.split(':', 1)
+        section = section.strip()
+        values: dict[str, str] = {}
+        for token in raw.split():
+            key, sep, value = token.partition('=')
+            if not sep or not key or not value:
+                raise ValueError(
+                    f"Malformed annotation for {section}: {token!r} (expected key=value)"
+                )
+            values[key] = value
+        if values:
+            annotations[section] = values
+
+    return annotations
 
 
 def validate_section_file(section_path: Path) -> dict:
@@ -99,6 +143,93 @@ def validate_section_file(section_path: Path) -> dict:
     return {"valid": True, "error": None}
 
 
+def validate_sections_dir(sections_dir: Path) -> dict:
+    """
+    Validate sections directory structure.
+
+    Checks:
+    1. Path exists and is a directory
+    2. index.md exists
+    3. index.md has valid PROJECT_CONFIG block
+    4. index.md has valid SECTION_MANIFEST block
+    5. All manifest sections have corresponding files
+    6. All section files have content
+
+    Args:
+        sections_dir: Path to sections directory
+
+    Returns:
+        {"valid": bool, "error": str | None, "sections": list[str], "project_config": dict,
+         "section_annotations": dict} (annotations only when valid)
+    """
+    sections_dir = Path(sections_dir)
+
+    if not sections_dir.exists():
+        return {"valid": False, "error": f"Sections directory does not exist: {sections_dir}", "sections": [], "project_config": {}}
+
+    if not sections_dir.is_dir():
+        return {"valid": False, "error": f"Path is not a directory: {sections_dir}", "sections": [], "project_config": {}}
+
+    index_path = sections_dir / "index.md"
+    if not index_path.exists():
+        return {"valid": False, "error": f"index.md not found in {sections_dir}", "sections": [], "project_config": {}}
+
+    # Parse index.md
+    index_content = index_path.read_text()
+
+    # Parse project config
+    project_config = parse_project_config_block(index_content)
+    if not project_config:
+        example = """<!-- PROJECT_CONFIG
+runtime: python-uv
+test_command: uv run pytest
+END_PROJECT_CONFIG -->"""
+        return {
+            "valid": False,
+            "error": f"No valid PROJECT_CONFIG block found.\n\nFile: {index_path}\n\nAdd this block at the top of index.md (before SECTION_MANIFEST):\n\n{example}",
+            "sections": [],
+            "project_config": {}
+        }
+
+    # Validate required config fields
+    required_fields = ["runtime", "test_command"]
+    missing_fields = [f for f in required_fields if f not in project_config]
+    if missing_fields:
+        example_fields = "\n".join(f"{f}: <value>" for f in missing_fields)
+        return {
+            "valid": False,
+            "error": f"PROJECT_CONFIG missing required fields: {', '.join(missing_fields)}\n\nFile: {index_path}\n\nAdd these fields to the PROJECT_CONFIG block:\n\n{example_fields}",
+            "sections": [],
+            "project_config": project_config
+        }
+
+    # Parse manifest
+    sections = parse_manifest_block(index_content)
+
+    if not sections:
+        return {"valid": False, "error": "No valid SECTION_MANIFEST block found in index.md", "sections": [], "project_config": project_config}
+
+    # Validate each section file
+    for section in sections:
+        section_path = sections_dir / f"{section}.md"
+        result = validate_section_file(section_path)
+        if not result["valid"]:
+            return {"valid": False, "error": result["error"], "sections": sections, "project_config": project_config}
+
+    try:
+        section_annotations = parse_manifest_annotations(index_content)
+    except ValueError as e:
+        return {"valid": False, "error": f"Invalid SECTION_MANIFEST: {e}", "sections": sections, "project_config": project_config}
+
+    return {
+        "valid": True,
+        "error": None,
+        "sections": sections,
+        "project_config": project_config,
+        "section_annotations": section_annotations,
+    }
+
+
 def _is_commit_reachable(commit_hash: str, git_root: Path) -> bool:
     """Check if a commit hash is reachable in the git repo."""
     try:
@@ -187,3 +318,30 @@ def extract_file_paths_from_section(section_content: str) -> list[str]:
             paths.add(path)
 
     return list(paths)
+
+
+# Extensions used to infer lighter step pipelines for a section
+DOC_FILE_EXTENSIONS = ('.md', '.rst', '.txt', '.adoc')
+CONFIG_FILE_EXTENSIONS = ('.json', '.toml', '.yaml', '.yml', '.ini', '.cfg', '.env')
+
+
+def infer_section_profile(section_content: str) -> str:
+    """
+    Guess the step pipeline profile for a section from the files it touches.
+
+    Args:
+        section_content: Content of section markdown file
+
+    Returns:
+        "docs" if every referenced file is documentation, "light" if every
+        referenced file is documentation or configuration, otherwise "full"
+        (also when no file paths are found)
+    """
+    paths = extract_file_paths_from_section(section_content)
+    if not paths:
+        return "full"
+    if all(path.endswith(DOC_FILE_EXTENSIONS) for path in paths):
+        return "docs"
+    if all(path.endswith(DOC_FILE_EXTENSIONS + CONFIG_FILE_EXTENSIONS) for path in paths):
+        return "light"
+    return "full"
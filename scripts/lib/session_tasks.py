@@ -0,0 +1,1113 @@
+"""Task list planning for a deep-implement session.
+
+Turns a validated plan and the session's recorded state into the task
+list and its dependency graph: resume detection, per-section step
+pipelines, compaction points, section dependencies and claims. Setup
+writes the first list; update_section_state.py refreshes it through
+refresh_session_tasks() without re-running setup, and claims only touch
+the owner of the claimed section's tasks (set_section_owner()).
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from scripts.lib.config import load_session_config
+from scripts.lib.context_budget import (
+    diff_ratio,
+    estimate_section_tokens,
+    historical_diff_sizes,
+    schedule_compactions,
+)
+from scripts.lib.impl_tasks import (
+    STEP_ORDER,
+    CAPTURE_DIFF_STEP_ID,
+    SECTION_STEP_DEFINITIONS,
+    COMPACTION_TASK,
+    COMPACTION_STEP_ID,
+    FINALIZATION_TASK,
+    FINALIZATION_ID,
+    WINDOW_PLACEHOLDER_TASK,
+    WINDOW_PLACEHOLDER_ID,
+    COMPLETED_SUMMARY_TASK,
+    CONTEXT_ID_PREFIX,
+    DEFAULT_SECTION_PROFILE,
+    SECTION_PROFILES,
+    TaskOptions,
+    RESUME_STEP_COMPLETE_MAPPING,
+    CONTEXT_ITEM_KEYS,
+    context_task_id,
+    format_display_name,
+    section_steps,
+    pipelined_steps,
+    section_task_id,
+    summary_task_id,
+    parse_summary_task_id,
+)
+from scripts.lib.leases import LeaseBusyError, hold_lease, lock_owner, section_claims
+from scripts.lib.review_cache import restore_cached_review
+from scripts.lib.review_state import ReviewIndex, scan_review_artifacts, section_review_state
+from scripts.lib.scheduler import (
+    critical_path_lengths,
+    estimate_section_cost,
+    ready_sections,
+    sequential_dependencies,
+)
+from scripts.lib.section_conflicts import analyze_section_conflicts, inferred_dependencies
+from scripts.lib.sections import (
+    extract_file_paths_from_section,
+    get_completed_sections,
+    infer_section_profile,
+    validate_sections_dir,
+)
+from scripts.lib.task_graph import DependencyGraph
+from scripts.lib.task_storage import (
+    TaskToWrite,
+    TaskWriteResult,
+    TaskStatus,
+    FileTaskStore,
+    TaskStore,
+    assign_stable_positions,
+    load_position_map,
+    write_tasks,
+)
+
+# Lease serializing task list rewrites (kept in the tasks directory)
+TASK_LIST_LOCK_NAME = ".deep_implement_setup"
+TASK_LIST_LOCK_TTL = 120  # Seconds before a crashed run's lock is reclaimed
+DEFAULT_LOCK_WAIT = 30  # Seconds to wait for a concurrent run to finish
+
+
+def detect_section_review_state(
+    state_dir: Path,
+    section_name: str,
+    sections_dir: Path | None = None,
+    *,
+    review_index: ReviewIndex | None = None,
+) -> dict:
+    """
+    Detect the code review state for a specific section.
+
+    Checks for existence of code review files:
+    - section-NN-diff.md: Diff generated for review
+    - section-NN-review.md: Review findings from subagent
+    - section-NN-interview.md: Interview transcript (decisions recorded)
+
+    Recovery logic is simple and robust:
+    - Interview exists → apply fixes from beginning (Claude will notice already-applied fixes)
+    - No interview but review exists → start interview
+    - No review but diff exists → run review subagent, unless the review
+      cache holds a review of the same diff and plan; it is restored as
+      section-NN-review.md and the section resumes at the interview
+    - Nothing exists → start implementation
+
+    The commit is the definitive checkpoint - if section has a valid commit,
+    it's in completed_sections and won't reach this function.
+
+    Args:
+        state_dir: Path to implementation/state directory
+        section_name: Section name (e.g., "section-01-foundation")
+        sections_dir: Path to sections directory; enables restoring from
+            the review cache, which writes section-NN-review.md
+        review_index: Index from scan_review_artifacts() (scanned here if
+            not given)
+
+    Returns:
+        {
+            "has_diff": bool,
+            "has_review": bool,
+            "has_interview": bool,
+            "resume_step": str,  # Which step to resume from
+            "review_cached": bool  # Review restored from the cache
+        }
+    """
+    if review_index is None:
+        review_index = scan_review_artifacts(state_dir)
+    state = section_review_state(review_index, section_name)
+    state["review_cached"] = False
+    if (
+        sections_dir is not None
+        and state["resume_step"] == "review"
+        and restore_cached_review(state_dir, sections_dir, section_name)
+    ):
+        state.update(has_review=True, resume_step="interview", review_cached=True)
+    return state
+
+
+def infer_session_state(
+    sections_dir: Path,
+    implementation_dir: Path,
+    git_root: Path,
+    *,
+    review_index: ReviewIndex | None = None,
+    restore_cached: bool = False,
+) -> dict:
+    """
+    Determine if this is a new or resume session.
+
+    Only reads state unless restore_cached is set, so listing sections or
+    refreshing tasks never rewrites review artifacts.
+
+    Args:
+        sections_dir: Path to sections directory
+        implementation_dir: Path to implementation directory
+        git_root: Git repository root
+        review_index: Index from scan_review_artifacts(), shared with the
+            other readers of code_review/ (scanned here if not given)
+        restore_cached: Restore a cached review of the resume section's
+            diff as section-NN-review.md (setup only)
+
+    Returns:
+        {
+            "mode": "new" | "resume" | "complete",
+            "completed_sections": list[str],
+            "resume_from": str | None,
+            "resume_section_state": dict | None  # Code review state for resume section
+        }
+    """
+    implementation_dir = Path(implementation_dir)
+
+    # Check for existing config
+    config = load_session_config(implementation_dir)
+    if config is None:
+        return {
+            "mode": "new",
+            "completed_sections": [],
+            "resume_from": None,
+            "resume_section_state": None
+        }
+
+    # Get completed sections
+    completed = get_completed_sections(implementation_dir, git_root)
+    all_sections = config.get("sections", [])
+
+    if len(completed) >= len(all_sections) and all_sections:
+        return {
+            "mode": "complete",
+            "completed_sections": completed,
+            "resume_from": None,
+            "resume_section_state": None
+        }
+
+    # Find first incomplete section
+    resume_from = None
+    for section in all_sections:
+        if section not in completed:
+            resume_from = section
+            break
+
+    # Detect code review state for the section being resumed
+    resume_section_state = None
+    if resume_from:
+        resume_section_state = detect_section_review_state(
+            implementation_dir,
+            resume_from,
+            sections_dir if restore_cached else None,
+            review_index=review_index,
+        )
+
+    return {
+        "mode": "resume" if completed else "new",
+        "completed_sections": completed,
+        "resume_from": resume_from,
+        "resume_section_state": resume_section_state
+    }
+
+
+def generate_implementation_tasks(
+    sections: list[str],
+    completed_sections: list[str],
+    resume_section: str | None,
+    resume_section_state: dict | None,
+    context_values: dict[str, str],
+    *,
+    window: int | None = None,
+    collapse_completed: bool = False,
+    commit_hashes: dict[str, str] | None = None,
+    compaction_after: set[str] | None = None,
+    section_profiles: dict[str, str] | None = None,
+    pipelined: bool = False,
+    claims: dict[str, str] | None = None,
+) -> list[TaskToWrite]:
+    """Generate implementation tasks for direct file write.
+
+    Args:
+        sections: List of section names from manifest
+        completed_sections: List of already completed section names
+        resume_section: Section name being resumed (if any)
+        resume_section_state: Code review state for resume section
+        context_values: Dict of context values to persist (paths, settings)
+        window: If set, fully materialize only the current section and the
+            next `window` sections; later sections collapse into a single
+            placeholder task
+        collapse_completed: If True, each run of consecutive completed
+            sections becomes one completed summary task instead of six
+            completed step tasks (plus compaction)
+        commit_hashes: Dict of section name -> commit hash, listed in
+            summary task descriptions
+        compaction_after: Sections followed by a compaction prompt
+            (default: every 2nd section)
+        section_profiles: Dict of section name -> step pipeline profile
+            (sections not listed use the full pipeline)
+        pipelined: Add a capture_diff step after implement for reviewed
+            sections (pipelined review)
+        claims: Dict of section name -> session holding its claim; the
+            claimant is written as the owner of the section's open tasks
+
+    Returns:
+        List of TaskToWrite ready for write_tasks()
+    """
+    tasks: list[TaskToWrite] = []
+    position = 1
+
+    # Context tasks (at start, with values in subject for recovery)
+    # Status is PENDING so they stay in context window until finalization completes
+    for key in CONTEXT_ITEM_KEYS:
+        if key in context_values:
+            value = context_values[key]
+            tasks.append(TaskToWrite(
+                position=position,
+                subject=f"{key}={value}",
+                status=TaskStatus.PENDING,
+                description=f"Session context: {key}",
+                active_form=f"Context: {key}",
+                semantic_id=context_task_id(key),
+            ))
+            position += 1
+
+    # Determine completed steps for resume section
+    resume_steps_complete: set[str] = set()
+    if resume_section and resume_section_state:
+        resume_step = resume_section_state.get("resume_step", "implement")
+        resume_steps_complete = RESUME_STEP_COMPLETE_MAPPING.get(resume_step, set())
+
+    # Sections beyond the window collapse into one placeholder
+    materialized = sections
+    if window is not None:
+        current_index = next(
+            (i for i, s in enumerate(sections) if s not in completed_sections),
+            len(sections),
+        )
+        materialized = sections[:current_index + window + 1]
+    deferred = sections[len(materialized):]
+
+    commit_hashes = commit_hashes or {}
+    section_profiles = section_profiles or {}
+    claims = claims or {}
+    completed_run: list[str] = []
+
+    def flush_completed_run() -> None:
+        nonlocal position
+        if not completed_run:
+            return
+        summary_values = {
+            "count": len(completed_run),
+            "first": completed_run[0],
+            "last": completed_run[-1],
+            "commits": ", ".join(
+                f"{s}={commit_hashes.get(s, 'unknown')}" for s in completed_run
+            ),
+        }
+        tasks.append(TaskToWrite(
+            position=position,
+            subject=COMPLETED_SUMMARY_TASK.subject.format(**summary_values),
+            status=TaskStatus.COMPLETED,
+            description=COMPLETED_SUMMARY_TASK.description.format(**summary_values),
+            active_form=COMPLETED_SUMMARY_TASK.active_form,
+            semantic_id=summary_task_id(completed_run[0]),
+        ))
+        position += 1
+        completed_run.clear()
+
+    # Section tasks
+    for section_index, section in enumerate(materialized):
+        display_name = format_display_name(section)
+        is_completed = section in completed_sections
+        is_resume = section == resume_section
+
+        if collapse_completed and is_completed:
+            completed_run.append(section)
+            continue
+        flush_completed_run()
+
+        profile = section_profiles.get(section, DEFAULT_SECTION_PROFILE)
+        steps = section_steps(profile)
+        if pipelined:
+            steps = pipelined_steps(steps)
+        overrides = SECTION_PROFILES[profile].overrides
+        for step_id in steps:
+            defn = overrides.get(step_id, SECTION_STEP_DEFINITIONS[step_id])
+
+            # Determine status
+            if is_completed:
+                status = TaskStatus.COMPLETED
+            elif is_resume and step_id in resume_steps_complete:
+                status = TaskStatus.COMPLETED
+            else:
+                status = TaskStatus.PENDING
+
+            tasks.append(TaskToWrite(
+                position=position,
+                subject=defn.subject.format(section=section, display_name=display_name),
+                status=status,
+                description=defn.description.format(section=section, display_name=display_name),
+                active_form=defn.active_form.format(section=section, display_name=display_name),
+                owner=claims.get(section, "") if status != TaskStatus.COMPLETED else "",
+                semantic_id=section_task_id(section, step_id),
+            ))
+            position += 1
+
+        # Compaction prompt every 2nd section (after sections 2, 4, 6, etc.)
+        if compaction_after is None:
+            needs_compaction = (section_index + 1) % 2 == 0
+        else:
+            needs_compaction = section in compaction_after
+        if needs_compaction:
+            if is_completed:
+                status = TaskStatus.COMPLETED
+            else:
+                status = TaskStatus.PENDING
+
+            tasks.append(TaskToWrite(
+                position=position,
+                subject=COMPACTION_TASK.subject.format(section=section, display_name=display_name),
+                status=status,
+                description=COMPACTION_TASK.description.format(section=section, display_name=display_name),
+                active_form=COMPACTION_TASK.active_form.format(section=section, display_name=display_name),
+                semantic_id=section_task_id(section, COMPACTION_STEP_ID),
+            ))
+            position += 1
+
+    flush_completed_run()
+
+    if deferred:
+        placeholder_values = {
+            "count": len(deferred),
+            "first": deferred[0],
+            "last": deferred[-1],
+            "sections": ", ".join(deferred),
+        }
+        tasks.append(TaskToWrite(
+            position=position,
+            subject=WINDOW_PLACEHOLDER_TASK.subject.format(**placeholder_values),
+            status=TaskStatus.PENDING,
+            description=WINDOW_PLACEHOLDER_TASK.description.format(**placeholder_values),
+            active_form=WINDOW_PLACEHOLDER_TASK.active_form,
+            semantic_id=WINDOW_PLACEHOLDER_ID,
+        ))
+        position += 1
+
+    # Finalization task
+    all_complete = all(s in completed_sections for s in sections) if sections else False
+    tasks.append(TaskToWrite(
+        position=position,
+        subject=FINALIZATION_TASK.subject,
+        status=TaskStatus.COMPLETED if all_complete else TaskStatus.PENDING,
+        description=FINALIZATION_TASK.description,
+        active_form=FINALIZATION_TASK.active_form,
+        semantic_id=FINALIZATION_ID,
+    ))
+
+    return tasks
+
+
+def build_impl_dependency_graph(
+    tasks: list[TaskToWrite],
+    sections: list[str],
+    *,
+    reduce: bool = True,
+    section_dependencies: dict[str, list[str]] | None = None,
+    pipeline_breaks: set[str] | None = None,
+) -> dict[int, tuple[list[str], list[str]]]:
+    """Build dependency graph for implementation tasks.
+
+    Dependencies:
+    - Each section's steps are sequential (implement -> review -> interview -> docs -> commit -> record),
+      skipping steps its profile leaves out
+    - First step of each section blocked by last step of previous section
+      (or, with section_dependencies, by the last step of each section it depends on)
+    - Compaction tasks blocked by their section's last step
+    - A completed-sections summary takes the place of every section in its run
+    - Window placeholder (if any) blocked by the last materialized section
+    - Finalization blocked by last section's last step (or its compaction);
+      with section_dependencies, by every lane tail
+    - Pipelined review (sequential plans): if the previous section has a
+      capture_diff task, the next section's first step waits only for that
+      capture, and its commit waits for the previous section's last step so
+      commits stay in order. Sections in pipeline_breaks (e.g. sharing
+      files with the previous section) wait for the whole previous section.
+
+    Tasks are matched by semantic ID, so the graph does not depend on
+    where tasks sit in the list.
+
+    Args:
+        tasks: List of tasks with positions and semantic IDs
+        sections: List of section names in manifest order
+        reduce: If True, drop edges implied by longer dependency chains
+        section_dependencies: Dict of section -> sections it depends on.
+            If given, sections only wait for their declared dependencies,
+            so independent sections form parallel lanes.
+        pipeline_breaks: Sections that must not start before the previous
+            section is fully done, even with pipelined review
+
+    Returns:
+        Dict of position -> (blocks, blockedBy) as lists of position strings
+
+    Raises:
+        DependencyGraphError: If the generated graph is cyclic or references
+            tasks that were not generated
+    """
+    semantic_to_position = {t.semantic_id: t.position for t in tasks if t.semantic_id}
+    graph = DependencyGraph(semantic_to_position)
+
+    summary_for = summary_membership(semantic_to_position, sections)
+    parallel = section_dependencies is not None
+    pipeline_breaks = pipeline_breaks or set()
+
+    previous_tail: str | None = None
+    previous_capture: str | None = None
+    tails: dict[str, str] = {}  # section -> task later work waits for
+    for section in sections:
+        # A completed-sections summary stands in for its whole run
+        if section in summary_for:
+            summary = summary_for[section]
+            tails[section] = summary
+            if summary != previous_tail:
+                if previous_tail is not None and not parallel:
+                    graph.add_dependency(summary, previous_tail)
+                previous_tail = summary
+            previous_capture = None
+            continue
+
+        steps = [
+            section_task_id(section, step_id)
+            for step_id in STEP_ORDER
+            if section_task_id(section, step_id) in graph
+        ]
+        if not steps:
+            continue
+
+        # Link steps within section (sequential)
+        for current, following in zip(steps, steps[1:]):
+            graph.add_dependency(following, current)
+
+        # Link first step to the previous section (or declared dependencies)
+        if parallel:
+            for dependency in section_dependencies.get(section, []):
+                if dependency in tails:
+                    graph.add_dependency(steps[0], tails[dependency])
+        elif previous_capture is not None and section not in pipeline_breaks:
+            # Start as soon as the previous diff is captured; commit in order
+            graph.add_dependency(steps[0], previous_capture)
+            commit = section_task_id(section, "commit")
+            graph.add_dependency(commit if commit in graph else steps[-1], previous_tail)
+        elif previous_tail is not None:
+            graph.add_dependency(steps[0], previous_tail)
+
+        capture = section_task_id(section, CAPTURE_DIFF_STEP_ID)
+        previous_capture = capture if capture in graph else None
+
+        tail = steps[-1]
+        compaction = section_task_id(section, COMPACTION_STEP_ID)
+        if compaction in graph:
+            graph.add_dependency(compaction, tail)
+            tail = compaction
+        tails[section] = tail
+        previous_tail = tail
+
+    # With lanes, the end of the plan waits for every lane tail (the
+    # transitive reduction keeps only the real tails)
+    final_tails = set(tails.values()) if parallel else {previous_tail} - {None}
+
+    if WINDOW_PLACEHOLDER_ID in graph:
+        for tail in final_tails:
+            graph.add_dependency(WINDOW_PLACEHOLDER_ID, tail)
+        final_tails = {WINDOW_PLACEHOLDER_ID}
+
+    if FINALIZATION_ID in graph and final_tails:
+        for tail in final_tails:
+            graph.add_dependency(FINALIZATION_ID, tail)
+
+        # Context tasks blockedBy finalization (keeps them pending until workflow completes)
+        for semantic_id in semantic_to_position:
+            if semantic_id.startswith(CONTEXT_ID_PREFIX):
+                graph.add_dependency(semantic_id, FINALIZATION_ID)
+
+    graph.check(strict=True)
+    if reduce:
+        graph.transitive_reduction()
+
+    return graph.to_position_graph(
+        semantic_to_position, positions=[t.position for t in tasks]
+    )
+
+
+def resolve_section_dependencies(
+    sections: list[str],
+    section_annotations: dict[str, dict[str, str]],
+) -> dict[str, list[str]] | None:
+    """Read "depends=" manifest annotations.
+
+    References may be full section names or their "section-NN" prefix,
+    comma-separated (e.g. "depends=section-01,section-03-api"). Sections
+    may only depend on sections listed before them in the manifest.
+
+    Args:
+        sections: Section names in manifest order
+        section_annotations: Annotations from parse_manifest_annotations()
+
+    Returns:
+        Dict of section -> sections it depends on (every section present),
+        or None if no section declares dependencies (sequential plan)
+
+    Raises:
+        ValueError: If a reference is unknown, ambiguous or not earlier in
+            the manifest
+    """
+    if not any("depends" in values for values in section_annotations.values()):
+        return None
+
+    dependencies: dict[str, list[str]] = {}
+    for index, section in enumerate(sections):
+        raw = section_annotations.get(section, {}).get("depends", "")
+        resolved: list[str] = []
+        for ref in filter(None, (r.strip() for r in raw.split(","))):
+            matches = [s for s in sections if s == ref or s.startswith(f"{ref}-")]
+            if len(matches) != 1:
+                problem = "unknown" if not matches else "ambiguous"
+                raise ValueError(f"{section} depends on {problem} section: {ref}")
+            if sections.index(matches[0]) >= index:
+                raise ValueError(
+                    f"{section} depends on {matches[0]}, which is not listed before it in the manifest"
+                )
+            resolved.append(matches[0])
+        dependencies[section] = resolved
+    return dependencies
+
+
+def needs_conflict_analysis(options: TaskOptions) -> bool:
+    """Whether any enabled option uses the file-overlap analysis."""
+    return options.infer_dependencies or options.pipelined_review or options.lanes is not None
+
+
+def resolve_plan_dependencies(
+    sections_dir: Path,
+    sections: list[str],
+    section_annotations: dict[str, dict[str, str]],
+    options: TaskOptions,
+) -> tuple[dict[str, list[str]] | None, dict | None]:
+    """Section dependencies for the plan plus its file-overlap report.
+
+    Declared depends= annotations win. Otherwise, with infer_dependencies
+    set, every section depends on the earlier sections it shares files
+    with; without it the plan stays sequential. The overlap analysis only
+    runs when an option uses it (infer_dependencies, pipelined_review or
+    lanes).
+
+    Returns:
+        Tuple of (dependencies or None for a sequential plan, conflict
+        report or None if the analysis was skipped)
+
+    Raises:
+        ValueError: If a depends= annotation is invalid
+    """
+    dependencies = resolve_section_dependencies(sections, section_annotations)
+    if not needs_conflict_analysis(options):
+        return dependencies, None
+    report = analyze_section_conflicts(sections_dir, sections)
+    if dependencies is None and options.infer_dependencies:
+        dependencies = inferred_dependencies(report)
+    return dependencies, report
+
+
+def pipeline_breaks(sections: list[str], conflict_report: dict | None) -> set[str]:
+    """Sections that cannot overlap with the previous section's review.
+
+    A section that shares files with the section before it (or whose files
+    are unknown) would mix its edits into the previous section's commit,
+    so it falls back to serial execution. Without a report (analysis
+    skipped) there are no breaks.
+    """
+    if conflict_report is None:
+        return set()
+    conflicting = {tuple(pair["sections"]) for pair in conflict_report["pairs"]}
+    unknown = set(conflict_report.get("unknown", []))
+    return {
+        current
+        for previous, current in zip(sections, sections[1:])
+        if (previous, current) in conflicting or previous in unknown or current in unknown
+    }
+
+
+def recorded_commit_hashes(config: dict | None) -> dict[str, str]:
+    """Commit hash recorded for each section in the session config."""
+    if config is None:
+        return {}
+    return {
+        section: state["commit_hash"]
+        for section, state in config.get("sections_state", {}).items()
+        if state.get("commit_hash")
+    }
+
+
+def summary_membership(semantic_ids, sections: list[str]) -> dict[str, str]:
+    """Map each section covered by a completed summary to the summary's ID.
+
+    A summary covers the sections from its first one up to the next
+    section that has tasks of its own or starts another summary.
+    """
+    semantic_ids = list(semantic_ids)
+    starts = {}
+    for semantic_id in semantic_ids:
+        first = parse_summary_task_id(semantic_id)
+        if first is not None:
+            starts[first] = semantic_id
+    with_tasks = {semantic_id.split(":", 1)[0] for semantic_id in semantic_ids}
+    membership: dict[str, str] = {}
+    current = None
+    for section in sections:
+        if section in starts:
+            current = starts[section]
+        elif section in with_tasks:
+            current = None
+        if current is not None:
+            membership[section] = current
+    return membership
+
+
+def resolve_section_profiles(
+    sections_dir: Path,
+    sections: list[str],
+    section_annotations: dict[str, dict[str, str]],
+    *,
+    infer: bool = False,
+) -> dict[str, str]:
+    """Pick the step pipeline profile for every section.
+
+    A "profile=<name>" manifest annotation wins; otherwise the profile is
+    inferred from the section's files when infer is set, else "full".
+
+    Args:
+        sections_dir: Path to sections directory
+        sections: Section names in manifest order
+        section_annotations: Annotations from parse_manifest_annotations()
+        infer: Infer profiles for sections without an annotation
+
+    Returns:
+        Dict of section name -> profile name
+
+    Raises:
+        ValueError: If an annotation names an unknown profile
+    """
+    profiles: dict[str, str] = {}
+    for section in sections:
+        profile = section_annotations.get(section, {}).get("profile")
+        if profile is None:
+            if infer:
+                profile = infer_section_profile((sections_dir / f"{section}.md").read_text())
+            else:
+                profile = DEFAULT_SECTION_PROFILE
+        section_steps(profile)  # Validate
+        profiles[section] = profile
+    return profiles
+
+
+def budget_compaction_points(
+    sections_dir: Path,
+    state_dir: Path,
+    sections: list[str],
+    section_profiles: dict[str, str],
+    budget: int,
+    *,
+    review_index: ReviewIndex | None = None,
+) -> tuple[list[str], dict[str, int]]:
+    """Schedule compaction prompts from per-section token estimates.
+
+    Estimates come from each section file's size and code block volume,
+    scaled by the diff sizes observed for sections already reviewed (their
+    real diff size is used directly).
+
+    Args:
+        sections_dir: Path to sections directory
+        state_dir: Path to state directory holding code_review/ diffs
+        sections: Section names in manifest order
+        section_profiles: Dict of section name -> step pipeline profile
+        budget: Token budget between compaction prompts
+        review_index: Index from scan_review_artifacts() (scanned here if
+            not given)
+
+    Returns:
+        Tuple of (sections followed by a compaction prompt, dict of
+        section name -> estimated tokens)
+    """
+    contents = {s: (sections_dir / f"{s}.md").read_text() for s in sections}
+    diff_sizes = historical_diff_sizes(state_dir, sections, review_index)
+    ratio = diff_ratio(contents, diff_sizes)
+    estimates = {
+        section: estimate_section_tokens(
+            contents[section],
+            step_count=len(section_steps(section_profiles.get(section, DEFAULT_SECTION_PROFILE))),
+            ratio=ratio,
+            diff_size=diff_sizes.get(section),
+        )
+        for section in sections
+    }
+    return schedule_compactions(sections, estimates, budget), estimates
+
+
+def section_cost_estimates(
+    sections_dir: Path,
+    sections: list[str],
+    section_profiles: dict[str, str],
+) -> dict[str, float]:
+    """Relative implementation cost of each section.
+
+    Uses the section file's size, the files it mentions and the number of
+    steps in its profile.
+    """
+    costs = {}
+    for section in sections:
+        content = (sections_dir / f"{section}.md").read_text()
+        costs[section] = estimate_section_cost(
+            content,
+            file_count=len(extract_file_paths_from_section(content)),
+            step_count=len(section_steps(section_profiles.get(section, DEFAULT_SECTION_PROFILE))),
+        )
+    return costs
+
+
+def claimable_sections(state_dir: Path) -> list[str]:
+    """Sections a session may start now, most urgent first.
+
+    A section is ready when it is unfinished and all its dependencies are
+    complete (in a sequential plan: the previous section). Ready sections
+    are ordered by the length of the remaining work chain they head, then
+    by manifest order. Claims are not considered here.
+
+    Args:
+        state_dir: Path to state directory holding the session config
+
+    Returns:
+        Ready section names
+
+    Raises:
+        ValueError: If the session or its plan cannot be loaded
+    """
+    config = load_session_config(state_dir)
+    if config is None:
+        raise ValueError(f"No config found in {state_dir}")
+    sections_dir = Path(config["sections_dir"])
+    validation = validate_sections_dir(sections_dir)
+    if not validation["valid"]:
+        raise ValueError(validation["error"])
+
+    sections = validation["sections"]
+    annotations = validation["section_annotations"]
+    options = TaskOptions.from_project_config(validation["project_config"])
+    completed = infer_session_state(sections_dir, state_dir, Path(config["git_root"]))["completed_sections"]
+    section_dependencies, _ = resolve_plan_dependencies(sections_dir, sections, annotations, options)
+    if section_dependencies is None:
+        section_dependencies = sequential_dependencies(sections)
+    profiles = resolve_section_profiles(sections_dir, sections, annotations, infer=options.infer_profiles)
+
+    remaining = [s for s in sections if s not in completed]
+    lengths = critical_path_lengths(
+        remaining,
+        section_cost_estimates(sections_dir, remaining, profiles),
+        section_dependencies,
+    )
+    order = {section: i for i, section in enumerate(sections)}
+    return sorted(
+        ready_sections(sections, completed, section_dependencies),
+        key=lambda s: (-lengths[s], order[s]),
+    )
+
+
+def sticky_compaction_points(
+    sections: list[str],
+    previous_ids: Iterable[str],
+) -> set[str]:
+    """Sections that keep a compaction prompt across task list rewrites.
+
+    Sections seen last run keep (or keep lacking) their compaction prompt.
+    New sections alternate with their predecessor, which reproduces the
+    every-2nd-section default when nothing was seen before.
+
+    Args:
+        sections: Ordered section names
+        previous_ids: Semantic IDs written last run
+
+    Returns:
+        Set of section names followed by a compaction prompt
+    """
+    previous_ids = set(previous_ids)
+    known = {semantic_id.split(":", 1)[0] for semantic_id in previous_ids}
+    points: set[str] = set()
+    previous_has_compaction = True
+    for section in sections:
+        if section in known:
+            has_compaction = section_task_id(section, COMPACTION_STEP_ID) in previous_ids
+        else:
+            has_compaction = not previous_has_compaction
+        if has_compaction:
+            points.add(section)
+        previous_has_compaction = has_compaction
+    return points
+
+
+def plan_session_tasks(
+    sections: list[str],
+    state: dict,
+    context_values: dict[str, str],
+    options: TaskOptions,
+    *,
+    config: dict | None,
+    store: TaskStore | None,
+    section_profiles: dict[str, str] | None = None,
+    compaction_after: set[str] | None = None,
+    section_dependencies: dict[str, list[str]] | None = None,
+    pipeline_breaks: set[str] | None = None,
+    claims: dict[str, str] | None = None,
+) -> tuple[list[TaskToWrite], dict[int, tuple[list[str], list[str]]]]:
+    """Generate the task list and its dependency graph for a session.
+
+    With stable task IDs, compaction prompts (unless scheduled explicitly)
+    and positions follow the semantic ID map persisted in the store by the
+    previous run.
+
+    Args:
+        sections: Ordered section names
+        state: Session state from infer_session_state()
+        context_values: Dict of context values to persist
+        options: Task options from PROJECT_CONFIG
+        config: Session config (for recorded commit hashes), if any
+        store: Task store the list will be written to, if known
+        section_profiles: Dict of section name -> step pipeline profile
+        compaction_after: Sections followed by a compaction prompt, e.g.
+            from budget_compaction_points()
+        section_dependencies: Declared section dependencies (parallel
+            lanes), or None for a sequential plan; pipelined review only
+            applies to sequential plans
+        pipeline_breaks: Sections that share files with the previous
+            section and so cannot be pipelined (see pipeline_breaks())
+        claims: Dict of section name -> session holding its claim
+
+    Returns:
+        Tuple of (tasks, position-keyed dependency graph)
+
+    Raises:
+        DependencyGraphError: If the generated graph is invalid
+    """
+    stable = options.stable_ids and store is not None
+    if stable and compaction_after is None:
+        previous_map = load_position_map(store)
+        if previous_map:
+            compaction_after = sticky_compaction_points(sections, previous_map)
+
+    tasks = generate_implementation_tasks(
+        sections=sections,
+        completed_sections=state["completed_sections"],
+        resume_section=state.get("resume_from"),
+        resume_section_state=state.get("resume_section_state"),
+        context_values=context_values,
+        window=options.window,
+        collapse_completed=options.collapse_completed,
+        commit_hashes=recorded_commit_hashes(config),
+        compaction_after=compaction_after,
+        section_profiles=section_profiles,
+        # Lanes already overlap independent sections, and the pipelining
+        # edges only chain consecutive sections of a sequential plan
+        pipelined=options.pipelined_review and section_dependencies is None,
+        claims=claims,
+    )
+    if stable:
+        tasks = assign_stable_positions(tasks, store)
+
+    return tasks, build_impl_dependency_graph(
+        tasks,
+        sections,
+        section_dependencies=section_dependencies,
+        pipeline_breaks=pipeline_breaks,
+    )
+
+
+class SetupInProgressError(Exception):
+    """Another run is rewriting the same task list."""
+
+
+@contextmanager
+def task_list_lock(store: TaskStore | None, *, wait: float = DEFAULT_LOCK_WAIT) -> Iterator[None]:
+    """Serialize generating and writing one task list across processes.
+
+    Holds a lease in the task list's directory for the block, so a second
+    setup (or task list refresh) on the same task list waits for the first
+    instead of interleaving writes. Stores without a directory are not
+    shared between processes and are not locked.
+
+    Args:
+        store: Task store about to be written
+        wait: Seconds to wait for a concurrent run
+
+    Raises:
+        SetupInProgressError: If the task list is still locked after waiting
+    """
+    if not isinstance(store, FileTaskStore):
+        yield
+        return
+    store.prepare()
+    try:
+        with hold_lease(
+            store.tasks_dir,
+            TASK_LIST_LOCK_NAME,
+            lock_owner(),
+            ttl=TASK_LIST_LOCK_TTL,
+            wait=wait,
+        ):
+            yield
+    except LeaseBusyError as e:
+        owner = e.holder.get("owner", "unknown") if e.holder else "unknown"
+        raise SetupInProgressError(
+            f"Another setup is in progress for task list {store.tasks_dir.name} "
+            f"(held by {owner}); waited {wait:g}s. Retry once it finishes."
+        ) from e
+
+
+def refresh_session_tasks(
+    state_dir: Path,
+    *,
+    windowed_only: bool = False,
+) -> TaskWriteResult | None:
+    """Regenerate the task list recorded in the session config.
+
+    Only tasks whose content changed are rewritten, under the task list
+    lock. Used by update_section_state.py to advance the task window once a
+    section completion is recorded, without re-running full setup.
+
+    Args:
+        state_dir: Path to state directory holding the session config
+        windowed_only: Only refresh when the plan sets task_window
+
+    Returns:
+        TaskWriteResult, or None if the session has no task list to refresh
+    """
+    config = load_session_config(state_dir)
+    if config is None or not config.get("task_list_id"):
+        return None
+
+    sections_dir = Path(config["sections_dir"])
+    validation = validate_sections_dir(sections_dir)
+    if not validation["valid"]:
+        return None
+
+    sections = validation["sections"]
+    project_config = validation["project_config"]
+    options = TaskOptions.from_project_config(project_config)
+    if windowed_only and options.window is None:
+        return None
+
+    context_values = {
+        "plugin_root": config["plugin_root"],
+        "sections_dir": config["sections_dir"],
+        "target_dir": config["target_dir"],
+        "state_dir": config["state_dir"],
+        "runtime": project_config["runtime"],
+        "test_command": project_config["test_command"],
+    }
+    tasks_root = Path(config["tasks_root"]) if config.get("tasks_root") else None
+    task_list_id = config["task_list_id"]
+    store = FileTaskStore.for_task_list(task_list_id, root=tasks_root)
+
+    section_profiles = resolve_section_profiles(
+        sections_dir, sections, validation["section_annotations"], infer=options.infer_profiles
+    )
+    section_dependencies, conflict_report = resolve_plan_dependencies(
+        sections_dir, sections, validation["section_annotations"], options
+    )
+
+    try:
+        with task_list_lock(store):
+            # Session state is read under the lock, and only tasks whose
+            # content changed are rewritten, so statuses other sessions set
+            # on the rest survive the refresh
+            review_index = scan_review_artifacts(state_dir)
+            state = infer_session_state(
+                sections_dir, state_dir, Path(config["git_root"]), review_index=review_index
+            )
+            compaction_after = None
+            if options.compaction_budget is not None:
+                points, _ = budget_compaction_points(
+                    sections_dir, state_dir, sections, section_profiles, options.compaction_budget,
+                    review_index=review_index,
+                )
+                compaction_after = set(points)
+            tasks, dependency_graph = plan_session_tasks(
+                sections,
+                state,
+                context_values,
+                options,
+                config=load_session_config(state_dir) or config,
+                store=store,
+                section_profiles=section_profiles,
+                compaction_after=compaction_after,
+                section_dependencies=section_dependencies,
+                pipeline_breaks=pipeline_breaks(sections, conflict_report),
+                claims=section_claims(state_dir),
+            )
+            return write_tasks(
+                task_list_id,
+                tasks,
+                dependency_graph=dependency_graph,
+                store=store,
+                skip_unchanged=True,
+            )
+    except SetupInProgressError as e:
+        return TaskWriteResult.err(task_list_id, str(e))
+
+
+def set_section_owner(state_dir: Path, section: str, owner: str) -> int | None:
+    """Set or clear the owner of one section's open tasks in place.
+
+    Claims and releases rewrite only the owner field of the section's task
+    files (located through the manifest's semantic IDs), so statuses other
+    sessions have set on their tasks survive. Completed tasks never carry
+    an owner.
+
+    Args:
+        state_dir: Path to state directory holding the session config
+        section: Section whose tasks change owner
+        owner: Claiming session, or "" to clear the owner on release
+
+    Returns:
+        Number of task files rewritten, or None if the session has no task list
+
+    Raises:
+        SetupInProgressError: If the task list stays locked by another run
+    """
+    config = load_session_config(state_dir)
+    if config is None or not config.get("task_list_id"):
+        return None
+
+    tasks_root = Path(config["tasks_root"]) if config.get("tasks_root") else None
+    store = FileTaskStore.for_task_list(config["task_list_id"], root=tasks_root)
+    prefix = section_task_id(section, "")
+
+    updated = 0
+    with task_list_lock(store):
+        for semantic_id, position in sorted(load_position_map(store).items()):
+            if not semantic_id.startswith(prefix):
+                continue
+            try:
+                data = store.read_task(position)
+            except ValueError:
+                continue  # Skip invalid files
+            if data is None:
+                continue
+            changed = dict(data)
+            if owner and data.get("status") != str(TaskStatus.COMPLETED):
+                changed["owner"] = owner
+            else:
+                changed.pop("owner", None)
+            if changed != data:
+                store.write_task(position, changed)
+                updated += 1
+    return updated
@@ -0,0 +1,279 @@
+"""Dependency graph engine for task lists.
+
+Tasks are identified by semantic IDs (e.g. "section-01-foundation:commit").
+Edges read "node is blocked by dependency". Adjacency is set-backed so
+duplicate edges collapse, validation is a single O(V+E) topological pass
+that reports cycles and references to unknown IDs, and transitive
+reduction keeps the blockedBy lists written to task files minimal.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+class DependencyGraphError(Exception):
+    """Raised when a dependency graph has cycles or dangling references."""
+
+    def __init__(self, message: str, validation: GraphValidation) -> None:
+        super().__init__(message)
+        self.validation = validation
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GraphValidation:
+    """Result of validating a dependency graph."""
+
+    cycles: tuple[tuple[str, ...], ...] = ()  # Each cycle as a node path
+    dangling: tuple[tuple[str, str], ...] = ()  # (node, unknown dependency)
+
+    @property
+    def valid(self) -> bool:
+        return not self.cycles and not self.dangling
+
+    def describe(self) -> str:
+        """Human-readable summary of every problem found."""
+        problems = [
+            "cycle: " + " -> ".join(cycle + (cycle[0],)) for cycle in self.cycles
+        ]
+        problems.extend(
+            f"unknown reference: {node} depends on {dep}" for node, dep in self.dangling
+        )
+        return "; ".join(problems)
+
+
+class DependencyGraph:
+    """Directed dependency graph over semantic task IDs."""
+
+    def __init__(self, nodes: Iterable[str] = ()) -> None:
+        # dict preserves insertion order, which keeps topological order stable
+        self._blocked_by: dict[str, set[str]] = {}
+        self._blocks: dict[str, set[str]] = {}
+        self._dangling: set[tuple[str, str]] = set()
+        self._rank: dict[str, int] = {}
+        for node in nodes:
+            self.add_node(node)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._blocked_by
+
+    def __len__(self) -> int:
+        return len(self._blocked_by)
+
+    @property
+    def nodes(self) -> list[str]:
+        return list(self._blocked_by)
+
+    def add_node(self, node: str) -> None:
+        if node not in self._blocked_by:
+            self._rank[node] = len(self._rank)
+            self._blocked_by[node] = set()
+            self._blocks[node] = set()
+
+    def add_dependency(self, node: str, depends_on: str) -> None:
+        """Record that node is blocked by depends_on.
+
+        Unknown endpoints are recorded as dangling references instead of
+        edges, so they can be reported by validate().
+        """
+        if node not in self._blocked_by or depends_on not in self._blocked_by:
+            self._dangling.add((node, depends_on))
+            return
+        self._blocked_by[node].add(depends_on)
+        self._blocks[depends_on].add(node)
+
+    def remove_dependency(self, node: str, depends_on: str) -> None:
+        self._blocked_by.get(node, set()).discard(depends_on)
+        self._blocks.get(depends_on, set()).discard(node)
+
+    def blocked_by(self, node: str) -> set[str]:
+        return set(self._blocked_by[node])
+
+    def blocks(self, node: str) -> set[str]:
+        return set(self._blocks[node])
+
+    def _kahn(self) -> tuple[list[str], set[str]]:
+        """Topological sort.
+
+        Returns:
+            Tuple of (ordered nodes, nodes left over because of cycles)
+        """
+        indegree = {node: len(deps) for node, deps in self._blocked_by.items()}
+        ready = deque(node for node, degree in indegree.items() if degree == 0)
+        order: list[str] = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for dependent in sorted(self._blocks[node], key=self._rank.__getitem__):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+        leftover = {node for node, degree in indegree.items() if degree > 0}
+        return order, leftover
+
+    def _find_cycles(self, candidates: set[str]) -> list[tuple[str, ...]]:
+        """Extract cycles among nodes that Kahn's algorithm could not order."""
+        cycles: list[tuple[str, ...]] = []
+        state: dict[str, int] = {}  # 1 = on stack, 2 = done
+        for start in self._blocked_by:
+            if start not in candidates or start in state:
+                continue
+            stack: list[tuple[str, Iterable[str]]] = [
+                (start, iter(sorted(self._blocks[start] & candidates)))
+            ]
+            path = [start]
+            state[start] = 1
+            while stack:
+                node, successors = stack[-1]
+                advanced = False
+                for successor in successors:
+                    if state.get(successor) == 1:
+                        cycles.append(tuple(path[path.index(successor):]))
+                    elif successor not in state:
+                        state[successor] = 1
+                        path.append(successor)
+                        stack.append(
+                            (successor, iter(sorted(self._blocks[successor] & candidates)))
+                        )
+                        advanced = True
+                        break
+                if not advanced:
+                    state[node] = 2
+                    path.pop()
+                    stack.pop()
+        return cycles
+
+    def validate(self) -> GraphValidation:
+        """Check for cycles and dangling references in O(V+E)."""
+        _, leftover = self._kahn()
+        cycles = self._find_cycles(leftover) if leftover else []
+        return GraphValidation(
+            cycles=tuple(cycles),
+            dangling=tuple(sorted(self._dangling)),
+        )
+
+    def topological_order(self) -> list[str]:
+        """Nodes ordered so every node follows its dependencies.
+
+        Raises:
+            DependencyGraphError: If the graph contains a cycle
+        """
+        order, leftover = self._kahn()
+        if leftover:
+            validation = GraphValidation(cycles=tuple(self._find_cycles(leftover)))
+            raise DependencyGraphError(
+                f"Dependency graph has cycles: {validation.describe()}", validation
+            )
+        return order
+
+    def transitive_reduction(self) -> None:
+        """Drop edges implied by longer paths (graph must be acyclic).
+
+        Nodes are visited in reverse topological order, keeping the set of
+        nodes each one reaches as an integer bitset, so the cost is
+        O(V * E / wordsize). A bitset is dropped once every predecessor of
+        its node has been visited, so memory is O(F * V) bits for a
+        frontier of F nodes still waiting on predecessors: small for the
+        chain-like task graphs built here, O(V²) bits in the worst case.
+        """
+        order = self.topological_order()
+        index = {node: i for i, node in enumerate(order)}
+        unvisited_predecessors = {node: len(self._blocked_by[node]) for node in order}
+        reach: dict[str, int] = {}
+        for node in reversed(order):
+            dependents = list(self._blocks[node])
+            implied = 0
+            for dependent in dependents:
+                implied |= reach[dependent]
+            bits = implied
+            for dependent in dependents:
+                bits |= 1 << index[dependent]
+                if implied >> index[dependent] & 1:
+                    self.remove_dependency(dependent, node)
+                unvisited_predecessors[dependent] -= 1
+                if not unvisited_predecessors[dependent]:
+                    del reach[dependent]
+            if unvisited_predecessors[node]:
+                reach[node] = bits
+
+    def to_position_graph(
+        self,
+        semantic_to_position: dict[str, int],
+        positions: Iterable[int] = (),
+    ) -> dict[int, tuple[list[str], list[str]]]:
+        """Translate to the position-keyed (blocks, blockedBy) format.
+
+        Args:
+            semantic_to_position: Dict of semantic_id -> position number
+            positions: Extra positions to include with empty lists
+
+        Returns:
+            Dict of position -> (blocks, blockedBy), each a numerically
+            sorted list of position strings
+        """
+        graph: dict[int, tuple[list[str], list[str]]] = {
+            position: ([], []) for position in positions
+        }
+        for node in self._blocked_by:
+            if node not in semantic_to_position:
+                continue
+            blocks = sorted(
+                semantic_to_position[n] for n in self._blocks[node] if n in semantic_to_position
+            )
+            blocked_by = sorted(
+                semantic_to_position[n] for n in self._blocked_by[node] if n in semantic_to_position
+            )
+            graph[semantic_to_position[node]] = (
+                [str(p) for p in blocks],
+                [str(p) for p in blocked_by],
+            )
+        return graph
+
+    def check(self, *, strict: bool = True) -> None:
+        """Raise if the graph is unusable.
+
+        Args:
+            strict: Also reject dangling references (cycles always raise)
+
+        Raises:
+            DependencyGraphError: With the validation attached
+        """
+        validation = self.validate()
+        if validation.cycles or (strict and validation.dangling):
+            raise DependencyGraphError(
+                f"Invalid dependency graph: {validation.describe()}", validation
+            )
+
+
+def chain_lanes(
+    order: Iterable[str],
+    dependencies: dict[str, Iterable[str]],
+) -> list[list[str]]:
+    """Split a DAG into lanes of dependent nodes (greedy chain decomposition).
+
+    Each node extends the lane of one of its dependencies when that
+    dependency is still the lane's tail; otherwise it starts a new lane.
+    Nodes with no dependency in common can then run in separate lanes.
+
+    Args:
+        order: Nodes in a topological order
+        dependencies: Dict of node -> nodes it depends on
+
+    Returns:
+        Lanes, each a list of nodes in execution order
+    """
+    lanes: list[list[str]] = []
+    lane_of_tail: dict[str, int] = {}
+    for node in order:
+        lane_index = next(
+            (lane_of_tail.pop(dep) for dep in dependencies.get(node, ()) if dep in lane_of_tail),
+            None,
+        )
+        if lane_index is None:
+            lane_index = len(lanes)
+            lanes.append([])
+        lanes[lane_index].append(node)
+        lane_of_tail[node] = lane_index
+    return lanes
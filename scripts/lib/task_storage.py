@@ -11,10 +11,13 @@ will need to be updated.
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
 from pathlib import Path
-from typing import Self
+from typing import Protocol, Self
+
+from scripts.lib.task_graph import DependencyGraph
 
 
 class TaskStatus(StrEnum):
@@ -31,9 +34,150 @@ class TaskWriteError(Exception):
     pass
 
 
-def get_tasks_dir(task_list_id: str) -> Path:
-    """Get the tasks directory for a task list ID."""
-    return Path.home() / ".claude" / "tasks" / task_list_id
+def get_tasks_root() -> Path:
+    """Get the default root holding every task list directory."""
+    return Path.home() / ".claude" / "tasks"
+
+
+def get_tasks_dir(task_list_id: str, root: Path | None = None) -> Path:
+    """Get the tasks directory for a task list ID.
+
+    Args:
+        task_list_id: Session ID or user-specified task list ID
+        root: Alternative tasks root (defaults to ~/.claude/tasks)
+    """
+    return (root if root is not None else get_tasks_root()) / task_list_id
+
+
+# Bookkeeping file kept next to the task files. It has no .json suffix so
+# Claude Code (and the legacy *.json scan) never mistake it for a task.
+MANIFEST_FILENAME = ".deep_implement_manifest"
+MANIFEST_VERSION = 1
+
+
+class TaskStore(Protocol):
+    """Storage backend holding the task files of one task list.
+
+    Task data is exchanged as the dicts produced by TaskToWrite.to_file_dict().
+    read_task returns None for a missing task and raises ValueError for
+    unparseable content.
+    """
+
+    @property
+    def location(self) -> Path:
+        """Where the tasks live (reported back in TaskWriteResult)."""
+        ...
+
+    def prepare(self) -> None:
+        """Create the backing storage if needed."""
+        ...
+
+    def read_task(self, position: int) -> dict | None: ...
+
+    def write_task(self, position: int, data: dict) -> None: ...
+
+    def task_exists(self, position: int) -> bool: ...
+
+    def positions(self) -> Iterable[int]:
+        """All task positions currently stored (full scan)."""
+        ...
+
+    def read_manifest(self) -> dict | None: ...
+
+    def write_manifest(self, manifest: dict) -> None: ...
+
+
+class FileTaskStore:
+    """Task store backed by a directory of <position>.json files."""
+
+    def __init__(self, tasks_dir: Path) -> None:
+        self.tasks_dir = Path(tasks_dir)
+
+    @classmethod
+    def for_task_list(cls, task_list_id: str, root: Path | None = None) -> Self:
+        """Store for a task list under the default or an alternative root."""
+        return cls(get_tasks_dir(task_list_id, root))
+
+    @property
+    def location(self) -> Path:
+        return self.tasks_dir
+
+    def prepare(self) -> None:
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+
+    def read_task(self, position: int) -> dict | None:
+        try:
+            return json.loads((self.tasks_dir / f"{position}.json").read_text())
+        except FileNotFoundError:
+            return None
+
+    def write_task(self, position: int, data: dict) -> None:
+        (self.tasks_dir / f"{position}.json").write_text(json.dumps(data, indent=2))
+
+    def task_exists(self, position: int) -> bool:
+        return (self.tasks_dir / f"{position}.json").exists()
+
+    def positions(self) -> Iterable[int]:
+        for task_file in self.tasks_dir.glob("*.json"):
+            try:
+                yield int(task_file.stem)
+            except ValueError:
+                continue  # Skip non-numeric files
+
+    def read_manifest(self) -> dict | None:
+        try:
+            return json.loads((self.tasks_dir / MANIFEST_FILENAME).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def write_manifest(self, manifest: dict) -> None:
+        (self.tasks_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest, indent=2))
+
+
+@dataclass(slots=True)
+class InMemoryTaskStore:
+    """Task store kept entirely in memory.
+
+    Serializes tasks exactly like FileTaskStore so content comparisons and
+    benchmarks see the same bytes, without touching the file system.
+    """
+
+    task_list_id: str = "memory"
+    files: dict[int, str] = field(default_factory=dict)
+    manifest: str | None = None
+    writes: int = 0  # Task writes performed, for benchmarks
+
+    @property
+    def location(self) -> Path:
+        return Path(":memory:") / self.task_list_id
+
+    def prepare(self) -> None:
+        pass
+
+    def read_task(self, position: int) -> dict | None:
+        raw = self.files.get(position)
+        return None if raw is None else json.loads(raw)
+
+    def write_task(self, position: int, data: dict) -> None:
+        self.files[position] = json.dumps(data, indent=2)
+        self.writes += 1
+
+    def task_exists(self, position: int) -> bool:
+        return position in self.files
+
+    def positions(self) -> Iterable[int]:
+        return list(self.files)
+
+    def read_manifest(self) -> dict | None:
+        if self.manifest is None:
+            return None
+        try:
+            return json.loads(self.manifest)
+        except ValueError:
+            return None
+
+    def write_manifest(self, manifest: dict) -> None:
+        self.manifest = json.dumps(manifest, indent=2)
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -47,10 +191,12 @@ class TaskToWrite:
     active_form: str = ""
     blocks: tuple[str, ...] = ()  # Task IDs this task blocks
     blocked_by: tuple[str, ...] = ()  # Task IDs blocking this task
+    owner: str = ""  # Session that claimed the task (omitted when unclaimed)
+    semantic_id: str = ""  # Stable ID such as "section-01-foundation:commit" (not written)
 
     def to_file_dict(self) -> dict:
         """Convert to dict matching Claude Code task file format."""
-        return {
+        task = {
             "id": str(self.position),
             "subject": self.subject,
             "description": self.description,
@@ -59,6 +205,9 @@ class TaskToWrite:
             "blocks": list(self.blocks),
             "blockedBy": list(self.blocked_by),
         }
+        if self.owner:
+            task["owner"] = self.owner
+        return task
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -70,14 +219,22 @@ class TaskWriteResult:
     tasks_written: int
     tasks_dir: Path
     error: str | None = None
+    tasks_unchanged: int = 0  # Tasks skipped because their file already matched
 
     @classmethod
-    def ok(cls, task_list_id: str, tasks_written: int, tasks_dir: Path) -> Self:
+    def ok(
+        cls,
+        task_list_id: str,
+        tasks_written: int,
+        tasks_dir: Path,
+        tasks_unchanged: int = 0,
+    ) -> Self:
         return cls(
             success=True,
             task_list_id=task_list_id,
             tasks_written=tasks_written,
             tasks_dir=tasks_dir,
+            tasks_unchanged=tasks_unchanged,
         )
 
     @classmethod
@@ -97,6 +254,8 @@ def write_tasks(
     dependency_graph: dict[int, tuple[list[str], list[str]]] | None = None,
     *,
     mark_extra_obsolete: bool = True,
+    store: TaskStore | None = None,
+    skip_unchanged: bool = False,
 ) -> TaskWriteResult:
     """Write tasks directly to Claude Code task storage.
 
@@ -105,8 +264,13 @@ def write_tasks(
         tasks: List of tasks to write (in position order)
         dependency_graph: Optional dict of position -> (blocks, blockedBy).
             If provided, overrides blocks/blocked_by on TaskToWrite.
-        mark_extra_obsolete: If True, marks existing tasks beyond
-            the last written position as [obsolete] + completed
+        mark_extra_obsolete: If True, marks existing tasks that were
+            written last run but not this run (or appended since) as
+            [obsolete] + completed
+        store: Storage backend (defaults to the task list's directory
+            under ~/.claude/tasks)
+        skip_unchanged: If True, leave task files that already hold
+            identical content untouched
 
     Returns:
         TaskWriteResult with success status and details
@@ -116,14 +280,17 @@ def write_tasks(
     if not task_list_id:
         return TaskWriteResult.err("", "No task_list_id provided")
 
-    tasks_dir = get_tasks_dir(task_list_id)
+    if store is None:
+        store = FileTaskStore.for_task_list(task_list_id)
 
     try:
         # Create directory if needed
-        tasks_dir.mkdir(parents=True, exist_ok=True)
+        store.prepare()
 
-        # Track highest position we write to
-        max_written_position = 0
+        # Track every position we write to
+        written: set[int] = set()
+        position_map: dict[str, int] = {}
+        unchanged = 0
 
         # Write each task
         for task in tasks:
@@ -135,18 +302,24 @@ def write_tasks(
                 task_data["blocks"] = blocks
                 task_data["blockedBy"] = blocked_by
 
-            task_file = tasks_dir / f"{task.position}.json"
-            task_file.write_text(json.dumps(task_data, indent=2))
-            max_written_position = max(max_written_position, task.position)
+            written.add(task.position)
+            if task.semantic_id:
+                position_map[task.semantic_id] = task.position
+
+            if skip_unchanged and _read_task_or_none(store, task.position) == task_data:
+                unchanged += 1
+                continue
+            store.write_task(task.position, task_data)
 
         # Mark extra existing tasks as obsolete
         if mark_extra_obsolete:
-            _mark_extra_obsolete(tasks_dir, max_written_position)
+            _mark_extra_obsolete(store, written, position_map)
 
         return TaskWriteResult.ok(
             task_list_id=task_list_id,
             tasks_written=len(tasks),
-            tasks_dir=tasks_dir,
+            tasks_dir=store.location,
+            tasks_unchanged=unchanged,
         )
 
     except PermissionError as e:
@@ -155,37 +328,242 @@ def write_tasks(
         return TaskWriteResult.err(task_list_id, f"File system error: {e}")
 
 
-def _mark_extra_obsolete(tasks_dir: Path, max_written_position: int) -> None:
-    """Mark existing task files beyond max_written_position as obsolete.
+def _positions_to_ranges(positions: set[int]) -> list[list[int]]:
+    """Compress a set of positions into sorted inclusive [start, end] ranges."""
+    ranges: list[list[int]] = []
+    for position in sorted(positions):
+        if ranges and position == ranges[-1][1] + 1:
+            ranges[-1][1] = position
+        else:
+            ranges.append([position, position])
+    return ranges
 
-    Preserves existing blocks/blockedBy fields when marking obsolete.
+
+def _ranges_to_positions(ranges: list[list[int]]) -> set[int]:
+    """Expand inclusive [start, end] ranges back into a set of positions."""
+    positions: set[int] = set()
+    for start, end in ranges:
+        positions.update(range(start, end + 1))
+    return positions
+
+
+def load_tasks_manifest(store: TaskStore) -> dict | None:
+    """Load the obsolete-marking manifest of a task store.
+
+    Returns:
+        Manifest dict, or None if missing, unreadable or from another version
+    """
+    data = store.read_manifest()
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    return data
+
+
+def save_tasks_manifest(
+    store: TaskStore,
+    max_written_position: int,
+    high_water_mark: int,
+    obsolete_positions: set[int],
+    written_positions: set[int] | None = None,
+    position_map: dict[str, int] | None = None,
+) -> None:
+    """Persist the high-water mark, obsolete positions and semantic ID map of a task store."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "max_written_position": max_written_position,
+        "high_water_mark": high_water_mark,
+        "obsolete": _positions_to_ranges(obsolete_positions),
+    }
+    if written_positions is not None:
+        manifest["written"] = _positions_to_ranges(written_positions)
+    if position_map:
+        manifest["positions"] = position_map
+    store.write_manifest(manifest)
+
+
+def _previous_written_positions(manifest: dict) -> set[int]:
+    """Positions written by the last run recorded in a manifest.
+
+    Manifests written before the "written" key existed only covered a
+    contiguous 1..max_written_position prefix.
+    """
+    if "written" in manifest:
+        return _ranges_to_positions(manifest["written"])
+    return set(range(1, manifest.get("max_written_position", 0) + 1))
+
+
+def load_position_map(store: TaskStore) -> dict[str, int]:
+    """Semantic ID -> position map persisted by the last write_tasks() run."""
+    manifest = load_tasks_manifest(store)
+    if manifest is None:
+        return {}
+    positions = manifest.get("positions", {})
+    if not isinstance(positions, dict):
+        return {}
+    return {
+        semantic_id: position
+        for semantic_id, position in positions.items()
+        if isinstance(position, int) and position > 0
+    }
+
+
+def assign_stable_positions(
+    tasks: list[TaskToWrite],
+    store: TaskStore,
+) -> list[TaskToWrite]:
+    """Give tasks the positions their semantic IDs held last run.
+
+    Tasks whose semantic ID was written before keep that position; new
+    IDs get fresh positions past every position the store has used, so
+    inserting or removing sections never shifts unrelated task files. The
+    first run (no persisted map) keeps the sequential positions.
+
+    Args:
+        tasks: Tasks in execution order with sequential positions
+        store: Storage backend holding the manifest of the last run
+
+    Returns:
+        Tasks with positions reassigned (order unchanged)
+    """
+    previous = load_position_map(store)
+    if not previous:
+        return tasks
+
+    manifest = load_tasks_manifest(store) or {}
+    next_free = max(
+        manifest.get("high_water_mark", 0),
+        manifest.get("max_written_position", 0),
+        max(previous.values()),
+    ) + 1
+
+    stable: list[TaskToWrite] = []
+    for task in tasks:
+        position = previous.get(task.semantic_id) if task.semantic_id else None
+        if position is None:
+            position = next_free
+            next_free += 1
+        stable.append(replace(task, position=position))
+    return stable
+
+
+def _is_obsolete(data: dict) -> bool:
+    return data.get("subject") == "[obsolete]" and data.get("status") == "completed"
+
+
+def _scan_existing_positions(store: TaskStore) -> tuple[set[int], set[int]]:
+    """Full scan used when no manifest exists yet.
+
+    Returns:
+        Tuple of (all task positions in the store, positions already obsolete)
     """
-    for task_file in tasks_dir.glob("*.json"):
+    existing: set[int] = set()
+    obsolete: set[int] = set()
+    for position in store.positions():
         try:
-            position = int(task_file.stem)
-            if position > max_written_position:
-                # Read existing, check if already obsolete
-                data = json.loads(task_file.read_text())
-                if (
-                    data.get("subject") == "[obsolete]"
-                    and data.get("status") == "completed"
-                ):
-                    continue  # Already obsolete
-                # Mark as obsolete (preserve other fields like blocks/blockedBy)
-                data["subject"] = "[obsolete]"
-                data["status"] = "completed"
-                # Ensure required fields exist
-                data.setdefault("blocks", [])
-                data.setdefault("blockedBy", [])
-                task_file.write_text(json.dumps(data, indent=2))
-        except (ValueError, json.JSONDecodeError):
-            continue  # Skip non-numeric or invalid files
+            data = store.read_task(position)
+        except ValueError:
+            continue  # Skip invalid files
+        if data is None:
+            continue
+        existing.add(position)
+        if _is_obsolete(data):
+            obsolete.add(position)
+    return existing, obsolete
+
+
+def _read_task_or_none(store: TaskStore, position: int) -> dict | None:
+    try:
+        return store.read_task(position)
+    except ValueError:
+        return None
+
+
+def _mark_obsolete(store: TaskStore, position: int) -> bool:
+    """Mark a single task obsolete.
+
+    Returns:
+        True if the position now holds an obsolete task, False if it was
+        missing or unreadable
+    """
+    try:
+        data = store.read_task(position)
+    except ValueError:
+        return False
+    if data is None:
+        return False
+    if _is_obsolete(data):
+        return True  # Already obsolete
+    # Mark as obsolete (preserve other fields like blocks/blockedBy)
+    data["subject"] = "[obsolete]"
+    data["status"] = "completed"
+    # Ensure required fields exist
+    data.setdefault("blocks", [])
+    data.setdefault("blockedBy", [])
+    store.write_task(position, data)
+    return True
+
+
+def _mark_extra_obsolete(
+    store: TaskStore,
+    written_positions: set[int],
+    position_map: dict[str, int] | None = None,
+) -> None:
+    """Mark existing tasks that were not written this run as obsolete.
+
+    Preserves existing blocks/blockedBy fields when marking obsolete.
+
+    A manifest in the store records the positions written by the previous
+    run, the highest position ever seen (high-water mark), which positions
+    are already obsolete and the semantic ID of each written task. Only
+    positions written last run but not this run are touched, plus any
+    tasks appended past the high-water mark since the last run (Claude
+    Code assigns new task IDs sequentially, so probing stops at the first
+    gap). Without a manifest, falls back to a full scan once.
+    """
+    max_written_position = max(written_positions, default=0)
+    manifest = load_tasks_manifest(store)
+
+    if manifest is None:
+        existing, obsolete = _scan_existing_positions(store)
+        candidates = {p for p in existing if p > max_written_position} - obsolete
+        high_water_mark = max(existing, default=0)
+    else:
+        obsolete = _ranges_to_positions(manifest.get("obsolete", []))
+        previous_max = manifest.get("max_written_position", 0)
+        high_water_mark = manifest.get("high_water_mark", previous_max)
+        # Positions that were live last run and were not rewritten now
+        candidates = _previous_written_positions(manifest) - written_positions - obsolete
+        # Tasks created after the last run (e.g. by the agent via TaskCreate)
+        probe = max(high_water_mark, max_written_position) + 1
+        while store.task_exists(probe):
+            candidates.add(probe)
+            probe += 1
+        high_water_mark = probe - 1
+
+    # Everything we just wrote is live again
+    obsolete -= written_positions
+
+    for position in sorted(candidates):
+        if _mark_obsolete(store, position):
+            obsolete.add(position)
+
+    save_tasks_manifest(
+        store,
+        max_written_position=max_written_position,
+        high_water_mark=max(high_water_mark, max_written_position),
+        obsolete_positions=obsolete,
+        written_positions=written_positions,
+        position_map=position_map,
+    )
 
 
 def build_dependency_graph(
     tasks: list[TaskToWrite],
     semantic_dependencies: dict[str, list[str]],
     semantic_to_position: dict[str, int],
+    *,
+    strict: bool = False,
+    reduce: bool = False,
 ) -> dict[int, tuple[list[str], list[str]]]:
     """Build blocks and blockedBy arrays for each task position.
 
@@ -193,31 +571,28 @@ def build_dependency_graph(
         tasks: List of tasks with positions
         semantic_dependencies: Dict of semantic_id -> list of semantic_ids it's blocked by
         semantic_to_position: Dict of semantic_id -> position number
+        strict: If True, references to IDs without a task raise instead of
+            being dropped
+        reduce: If True, drop edges implied by longer dependency chains
 
     Returns:
         Dict of position -> (blocks, blockedBy) where each is a list of position strings
-    """
-    # Initialize empty lists for each position
-    blocks: dict[int, list[str]] = {t.position: [] for t in tasks}
-    blocked_by: dict[int, list[str]] = {t.position: [] for t in tasks}
 
-    # Build blockedBy from semantic dependencies
+    Raises:
+        DependencyGraphError: On cycles, or on dangling references when strict
+    """
+    positions = {t.position for t in tasks}
+    graph = DependencyGraph(
+        semantic_id
+        for semantic_id, position in semantic_to_position.items()
+        if position in positions
+    )
     for semantic_id, deps in semantic_dependencies.items():
-        if semantic_id not in semantic_to_position:
-            continue
-        position = semantic_to_position[semantic_id]
-        if position not in blocked_by:
-            continue
         for dep_id in deps:
-            if dep_id in semantic_to_position:
-                dep_position = semantic_to_position[dep_id]
-                blocked_by[position].append(str(dep_position))
-
-    # Build blocks (inverse of blockedBy)
-    for position, deps in blocked_by.items():
-        for dep_pos_str in deps:
-            dep_pos = int(dep_pos_str)
-            if dep_pos in blocks:
-                blocks[dep_pos].append(str(position))
-
-    return {pos: (blocks[pos], blocked_by[pos]) for pos in blocks}
+            graph.add_dependency(semantic_id, dep_id)
+
+    graph.check(strict=strict)
+    if reduce:
+        graph.transitive_reduction()
+
+    return graph.to_position_graph(semantic_to_position, positions=sorted(positions))
@@ -0,0 +1,176 @@
+"""Git worktree-per-lane support for concurrent section implementation.
+
+Each parallel lane gets its own worktree and branch under
+{state_dir}/worktrees, so several agents can implement sections from one
+checkout without sharing a working tree. Completed lanes are merged back
+into the main branch in lane order.
+"""
+
+import subprocess
+from pathlib import Path
+
+WORKTREES_DIRNAME = "worktrees"
+LANE_BRANCH_PREFIX = "deep-implement/lane-"
+
+
+def worktrees_dir(state_dir: Path) -> Path:
+    """Directory holding the lane worktrees."""
+    return Path(state_dir) / WORKTREES_DIRNAME
+
+
+def lane_name(lane_number: int) -> str:
+    """Directory and branch suffix for a lane (1-based), e.g. "lane-01"."""
+    return f"lane-{lane_number:02d}"
+
+
+def _git(git_root: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        cwd=git_root,
+        capture_output=True,
+        text=True,
+    )
+
+
+def registered_worktrees(git_root: Path) -> dict[Path, str | None]:
+    """Worktrees known to git.
+
+    Returns:
+        Dict of resolved worktree path -> checked out branch (None if detached)
+    """
+    result = _git(git_root, "worktree", "list", "--porcelain")
+    if result.returncode != 0:
+        return {}
+    worktrees: dict[Path, str | None] = {}
+    current: Path | None = None
+    for line in result.stdout.splitlines():
+        if line.startswith("worktree "):
+            current = Path(line[len("worktree "):]).resolve()
+            worktrees[current] = None
+        elif line.startswith("branch ") and current is not None:
+            worktrees[current] = line[len("branch "):].removeprefix("refs/heads/")
+    return worktrees
+
+
+def _branch_exists(git_root: Path, branch: str) -> bool:
+    return _git(git_root, "rev-parse", "--verify", "--quiet", f"refs/heads/{branch}").returncode == 0
+
+
+def provision_lane_worktrees(
+    git_root: Path,
+    state_dir: Path,
+    lanes: list[list[str]],
+    base_ref: str = "HEAD",
+) -> list[dict]:
+    """Create (or reuse) one worktree and branch per lane.
+
+    Worktrees live in {state_dir}/worktrees/lane-NN on branches
+    deep-implement/lane-NN started from base_ref. Existing worktrees and
+    branches are reused, so re-running setup is safe. A "*" .gitignore in
+    the worktrees directory keeps the main checkout's status clean.
+
+    Args:
+        git_root: Main repository root
+        state_dir: Path to state directory
+        lanes: Section names per lane (e.g. from chain_lanes())
+        base_ref: Commit new lane branches start from
+
+    Returns:
+        List of {"lane", "worktree", "branch", "sections"} dicts
+
+    Raises:
+        RuntimeError: If git fails to create a worktree
+    """
+    root = worktrees_dir(state_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    (root / ".gitignore").write_text("*\n")
+
+    existing = registered_worktrees(git_root)
+    provisioned: list[dict] = []
+    for number, sections in enumerate(lanes, start=1):
+        path = root / lane_name(number)
+        branch = f"{LANE_BRANCH_PREFIX}{number:02d}"
+        if path.resolve() not in existing:
+            if _branch_exists(git_root, branch):
+                result = _git(git_root, "worktree", "add", str(path), branch)
+            else:
+                result = _git(git_root, "worktree", "add", "-b", branch, str(path), base_ref)
+            if result.returncode != 0:
+                raise RuntimeError(
+                    f"Could not create worktree for {lane_name(number)}: {result.stderr.strip()}"
+                )
+        provisioned.append({
+            "lane": number,
+            "worktree": str(path),
+            "branch": branch,
+            "sections": list(sections),
+        })
+    return provisioned
+
+
+def lane_for_section(lanes: list[dict], section: str) -> dict | None:
+    """The provisioned lane that owns a section, if any."""
+    return next((lane for lane in lanes if section in lane["sections"]), None)
+
+
+def section_work_dir(config: dict, section: str, worktree: str | None = None) -> Path:
+    """Checkout a section is staged and committed in.
+
+    With lane worktrees, a section's work happens in its lane's worktree,
+    not the main checkout.
+
+    Args:
+        config: Session config (its "lanes" come from setup --lane-worktrees)
+        section: Section name
+        worktree: Explicit worktree, overriding the lane lookup
+
+    Returns:
+        The worktree path, or the main repository root outside lane mode
+    """
+    if worktree:
+        return Path(worktree)
+    lane = lane_for_section(config.get("lanes") or [], section)
+    return Path(lane["worktree"]) if lane is not None else Path(config["git_root"])
+
+
+def lane_dependencies(
+    lanes: list[dict],
+    section_dependencies: dict[str, list[str]],
+) -> dict[int, list[int]]:
+    """Other lanes whose work each lane builds on.
+
+    A lane needs another lane's branch merged in before starting a section
+    that depends on a section implemented there.
+
+    Returns:
+        Dict of lane number -> sorted lane numbers it depends on
+    """
+    owner = {section: lane["lane"] for lane in lanes for section in lane["sections"]}
+    needs: dict[int, set[int]] = {lane["lane"]: set() for lane in lanes}
+    for lane in lanes:
+        for section in lane["sections"]:
+            for dependency in section_dependencies.get(section, []):
+                if owner.get(dependency, lane["lane"]) != lane["lane"]:
+                    needs[lane["lane"]].add(owner[dependency])
+    return {number: sorted(deps) for number, deps in needs.items()}
+
+
+def merge_lane(git_root: Path, branch: str) -> dict:
+    """Merge one lane branch into the branch checked out at git_root.
+
+    A conflicting merge is aborted, leaving the main checkout unchanged.
+
+    Returns:
+        {"merged": bool, "commit": str | None, "error": str | None}
+    """
+    result = _git(git_root, "merge", "--no-ff", "--no-edit", branch)
+    if result.returncode != 0:
+        _git(git_root, "merge", "--abort")
+        return {"merged": False, "commit": None, "error": (result.stdout + result.stderr).strip()}
+    head = _git(git_root, "rev-parse", "HEAD")
+    return {"merged": True, "commit": head.stdout.strip(), "error": None}
+
+
+def remove_lane_worktree(git_root: Path, worktree: str) -> bool:
+    """Remove a lane worktree (its branch is kept)."""
+    return _git(git_root, "worktree", "remove", worktree).returncode == 0
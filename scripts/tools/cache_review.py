@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Store or look up a section's code review in the review cache.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/cache_review.py \
+        --state-dir "{state_dir}" --section "section-01-foundation" \
+        (--lookup | --store)
+
+Reviews are cached under the SHA-256 of section-NN-diff.md and the
+section plan. --lookup, run before launching the reviewer, restores a
+cached review as section-NN-review.md on a hit. --store, run after the
+review file is written, adds it to the cache.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.config import load_session_config
+from scripts.lib.review_cache import (
+    cache_section_review,
+    restore_cached_review,
+    review_file,
+    section_cache_key,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Store or look up a cached code review")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--section", required=True, help="Section name")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--lookup", action="store_true", help="Restore a cached review of the same diff and plan")
+    mode.add_argument("--store", action="store_true", help="Cache the section's written review")
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+    config = load_session_config(state_dir)
+    if config is None:
+        print(f"Error: No config found in {state_dir}")
+        return 1
+    sections_dir = Path(config["sections_dir"])
+
+    if args.store:
+        key = cache_section_review(state_dir, sections_dir, args.section)
+        if key is None:
+            print(f"Error: {args.section} needs a diff, a section plan and a review file to cache")
+            return 1
+        print(json.dumps({"success": True, "stored": True, "key": key}, indent=2))
+        return 0
+
+    hit = restore_cached_review(state_dir, sections_dir, args.section)
+    print(json.dumps({
+        "success": True,
+        "hit": hit,
+        "key": section_cache_key(state_dir, sections_dir, args.section),
+        "review_file": str(review_file(state_dir, args.section)) if hit else None,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
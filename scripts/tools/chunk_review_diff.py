@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Split a section's review diff into chunks, or merge the chunk reviews.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/chunk_review_diff.py \
+        --state-dir "{state_dir}" --section "section-02-api" \
+        [--max-tokens 12000] [--group-by module|file]
+
+    uv run {plugin_root}/scripts/tools/chunk_review_diff.py \
+        --state-dir "{state_dir}" --section "section-02-api" --merge
+
+Chunking reads {state_dir}/code_review/section-NN-diff.md, writes
+section-NN-diff-chunk-KK.md files and a section-NN-chunks.json manifest,
+and prints the manifest. Each chunk goes to its own code-reviewer
+subagent, whose JSON output is saved to the chunk's "review" path.
+--merge then joins those outputs into section-NN-review.md.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.diff_chunks import (
+    DEFAULT_CHUNK_TOKENS,
+    GROUP_MODES,
+    merge_chunk_reviews,
+    write_diff_chunks,
+)
+from scripts.lib.leases import LeaseBusyError
+from scripts.lib.review_state import code_review_dir, section_number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Chunk a section diff for parallel review")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--section", required=True, help="Section name")
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=DEFAULT_CHUNK_TOKENS,
+        help=f"Token budget per chunk (default: {DEFAULT_CHUNK_TOKENS})",
+    )
+    parser.add_argument(
+        "--group-by",
+        choices=GROUP_MODES,
+        default="module",
+        help="Keep files of one directory together (module) or chunk per file",
+    )
+    parser.add_argument("--merge", action="store_true", help="Merge chunk reviews into section-NN-review.md")
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+
+    if args.merge:
+        try:
+            path = merge_chunk_reviews(state_dir, args.section)
+        except (ValueError, LeaseBusyError) as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Merged review written to {path}")
+        return 0
+
+    diff_path = code_review_dir(state_dir) / f"section-{section_number(args.section)}-diff.md"
+    if not diff_path.exists():
+        print(f"Error: No diff found at {diff_path}")
+        return 1
+
+    try:
+        manifest = write_diff_chunks(
+            state_dir, args.section, diff_path.read_text(), args.max_tokens, args.group_by
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    print(json.dumps(manifest, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
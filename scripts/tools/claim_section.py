@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Claim a section so concurrent sessions on one task list never collide.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/claim_section.py \
+        --state-dir "{state_dir}" --owner "{session_id}" \
+        [--section "section-02-api"] [--heartbeat | --release] [--ttl 1800]
+
+Without --section, claims the most urgent ready section (dependencies
+complete) that no other session holds. Claims are lease files in
+{state_dir}/leases; a claim whose holder stopped sending heartbeats for
+--ttl seconds is reclaimed. After a claim or release the section's task
+files are updated in place so its open tasks show their owner.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.leases import (
+    DEFAULT_LEASE_TTL,
+    acquire_lease,
+    claim_next_section,
+    leases_dir,
+    read_lease,
+    release_lease,
+    renew_lease,
+)
+from scripts.lib.session_tasks import SetupInProgressError, claimable_sections, set_section_owner
+
+
+def _set_owner(state_dir: Path, section: str, owner: str) -> None:
+    """Show the claim as the owner of the section's open tasks."""
+    try:
+        set_section_owner(state_dir, section, owner)
+    except (OSError, KeyError, ValueError, SetupInProgressError) as e:
+        # The claim itself is recorded; only the task list is stale
+        print(f"Warning: could not update task list: {e}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Claim a section for this session")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--owner", required=True, help="Session claiming the section (e.g. DEEP_SESSION_ID)")
+    parser.add_argument("--section", help="Section to claim, renew or release (default: next ready section)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--heartbeat", action="store_true", help="Renew this session's claim on --section")
+    mode.add_argument("--release", action="store_true", help="Give up this session's claim on --section")
+    parser.add_argument(
+        "--ttl",
+        type=int,
+        default=DEFAULT_LEASE_TTL,
+        help=f"Seconds without a heartbeat before the claim can be reclaimed (default: {DEFAULT_LEASE_TTL})",
+    )
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+    directory = leases_dir(state_dir)
+
+    if (args.heartbeat or args.release) and not args.section:
+        print("Error: --heartbeat and --release need --section")
+        return 1
+
+    if args.heartbeat:
+        if renew_lease(directory, args.section, args.owner) is None:
+            print(f"Error: {args.section} is not claimed by {args.owner}")
+            return 1
+        print(f"Renewed claim on {args.section}")
+        return 0
+
+    if args.release:
+        if not release_lease(directory, args.section, args.owner):
+            print(f"Error: {args.section} is not claimed by {args.owner}")
+            return 1
+        print(f"Released {args.section}")
+        _set_owner(state_dir, args.section, "")
+        return 0
+
+    try:
+        ready = claimable_sections(state_dir)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.section:
+        if args.section not in ready:
+            print(f"Error: {args.section} is not ready (unfinished dependencies or already complete)")
+            return 1
+        lease = acquire_lease(directory, args.section, args.owner, ttl=args.ttl)
+        if lease is None:
+            holder = read_lease(directory, args.section) or {}
+            print(f"Error: {args.section} is claimed by {holder.get('owner', 'another session')}")
+            return 1
+    else:
+        lease = claim_next_section(state_dir, ready, args.owner, ttl=args.ttl)
+        if lease is None:
+            print("No section to claim: every ready section is claimed or waiting on dependencies")
+            return 0
+
+    print(f"Claimed {lease['name']} (send --heartbeat within {int(lease['ttl'])}s to keep it)")
+    _set_owner(state_dir, lease["name"], args.owner)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
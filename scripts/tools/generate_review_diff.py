@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Write a section's staged diff for code review, minus the noise.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/generate_review_diff.py \
+        --state-dir "{state_dir}" --section "section-01-foundation" \
+        [--exclude "docs/generated/*" ...] [--no-default-excludes] \
+        [--delta] [--worktree <path>] [-- path ...]
+
+Writes {state_dir}/code_review/section-NN-diff.md: a --numstat header of
+every staged file, then the diff (rename/copy detection on) without
+excluded, binary or whitespace-only files. Exclude globs come from the
+defaults, the review_excludes key of PROJECT_CONFIG (comma-separated) and
+--exclude. Paths after "--" limit the diff to one section's files
+(pipelined review), relative to the repository root. Size metrics are
+saved as the section's review_diff state; the printed JSON says whether
+anything is left to review.
+
+Each capture records the index tree oid as the section's reviewed_tree.
+--delta writes section-NN-delta.md instead: only the changes between that
+tree and the current index (e.g. interview fixes), for a cheap follow-up
+review. Its metrics are saved as review_delta and the checkpoint advances.
+
+With lane worktrees, git runs in the section's lane worktree (or the one
+given with --worktree), where the section was staged.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.config import load_session_config, merge_section_state
+from scripts.lib.review_diff import DEFAULT_REVIEW_EXCLUDES, generate_review_diff, write_tree
+from scripts.lib.review_state import code_review_dir, section_number
+from scripts.lib.sections import parse_project_config_block
+from scripts.lib.worktrees import section_work_dir
+
+
+def configured_excludes(sections_dir: Path) -> list[str]:
+    """Exclude globs from the review_excludes key of PROJECT_CONFIG."""
+    index = Path(sections_dir) / "index.md"
+    if not index.exists():
+        return []
+    raw = parse_project_config_block(index.read_text()).get("review_excludes", "")
+    return [pattern.strip() for pattern in raw.split(",") if pattern.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write a lean review diff for a section")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--section", required=True, help="Section name")
+    parser.add_argument("--exclude", action="append", default=[], help="Extra glob to leave out (repeatable)")
+    parser.add_argument(
+        "--no-default-excludes",
+        action="store_true",
+        help="Do not leave out lockfiles, snapshots and generated code by default",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only diff changes since the last reviewed tree (writes section-NN-delta.md)",
+    )
+    parser.add_argument("--worktree", help="Checkout the section is staged in (default: its lane worktree)")
+    parser.add_argument("paths", nargs="*", help="Limit the diff to these paths")
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+    config = load_session_config(state_dir)
+    if config is None:
+        print(f"Error: No config found in {state_dir}")
+        return 1
+
+    excludes = [
+        *([] if args.no_default_excludes else DEFAULT_REVIEW_EXCLUDES),
+        *configured_excludes(Path(config.get("sections_dir", ""))),
+        *args.exclude,
+    ]
+
+    base = None
+    if args.delta:
+        base = config.get("sections_state", {}).get(args.section, {}).get("reviewed_tree")
+        if not base:
+            print(f"Error: No reviewed tree recorded for {args.section} (capture the full diff first)")
+            return 1
+
+    work_dir = section_work_dir(config, args.section, args.worktree)
+    try:
+        review = generate_review_diff(work_dir, excludes, args.paths, base)
+        tree = write_tree(work_dir)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return 1
+
+    kind = "delta" if args.delta else "diff"
+    diff_path = code_review_dir(state_dir) / f"section-{section_number(args.section)}-{kind}.md"
+    diff_path.parent.mkdir(parents=True, exist_ok=True)
+    content = review.render(args.section, base)
+    diff_path.write_text(content)
+
+    metrics = review.metrics(content)
+    merge_section_state(state_dir, args.section, {f"review_{kind}": metrics, "reviewed_tree": tree})
+    print(json.dumps({
+        "success": True,
+        "diff_file": str(diff_path),
+        "reviewed_tree": tree,
+        "has_reviewable_changes": metrics["files_reviewed"] > 0,
+        **metrics,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
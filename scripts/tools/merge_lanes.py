@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Merge completed lane branches back into the main checkout, in lane order.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/merge_lanes.py \
+        --state-dir "{state_dir}" [--remove-worktrees]
+
+Lanes are the worktrees provisioned by setup with --lane-worktrees. Lanes
+are merged one at a time (git merge --no-ff) into the branch checked out
+at git_root; merging stops at the first lane with unfinished sections or
+a merge conflict, which is aborted and reported.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.config import load_session_config, update_session_config
+from scripts.lib.leases import LeaseBusyError
+from scripts.lib.worktrees import merge_lane, remove_lane_worktree
+
+
+def _record_merge(state_dir: Path, branch: str, commit: str) -> bool:
+    """Store the merge commit on the lane entry.
+
+    Returns:
+        False if the config is gone
+    """
+    def record(config: dict | None) -> dict | None:
+        if config is None:
+            return None
+        for lane in config.get("lanes", []):
+            if lane["branch"] == branch:
+                lane["merged_commit"] = commit
+        return config
+
+    return update_session_config(state_dir, record) is not None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Merge completed lanes")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument(
+        "--remove-worktrees",
+        action="store_true",
+        help="Remove each lane's worktree after merging it",
+    )
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+
+    config = load_session_config(state_dir)
+    if config is None:
+        print(f"Error: No config found in {state_dir}")
+        return 1
+
+    lanes = config.get("lanes", [])
+    if not lanes:
+        print("Error: No lanes recorded (run setup with --lane-worktrees)")
+        return 1
+
+    git_root = Path(config["git_root"])
+    sections_state = config.get("sections_state", {})
+
+    for lane in lanes:
+        name = f"lane {lane['lane']:02d} ({lane['branch']})"
+        if lane.get("merged_commit"):
+            print(f"Already merged {name}: {lane['merged_commit']}")
+            continue
+
+        pending = [
+            s for s in lane["sections"]
+            if sections_state.get(s, {}).get("status") != "complete"
+        ]
+        if pending:
+            print(f"Stopped at {name}: unfinished sections {', '.join(pending)}")
+            return 0
+
+        result = merge_lane(git_root, lane["branch"])
+        if not result["merged"]:
+            print(f"Error: merging {name} failed and was aborted:\n{result['error']}")
+            return 1
+
+        print(f"Merged {name}: {result['commit']}")
+        try:
+            recorded = _record_merge(state_dir, lane["branch"], result["commit"])
+        except LeaseBusyError as e:
+            print(f"Error: could not record the merge of {name}: {e}")
+            return 1
+        if not recorded:
+            print(f"Error: No config found in {state_dir} (merge of {name} not recorded)")
+            return 1
+
+        if args.remove_worktrees and not remove_lane_worktree(git_root, lane["worktree"]):
+            print(f"Warning: could not remove worktree {lane['worktree']}")
+
+    print("All lanes merged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Record, list and resolve structured code review findings.
+
+Usage:
+    # Save the code-reviewer's JSON output: prose to section-NN-review.md,
+    # findings to section-NN-findings.json
+    uv run {plugin_root}/scripts/tools/review_findings.py \
+        --state-dir "{state_dir}" --section "section-01-foundation" \
+        --record reviewer-output.json
+
+    # Findings for triage (most severe first)
+    uv run {plugin_root}/scripts/tools/review_findings.py \
+        --state-dir "{state_dir}" --section "section-01-foundation" \
+        --list [--min-severity high] [--open]
+
+    # Record a triage decision
+    uv run {plugin_root}/scripts/tools/review_findings.py \
+        --state-dir "{state_dir}" --section "section-01-foundation" \
+        --resolve F2 --status fixed [--note "Added 404 handling"]
+
+    # Counts per section
+    uv run {plugin_root}/scripts/tools/review_findings.py --state-dir "{state_dir}" --index
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.diff_chunks import section_title
+from scripts.lib.leases import LeaseBusyError
+from scripts.lib.review_cache import review_file
+from scripts.lib.review_findings import (
+    SEVERITIES,
+    STATUSES,
+    load_findings,
+    load_findings_index,
+    parse_findings,
+    resolve_finding,
+    save_findings,
+)
+
+
+def record(state_dir: Path, section: str, output_path: str) -> int:
+    """Split a reviewer's JSON output into the review and findings files."""
+    try:
+        raw = sys.stdin.read() if output_path == "-" else Path(output_path).read_text()
+        output = json.loads(raw)
+        findings = parse_findings(output.get("findings", []))
+    except (OSError, json.JSONDecodeError, AttributeError, ValueError) as e:
+        print(f"Error: Invalid reviewer output: {e}")
+        return 1
+
+    review_path = review_file(state_dir, section)
+    review_path.parent.mkdir(parents=True, exist_ok=True)
+    review_path.write_text(f"# Code Review: {section_title(section)}\n\n{str(output.get('review', '')).strip()}\n")
+    try:
+        findings_file = save_findings(state_dir, section, findings)
+    except LeaseBusyError as e:
+        print(f"Error: could not update the findings index: {e}")
+        return 1
+    print(json.dumps({
+        "success": True,
+        "review_file": str(review_path),
+        "findings_file": str(findings_file),
+        "findings": len(findings),
+    }, indent=2))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage structured code review findings")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--section", help="Section name (all modes except --index)")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--record", metavar="FILE", help="Reviewer JSON output to save ('-' for stdin)")
+    mode.add_argument("--list", action="store_true", help="Print the section's findings as JSON")
+    mode.add_argument("--resolve", metavar="ID", help="Finding to resolve (e.g. F2)")
+    mode.add_argument("--index", action="store_true", help="Print findings counts for every section")
+    parser.add_argument("--min-severity", choices=SEVERITIES, help="With --list: only this severity or worse")
+    parser.add_argument("--open", action="store_true", help="With --list: skip resolved findings")
+    parser.add_argument("--status", choices=STATUSES, help="With --resolve: the triage decision")
+    parser.add_argument("--note", default="", help="With --resolve: what was done")
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+
+    if args.index:
+        print(json.dumps(load_findings_index(state_dir), indent=2))
+        return 0
+
+    if not args.section:
+        print("Error: --section is required")
+        return 1
+
+    if args.record:
+        return record(state_dir, args.section, args.record)
+
+    try:
+        if args.list:
+            findings = load_findings(
+                state_dir, args.section, min_severity=args.min_severity, open_only=args.open
+            )
+            print(json.dumps([asdict(f) for f in findings], indent=2))
+            return 0
+        if not args.status:
+            print("Error: --resolve needs --status")
+            return 1
+        finding = resolve_finding(state_dir, args.section, args.resolve, args.status, args.note)
+    except (ValueError, LeaseBusyError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(json.dumps(asdict(finding), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
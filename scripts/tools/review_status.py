@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Show the review status of every section in the plan.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/review_status.py \
+        --state-dir "{state_dir}" [--json]
+
+Reads the code_review directory once and reports, per section, whether it
+is complete, in review or pending, the step to resume it from, and the
+sizes of its diff, review and interview files.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.config import load_session_config
+from scripts.lib.review_state import ARTIFACT_KINDS, review_status, scan_review_artifacts
+from scripts.lib.sections import get_completed_sections
+
+
+def _format_size(size: int) -> str:
+    return f"{size} B" if size < 1024 else f"{size / 1024:.1f} KiB"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show review status of every section")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON")
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+
+    config = load_session_config(state_dir)
+    if config is None:
+        print(f"Error: No config found in {state_dir}")
+        return 1
+
+    sections = config.get("sections", [])
+    completed = get_completed_sections(state_dir, Path(config["git_root"]))
+    status = review_status(scan_review_artifacts(state_dir), sections, completed)
+
+    if args.json:
+        print(json.dumps(status, indent=2))
+        return 0
+
+    width = max((len(s) for s in sections), default=0)
+    for section, entry in status.items():
+        artifacts = "  ".join(
+            f"{kind} {_format_size(entry['artifacts'][kind]['size'])}"
+            for kind in ARTIFACT_KINDS
+            if kind in entry["artifacts"]
+        )
+        resume = f"  (resume: {entry['resume_step']})" if entry["status"] == "in_review" else ""
+        print(f"{section:<{width}}  {entry['status']:<9}  {artifacts}{resume}".rstrip())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
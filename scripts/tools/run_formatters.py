@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Run the detected formatter hooks on staged files before review.
+
+Usage:
+    uv run {plugin_root}/scripts/tools/run_formatters.py \
+        --state-dir "{state_dir}" --section "section-01-foundation" \
+        [--worktree <path>] [-- path ...]
+
+Runs each of the session's detected_formatters as `pre-commit run <id>
+--files <staged files>` and re-stages the files they rewrite, so the
+review diff and the commit see formatted code and the commit does not
+fail on formatter changes. Paths after "--" (relative to the repository
+root) limit the pass to one section's files. Skips cleanly when no
+formatter hooks were detected, only a native hook exists, or pre-commit
+is not installed; the commit's re-stage and retry handles those cases.
+
+With lane worktrees, the hooks run in the section's lane worktree (or the
+one given with --worktree), where the section was staged.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.lib.config import load_session_config, merge_section_state
+from scripts.lib.formatters import run_formatters, staged_files
+from scripts.lib.worktrees import section_work_dir
+
+
+def _skip(reason: str) -> int:
+    print(json.dumps({"success": True, "skipped": reason, "formatted_files": []}, indent=2))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Format staged files before review")
+    parser.add_argument("--state-dir", required=True, help="Path to state directory")
+    parser.add_argument("--section", required=True, help="Section name")
+    parser.add_argument("--worktree", help="Checkout the section is staged in (default: its lane worktree)")
+    parser.add_argument("paths", nargs="*", help="Only format these staged paths")
+    args = parser.parse_args()
+
+    state_dir = Path(args.state_dir)
+    config = load_session_config(state_dir)
+    if config is None:
+        print(f"Error: No config found in {state_dir}")
+        return 1
+
+    pre_commit = config.get("pre_commit", {})
+    formatters = pre_commit.get("detected_formatters", [])
+    if not formatters:
+        return _skip("No formatter hooks detected")
+    if pre_commit.get("type") not in ("pre-commit-framework", "both"):
+        return _skip("Formatters in a native hook cannot be run separately")
+
+    work_dir = section_work_dir(config, args.section, args.worktree)
+    try:
+        files = staged_files(work_dir)
+        if args.paths:
+            wanted = set(args.paths)
+            files = [f for f in files if f in wanted]
+        if not files:
+            return _skip("No staged files")
+        result = run_formatters(work_dir, formatters, files)
+    except RuntimeError as e:
+        return _skip(str(e))
+    except subprocess.CalledProcessError as e:
+        print(f"Error: Could not re-stage formatted files: {(e.stderr or '').strip() or e}")
+        return 1
+
+    merge_section_state(state_dir, args.section, {
+        "preformat": {"hooks": result["ran"], "formatted_files": result["formatted_files"]},
+    })
+    print(json.dumps({"success": not result["failed"], **result}, indent=2))
+    return 0 if not result["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
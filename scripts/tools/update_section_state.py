@@ -6,6 +6,9 @@ Usage:
         --state-dir "{state_dir}" \
         --section "section-01-foundation" \
         --commit-hash "abc1234"
+
+Sections implemented in a lane worktree also record the worktree path and
+branch (detected from the session's lanes, or passed with --worktree).
 """
 
 import argparse
@@ -14,7 +17,11 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.lib.config import load_session_config, save_session_config
+from scripts.lib.config import load_session_config, merge_section_state
+from scripts.lib.leases import LeaseBusyError, leases_dir, release_lease
+from scripts.lib.worktrees import lane_for_section
+from scripts.lib.task_graph import DependencyGraphError
+from scripts.lib.session_tasks import refresh_session_tasks
 
 
 def main() -> int:
@@ -23,6 +30,7 @@ def main() -> int:
     parser.add_argument("--section", required=True, help="Section name")
     parser.add_argument("--commit-hash", required=True, help="Git commit hash")
     parser.add_argument("--review-file", help="Review file name (optional)")
+    parser.add_argument("--worktree", help="Lane worktree the section was committed in (optional)")
     args = parser.parse_args()
 
     state_dir = Path(args.state_dir)
@@ -33,22 +41,47 @@ def main() -> int:
         print(f"Error: No config found in {state_dir}")
         return 1
 
-    # Update sections_state
-    if "sections_state" not in config:
-        config["sections_state"] = {}
-
-    config["sections_state"][args.section] = {
+    updates = {
         "status": "complete",
         "commit_hash": args.commit_hash,
     }
 
     if args.review_file:
-        config["sections_state"][args.section]["review_file"] = args.review_file
+        updates["review_file"] = args.review_file
 
-    # Save
-    save_session_config(state_dir, config)
+    lane = lane_for_section(config.get("lanes", []), args.section)
+    if lane is not None:
+        updates["lane"] = lane["lane"]
+        updates["worktree"] = lane["worktree"]
+        updates["branch"] = lane["branch"]
+    if args.worktree:
+        updates["worktree"] = args.worktree
+
+    # Merge into existing section state (other lanes may be saving too)
+    try:
+        merge_section_state(state_dir, args.section, updates)
+    except LeaseBusyError as e:
+        print(f"Error: could not save {args.section}: {e}")
+        return 1
 
     print(f"Updated {args.section}: commit_hash={args.commit_hash}")
+
+    # A completed section no longer needs its claim
+    release_lease(leases_dir(state_dir), args.section)
+
+    # Advance the task window so the next section gets materialized
+    try:
+        refresh = refresh_session_tasks(state_dir, windowed_only=True)
+    except (OSError, KeyError, ValueError, DependencyGraphError) as e:
+        # The completion is already saved; only the task list is stale
+        print(f"Warning: could not advance task window: {e}")
+        return 0
+    if refresh is not None:
+        if refresh.success:
+            print(f"Advanced task window: {refresh.tasks_written} tasks written")
+        else:
+            print(f"Warning: could not advance task window: {refresh.error}")
+
     return 0
 
 
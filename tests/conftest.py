@@ -94,3 +94,36 @@ def sample_config():
         "sections_state": {},
         "created_at": "2025-01-14T10:30:00Z"
     }
+
+
+# Stand-in for `pre-commit run <id> --files ...`: "upper" uppercases the
+# files, "lint" fails without touching them, anything else passes
+FAKE_PRE_COMMIT = """
+import sys
+hook, files = sys.argv[2], sys.argv[4:]
+if hook == "upper":
+    changed = False
+    for name in files:
+        text = open(name).read()
+        if text != text.upper():
+            open(name, "w").write(text.upper())
+            changed = True
+    sys.exit(1 if changed else 0)
+if hook == "lint":
+    print("lint: E501 line too long")
+    sys.exit(1)
+if hook == "lock-index":
+    open(".git/index.lock", "w").close()
+"""
+
+
+@pytest.fixture
+def fake_pre_commit_bin(tmp_path):
+    """Directory with a fake `pre-commit` executable, for putting on PATH."""
+    import sys
+    bin_dir = tmp_path / "fake-bin"
+    bin_dir.mkdir()
+    script = bin_dir / "pre-commit"
+    script.write_text(f"#!{sys.executable}{FAKE_PRE_COMMIT}")
+    script.chmod(0o755)
+    return bin_dir
@@ -0,0 +1,61 @@
+"""Light checks for the benchmark suite (the full run lives in benchmarks/)."""
+
+import pytest
+
+from benchmarks.plan_generator import section_names, synthetic_plan
+from benchmarks.run_benchmarks import TIME_FLOOR_MS, benchmark_plan, find_regressions
+
+
+class TestSyntheticPlan:
+    """Tests for the synthetic plan generator."""
+
+    def test_names_sort_in_manifest_order(self):
+        names = section_names(1000)
+
+        assert names[0] == "section-0001-core"
+        assert names == sorted(names)
+
+    def test_resume_state(self):
+        plan = synthetic_plan(10, "resume")
+
+        assert plan.completed_sections == plan.sections[:5]
+        assert plan.resume_section == plan.sections[5]
+
+    def test_unknown_state(self):
+        with pytest.raises(ValueError, match="Unknown plan state"):
+            synthetic_plan(10, "halfway")
+
+
+class TestBenchmarkPlan:
+    """Tests for benchmark_plan and regression detection."""
+
+    def test_measures_every_stage(self):
+        results = benchmark_plan(10, "fresh", repeat=1)
+
+        assert set(results) == {"generate", "graph", "write", "setup"}
+        assert results["write"]["files_written"] == 72
+        assert results["setup"]["files_written"] > 0
+        assert all(metrics["peak_kib"] > 0 for metrics in results.values())
+
+    def test_regression_over_threshold(self):
+        baseline = {"10": {"fresh": {"graph": {"time_ms": 100.0, "peak_kib": 50.0}}}}
+        results = {"10": {"fresh": {"graph": {"time_ms": 120.0, "peak_kib": 80.0}}}}
+
+        regressions = find_regressions(results, baseline, threshold=0.25)
+
+        assert len(regressions) == 1
+        assert "peak_kib" in regressions[0]
+
+    def test_tiny_timings_use_floor(self):
+        baseline = {"10": {"fresh": {"generate": {"time_ms": 0.1}}}}
+        results = {"10": {"fresh": {"generate": {"time_ms": TIME_FLOOR_MS}}}}
+
+        assert find_regressions(results, baseline, threshold=0.1, compare_times=True) == []
+
+    def test_times_only_compared_on_request(self):
+        """Wall times from another machine are not compared by default."""
+        baseline = {"10": {"fresh": {"setup": {"time_ms": 100.0}}}}
+        results = {"10": {"fresh": {"setup": {"time_ms": 400.0}}}}
+
+        assert find_regressions(results, baseline, threshold=0.5) == []
+        assert len(find_regressions(results, baseline, threshold=0.5, compare_times=True)) == 1
@@ -1,5 +1,6 @@
 import pytest
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from scripts.lib.config import (
@@ -7,6 +8,8 @@ from scripts.lib.config import (
     save_session_config,
     create_session_config,
     update_section_state,
+    merge_section_state,
+    update_session_config,
     CONFIG_FILE,
 )
 
@@ -185,3 +188,88 @@ class TestUpdateSectionState:
         state = config["sections_state"]["section-01-foundation"]
         assert state["pre_commit"]["hooks_ran"] is True
         assert state["pre_commit"]["modification_retries"] == 1
+
+
+class TestUpdateSessionConfig:
+    """Tests for update_session_config function."""
+
+    def test_saves_returned_config(self, mock_implementation_dir, sample_config):
+        save_session_config(mock_implementation_dir, sample_config)
+
+        saved = update_session_config(mock_implementation_dir, lambda config: {**config, "task_list_id": "abc"})
+
+        assert saved["task_list_id"] == "abc"
+        assert load_session_config(mock_implementation_dir) == saved
+        assert [p.name for p in mock_implementation_dir.iterdir()] == [CONFIG_FILE]
+
+    def test_missing_config_is_left_alone(self, mock_implementation_dir):
+        """Returning None for a missing config should not create one."""
+        assert update_session_config(mock_implementation_dir, lambda config: config) is None
+        assert load_session_config(mock_implementation_dir) is None
+
+    def test_concurrent_updates_are_not_lost(self, mock_implementation_dir, sample_config):
+        """Config writers racing with section state merges should all be kept."""
+        save_session_config(mock_implementation_dir, sample_config)
+
+        def add_lane(index: int) -> None:
+            def update(config):
+                config.setdefault("lanes", []).append({"lane": index})
+                return config
+            update_session_config(mock_implementation_dir, update)
+
+        def complete_section(index: int) -> None:
+            merge_section_state(mock_implementation_dir, f"section-{index:02d}", {"status": "complete"})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(write, i) for i in range(4) for write in (add_lane, complete_section)]
+            for future in futures:
+                future.result()
+
+        config = load_session_config(mock_implementation_dir)
+        assert sorted(lane["lane"] for lane in config["lanes"]) == [0, 1, 2, 3]
+        assert len(config["sections_state"]) == 4
+
+
+class TestMergeSectionState:
+    """Tests for merge_section_state function."""
+
+    def test_keeps_existing_fields(self, mock_implementation_dir, sample_config):
+        """Fields not being updated should be preserved."""
+        sample_config["sections_state"] = {
+            "section-01-foundation": {"status": "in_progress", "worktree": "/wt/lane-01"},
+        }
+        save_session_config(mock_implementation_dir, sample_config)
+
+        state = merge_section_state(
+            mock_implementation_dir, "section-01-foundation", {"status": "complete", "commit_hash": "abc"}
+        )
+
+        assert state == {"status": "complete", "worktree": "/wt/lane-01", "commit_hash": "abc"}
+        assert load_session_config(mock_implementation_dir)["sections_state"]["section-01-foundation"] == state
+
+    def test_requires_config(self, mock_implementation_dir):
+        with pytest.raises(ValueError, match="No config"):
+            merge_section_state(mock_implementation_dir, "section-01-foundation", {})
+
+    def test_save_leaves_no_temp_files(self, mock_implementation_dir, sample_config):
+        """Atomic saves should not leave temporary files behind."""
+        save_session_config(mock_implementation_dir, sample_config)
+        merge_section_state(mock_implementation_dir, "section-01-foundation", {"status": "complete"})
+
+        assert [p.name for p in mock_implementation_dir.iterdir()] == [CONFIG_FILE]
+
+    def test_concurrent_merges_are_not_lost(self, mock_implementation_dir, sample_config):
+        """Updates racing from several lanes should all be kept."""
+        save_session_config(mock_implementation_dir, sample_config)
+        sections = [f"section-{i:02d}-lane" for i in range(1, 9)]
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            list(pool.map(
+                lambda section: merge_section_state(
+                    mock_implementation_dir, section, {"status": "complete"}
+                ),
+                sections,
+            ))
+
+        states = load_session_config(mock_implementation_dir)["sections_state"]
+        assert all(states[section] == {"status": "complete"} for section in sections)
@@ -0,0 +1,87 @@
+"""Tests for context budget estimation and compaction scheduling."""
+
+from scripts.lib.context_budget import (
+    CHARS_PER_TOKEN,
+    DEFAULT_DIFF_RATIO,
+    STEP_OVERHEAD_TOKENS,
+    code_block_chars,
+    diff_ratio,
+    estimate_section_tokens,
+    historical_diff_sizes,
+    schedule_compactions,
+)
+
+
+class TestEstimateSectionTokens:
+    """Tests for per-section token estimates."""
+
+    def test_counts_code_blocks(self):
+        """Only fenced code block bodies should count as code."""
+        content = "Intro\n```python\nprint('hi')\n```\nOutro"
+
+        assert code_block_chars(content) == len("print('hi')\n")
+
+    def test_estimate_grows_with_code(self):
+        """Sections with more planned code should cost more tokens."""
+        prose = "# Section\n" + "words " * 100
+        code = prose + "```python\n" + "x = 1\n" * 500 + "```\n"
+
+        assert estimate_section_tokens(code, step_count=6) > estimate_section_tokens(prose, step_count=6)
+
+    def test_actual_diff_size_overrides_prediction(self):
+        """A known diff size should replace the code-block prediction."""
+        content = "```\n" + "y\n" * 100 + "```"
+
+        estimate = estimate_section_tokens(content, step_count=0, diff_size=0)
+
+        assert estimate == -(-len(content) // CHARS_PER_TOKEN)
+
+    def test_step_overhead(self):
+        """Each workflow step should add a fixed overhead."""
+        assert estimate_section_tokens("", step_count=3) == 3 * STEP_OVERHEAD_TOKENS
+
+
+class TestDiffHistory:
+    """Tests for learning the diff ratio from earlier sections."""
+
+    def test_reads_diff_sizes(self, tmp_path):
+        """Diff files are matched to sections by number."""
+        (tmp_path / "code_review").mkdir()
+        (tmp_path / "code_review" / "section-02-diff.md").write_text("d" * 300)
+
+        sizes = historical_diff_sizes(tmp_path, ["section-01-a", "section-02-b"])
+
+        assert sizes == {"section-02-b": 300}
+
+    def test_ratio_from_history(self):
+        """Ratio should be total diff size over total planned code."""
+        contents = {"section-01-a": "```\n" + "a" * 99 + "\n```"}
+
+        assert diff_ratio(contents, {"section-01-a": 400}) == 4.0
+
+    def test_default_ratio_without_history(self):
+        assert diff_ratio({"section-01-a": "no code"}, {}) == DEFAULT_DIFF_RATIO
+
+
+class TestScheduleCompactions:
+    """Tests for greedy compaction scheduling."""
+
+    SECTIONS = ["s1", "s2", "s3", "s4", "s5"]
+
+    def test_small_sections_share_a_context(self):
+        """Compaction should only happen when the next section would overflow."""
+        estimates = dict.fromkeys(self.SECTIONS, 30)
+
+        assert schedule_compactions(self.SECTIONS, estimates, budget=100) == ["s3"]
+
+    def test_large_section_gets_its_own_context(self):
+        """An oversized section is isolated by compactions on both sides."""
+        estimates = {"s1": 10, "s2": 500, "s3": 10, "s4": 10, "s5": 10}
+
+        assert schedule_compactions(self.SECTIONS, estimates, budget=100) == ["s1", "s2"]
+
+    def test_no_compaction_after_last_section(self):
+        """The final section never needs a compaction prompt."""
+        estimates = dict.fromkeys(self.SECTIONS, 200)
+
+        assert schedule_compactions(self.SECTIONS, estimates, budget=100) == ["s1", "s2", "s3", "s4"]
@@ -0,0 +1,157 @@
+"""Tests for diff chunking and chunk review merging."""
+
+import json
+
+import pytest
+
+from scripts.lib.diff_chunks import (
+    chunk_diff,
+    estimate_tokens,
+    merge_chunk_reviews,
+    section_title,
+    split_file_diffs,
+    split_hunks,
+    write_diff_chunks,
+)
+from scripts.lib.review_findings import load_findings
+
+
+def _file_diff(path: str, hunks: int = 1, lines: int = 5) -> str:
+    text = f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n"
+    for h in range(hunks):
+        text += f"@@ -{h * 10 + 1},0 +{h * 10 + 1},{lines} @@\n"
+        text += "".join(f"+line {h}-{i} of {path}\n" for i in range(lines))
+    return text
+
+
+class TestSplitFileDiffs:
+    """Tests for split_file_diffs function."""
+
+    def test_one_entry_per_file(self):
+        diff = _file_diff("src/a.py") + _file_diff("src/b.py")
+
+        files = split_file_diffs(diff)
+
+        assert [f.path for f in files] == ["src/a.py", "src/b.py"]
+        assert "".join(f.text for f in files) == diff
+
+    def test_empty_diff(self):
+        assert split_file_diffs("") == []
+
+
+class TestSplitHunks:
+    """Tests for split_hunks function."""
+
+    def test_every_piece_repeats_header(self):
+        (file_diff,) = split_file_diffs(_file_diff("big.py", hunks=4, lines=20))
+        budget = estimate_tokens(file_diff.text) // 2
+
+        pieces = split_hunks(file_diff, budget)
+
+        assert len(pieces) > 1
+        assert all(p.text.startswith("diff --git a/big.py b/big.py\n") for p in pieces)
+        assert sum(p.text.count("@@ -") for p in pieces) == 4
+
+
+class TestChunkDiff:
+    """Tests for chunk_diff function."""
+
+    def test_small_diff_is_one_chunk(self):
+        chunks = chunk_diff(_file_diff("a.py") + _file_diff("b.py"), max_tokens=10_000)
+
+        assert len(chunks) == 1
+        assert chunks[0].files == ["a.py", "b.py"]
+
+    def test_module_files_stay_together(self):
+        diff = _file_diff("api/a.py") + _file_diff("models/b.py") + _file_diff("api/c.py")
+        budget = estimate_tokens(_file_diff("api/a.py") + _file_diff("api/c.py"))
+
+        chunks = chunk_diff(diff, max_tokens=budget, group_by="module")
+
+        assert [c.files for c in chunks] == [["api/a.py", "api/c.py"], ["models/b.py"]]
+
+    def test_chunks_respect_budget(self):
+        diff = "".join(_file_diff(f"pkg{i}/m.py", lines=30) for i in range(6))
+        budget = estimate_tokens(_file_diff("pkg0/m.py", lines=30)) * 2
+
+        chunks = chunk_diff(diff, max_tokens=budget, group_by="file")
+
+        assert len(chunks) == 3
+        assert all(c.tokens <= budget for c in chunks)
+        assert "".join(c.text for c in chunks) == diff
+
+    def test_oversized_file_split_by_hunk(self):
+        diff = _file_diff("huge.py", hunks=6, lines=20)
+
+        chunks = chunk_diff(diff, max_tokens=estimate_tokens(diff) // 3)
+
+        assert len(chunks) >= 3
+        assert all(c.files == ["huge.py"] for c in chunks)
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(ValueError, match="positive"):
+            chunk_diff("", max_tokens=0)
+        with pytest.raises(ValueError, match="Unknown grouping"):
+            chunk_diff("", group_by="package")
+
+
+class TestWriteAndMerge:
+    """Tests for write_diff_chunks and merge_chunk_reviews."""
+
+    def test_round_trip(self, temp_dir):
+        diff = _file_diff("api/a.py", lines=40) + _file_diff("models/b.py", lines=40)
+        budget = estimate_tokens(_file_diff("api/a.py", lines=40))
+
+        manifest = write_diff_chunks(temp_dir, "section-02-api-layer", diff, budget)
+
+        assert [c["files"] for c in manifest["chunks"]] == [["api/a.py"], ["models/b.py"]]
+        assert json.loads((temp_dir / "code_review" / "section-02-chunks.json").read_text()) == manifest
+        for chunk in manifest["chunks"]:
+            with open(chunk["review"], "w") as f:
+                json.dump({"section": "section-02-api-layer", "review": f"Findings {chunk['index']}"}, f)
+
+        path = merge_chunk_reviews(temp_dir, "section-02-api-layer")
+
+        review = path.read_text()
+        assert path.name == "section-02-review.md"
+        assert review.startswith("# Code Review: Section 02 - Api Layer\n")
+        assert "## Chunk 1 of 2: api/a.py\n\nFindings 1" in review
+        assert "## Chunk 2 of 2: models/b.py\n\nFindings 2" in review
+
+    def test_merge_collects_findings(self, temp_dir):
+        diff = _file_diff("api/a.py", lines=40) + _file_diff("models/b.py", lines=40)
+        manifest = write_diff_chunks(
+            temp_dir, "section-02-api-layer", diff, estimate_tokens(_file_diff("api/a.py", lines=40))
+        )
+        for chunk in manifest["chunks"]:
+            with open(chunk["review"], "w") as f:
+                json.dump({
+                    "section": "section-02-api-layer",
+                    "review": "Findings",
+                    "findings": [{"id": "F1", "severity": "high", "file": chunk["files"][0], "summary": "Bug"}],
+                }, f)
+
+        merge_chunk_reviews(temp_dir, "section-02-api-layer")
+
+        findings = load_findings(temp_dir, "section-02-api-layer")
+        assert [(f.id, f.file) for f in findings] == [("F1", "api/a.py"), ("F2", "models/b.py")]
+
+    def test_rechunking_removes_stale_chunks(self, temp_dir):
+        diff = "".join(_file_diff(f"m{i}/x.py", lines=40) for i in range(3))
+        write_diff_chunks(temp_dir, "section-01-core", diff, estimate_tokens(_file_diff("m0/x.py", lines=40)))
+
+        write_diff_chunks(temp_dir, "section-01-core", diff)
+
+        assert sorted(p.name for p in (temp_dir / "code_review").glob("section-01-diff-chunk-*")) == [
+            "section-01-diff-chunk-01.md"
+        ]
+
+    def test_merge_reports_missing_reviews(self, temp_dir):
+        write_diff_chunks(temp_dir, "section-01-core", _file_diff("a.py"))
+
+        with pytest.raises(ValueError, match="section-01-review-chunk-01.json"):
+            merge_chunk_reviews(temp_dir, "section-01-core")
+
+
+def test_section_title():
+    assert section_title("section-03-api-endpoints") == "Section 03 - Api Endpoints"
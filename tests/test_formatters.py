@@ -0,0 +1,93 @@
+"""Tests for the pre-emptive formatter pass."""
+
+import os
+import subprocess
+
+import pytest
+
+from scripts.lib.formatters import run_formatters, staged_files, unstaged_changes
+
+@pytest.fixture
+def fake_pre_commit(fake_pre_commit_bin, monkeypatch):
+    monkeypatch.setenv("PATH", f"{fake_pre_commit_bin}:{os.environ['PATH']}")
+    return fake_pre_commit_bin
+
+
+def _stage(repo, files):
+    for name, content in files.items():
+        (repo / name).write_text(content)
+    subprocess.run(["git", "add", *files], cwd=repo, check=True)
+
+
+class TestStagedFiles:
+    """Tests for staged_files and unstaged_changes."""
+
+    def test_lists_staged_files(self, mock_git_repo):
+        _stage(mock_git_repo, {"a.py": "a\n", "b.py": "b\n"})
+        subprocess.run(["git", "rm", "-q", "--cached", "README.md"], cwd=mock_git_repo, check=True)
+
+        assert staged_files(mock_git_repo) == ["a.py", "b.py"]
+
+    def test_unstaged_changes(self, mock_git_repo):
+        _stage(mock_git_repo, {"a.py": "a\n"})
+        (mock_git_repo / "a.py").write_text("edited\n")
+
+        assert unstaged_changes(mock_git_repo, ["a.py", "README.md"]) == ["a.py"]
+
+
+class TestRunFormatters:
+    """Tests for run_formatters function."""
+
+    def test_formats_and_restages(self, mock_git_repo, fake_pre_commit):
+        _stage(mock_git_repo, {"a.py": "x = 1\n", "B.PY": "Y = 2\n"})
+
+        result = run_formatters(mock_git_repo, ["upper", "upper"], ["a.py", "B.PY"])
+
+        assert result["ran"] == ["upper"]
+        assert result["formatted_files"] == ["a.py"]
+        assert result["failed"] == []
+        staged = subprocess.run(
+            ["git", "show", ":a.py"], cwd=mock_git_repo, capture_output=True, text=True
+        ).stdout
+        assert staged == "X = 1\n"
+        assert unstaged_changes(mock_git_repo, ["a.py"]) == []
+
+    def test_restages_new_files(self, mock_git_repo, fake_pre_commit):
+        (mock_git_repo / "pkg").mkdir()
+        _stage(mock_git_repo, {"pkg/new.py": "x = 1\n"})
+        files = staged_files(mock_git_repo)
+
+        result = run_formatters(mock_git_repo, ["upper"], files)
+
+        assert files == ["pkg/new.py"]
+        assert result["formatted_files"] == ["pkg/new.py"]
+        staged = subprocess.run(
+            ["git", "show", ":pkg/new.py"], cwd=mock_git_repo, capture_output=True, text=True
+        ).stdout
+        assert staged == "X = 1\n"
+        assert staged_files(mock_git_repo) == ["pkg/new.py"]
+        assert unstaged_changes(mock_git_repo, files) == []
+
+    def test_reports_failures_without_rewrites(self, mock_git_repo, fake_pre_commit):
+        _stage(mock_git_repo, {"a.py": "x = 1\n"})
+
+        result = run_formatters(mock_git_repo, ["lint"], ["a.py"])
+
+        assert result["failed"] == [{"id": "lint", "output": "lint: E501 line too long"}]
+        assert result["formatted_files"] == []
+
+    def test_leaves_files_with_unstaged_edits(self, mock_git_repo, fake_pre_commit):
+        _stage(mock_git_repo, {"a.py": "x = 1\n"})
+        (mock_git_repo / "a.py").write_text("x = 1\ny = 2\n")
+
+        result = run_formatters(mock_git_repo, ["upper"], ["a.py"])
+
+        assert result["skipped_files"] == ["a.py"]
+        assert result["ran"] == []
+        assert (mock_git_repo / "a.py").read_text() == "x = 1\ny = 2\n"
+
+    def test_requires_pre_commit(self, mock_git_repo, monkeypatch):
+        monkeypatch.setattr("scripts.lib.formatters.shutil.which", lambda name: None)
+
+        with pytest.raises(RuntimeError, match="not installed"):
+            run_formatters(mock_git_repo, ["black"], ["a.py"])
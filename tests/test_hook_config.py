@@ -0,0 +1,213 @@
+"""Tests for static pre-commit hook inspection."""
+
+import json
+
+import pytest
+
+from scripts.lib import hook_config
+from scripts.lib.hook_config import (
+    PRE_COMMIT_CACHE_FILE,
+    cached_inspection,
+    commit_hooks,
+    parse_pre_commit_config,
+    scan_native_hook,
+)
+
+FLOW_CONFIG = """repos:
+  - {repo: https://github.com/psf/black, rev: 23.1.0, hooks: [{id: black}]}
+  - repo: local
+    hooks: [{id: mypy, entry: mypy, language: system, pass_filenames: false}]
+"""
+
+BLOCK_CONFIG = """default_stages: [pre-commit]
+repos:
+  - repo: https://github.com/pre-commit/mirrors-eslint
+    rev: v8.0.0
+    hooks:
+      - id: eslint  # lint only unless --fix
+        args:
+          - --fix
+      - name: pytest
+        id: pytest
+        always_run: true
+        stages: [pre-push]
+"""
+
+ANCHOR_CONFIG = """x-python: &python-hook
+  language: python
+  types: [python]
+repos:
+  - repo: local
+    hooks:
+      - <<: *python-hook
+        id: black
+        entry: black
+"""
+
+# pre-commit's own layout: keys four columns past the dash
+WIDE_INDENT_CONFIG = """repos:
+-   repo: https://github.com/pre-commit/mirrors-eslint
+    rev: v8.0.0
+    hooks:
+    -   id: eslint
+        args: [--fix]
+-   repo: https://github.com/psf/black
+    rev: 23.1.0
+    hooks:
+    -   id: black
+        stages: [pre-push]
+"""
+
+ALIAS_CONFIG = """x-black: &black
+  id: black
+  stages: [pre-push]
+repos:
+  - repo: local
+    hooks:
+      - &base
+        id: flake8
+        entry: flake8
+      - *black
+      - <<: *base
+        id: mypy
+        args: [
+          --strict,
+        ]
+"""
+
+
+@pytest.fixture(params=["yaml", "fallback"])
+def parser(request, monkeypatch):
+    """Run a test with PyYAML and with the fallback parser."""
+    if request.param == "yaml":
+        if hook_config.yaml is None:
+            pytest.skip("PyYAML is not installed")
+    else:
+        monkeypatch.setattr(hook_config, "yaml", None)
+    return request.param
+
+
+class TestParsePreCommitConfig:
+    """Tests for parse_pre_commit_config()."""
+
+    def test_flow_style(self, parser):
+        config = parse_pre_commit_config(FLOW_CONFIG)
+
+        assert config["parser"] == parser
+        assert [h["id"] for h in config["hooks"]] == ["black", "mypy"]
+        assert config["hooks"][1]["pass_filenames"] is False
+
+    def test_block_style_keys(self, parser):
+        config = parse_pre_commit_config(BLOCK_CONFIG)
+
+        eslint, pytest_hook = config["hooks"]
+        assert eslint["id"] == "eslint"
+        assert eslint["args"] == ["--fix"]
+        assert pytest_hook["always_run"] is True
+        assert pytest_hook["stages"] == ["pre-push"]
+        assert config["default_stages"] == ["pre-commit"]
+
+    def test_anchors_and_merge_keys(self, parser):
+        config = parse_pre_commit_config(ANCHOR_CONFIG)
+
+        assert [h["id"] for h in config["hooks"]] == ["black"]
+
+    def test_wide_indent_keys(self, parser):
+        """Keys after `id` in `-   id:` items should not be dropped."""
+        eslint, black = parse_pre_commit_config(WIDE_INDENT_CONFIG)["hooks"]
+
+        assert eslint["args"] == ["--fix"]
+        assert black["stages"] == ["pre-push"]
+
+    def test_aliases_resolve_to_hooks(self, parser):
+        config = parse_pre_commit_config(ALIAS_CONFIG)
+
+        flake8, black, mypy = config["hooks"]
+        assert flake8["id"] == "flake8"
+        assert black["stages"] == ["pre-push"]
+        assert mypy["id"] == "mypy"
+        assert mypy["args"] == ["--strict"]
+
+    def test_commit_hooks_skip_other_stages(self, parser):
+        hooks = commit_hooks(parse_pre_commit_config(BLOCK_CONFIG))
+
+        assert [h["id"] for h in hooks] == ["eslint"]
+
+
+class TestScanNativeHook:
+    """Tests for scan_native_hook()."""
+
+    def test_linter_only_hook_does_not_modify(self):
+        scan = scan_native_hook("#!/bin/sh\nflake8 src\nblack --check .\n")
+
+        assert scan["may_modify_files"] is False
+        assert scan["formatters"] == []
+
+    def test_formatter_and_restage(self):
+        scan = scan_native_hook("#!/bin/sh\n# run black\nblack .\ngit add -u\n")
+
+        assert scan["formatters"] == ["black"]
+        assert scan["restages"] is True
+        assert scan["may_modify_files"] is True
+
+    def test_write_flag_required(self):
+        assert scan_native_hook("prettier --list-different src")["formatters"] == []
+        assert scan_native_hook("npx prettier --write src")["formatters"] == ["prettier"]
+
+    @pytest.mark.parametrize("command, unresolved", [
+        ("make fmt", "make fmt"),
+        ("./scripts/format.sh", "./scripts/format.sh"),
+        ("npm run lint", "npm run lint"),
+        ("cd web && just fix", "just fix"),
+        ("bash scripts/fmt.sh src", "bash scripts/fmt.sh"),
+    ])
+    def test_delegated_commands_may_modify(self, command, unresolved):
+        """Commands the scan cannot see into should count as modifying files."""
+        scan = scan_native_hook(f"#!/bin/sh\nset -e\n{command}\n")
+
+        assert scan["unresolved"] == [unresolved]
+        assert scan["formatters"] == []
+        assert scan["may_modify_files"] is True
+
+    def test_delegation_only_in_command_position(self):
+        scan = scan_native_hook("#!/bin/sh\necho make sure\ntest -x ./tools/lint\nflake8 src\n")
+
+        assert scan["unresolved"] == []
+        assert scan["may_modify_files"] is False
+
+    def test_framework_shim(self):
+        shim = "#!/usr/bin/env bash\n# File generated by pre-commit: https://pre-commit.com\nexec pre-commit\n"
+
+        scan = scan_native_hook(shim)
+
+        assert scan["framework_shim"] is True
+        assert scan["may_modify_files"] is False
+
+
+class TestCachedInspection:
+    """Tests for the file-hash cache."""
+
+    def test_hit_after_store(self, tmp_path):
+        first, cached = cached_inspection("config", FLOW_CONFIG, tmp_path)
+        assert cached is False
+
+        second, cached = cached_inspection("config", FLOW_CONFIG, tmp_path)
+        assert cached is True
+        assert second == first
+
+    def test_changed_file_misses(self, tmp_path):
+        cached_inspection("native", "black .\n", tmp_path)
+
+        scan, cached = cached_inspection("native", "flake8 .\n", tmp_path)
+
+        assert cached is False
+        assert scan["formatters"] == []
+        # Only the current version of each file is kept
+        cache = json.loads((tmp_path / PRE_COMMIT_CACHE_FILE).read_text())
+        assert len(cache["native"]) == 1
+
+    def test_no_cache_dir(self, tmp_path):
+        _, cached = cached_inspection("config", FLOW_CONFIG, None)
+
+        assert cached is False
+        assert not (tmp_path / PRE_COMMIT_CACHE_FILE).exists()
@@ -0,0 +1,181 @@
+"""Tests for pre-commit hook profiling."""
+
+import subprocess
+
+from scripts.checks.setup_implementation_session import check_pre_commit_hooks
+from scripts.lib.hook_profile import (
+    parse_pre_commit_output,
+    profile_pre_commit_hooks,
+    whole_repo_hooks,
+)
+
+VERBOSE_OUTPUT = """black....................................................................Passed
+- hook id: black
+- duration: 0.41s
+ruff.....................................................................Failed
+- hook id: ruff
+- duration: 0.12s
+- exit code: 1
+- files were modified by this hook
+
+Fixed 1 error.
+
+mypy.....................................................................Passed
+- hook id: mypy
+- duration: 23.5s
+check json...........................................(no files to check)Skipped
+- hook id: check-json
+"""
+
+CONFIG = """repos:
+  - repo: https://github.com/psf/black
+    rev: 23.1.0
+    hooks:
+      - id: black
+  - repo: local
+    hooks:
+      - id: mypy
+        name: mypy
+        entry: mypy src
+        language: system
+        pass_filenames: false
+      - id: ruff
+"""
+
+
+def _native_hook(repo, body):
+    hook = repo / ".git" / "hooks" / "pre-commit"
+    hook.parent.mkdir(parents=True, exist_ok=True)
+    hook.write_text(f"#!/bin/sh\n{body}\n")
+    hook.chmod(0o755)
+
+
+class TestParsePreCommitOutput:
+    """Tests for parse_pre_commit_output function."""
+
+    def test_parses_hooks(self):
+        hooks = parse_pre_commit_output(VERBOSE_OUTPUT)
+
+        assert [(h["id"], h["status"], h["duration"], h["modifies_files"]) for h in hooks] == [
+            ("black", "passed", 0.41, False),
+            ("ruff", "failed", 0.12, True),
+            ("mypy", "passed", 23.5, False),
+            ("check-json", "skipped", None, False),
+        ]
+        assert hooks[3]["name"] == "check json"
+
+    def test_empty_output(self):
+        assert parse_pre_commit_output("") == []
+
+
+def test_whole_repo_hooks():
+    assert whole_repo_hooks(CONFIG) == {"mypy"}
+    assert whole_repo_hooks("repos:\n  - repo: x\n    hooks:\n      - id: y\n        always_run: true\n") == {"y"}
+
+
+class TestProfilePreCommitHooks:
+    """Tests for profile_pre_commit_hooks function."""
+
+    def test_framework_summary(self, mock_git_repo, monkeypatch):
+        (mock_git_repo / ".pre-commit-config.yaml").write_text(CONFIG)
+        subprocess.run(["git", "add", "."], cwd=mock_git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "hooks"], cwd=mock_git_repo, check=True)
+        monkeypatch.setattr("scripts.lib.hook_profile.shutil.which", lambda name: "/usr/bin/pre-commit")
+        monkeypatch.setattr(
+            "scripts.lib.hook_profile._run_timed", lambda command, worktree, timeout: (24.1, VERBOSE_OUTPUT, 1)
+        )
+
+        profile = profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
+
+        assert profile["tool"] == "pre-commit"
+        assert profile["slow_hooks"] == ["mypy"]
+        assert profile["modifying_hooks"] == ["ruff"]
+        assert profile["scope_to_staged"] == ["mypy"]
+        assert profile["whole_repo_seconds"] == 23.5
+        assert "uncommitted_config" not in profile
+
+    def test_framework_uses_working_tree_config(self, mock_git_repo, monkeypatch):
+        (mock_git_repo / ".pre-commit-config.yaml").write_text(CONFIG)
+        monkeypatch.setattr("scripts.lib.hook_profile.shutil.which", lambda name: "/usr/bin/pre-commit")
+        seen = {}
+
+        def run_timed(command, worktree, timeout):
+            seen["config"] = (worktree / ".pre-commit-config.yaml").read_text()
+            seen["staged"] = subprocess.run(
+                ["git", "diff", "--cached", "--name-only"], cwd=worktree, capture_output=True, text=True
+            ).stdout
+            return 24.1, VERBOSE_OUTPUT, 1
+
+        monkeypatch.setattr("scripts.lib.hook_profile._run_timed", run_timed)
+
+        profile = profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
+
+        assert profile["uncommitted_config"] is True
+        assert profile["scope_to_staged"] == ["mypy"]
+        assert seen == {"config": CONFIG, "staged": ".pre-commit-config.yaml\n"}
+        # The user's index is untouched
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=mock_git_repo, capture_output=True, text=True
+        ).stdout
+        assert status == "?? .pre-commit-config.yaml\n"
+
+    def test_native_hook_runs_in_scratch_worktree(self, mock_git_repo):
+        _native_hook(mock_git_repo, "echo '# formatted' >> README.md")
+
+        profile = profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
+
+        assert profile["tool"] == "native-hook"
+        (hook,) = profile["hooks"]
+        assert hook["status"] == "passed"
+        assert hook["modifies_files"] is True
+        assert hook["duration"] >= 0
+        # The user's checkout is untouched and the scratch worktree is gone
+        assert (mock_git_repo / "README.md").read_text() == "# Test Repo"
+        worktrees = subprocess.run(
+            ["git", "worktree", "list"], cwd=mock_git_repo, capture_output=True, text=True
+        ).stdout
+        assert len(worktrees.splitlines()) == 1
+
+    def test_native_hook_sees_head_changes_staged(self, mock_git_repo, temp_dir):
+        """A native hook is timed against HEAD's changes, staged as for a commit."""
+        (mock_git_repo / "app.py").write_text("print('hi')\n")
+        subprocess.run(["git", "add", "app.py"], cwd=mock_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "Add app"], cwd=mock_git_repo, capture_output=True)
+        seen = temp_dir / "staged.txt"
+        _native_hook(mock_git_repo, f"git diff --cached --name-only > '{seen}'")
+
+        profile = profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
+
+        assert seen.read_text() == "app.py\n"
+        assert profile["staged_files"] == 1
+        assert "approximate" not in profile
+        assert profile["hooks"][0]["modifies_files"] is False
+        head = subprocess.run(
+            ["git", "log", "--format=%s", "-1"], cwd=mock_git_repo, capture_output=True, text=True
+        ).stdout
+        assert head == "Add app\n"
+
+    def test_native_hook_on_root_commit_stages_every_file(self, mock_git_repo, temp_dir):
+        seen = temp_dir / "staged.txt"
+        _native_hook(mock_git_repo, f"git diff --cached --name-only > '{seen}'")
+
+        profile = profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
+
+        assert seen.read_text() == "README.md\n"
+        assert profile["staged_files"] == 1
+        branches = subprocess.run(
+            ["git", "branch", "--list", "deep-implement-profile-*"],
+            cwd=mock_git_repo, capture_output=True, text=True,
+        ).stdout
+        assert branches == ""
+
+    def test_framework_without_pre_commit_installed(self, mock_git_repo, monkeypatch):
+        (mock_git_repo / ".pre-commit-config.yaml").write_text(CONFIG)
+        monkeypatch.setattr("scripts.lib.hook_profile.shutil.which", lambda name: None)
+
+        profile = profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
+
+        assert profile == {"error": "pre-commit is not installed"}
+
+    def test_no_hooks(self, mock_git_repo):
+        assert "error" in profile_pre_commit_hooks(mock_git_repo, check_pre_commit_hooks(mock_git_repo))
@@ -0,0 +1,70 @@
+"""Tests for implementation task definitions."""
+
+import pytest
+
+from scripts.lib.impl_tasks import TaskOptions, format_display_name
+
+
+class TestFormatDisplayName:
+    """Tests for format_display_name function."""
+
+    def test_formats_section_name(self):
+        """Should turn section file names into readable names."""
+        assert format_display_name("section-01-data-models") == "section 01: data models"
+
+
+class TestTaskOptions:
+    """Tests for TaskOptions.from_project_config."""
+
+    def test_defaults(self):
+        """No optional keys should give default options."""
+        options = TaskOptions.from_project_config({"runtime": "python-uv"})
+
+        assert options.window is None
+
+    def test_task_window(self):
+        """Should parse task_window as an integer."""
+        options = TaskOptions.from_project_config({"task_window": "3"})
+
+        assert options.window == 3
+
+    def test_invalid_task_window(self):
+        """Malformed task_window should raise ValueError."""
+        with pytest.raises(ValueError, match="task_window"):
+            TaskOptions.from_project_config({"task_window": "-1"})
+
+    def test_collapse_completed(self):
+        """Should parse collapse_completed as a boolean."""
+        assert TaskOptions.from_project_config({"collapse_completed": "true"}).collapse_completed is True
+        assert TaskOptions.from_project_config({"collapse_completed": "no"}).collapse_completed is False
+
+    def test_stable_task_ids(self):
+        """Should parse stable_task_ids as a boolean."""
+        assert TaskOptions.from_project_config({"stable_task_ids": "yes"}).stable_ids is True
+        assert TaskOptions.from_project_config({}).stable_ids is False
+
+    def test_infer_section_profiles(self):
+        """Should parse infer_section_profiles as a boolean."""
+        assert TaskOptions.from_project_config({"infer_section_profiles": "on"}).infer_profiles is True
+
+    def test_compaction_budget(self):
+        """Should parse compaction_budget, allowing digit separators."""
+        assert TaskOptions.from_project_config({"compaction_budget": "120_000"}).compaction_budget == 120000
+        with pytest.raises(ValueError, match="compaction_budget"):
+            TaskOptions.from_project_config({"compaction_budget": "0"})
+
+    def test_pipelined_review(self):
+        """Should parse pipelined_review as a boolean."""
+        assert TaskOptions.from_project_config({"pipelined_review": "true"}).pipelined_review is True
+        assert TaskOptions.from_project_config({}).pipelined_review is False
+
+    def test_lanes(self):
+        """Should parse lanes as a positive integer."""
+        assert TaskOptions.from_project_config({"lanes": "4"}).lanes == 4
+        with pytest.raises(ValueError, match="lanes"):
+            TaskOptions.from_project_config({"lanes": "0"})
+
+    def test_invalid_boolean(self):
+        """Unrecognized boolean values should raise ValueError."""
+        with pytest.raises(ValueError, match="collapse_completed"):
+            TaskOptions.from_project_config({"collapse_completed": "maybe"})
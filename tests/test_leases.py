@@ -0,0 +1,228 @@
+"""Tests for lease files and section claims."""
+
+import os
+
+import pytest
+
+from scripts.lib import leases
+from scripts.lib.leases import (
+    LeaseBusyError,
+    acquire_lease,
+    active_leases,
+    claim_next_section,
+    hold_lease,
+    lease_path,
+    leases_dir,
+    lock_owner,
+    read_lease,
+    release_lease,
+    renew_lease,
+    section_claims,
+)
+
+
+def _reclaim_before_next_rename(directory, monkeypatch):
+    """Let agent-b reclaim section-01 right before the next lease file rename."""
+    rename = os.rename
+
+    def reclaimed_meanwhile(src, dst):
+        monkeypatch.setattr(leases.os, "rename", rename)
+        assert acquire_lease(directory, "section-01", "agent-b", now=161)["owner"] == "agent-b"
+        rename(src, dst)
+
+    monkeypatch.setattr(leases.os, "rename", reclaimed_meanwhile)
+
+
+class TestAcquireLease:
+    """Tests for acquire_lease function."""
+
+    def test_only_one_owner_holds_a_lease(self, temp_dir):
+        assert acquire_lease(temp_dir, "section-01", "agent-a", now=100) is not None
+        assert acquire_lease(temp_dir, "section-01", "agent-b", now=110) is None
+        assert read_lease(temp_dir, "section-01")["owner"] == "agent-a"
+
+    def test_same_owner_renews(self, temp_dir):
+        acquire_lease(temp_dir, "section-01", "agent-a", now=100)
+
+        lease = acquire_lease(temp_dir, "section-01", "agent-a", now=150)
+
+        assert lease["acquired_at"] == 100
+        assert lease["heartbeat_at"] == 150
+
+    def test_stale_lease_is_reclaimed(self, temp_dir):
+        """A lease without a heartbeat for longer than its TTL can be taken over."""
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+
+        assert acquire_lease(temp_dir, "section-01", "agent-b", now=150) is None
+        lease = acquire_lease(temp_dir, "section-01", "agent-b", now=161)
+
+        assert lease["owner"] == "agent-b"
+        assert not list(temp_dir.glob(".*.pinned"))
+
+    def test_reclaim_keeps_lease_recreated_in_between(self, temp_dir, monkeypatch):
+        """A lease re-created after the stale check is put back, not deleted."""
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+        rename = os.rename
+
+        def reclaimed_meanwhile(src, dst):
+            # Another session reclaims and re-creates the lease first
+            os.unlink(src)
+            leases._create_exclusive(lease_path(temp_dir, "section-01"), {
+                "name": "section-01", "owner": "agent-c", "heartbeat_at": 160, "ttl": 60,
+            })
+            rename(src, dst)
+
+        monkeypatch.setattr(leases.os, "rename", reclaimed_meanwhile)
+
+        assert acquire_lease(temp_dir, "section-01", "agent-b", now=161) is None
+        assert read_lease(temp_dir, "section-01")["owner"] == "agent-c"
+        assert not list(temp_dir.glob(".*.pinned"))
+
+    def test_reclaim_race_lost_is_not_an_error(self, temp_dir, monkeypatch):
+        """A lease removed during the reclaim only means another session won."""
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+
+        def removed_meanwhile(src, dst):
+            os.unlink(src)
+            raise FileNotFoundError(src)
+
+        monkeypatch.setattr(leases.os, "rename", removed_meanwhile)
+
+        assert acquire_lease(temp_dir, "section-01", "agent-b", now=161)["owner"] == "agent-b"
+
+    def test_heartbeat_keeps_lease_alive(self, temp_dir):
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+        renew_lease(temp_dir, "section-01", "agent-a", now=150)
+
+        assert acquire_lease(temp_dir, "section-01", "agent-b", now=200) is None
+
+    def test_renew_requires_owner(self, temp_dir):
+        acquire_lease(temp_dir, "section-01", "agent-a", now=100)
+
+        assert renew_lease(temp_dir, "section-01", "agent-b", now=120) is None
+
+    def test_renew_keeps_lease_reclaimed_in_between(self, temp_dir, monkeypatch):
+        """A late heartbeat must not overwrite a lease another session reclaimed."""
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+        mkstemp = leases.tempfile.mkstemp
+
+        def reclaimed_meanwhile(*args, **kwargs):
+            monkeypatch.setattr(leases.tempfile, "mkstemp", mkstemp)
+            assert acquire_lease(temp_dir, "section-01", "agent-b", now=161)["owner"] == "agent-b"
+            return mkstemp(*args, **kwargs)
+
+        monkeypatch.setattr(leases.tempfile, "mkstemp", reclaimed_meanwhile)
+
+        assert renew_lease(temp_dir, "section-01", "agent-a", now=170) is None
+        assert read_lease(temp_dir, "section-01")["owner"] == "agent-b"
+        assert not list(temp_dir.glob(".*.pinned"))
+
+    def test_renew_keeps_lease_file_in_place(self, temp_dir, monkeypatch):
+        """A live lease cannot be taken by another session mid-renewal."""
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+        replace = os.replace
+        competing = []
+
+        def acquire_meanwhile(src, dst):
+            competing.append(acquire_lease(temp_dir, "section-01", "agent-b", now=120))
+            replace(src, dst)
+
+        monkeypatch.setattr(leases.os, "replace", acquire_meanwhile)
+
+        assert renew_lease(temp_dir, "section-01", "agent-a", now=130)["owner"] == "agent-a"
+        assert competing == [None]
+        assert read_lease(temp_dir, "section-01")["heartbeat_at"] == 130
+        assert not list(temp_dir.glob(".*.tmp"))
+
+    def test_unreadable_lease_reclaimed_after_ttl(self, temp_dir):
+        lease_path(temp_dir, "section-01").write_text("")
+
+        assert acquire_lease(temp_dir, "section-01", "agent-a", ttl=60) is None
+        lease = acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=10**12)
+
+        assert lease["owner"] == "agent-a"
+
+
+class TestReleaseLease:
+    """Tests for release_lease function."""
+
+    def test_release_checks_owner(self, temp_dir):
+        acquire_lease(temp_dir, "section-01", "agent-a")
+
+        assert release_lease(temp_dir, "section-01", "agent-b") is False
+        assert release_lease(temp_dir, "section-01", "agent-a") is True
+        assert read_lease(temp_dir, "section-01") is None
+
+    def test_release_keeps_lease_reclaimed_in_between(self, temp_dir, monkeypatch):
+        """Releasing a lease that was reclaimed after the owner check leaves the new lease."""
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+        _reclaim_before_next_rename(temp_dir, monkeypatch)
+
+        assert release_lease(temp_dir, "section-01", "agent-a") is False
+        assert read_lease(temp_dir, "section-01")["owner"] == "agent-b"
+        assert not list(temp_dir.glob(".*.pinned"))
+
+    def test_release_without_owner(self, temp_dir):
+        acquire_lease(temp_dir, "section-01", "agent-a")
+
+        assert release_lease(temp_dir, "section-01") is True
+
+
+class TestSectionClaims:
+    """Tests for section_claims and claim_next_section."""
+
+    def test_active_leases_skip_expired(self, temp_dir):
+        acquire_lease(temp_dir, "section-01", "agent-a", ttl=60, now=100)
+        acquire_lease(temp_dir, "section-02", "agent-b", ttl=60, now=150)
+
+        assert list(active_leases(temp_dir, now=200)) == ["section-02"]
+
+    def test_claims_next_unclaimed_section(self, temp_dir):
+        candidates = ["section-01", "section-02", "section-03"]
+
+        first = claim_next_section(temp_dir, candidates, "agent-a")
+        second = claim_next_section(temp_dir, candidates, "agent-b")
+
+        assert first["name"] == "section-01"
+        assert second["name"] == "section-02"
+        assert section_claims(temp_dir) == {"section-01": "agent-a", "section-02": "agent-b"}
+        assert leases_dir(temp_dir).is_dir()
+
+    def test_repeated_claim_returns_held_section(self, temp_dir):
+        claim_next_section(temp_dir, ["section-02"], "agent-a")
+
+        lease = claim_next_section(temp_dir, ["section-01", "section-02"], "agent-a")
+
+        assert lease["name"] == "section-02"
+
+    def test_nothing_left_to_claim(self, temp_dir):
+        claim_next_section(temp_dir, ["section-01"], "agent-a")
+
+        assert claim_next_section(temp_dir, ["section-01"], "agent-b") is None
+
+
+class TestHoldLease:
+    """Tests for hold_lease context manager."""
+
+    def test_releases_on_exit(self, temp_dir):
+        with hold_lease(temp_dir, "setup", "run-a", ttl=60, wait=0) as lease:
+            assert lease["owner"] == "run-a"
+            assert read_lease(temp_dir, "setup") is not None
+
+        assert read_lease(temp_dir, "setup") is None
+
+    def test_busy_lease_times_out(self, temp_dir):
+        acquire_lease(temp_dir, "setup", "run-a", ttl=60)
+
+        with pytest.raises(LeaseBusyError, match="run-a"):
+            with hold_lease(temp_dir, "setup", "run-b", ttl=60, wait=0.2):
+                pass
+        assert read_lease(temp_dir, "setup")["owner"] == "run-a"
+
+    def test_nested_hold_in_one_process_waits(self, temp_dir):
+        """Each acquisition owns the lease alone, so a nested hold cannot release it."""
+        with hold_lease(temp_dir, "setup", lock_owner(), ttl=60, wait=0) as outer:
+            with pytest.raises(LeaseBusyError):
+                with hold_lease(temp_dir, "setup", lock_owner(), ttl=60, wait=0.2):
+                    pass
+            assert read_lease(temp_dir, "setup")["owner"] == outer["owner"]
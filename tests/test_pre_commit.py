@@ -143,3 +143,80 @@ class TestCheckPreCommitHooks:
 
         assert result["may_modify_files"] is True
         assert any("go" in f for f in result["detected_formatters"])
+
+    def test_native_hook_without_formatters(self, mock_git_repo):
+        """A native hook that only lints should not force re-stage handling."""
+        hook = mock_git_repo / ".git" / "hooks" / "pre-commit"
+        hook.parent.mkdir(parents=True, exist_ok=True)
+        hook.write_text("#!/bin/sh\nflake8 src\n")
+        hook.chmod(0o755)
+
+        result = check_pre_commit_hooks(mock_git_repo)
+
+        assert result["type"] == "native-hook"
+        assert result["may_modify_files"] is False
+        assert result["native_formatters"] == []
+
+    def test_native_hook_formatter(self, mock_git_repo):
+        """Formatter commands in a native hook are reported separately."""
+        hook = mock_git_repo / ".git" / "hooks" / "pre-commit"
+        hook.parent.mkdir(parents=True, exist_ok=True)
+        hook.write_text("#!/bin/sh\ncargo fmt\ngit add -u\n")
+        hook.chmod(0o755)
+
+        result = check_pre_commit_hooks(mock_git_repo)
+
+        assert result["may_modify_files"] is True
+        assert result["native_formatters"] == ["cargo fmt"]
+        assert result["detected_formatters"] == []
+
+    def test_core_hooks_path(self, mock_git_repo):
+        """Should read the native hook from core.hooksPath."""
+        import subprocess
+        subprocess.run(["git", "config", "core.hooksPath", ".husky"], cwd=mock_git_repo, check=True)
+        hook = mock_git_repo / ".husky" / "pre-commit"
+        hook.parent.mkdir()
+        hook.write_text("#!/bin/sh\nnpx lint-staged\n")
+        hook.chmod(0o755)
+
+        result = check_pre_commit_hooks(mock_git_repo)
+
+        assert result["native_hook"] == str(hook)
+        assert result["native_formatters"] == ["lint-staged"]
+
+    def test_flow_style_config(self, mock_git_repo):
+        """Flow-style hook lists should be parsed."""
+        (mock_git_repo / ".pre-commit-config.yaml").write_text(
+            "repos:\n  - {repo: https://github.com/psf/black, rev: 23.1.0, hooks: [{id: black}]}\n"
+        )
+
+        result = check_pre_commit_hooks(mock_git_repo)
+
+        assert result["detected_formatters"] == ["black"]
+
+    def test_formatter_on_other_stage_ignored(self, mock_git_repo):
+        """Hooks that do not run on commit should not count."""
+        config = """repos:
+  - repo: https://github.com/psf/black
+    hooks:
+      - id: black
+        stages: [manual]
+"""
+        (mock_git_repo / ".pre-commit-config.yaml").write_text(config)
+
+        result = check_pre_commit_hooks(mock_git_repo)
+
+        assert result["may_modify_files"] is False
+        assert result["detected_formatters"] == []
+
+    def test_parse_cached_by_hash(self, mock_git_repo, tmp_path):
+        """The parsed config should be cached in cache_dir."""
+        (mock_git_repo / ".pre-commit-config.yaml").write_text(
+            "repos:\n  - repo: local\n    hooks:\n      - id: isort\n"
+        )
+
+        first = check_pre_commit_hooks(mock_git_repo, cache_dir=tmp_path)
+        second = check_pre_commit_hooks(mock_git_repo, cache_dir=tmp_path)
+
+        assert (tmp_path / "pre_commit_cache.json").exists()
+        assert first == second
@@ -0,0 +1,117 @@
+"""Tests for the content-addressed review cache."""
+
+from scripts.lib.review_cache import (
+    cache_section_review,
+    cached_review,
+    restore_cached_review,
+    review_cache_key,
+    section_cache_key,
+    store_review,
+)
+from scripts.lib.review_findings import load_findings, parse_findings, save_findings
+
+
+def _section(temp_dir, diff="diff --git a/x b/x\n+x\n", plan="# Foundation\n"):
+    sections_dir = temp_dir / "sections"
+    sections_dir.mkdir(exist_ok=True)
+    (sections_dir / "section-01-foundation.md").write_text(plan)
+    code_review = temp_dir / "code_review"
+    code_review.mkdir(exist_ok=True)
+    (code_review / "section-01-diff.md").write_text(diff)
+    return sections_dir
+
+
+class TestReviewCacheKey:
+    """Tests for cache keys."""
+
+    def test_key_depends_on_diff_and_plan(self):
+        key = review_cache_key("diff", "plan")
+
+        assert key == review_cache_key("diff", "plan")
+        assert key != review_cache_key("diff2", "plan")
+        assert key != review_cache_key("diff", "plan2")
+        assert review_cache_key("ab", "c") != review_cache_key("a", "bc")
+
+    def test_missing_inputs(self, temp_dir):
+        assert section_cache_key(temp_dir, temp_dir / "sections", "section-01-foundation") is None
+
+
+class TestStoreAndRestore:
+    """Tests for storing and restoring section reviews."""
+
+    def test_store_then_lookup(self, temp_dir):
+        store_review(temp_dir, "abc", "# Review")
+
+        assert cached_review(temp_dir, "abc") == "# Review"
+        assert cached_review(temp_dir, "def") is None
+
+    def test_round_trip_restores_review(self, temp_dir):
+        sections_dir = _section(temp_dir)
+        review = temp_dir / "code_review" / "section-01-review.md"
+        review.write_text("# Code Review\n\nFindings")
+        assert cache_section_review(temp_dir, sections_dir, "section-01-foundation") is not None
+        review.unlink()
+
+        assert restore_cached_review(temp_dir, sections_dir, "section-01-foundation") is True
+        assert review.read_text() == "# Code Review\n\nFindings"
+
+    def test_findings_are_cached_with_review(self, temp_dir):
+        sections_dir = _section(temp_dir)
+        review = temp_dir / "code_review" / "section-01-review.md"
+        review.write_text("# Review")
+        save_findings(temp_dir, "section-01-foundation", parse_findings([{"severity": "high", "summary": "Bug"}]))
+        cache_section_review(temp_dir, sections_dir, "section-01-foundation")
+        review.unlink()
+        (temp_dir / "code_review" / "section-01-findings.json").unlink()
+
+        assert restore_cached_review(temp_dir, sections_dir, "section-01-foundation") is True
+        assert [f.summary for f in load_findings(temp_dir, "section-01-foundation")] == ["Bug"]
+
+    def test_restored_findings_are_open_again(self, temp_dir):
+        """Triage decisions from an earlier run are not carried over."""
+        sections_dir = _section(temp_dir)
+        review = temp_dir / "code_review" / "section-01-review.md"
+        review.write_text("# Review")
+        save_findings(temp_dir, "section-01-foundation", parse_findings([
+            {"severity": "high", "summary": "Bug", "status": "wont_fix", "note": "Accepted"},
+        ]))
+        cache_section_review(temp_dir, sections_dir, "section-01-foundation")
+        review.unlink()
+        (temp_dir / "code_review" / "section-01-findings.json").unlink()
+
+        assert restore_cached_review(temp_dir, sections_dir, "section-01-foundation") is True
+        [finding] = load_findings(temp_dir, "section-01-foundation")
+        assert (finding.status, finding.note) == ("open", "")
+
+    def test_corrupt_findings_entry_is_a_miss(self, temp_dir):
+        """A truncated cache entry must not abort setup."""
+        sections_dir = _section(temp_dir)
+        review = temp_dir / "code_review" / "section-01-review.md"
+        review.write_text("# Review")
+        key = cache_section_review(temp_dir, sections_dir, "section-01-foundation")
+        review.unlink()
+        (temp_dir / "review_cache" / f"{key}.findings.json").write_text('{"findings": [{"sev')
+
+        assert restore_cached_review(temp_dir, sections_dir, "section-01-foundation") is False
+        assert not review.exists()
+
+    def test_changed_diff_misses(self, temp_dir):
+        sections_dir = _section(temp_dir)
+        review = temp_dir / "code_review" / "section-01-review.md"
+        review.write_text("# Review")
+        cache_section_review(temp_dir, sections_dir, "section-01-foundation")
+        review.unlink()
+        (temp_dir / "code_review" / "section-01-diff.md").write_text("diff --git a/y b/y\n+y\n")
+
+        assert restore_cached_review(temp_dir, sections_dir, "section-01-foundation") is False
+        assert not review.exists()
+
+    def test_existing_review_is_kept(self, temp_dir):
+        sections_dir = _section(temp_dir)
+        review = temp_dir / "code_review" / "section-01-review.md"
+        review.write_text("# Old")
+        cache_section_review(temp_dir, sections_dir, "section-01-foundation")
+        review.write_text("# Newer")
+
+        assert restore_cached_review(temp_dir, sections_dir, "section-01-foundation") is False
+        assert review.read_text() == "# Newer"
@@ -0,0 +1,150 @@
+"""Tests for lean review diff generation."""
+
+import subprocess
+
+from scripts.lib.review_diff import (
+    DEFAULT_REVIEW_EXCLUDES,
+    generate_review_diff,
+    matching_exclude,
+    parse_numstat,
+    write_tree,
+)
+
+
+def _stage(repo, files: dict[str, str | bytes]) -> None:
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo) -> None:
+    subprocess.run(["git", "commit", "-qm", "base"], cwd=repo, check=True, capture_output=True)
+
+
+class TestParseNumstat:
+    """Tests for parse_numstat function."""
+
+    def test_plain_binary_and_rename(self):
+        output = "3\t1\tsrc/a.py\0-\t-\tlogo.png\0" + "0\t0\t\0old.py\0new.py\0"
+
+        entries = parse_numstat(output)
+
+        assert [(e.path, e.added, e.deleted, e.old_path) for e in entries] == [
+            ("src/a.py", 3, 1, None),
+            ("logo.png", None, None, None),
+            ("new.py", 0, 0, "old.py"),
+        ]
+        assert entries[1].binary
+
+
+class TestMatchingExclude:
+    """Tests for matching_exclude function."""
+
+    def test_file_name_globs_match_any_directory(self):
+        assert matching_exclude("frontend/yarn.lock", DEFAULT_REVIEW_EXCLUDES) == "*.lock"
+        assert matching_exclude("src/app.py", DEFAULT_REVIEW_EXCLUDES) is None
+
+    def test_path_globs_match_trailing_path(self):
+        assert matching_exclude("tests/__snapshots__/app.ambr", ["__snapshots__/*"]) == "__snapshots__/*"
+        assert matching_exclude("docs/generated/api.md", ["docs/generated/*"]) == "docs/generated/*"
+        assert matching_exclude("docs/guide.md", ["docs/generated/*"]) is None
+
+
+class TestGenerateReviewDiff:
+    """Tests for generate_review_diff function."""
+
+    def test_omits_noise_but_lists_it(self, mock_git_repo):
+        _stage(mock_git_repo, {"src/util.py": "def f():\n    return 1\n", "old_name.py": "x = 1\n" * 20})
+        _commit(mock_git_repo)
+        subprocess.run(["git", "mv", "old_name.py", "new_name.py"], cwd=mock_git_repo, check=True)
+        _stage(mock_git_repo, {
+            "src/app.py": "print('hi')\n",
+            "src/util.py": "def f():\n    return 1   \n",
+            "uv.lock": "lock\n" * 100,
+            "logo.png": b"\x89PNG\x00\x01\x02",
+        })
+
+        review = generate_review_diff(mock_git_repo, list(DEFAULT_REVIEW_EXCLUDES))
+
+        omitted = {e.path: e.omitted for e in review.omitted}
+        assert omitted == {
+            "uv.lock": "excluded (*.lock)",
+            "logo.png": "binary",
+            "src/util.py": "whitespace-only",
+        }
+        assert "diff --git a/src/app.py b/src/app.py" in review.body
+        assert "rename from old_name.py" in review.body
+        assert "uv.lock" not in review.body and "logo.png" not in review.body and "util.py" not in review.body
+
+        rendered = review.render("section-01-foundation")
+        assert rendered.startswith("# Review diff: section-01-foundation\n# 5 files changed, +1 -0 reviewed, 3 omitted")
+        assert "old_name.py => new_name.py" in rendered
+        assert "uv.lock  [excluded (*.lock)]" in rendered
+
+        metrics = review.metrics(rendered)
+        assert metrics["files"] == 5
+        assert metrics["files_reviewed"] == 2
+        assert metrics["renames"] == 1
+        assert metrics["omitted_lines"] == 102
+        assert metrics["bytes"] == len(rendered.encode())
+
+    def test_excluded_rename_drops_both_paths(self, mock_git_repo):
+        """Renaming a lockfile must not dump its old content as a deletion."""
+        _stage(mock_git_repo, {"deps/old.lock": "pinned\n" * 50, "vendor.min.js": "min\n" * 50})
+        _commit(mock_git_repo)
+        subprocess.run(["git", "mv", "deps/old.lock", "deps/new.lock"], cwd=mock_git_repo, check=True)
+        subprocess.run(["git", "mv", "vendor.min.js", "vendor.js"], cwd=mock_git_repo, check=True)
+        _stage(mock_git_repo, {"src/app.py": "print('hi')\n"})
+
+        review = generate_review_diff(mock_git_repo, list(DEFAULT_REVIEW_EXCLUDES))
+
+        omitted = {e.path: e.omitted for e in review.omitted}
+        assert omitted == {"deps/new.lock": "excluded (*.lock)", "vendor.js": "excluded (*.min.js)"}
+        assert "diff --git a/src/app.py b/src/app.py" in review.body
+        assert "lock" not in review.body and "vendor" not in review.body
+
+    def test_paths_limit_the_diff(self, mock_git_repo):
+        _stage(mock_git_repo, {"a/one.py": "1\n", "b/two.py": "2\n"})
+
+        review = generate_review_diff(mock_git_repo, [], ["a"])
+
+        assert [e.path for e in review.entries] == ["a/one.py"]
+        assert "b/two.py" not in review.body
+
+    def test_everything_omitted_leaves_empty_body(self, mock_git_repo):
+        _stage(mock_git_repo, {"poetry.lock": "x\n"})
+
+        review = generate_review_diff(mock_git_repo, ["*.lock"])
+
+        assert review.body == ""
+        assert review.metrics(review.render("s"))["files_reviewed"] == 0
+
+
+class TestDeltaDiff:
+    """Tests for diffs against a reviewed tree."""
+
+    def test_only_changes_since_reviewed_tree(self, mock_git_repo):
+        _stage(mock_git_repo, {"src/a.py": "x = 1\n", "src/b.py": "y = 1\n"})
+        reviewed = write_tree(mock_git_repo)
+        _stage(mock_git_repo, {"src/b.py": "y = 2\n"})
+
+        review = generate_review_diff(mock_git_repo, [], base=reviewed)
+
+        assert [e.path for e in review.entries] == ["src/b.py"]
+        assert "-y = 1\n+y = 2" in review.body
+        assert review.render("section-01-core", reviewed).startswith(
+            f"# Review delta: section-01-core (since reviewed tree {reviewed[:12]})\n"
+        )
+
+    def test_unchanged_index_has_empty_delta(self, mock_git_repo):
+        _stage(mock_git_repo, {"src/a.py": "x = 1\n"})
+
+        review = generate_review_diff(mock_git_repo, [], base=write_tree(mock_git_repo))
+
+        assert review.entries == []
+        assert review.body == ""
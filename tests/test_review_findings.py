@@ -0,0 +1,150 @@
+"""Tests for structured review findings."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scripts.lib.review_findings import (
+    Finding,
+    load_findings,
+    load_findings_index,
+    parse_findings,
+    resolve_finding,
+    save_findings,
+)
+
+REVIEWER_FINDINGS = [
+    {"severity": "low", "file": "src/a.py", "line": 3, "category": "style", "summary": "Long line"},
+    {"severity": "critical", "file": "src/db.py", "line": 40, "category": "security", "summary": "SQL injection"},
+    {"severity": "high", "file": "src/api.py", "category": "plan", "summary": "Missing endpoint"},
+]
+
+
+class TestParseFindings:
+    """Tests for parse_findings function."""
+
+    def test_numbers_findings_in_order(self):
+        findings = parse_findings(REVIEWER_FINDINGS)
+
+        assert [f.id for f in findings] == ["F1", "F2", "F3"]
+        assert findings[1] == Finding(
+            id="F2", severity="critical", summary="SQL injection", file="src/db.py", line=40, category="security"
+        )
+        assert findings[2].line is None
+
+    def test_reviewer_ids_are_renumbered(self):
+        """IDs the reviewer supplied should not clash with the F1, F2, ... numbering."""
+        findings = parse_findings([
+            {"id": "F2", "severity": "low", "summary": "a"},
+            {"id": "F2", "severity": "high", "summary": "b"},
+        ])
+
+        assert [f.id for f in findings] == ["F1", "F2"]
+
+    def test_normalizes_case_and_defaults(self):
+        (finding,) = parse_findings([{"severity": "HIGH", "summary": "x", "category": "Naming"}])
+
+        assert finding.severity == "high"
+        assert finding.category == "naming"
+        assert finding.status == "open"
+
+    @pytest.mark.parametrize("item, message", [
+        ({"severity": "blocker", "summary": "x"}, "severity"),
+        ({"severity": "low", "summary": " "}, "summary"),
+        ({"severity": "low", "summary": "x", "line": 0}, "line"),
+        ({"severity": "low", "summary": "x", "status": "done"}, "status"),
+        ("not an object", "object"),
+    ])
+    def test_rejects_invalid_findings(self, item, message):
+        with pytest.raises(ValueError, match=message):
+            parse_findings([item])
+
+    def test_rejects_non_list(self):
+        with pytest.raises(ValueError, match="list"):
+            parse_findings({"severity": "low"})
+
+
+class TestFindingsStore:
+    """Tests for saving, loading and resolving findings."""
+
+    def test_save_writes_file_and_index(self, temp_dir):
+        path = save_findings(temp_dir, "section-01-foundation", parse_findings(REVIEWER_FINDINGS))
+
+        assert path.name == "section-01-findings.json"
+        assert json.loads(path.read_text())["section"] == "section-01-foundation"
+        index = load_findings_index(temp_dir)
+        assert index["section-01-foundation"]["total"] == 3
+        assert index["section-01-foundation"]["open_by_severity"] == {
+            "critical": 1, "high": 1, "medium": 0, "low": 1
+        }
+
+    def test_concurrent_saves_keep_every_index_entry(self, temp_dir):
+        """Sections saved at the same time should all be counted in the index."""
+        sections = [f"section-{i:02d}-lane" for i in range(1, 9)]
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as pool:
+            list(pool.map(
+                lambda section: save_findings(temp_dir, section, parse_findings(REVIEWER_FINDINGS)),
+                sections,
+            ))
+
+        index = load_findings_index(temp_dir)
+        assert sorted(index) == sections
+        assert not list((temp_dir / "code_review").glob(".*"))
+
+    def test_load_filters_by_severity(self, temp_dir):
+        save_findings(temp_dir, "section-01-foundation", parse_findings(REVIEWER_FINDINGS))
+
+        findings = load_findings(temp_dir, "section-01-foundation", min_severity="high")
+
+        assert [f.id for f in findings] == ["F2", "F3"]
+
+    def test_resolved_findings_are_skipped(self, temp_dir):
+        save_findings(temp_dir, "section-01-foundation", parse_findings(REVIEWER_FINDINGS))
+
+        resolved = resolve_finding(temp_dir, "section-01-foundation", "F2", "fixed", "Parameterized query")
+
+        assert resolved.status == "fixed"
+        assert [f.id for f in load_findings(temp_dir, "section-01-foundation", open_only=True)] == ["F3", "F1"]
+        stored = json.loads((temp_dir / "code_review" / "section-01-findings.json").read_text())
+        assert [f["id"] for f in stored["findings"]] == ["F1", "F2", "F3"]
+        assert stored["findings"][1]["note"] == "Parameterized query"
+        assert load_findings_index(temp_dir)["section-01-foundation"]["open"] == 2
+
+    def test_reordered_file_keeps_ids(self, temp_dir):
+        """Triage refers to findings by ID, so loading must not renumber them."""
+        path = save_findings(temp_dir, "section-01-foundation", parse_findings(REVIEWER_FINDINGS))
+        data = json.loads(path.read_text())
+        data["findings"].reverse()
+        path.write_text(json.dumps(data))
+
+        resolve_finding(temp_dir, "section-01-foundation", "F1", "wont_fix")
+
+        (finding,) = [f for f in load_findings(temp_dir, "section-01-foundation") if f.status != "open"]
+        assert finding.id == "F1"
+        assert finding.summary == "Long line"
+
+    def test_hand_added_findings_get_next_free_id(self, temp_dir):
+        path = save_findings(temp_dir, "section-01-foundation", parse_findings(REVIEWER_FINDINGS))
+        data = json.loads(path.read_text())
+        del data["findings"][0]
+        data["findings"] += [
+            {"severity": "medium", "summary": "Added by hand"},
+            {"id": "F2", "severity": "low", "summary": "Copied entry"},
+        ]
+        path.write_text(json.dumps(data))
+
+        findings = load_findings(temp_dir, "section-01-foundation")
+
+        assert sorted(f.id for f in findings) == ["F2", "F3", "F4", "F5"]
+        assert {f.summary: f.id for f in findings}["Added by hand"] == "F4"
+
+    def test_resolve_unknown_finding(self, temp_dir):
+        save_findings(temp_dir, "section-01-foundation", [])
+
+        with pytest.raises(ValueError, match="No finding F9"):
+            resolve_finding(temp_dir, "section-01-foundation", "F9", "fixed")
+
+    def test_missing_findings_file(self, temp_dir):
+        assert load_findings(temp_dir, "section-02-models") == []
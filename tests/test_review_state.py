@@ -0,0 +1,74 @@
+"""Tests for the code review artifact index."""
+
+from scripts.lib.review_state import (
+    review_status,
+    scan_review_artifacts,
+    section_review_state,
+)
+
+
+def _write_artifacts(state_dir, files):
+    code_review = state_dir / "code_review"
+    code_review.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        (code_review / name).write_text(content)
+
+
+class TestScanReviewArtifacts:
+    """Tests for scan_review_artifacts function."""
+
+    def test_missing_directory(self, temp_dir):
+        assert scan_review_artifacts(temp_dir) == {}
+
+    def test_indexes_every_section(self, temp_dir):
+        _write_artifacts(temp_dir, {
+            "section-01-diff.md": "abc",
+            "section-01-review.md": "review",
+            "section-02-diff.md": "x" * 10,
+            "notes.md": "ignored",
+            "section-03-summary.md": "ignored",
+        })
+
+        index = scan_review_artifacts(temp_dir)
+
+        assert set(index) == {"01", "02"}
+        assert set(index["01"]) == {"diff", "review"}
+        assert index["02"]["diff"].size == 10
+        assert index["01"]["diff"].mtime > 0
+
+
+class TestSectionReviewState:
+    """Tests for section_review_state and review_status."""
+
+    def test_resume_step_from_latest_artifact(self, temp_dir):
+        _write_artifacts(temp_dir, {
+            "section-01-diff.md": "d",
+            "section-01-review.md": "r",
+            "section-01-interview.md": "i",
+            "section-02-diff.md": "d",
+        })
+        index = scan_review_artifacts(temp_dir)
+
+        assert section_review_state(index, "section-01-foundation")["resume_step"] == "apply_fixes"
+        assert section_review_state(index, "section-02-models") == {
+            "has_diff": True,
+            "has_review": False,
+            "has_interview": False,
+            "resume_step": "review",
+        }
+
+    def test_status_for_whole_plan(self, temp_dir):
+        _write_artifacts(temp_dir, {
+            "section-01-diff.md": "d",
+            "section-01-review.md": "r",
+            "section-02-diff.md": "dd",
+        })
+        sections = ["section-01-foundation", "section-02-models", "section-03-api"]
+
+        status = review_status(scan_review_artifacts(temp_dir), sections, ["section-01-foundation"])
+
+        assert status["section-01-foundation"]["status"] == "complete"
+        assert status["section-01-foundation"]["resume_step"] is None
+        assert status["section-02-models"]["status"] == "in_review"
+        assert status["section-02-models"]["artifacts"]["diff"]["size"] == 2
+        assert status["section-03-api"] == {"status": "pending", "resume_step": "implement", "artifacts": {}}
@@ -0,0 +1,161 @@
+"""Tests for critical-path section scheduling."""
+
+import os
+import subprocess
+
+import pytest
+
+from scripts.lib.scheduler import (
+    FILE_COST,
+    allows_parallel_work,
+    STEP_COST,
+    calibrate_costs,
+    critical_path_lengths,
+    estimate_section_cost,
+    historical_durations,
+    schedule_sections,
+    sequential_dependencies,
+)
+
+
+def _commit_at(cwd, filename, timestamp):
+    (cwd / filename).write_text(filename)
+    env = {**os.environ, "GIT_AUTHOR_DATE": f"{timestamp} +0000", "GIT_COMMITTER_DATE": f"{timestamp} +0000"}
+    subprocess.run(["git", "add", filename], cwd=cwd, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", filename], cwd=cwd, capture_output=True, check=True, env=env)
+    return subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestEstimateSectionCost:
+    """Tests for estimate_section_cost function."""
+
+    def test_combines_size_files_and_steps(self):
+        cost = estimate_section_cost("x" * 2000, file_count=3, step_count=6)
+
+        assert cost == pytest.approx(2 + 3 * FILE_COST + 6 * STEP_COST)
+
+
+class TestScheduleSections:
+    """Tests for schedule_sections function."""
+
+    def test_independent_sections_use_lpt(self):
+        """Without dependencies the longest sections are placed first."""
+        sections = ["s1", "s2", "s3", "s4", "s5"]
+        costs = {"s1": 2, "s2": 2, "s3": 3, "s4": 3, "s5": 2}
+
+        schedule = schedule_sections(sections, costs, {}, lane_count=2)
+
+        assert schedule["order"][:2] == ["s3", "s4"]
+        assert schedule["makespan"] == 7
+        assert sorted(s for lane in schedule["lanes"] for s in lane) == sections
+
+    def test_long_late_section_starts_first(self):
+        """A long section at the end of the manifest should not set the makespan alone."""
+        sections = ["s1", "s2", "s3"]
+        costs = {"s1": 1, "s2": 1, "s3": 5}
+
+        schedule = schedule_sections(sections, costs, {}, lane_count=2)
+
+        assert schedule["order"][0] == "s3"
+        assert schedule["makespan"] == 5
+
+    def test_respects_dependencies_and_critical_path(self):
+        """Sections heading the longest chain go first; dependents wait."""
+        sections = ["core", "api", "docs", "cli"]
+        costs = {"core": 2, "api": 4, "docs": 3, "cli": 1}
+        dependencies = {"api": ["core"], "cli": ["core"]}
+
+        schedule = schedule_sections(sections, costs, dependencies, lane_count=2)
+
+        assert schedule["order"][0] == "core"
+        assert schedule["start"]["api"] == schedule["finish"]["core"]
+        assert schedule["critical_path"] == ["core", "api"]
+        assert schedule["makespan"] == 6
+
+    def test_completed_dependencies_are_satisfied(self):
+        """Dependencies outside the scheduled sections do not block."""
+        schedule = schedule_sections(["api"], {"api": 3}, {"api": ["core"]}, lane_count=1)
+
+        assert schedule["start"]["api"] == 0
+        assert schedule["makespan"] == 3
+
+    def test_sequential_plan_sums_costs(self):
+        sections = ["s1", "s2", "s3"]
+        costs = {"s1": 1, "s2": 2, "s3": 3}
+
+        schedule = schedule_sections(sections, costs, sequential_dependencies(sections), lane_count=4)
+
+        assert schedule["order"] == sections
+        assert schedule["lanes"] == [sections]
+        assert schedule["makespan"] == 6
+
+    def test_rejects_zero_lanes(self):
+        with pytest.raises(ValueError, match="lane_count"):
+            schedule_sections(["s1"], {"s1": 1}, {}, lane_count=0)
+
+    def test_large_plan_schedules_every_section(self):
+        """A long chain with side branches is placed without rescanning the plan."""
+        sections = [f"s{i}" for i in range(3000)]
+        dependencies = {s: [sections[i - 2]] if i >= 2 else [] for i, s in enumerate(sections)}
+
+        schedule = schedule_sections(sections, dict.fromkeys(sections, 1.0), dependencies, lane_count=2)
+
+        assert sorted(schedule["order"]) == sorted(sections)
+        assert schedule["makespan"] == 1500
+
+
+class TestAllowsParallelWork:
+    """Tests for allows_parallel_work function."""
+
+    def test_chain_is_sequential(self):
+        sections = ["s1", "s2", "s3"]
+
+        assert allows_parallel_work(sections, None) is False
+        assert allows_parallel_work(sections, sequential_dependencies(sections)) is False
+
+    def test_independent_sections(self):
+        assert allows_parallel_work(["s1", "s2"], {"s1": [], "s2": []}) is True
+
+
+class TestCriticalPathLengths:
+    """Tests for critical_path_lengths function."""
+
+    def test_includes_longest_dependent_chain(self):
+        lengths = critical_path_lengths(
+            ["a", "b", "c"], {"a": 1, "b": 2, "c": 5}, {"b": ["a"], "c": ["a"]}
+        )
+
+        assert lengths == {"a": 6, "b": 2, "c": 5}
+
+
+class TestCalibrateCosts:
+    """Tests for calibrate_costs function."""
+
+    def test_scales_to_seconds(self):
+        costs, unit = calibrate_costs({"s1": 2.0, "s2": 4.0}, {"s1": 600.0})
+
+        assert unit == "seconds"
+        assert costs == {"s1": 600.0, "s2": 1200.0}
+
+    def test_without_history_keeps_units(self):
+        costs, unit = calibrate_costs({"s1": 2.0}, {})
+
+        assert unit == "units"
+        assert costs == {"s1": 2.0}
+
+
+class TestHistoricalDurations:
+    """Tests for historical_durations function."""
+
+    def test_durations_between_section_commits(self, mock_git_repo):
+        first = _commit_at(mock_git_repo, "a.py", 1_700_000_000)
+        second = _commit_at(mock_git_repo, "b.py", 1_700_000_900)
+
+        durations = historical_durations(mock_git_repo, {"s1": first, "s2": second})
+
+        assert durations == {"s2": 900.0}
+
+    def test_unknown_commit_gives_no_history(self, mock_git_repo):
+        assert historical_durations(mock_git_repo, {"s1": "deadbeef", "s2": "cafebabe"}) == {}
@@ -0,0 +1,122 @@
+"""Tests for file-overlap conflict analysis."""
+
+import json
+
+from scripts.lib.section_conflicts import (
+    CONFLICTS_FILENAME,
+    analyze_section_conflicts,
+    build_file_index,
+    conflict_pairs,
+    independent_groups,
+    inferred_dependencies,
+    unknown_sections,
+    write_conflict_report,
+)
+
+SECTIONS = ["section-01-models", "section-02-api", "section-03-cli", "section-04-notes"]
+FILES = {
+    "section-01-models": ["src/models.py"],
+    "section-02-api": ["src/api.py", "src/models.py"],
+    "section-03-cli": ["src/cli.py"],
+    "section-04-notes": [],
+}
+
+
+class TestConflictPairs:
+    """Tests for the incidence index and conflicting pairs."""
+
+    def test_file_index(self):
+        """Each file should list the sections touching it."""
+        index = build_file_index(FILES)
+
+        assert index["src/models.py"] == ["section-01-models", "section-02-api"]
+        assert index["src/cli.py"] == ["section-03-cli"]
+
+    def test_shared_files_conflict(self):
+        """Sections sharing a file form a pair listing the shared files."""
+        pairs = conflict_pairs(SECTIONS, FILES)
+
+        assert pairs[("section-01-models", "section-02-api")] == ["src/models.py"]
+        assert ("section-01-models", "section-03-cli") not in pairs
+
+    def test_sections_without_files_are_unknown(self):
+        """Unanalyzable sections are listed once instead of paired with everything."""
+        pairs = conflict_pairs(SECTIONS, FILES)
+
+        assert unknown_sections(SECTIONS, FILES) == ["section-04-notes"]
+        assert all("section-04-notes" not in pair for pair in pairs)
+
+
+class TestIndependentGroups:
+    """Tests for grouping non-conflicting sections."""
+
+    def test_groups_have_no_internal_conflicts(self):
+        pairs = conflict_pairs(SECTIONS, FILES)
+
+        assert independent_groups(SECTIONS, pairs, unknown_sections(SECTIONS, FILES)) == [
+            ["section-01-models", "section-03-cli"],
+            ["section-02-api"],
+            ["section-04-notes"],
+        ]
+
+    def test_unknown_section_groups_alone(self):
+        """No section joins the group of a section with unknown files."""
+        sections = ["section-01-notes", "section-02-cli"]
+
+        assert independent_groups(sections, {}, ["section-01-notes"]) == [
+            ["section-01-notes"],
+            ["section-02-cli"],
+        ]
+
+    def test_inferred_dependencies_serialize_conflicts(self):
+        """Later sections depend on the earlier sections they overlap with."""
+        report = {
+            "sections": SECTIONS,
+            "unknown": unknown_sections(SECTIONS, FILES),
+            "pairs": [
+                {"sections": list(pair), "files": files}
+                for pair, files in conflict_pairs(SECTIONS, FILES).items()
+            ],
+        }
+
+        dependencies = inferred_dependencies(report)
+
+        assert dependencies["section-02-api"] == ["section-01-models"]
+        assert dependencies["section-03-cli"] == []
+        assert dependencies["section-04-notes"] == SECTIONS[:3]
+
+    def test_unknown_sections_act_as_barriers(self):
+        """Unknown sections are ordered against every section without listing all pairs."""
+        sections = ["section-01-a", "section-02-b", "section-03-c", "section-04-d", "section-05-e"]
+        report = {"sections": sections, "unknown": ["section-02-b", "section-04-d"], "pairs": []}
+
+        dependencies = inferred_dependencies(report)
+
+        assert dependencies == {
+            "section-01-a": [],
+            "section-02-b": ["section-01-a"],
+            "section-03-c": ["section-02-b"],
+            "section-04-d": ["section-02-b", "section-03-c"],
+            "section-05-e": ["section-04-d"],
+        }
+
+
+class TestAnalyzeSectionConflicts:
+    """Tests for the full report."""
+
+    def test_report_round_trips_as_json(self, tmp_path):
+        """Report should be built from section files and written as JSON."""
+        sections_dir = tmp_path / "sections"
+        sections_dir.mkdir()
+        (sections_dir / "section-01-a.md").write_text("| src/shared.py | edit |")
+        (sections_dir / "section-02-b.md").write_text("### File: `src/shared.py`\n| src/b.py | new |")
+
+        report = analyze_section_conflicts(sections_dir, ["section-01-a", "section-02-b"])
+        path = write_conflict_report(tmp_path / "implementation", report)
+
+        assert path.name == CONFLICTS_FILENAME
+        assert json.loads(path.read_text()) == report
+        assert report["shared_files"] == {"src/shared.py": ["section-01-a", "section-02-b"]}
+        assert report["groups"] == [["section-01-a"], ["section-02-b"]]
+        assert report["unknown"] == []
+        assert "\n" not in path.read_text().rstrip("\n")
@@ -9,6 +9,8 @@ from scripts.lib.sections import (
     validate_section_file,
     get_completed_sections,
     extract_file_paths_from_section,
+    parse_manifest_annotations,
+    infer_section_profile,
 )
 
 
@@ -149,6 +151,52 @@ END_MANIFEST -->"""
         assert len(result) == 2
 
 
+class TestParseManifestAnnotations:
+    """Tests for per-section manifest annotations."""
+
+    CONTENT = """<!-- SECTION_MANIFEST
+section-01-foundation
+section-02-readme: profile=docs
+END_MANIFEST -->"""
+
+    def test_manifest_block_strips_annotations(self):
+        """Section names should not include annotations."""
+        assert parse_manifest_block(self.CONTENT) == ["section-01-foundation", "section-02-readme"]
+
+    def test_parses_key_value_pairs(self):
+        """Only annotated sections should be returned."""
+        assert parse_manifest_annotations(self.CONTENT) == {"section-02-readme": {"profile": "docs"}}
+
+    def test_malformed_annotation(self):
+        """Annotations without '=' should raise ValueError."""
+        content = """<!-- SECTION_MANIFEST
+section-01-foundation: docs
+END_MANIFEST -->"""
+
+        with pytest.raises(ValueError, match="section-01-foundation"):
+            parse_manifest_annotations(content)
+
+
+class TestInferSectionProfile:
+    """Tests for infer_section_profile function."""
+
+    def test_docs_only(self):
+        """Sections touching only documentation should use the docs profile."""
+        assert infer_section_profile("Update `docs/usage.md` and `README.md`.\n### File: `docs/api.md`") == "docs"
+
+    def test_config_only(self):
+        """Sections touching config (and docs) should use the light profile."""
+        assert infer_section_profile("| config/settings.toml | add key |\n| docs/setup.md | note |") == "light"
+
+    def test_code_uses_full(self):
+        """Any code file should keep the full pipeline."""
+        assert infer_section_profile("| src/app.py | new |\n| docs/setup.md | note |") == "full"
+
+    def test_no_paths_uses_full(self):
+        """Without file paths there is nothing to infer from."""
+        assert infer_section_profile("Refactor things.") == "full"
+
+
 class TestValidateSectionFile:
     """Tests for validate_section_file function."""
 
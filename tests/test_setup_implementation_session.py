@@ -5,14 +5,32 @@ import sys
 from pathlib import Path
 
 from scripts.checks.setup_implementation_session import (
-    validate_sections_dir,
     check_git_repo,
     check_current_branch,
     check_working_tree_status,
     detect_commit_style,
+    estimate_step_savings,
+)
+from scripts.lib.impl_tasks import TaskOptions
+from scripts.lib.leases import acquire_lease, read_lease
+from scripts.lib.review_cache import cache_section_review
+from scripts.lib.review_state import ReviewArtifact
+from scripts.lib.sections import validate_sections_dir
+from scripts.lib.session_tasks import (
+    TASK_LIST_LOCK_NAME,
+    budget_compaction_points,
+    build_impl_dependency_graph,
     detect_section_review_state,
+    generate_implementation_tasks,
     infer_session_state,
+    pipeline_breaks,
+    plan_session_tasks,
+    resolve_section_dependencies,
+    refresh_session_tasks,
+    resolve_section_profiles,
+    sticky_compaction_points,
 )
+from scripts.lib.task_storage import InMemoryTaskStore, assign_stable_positions, write_tasks
 
 SETUP_SCRIPT = Path(__file__).parent.parent / "scripts" / "checks" / "setup_implementation_session.py"
 
@@ -216,6 +234,16 @@ class TestCheckWorkingTreeStatus:
         assert result["clean"] is False
         assert "new_file.txt" in result["dirty_files"]
 
+    def test_ignores_lane_worktrees(self, mock_git_repo):
+        """Entries under ignored directories should not count as dirty."""
+        worktrees = mock_git_repo / "planning" / "implementation" / "worktrees"
+        (worktrees / "lane-01").mkdir(parents=True)
+        (worktrees / "lane-01" / "file.py").write_text("x = 1")
+
+        result = check_working_tree_status(mock_git_repo, ignore_paths=[mock_git_repo / "planning"])
+
+        assert result["clean"] is True
+
     def test_modified_tracked_file(self, mock_git_repo):
         """Modified tracked file should appear in dirty_files."""
         (mock_git_repo / "README.md").write_text("modified content")
@@ -415,6 +443,36 @@ class TestDetectSectionReviewState:
         assert result["has_interview"] is False
         assert result["resume_step"] == "interview"
 
+    def test_cached_review_skips_to_interview(self, mock_implementation_dir, temp_dir):
+        """A cached review of the same diff and plan is restored."""
+        sections_dir = temp_dir / "sections"
+        sections_dir.mkdir()
+        (sections_dir / "section-01-foundation.md").write_text("# Foundation")
+        code_review_dir = mock_implementation_dir / "code_review"
+        code_review_dir.mkdir()
+        (code_review_dir / "section-01-diff.md").write_text("# Diff")
+        (code_review_dir / "section-01-review.md").write_text("# Review findings")
+        cache_section_review(mock_implementation_dir, sections_dir, "section-01-foundation")
+        (code_review_dir / "section-01-review.md").unlink()
+
+        result = detect_section_review_state(mock_implementation_dir, "section-01-foundation", sections_dir)
+
+        assert result["has_review"] is True
+        assert result["review_cached"] is True
+        assert result["resume_step"] == "interview"
+        assert (code_review_dir / "section-01-review.md").read_text() == "# Review findings"
+
+    def test_cache_miss_runs_review(self, mock_implementation_dir, temp_dir):
+        """Without a cached review the reviewer runs as usual."""
+        code_review_dir = mock_implementation_dir / "code_review"
+        code_review_dir.mkdir()
+        (code_review_dir / "section-01-diff.md").write_text("# Diff")
+
+        result = detect_section_review_state(mock_implementation_dir, "section-01-foundation", temp_dir)
+
+        assert result["review_cached"] is False
+        assert result["resume_step"] == "review"
+
     def test_infer_state_includes_review_state(self, mock_sections_dir, mock_implementation_dir, mock_git_repo):
         """infer_session_state should include resume_section_state for incomplete section."""
         # Create config with no completed sections
@@ -438,6 +496,529 @@ class TestDetectSectionReviewState:
         assert result["resume_section_state"]["resume_step"] == "apply_fixes"
         assert result["resume_section_state"]["has_interview"] is True
 
+    def test_infer_state_restores_cached_review_only_on_request(
+        self, mock_sections_dir, mock_implementation_dir, mock_git_repo
+    ):
+        """Inferring state must not write review files unless setup asks it to."""
+        config = {"sections": ["section-01-foundation", "section-02-models"], "sections_state": {}}
+        (mock_implementation_dir / "deep_implement_config.json").write_text(json.dumps(config))
+        code_review_dir = mock_implementation_dir / "code_review"
+        code_review_dir.mkdir()
+        (code_review_dir / "section-01-diff.md").write_text("# Diff")
+        (code_review_dir / "section-01-review.md").write_text("# Review findings")
+        cache_section_review(mock_implementation_dir, mock_sections_dir, "section-01-foundation")
+        (code_review_dir / "section-01-review.md").unlink()
+
+        result = infer_session_state(mock_sections_dir, mock_implementation_dir, mock_git_repo)
+
+        assert result["resume_section_state"]["resume_step"] == "review"
+        assert not (code_review_dir / "section-01-review.md").exists()
+
+        result = infer_session_state(
+            mock_sections_dir, mock_implementation_dir, mock_git_repo, restore_cached=True
+        )
+
+        assert result["resume_section_state"]["resume_step"] == "interview"
+        assert result["resume_section_state"]["review_cached"] is True
+        assert (code_review_dir / "section-01-review.md").exists()
+
+
+CONTEXT_VALUES = {
+    "plugin_root": "/plugin",
+    "sections_dir": "/plan/sections",
+    "target_dir": "/repo",
+    "state_dir": "/plan/implementation",
+    "runtime": "python-uv",
+    "test_command": "uv run pytest",
+}
+
+
+class TestBuildImplDependencyGraph:
+    """Tests for build_impl_dependency_graph function."""
+
+    def test_sections_chain_through_compaction(self):
+        """Section 03 should wait for the compaction task after section 02."""
+        sections = ["section-01-a", "section-02-b", "section-03-c"]
+        tasks = generate_implementation_tasks(sections, [], None, None, CONTEXT_VALUES)
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, sections)
+
+        compaction = by_id["section-02-b:compaction"]
+        assert graph[compaction][1] == [str(by_id["section-02-b:record_completion"])]
+        assert graph[by_id["section-03-c:implement"]][1] == [str(compaction)]
+
+    def test_trailing_compaction_blocked_by_last_section(self):
+        """A compaction task after the final section must not be left dangling."""
+        sections = ["section-01-a", "section-02-b"]
+        tasks = generate_implementation_tasks(sections, [], None, None, CONTEXT_VALUES)
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, sections)
+
+        compaction = by_id["section-02-b:compaction"]
+        assert graph[compaction][1] == [str(by_id["section-02-b:record_completion"])]
+        assert graph[by_id["finalization"]][1] == [str(compaction)]
+
+    def test_context_tasks_blocked_by_finalization(self):
+        """Context tasks stay pending until finalization completes."""
+        sections = ["section-01-a"]
+        tasks = generate_implementation_tasks(sections, [], None, None, CONTEXT_VALUES)
+        final_pos = str(tasks[-1].position)
+
+        graph = build_impl_dependency_graph(tasks, sections)
+
+        for position in range(1, len(CONTEXT_VALUES) + 1):
+            assert graph[position][1] == [final_pos]
+
+
+class TestTaskWindow:
+    """Tests for windowed task materialization."""
+
+    SECTIONS = [f"section-{i:02d}-part" for i in range(1, 11)]
+
+    def _section_ids(self, tasks) -> set[str]:
+        return {t.semantic_id.split(":", 1)[0] for t in tasks if t.semantic_id.startswith("section-")}
+
+    def test_window_materializes_current_and_next(self):
+        """Only the current section and the next K should get step tasks."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, window=2
+        )
+
+        assert self._section_ids(tasks) == set(self.SECTIONS[:3])
+        placeholder = next(t for t in tasks if t.semantic_id == "window:remaining")
+        assert "7 sections" in placeholder.subject
+        assert placeholder.status == "pending"
+
+    def test_window_follows_completed_sections(self):
+        """The window should start at the first incomplete section."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, self.SECTIONS[:4], "section-05-part",
+            {"resume_step": "implement"}, CONTEXT_VALUES, window=1,
+        )
+
+        assert self._section_ids(tasks) == set(self.SECTIONS[:6])
+
+    def test_no_placeholder_when_window_covers_plan(self):
+        """A window larger than the plan should generate everything."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, window=20
+        )
+
+        assert all(t.semantic_id != "window:remaining" for t in tasks)
+        assert self._section_ids(tasks) == set(self.SECTIONS)
+
+    def test_placeholder_sits_between_window_and_finalization(self):
+        """Placeholder waits for the window; finalization waits for the placeholder."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, window=0
+        )
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, self.SECTIONS)
+
+        placeholder = by_id["window:remaining"]
+        assert graph[placeholder][1] == [str(by_id["section-01-part:record_completion"])]
+        assert graph[by_id["finalization"]][1] == [str(placeholder)]
+
+
+class TestCollapseCompleted:
+    """Tests for collapsing completed sections into summary tasks."""
+
+    @staticmethod
+    def _sections(count: int) -> list[str]:
+        return [f"section-{i:02d}-part" for i in range(1, count + 1)]
+
+    def test_task_count_tracks_remaining_sections(self):
+        """Task count should depend on remaining sections, not plan length."""
+        long_plan = self._sections(50)
+        short_plan = self._sections(10)
+
+        resumed = generate_implementation_tasks(
+            long_plan, long_plan[:40], long_plan[40], {"resume_step": "implement"},
+            CONTEXT_VALUES, collapse_completed=True,
+        )
+        fresh = generate_implementation_tasks(
+            short_plan, [], None, None, CONTEXT_VALUES, collapse_completed=True,
+        )
+
+        # One summary task replaces all 40 completed sections
+        assert len(resumed) == len(fresh) + 1
+
+    def test_summary_lists_commit_hashes(self):
+        """Summary task should be completed and carry each commit hash."""
+        sections = self._sections(3)
+
+        tasks = generate_implementation_tasks(
+            sections, sections[:2], sections[2], {"resume_step": "implement"},
+            CONTEXT_VALUES, collapse_completed=True,
+            commit_hashes={"section-01-part": "abc1234", "section-02-part": "def5678"},
+        )
+
+        summary = next(t for t in tasks if t.semantic_id.startswith("summary:"))
+        assert summary.status == "completed"
+        assert "2 sections" in summary.subject
+        assert "section-01-part=abc1234" in summary.description
+        assert "section-02-part=def5678" in summary.description
+        assert not any(t.semantic_id.startswith("section-01-part:") for t in tasks)
+
+    def test_separate_runs_get_separate_summaries(self):
+        """Non-adjacent completed runs should each get a summary."""
+        sections = self._sections(4)
+
+        tasks = generate_implementation_tasks(
+            sections, [sections[0], sections[2]], sections[1],
+            {"resume_step": "implement"}, CONTEXT_VALUES, collapse_completed=True,
+        )
+
+        summaries = [t.semantic_id for t in tasks if t.semantic_id.startswith("summary:")]
+        assert summaries == ["summary:section-01-part", "summary:section-03-part"]
+
+    def test_graph_chains_through_summary(self):
+        """Next section should be blocked by the summary of the completed run."""
+        sections = self._sections(4)
+        tasks = generate_implementation_tasks(
+            sections, sections[:3], sections[3], {"resume_step": "implement"},
+            CONTEXT_VALUES, collapse_completed=True,
+        )
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, sections)
+
+        summary = by_id["summary:section-01-part"]
+        assert graph[by_id["section-04-part:implement"]][1] == [str(summary)]
+
+    def test_summary_keeps_position_as_sections_complete(self):
+        """With stable IDs the summary should be updated in place, not moved."""
+        sections = self._sections(4)
+        store = InMemoryTaskStore()
+        positions = []
+        for done in (1, 2, 3):
+            tasks = generate_implementation_tasks(
+                sections, sections[:done], sections[done], {"resume_step": "implement"},
+                CONTEXT_VALUES, collapse_completed=True,
+            )
+            tasks = assign_stable_positions(tasks, store)
+            write_tasks("summary-session", tasks, store=store)
+            summary = next(t for t in tasks if t.semantic_id == "summary:section-01-part")
+            assert f"{done} sections" in summary.subject
+            positions.append(summary.position)
+
+        assert len(set(positions)) == 1
+
+
+class TestStableTaskIds:
+    """Tests for stable task positions across plan edits."""
+
+    SECTIONS = [f"section-{i:02d}-part" for i in range(1, 7)]
+    OPTIONS = TaskOptions(stable_ids=True)
+    STATE = {"completed_sections": [], "resume_from": None}
+
+    def _write(self, sections, store):
+        tasks, graph = plan_session_tasks(
+            sections, self.STATE, CONTEXT_VALUES, self.OPTIONS, config=None, store=store
+        )
+        write_tasks("stable", tasks, dependency_graph=graph, store=store, skip_unchanged=True)
+        return {t.semantic_id: t.position for t in tasks}
+
+    def test_inserting_section_only_touches_neighbours(self):
+        """Inserting a section rewrites its own tasks and the two tasks linking to it."""
+        store = InMemoryTaskStore()
+        before = self._write(self.SECTIONS, store)
+        files_before = dict(store.files)
+
+        sections = self.SECTIONS[:3] + ["section-03b-extra"] + self.SECTIONS[3:]
+        after = self._write(sections, store)
+
+        for semantic_id, position in before.items():
+            assert after[semantic_id] == position
+        changed = {p for p, content in files_before.items() if store.files[p] != content}
+        assert changed == {
+            before["section-03-part:record_completion"],
+            before["section-04-part:implement"],
+        }
+        assert min(after[k] for k in after if k.startswith("section-03b-extra:")) > max(before.values())
+
+    def test_removing_section_marks_its_tasks_obsolete(self):
+        """Tasks of a removed section become obsolete; later tasks keep their files."""
+        store = InMemoryTaskStore()
+        before = self._write(self.SECTIONS, store)
+        files_before = dict(store.files)
+
+        self._write(self.SECTIONS[:2] + self.SECTIONS[3:], store)
+
+        removed = [p for k, p in before.items() if k.startswith("section-03-part:")]
+        assert all(store.read_task(p)["subject"] == "[obsolete]" for p in removed)
+        assert store.files[before["section-06-part:commit"]] == files_before[before["section-06-part:commit"]]
+
+    def test_sticky_compaction_matches_default_on_first_run(self):
+        """With no history, compaction follows every 2nd section."""
+        assert sticky_compaction_points(self.SECTIONS, []) == {
+            "section-02-part", "section-04-part", "section-06-part",
+        }
+
+    def test_sticky_compaction_keeps_existing_points(self):
+        """Known sections keep their compaction; new ones alternate with their predecessor."""
+        previous = [f"{s}:implement" for s in self.SECTIONS] + [
+            "section-02-part:compaction", "section-04-part:compaction",
+        ]
+        sections = self.SECTIONS[:2] + ["section-02b-extra"] + self.SECTIONS[2:]
+
+        assert sticky_compaction_points(sections, previous) == {
+            "section-02-part", "section-04-part",
+        }
+
+
+class TestSectionProfiles:
+    """Tests for per-section step pipeline profiles."""
+
+    SECTIONS = ["section-01-core", "section-02-readme", "section-03-settings"]
+    PROFILES = {"section-02-readme": "docs", "section-03-settings": "light"}
+
+    def _steps(self, tasks, section):
+        return [t.semantic_id.split(":", 1)[1] for t in tasks if t.semantic_id.startswith(f"{section}:")]
+
+    def test_profiles_drop_steps(self):
+        """Docs and light sections should only get their profile's steps."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, section_profiles=self.PROFILES
+        )
+
+        assert len(self._steps(tasks, "section-01-core")) == 6
+        assert self._steps(tasks, "section-02-readme") == ["implement", "commit", "record_completion", "compaction"]
+        assert self._steps(tasks, "section-03-settings") == [
+            "implement", "update_docs", "commit", "record_completion",
+        ]
+        implement = next(t for t in tasks if t.semantic_id == "section-02-readme:implement")
+        assert implement.subject == "Write section-02-readme documentation"
+
+    def test_graph_skips_dropped_steps(self):
+        """A docs section should chain implement straight into commit."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, section_profiles=self.PROFILES
+        )
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, self.SECTIONS)
+
+        assert graph[by_id["section-02-readme:commit"]][1] == [str(by_id["section-02-readme:implement"])]
+        assert graph[by_id["section-02-readme:implement"]][1] == [str(by_id["section-01-core:record_completion"])]
+
+    def test_resolve_annotation_wins_over_inference(self, tmp_path):
+        """Explicit annotations take precedence; others are inferred when enabled."""
+        (tmp_path / "section-01-core.md").write_text("| docs/a.md | x |")
+        (tmp_path / "section-02-readme.md").write_text("| src/app.py | x |")
+        (tmp_path / "section-03-settings.md").write_text("| config/app.toml | x |")
+
+        profiles = resolve_section_profiles(
+            tmp_path, self.SECTIONS, {"section-02-readme": {"profile": "docs"}}, infer=True
+        )
+
+        assert profiles == {
+            "section-01-core": "docs",
+            "section-02-readme": "docs",
+            "section-03-settings": "light",
+        }
+
+    def test_resolve_rejects_unknown_profile(self, tmp_path):
+        """Unknown profile names should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown section profile"):
+            resolve_section_profiles(tmp_path, ["section-01-core"], {"section-01-core": {"profile": "tiny"}})
+
+    def test_step_savings_counts_remaining_sections(self):
+        """Savings should only count sections that are not complete."""
+        savings = estimate_step_savings(self.SECTIONS, ["section-02-readme"], self.PROFILES)
+
+        assert savings == {"steps_skipped": 2, "review_rounds_skipped": 1}
+
+    def test_validate_reports_annotations(self, mock_sections_dir):
+        """validate_sections_dir should expose manifest annotations."""
+        index = mock_sections_dir / "index.md"
+        index.write_text(index.read_text().replace("section-02-models\n", "section-02-models: profile=light\n", 1))
+
+        result = validate_sections_dir(mock_sections_dir)
+
+        assert result["valid"] is True
+        assert result["sections"] == ["section-01-foundation", "section-02-models"]
+        assert result["section_annotations"] == {"section-02-models": {"profile": "light"}}
+
+
+class TestBudgetCompaction:
+    """Tests for token-budget compaction scheduling."""
+
+    SECTIONS = ["section-01-small", "section-02-small", "section-03-big", "section-04-small"]
+
+    def _write_sections(self, sections_dir: Path) -> None:
+        sections_dir.mkdir()
+        for section in self.SECTIONS:
+            body = "# Plan\n"
+            if "big" in section:
+                body += "```python\n" + "value = compute()\n" * 2000 + "```\n"
+            (sections_dir / f"{section}.md").write_text(body)
+
+    def test_big_section_is_isolated(self, tmp_path):
+        """Compactions should bracket the big section and skip the small ones."""
+        sections_dir = tmp_path / "sections"
+        self._write_sections(sections_dir)
+
+        points, estimates = budget_compaction_points(
+            sections_dir, tmp_path / "implementation", self.SECTIONS, {}, budget=30000
+        )
+
+        assert points == ["section-02-small", "section-03-big"]
+        assert estimates["section-03-big"] > estimates["section-01-small"]
+
+    def test_uses_shared_review_index(self, tmp_path):
+        """A review index from the caller should be used instead of a rescan."""
+        sections_dir = tmp_path / "sections"
+        self._write_sections(sections_dir)
+        diff = ReviewArtifact(path=tmp_path / "section-01-diff.md", size=400000, mtime=0.0)
+
+        _, estimates = budget_compaction_points(
+            sections_dir, tmp_path / "implementation", self.SECTIONS, {}, budget=30000,
+            review_index={"01": {"diff": diff}},
+        )
+
+        assert estimates["section-01-small"] > estimates["section-03-big"]
+
+    def test_schedule_drives_compaction_tasks(self):
+        """generate_implementation_tasks should place compaction where scheduled."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, compaction_after={"section-03-big"}
+        )
+
+        compactions = [t.semantic_id for t in tasks if t.semantic_id.endswith(":compaction")]
+        assert compactions == ["section-03-big:compaction"]
+
+
+class TestParallelLanes:
+    """Tests for declared section dependencies."""
+
+    SECTIONS = ["section-01-core", "section-02-api", "section-03-cli", "section-04-docs"]
+    DEPENDENCIES = {
+        "section-01-core": [],
+        "section-02-api": ["section-01-core"],
+        "section-03-cli": ["section-01-core"],
+        "section-04-docs": [],
+    }
+
+    def test_resolves_prefix_references(self):
+        """References may use the section-NN prefix."""
+        annotations = {"section-03-cli": {"depends": "section-01,section-02-api"}}
+
+        dependencies = resolve_section_dependencies(self.SECTIONS, annotations)
+
+        assert dependencies["section-03-cli"] == ["section-01-core", "section-02-api"]
+        assert dependencies["section-02-api"] == []
+
+    def test_no_annotations_means_sequential(self):
+        assert resolve_section_dependencies(self.SECTIONS, {"section-02-api": {"profile": "docs"}}) is None
+
+    def test_rejects_unknown_and_forward_references(self):
+        """Unknown sections and sections later in the manifest are errors."""
+        with pytest.raises(ValueError, match="unknown section"):
+            resolve_section_dependencies(self.SECTIONS, {"section-02-api": {"depends": "section-09"}})
+        with pytest.raises(ValueError, match="not listed before"):
+            resolve_section_dependencies(self.SECTIONS, {"section-02-api": {"depends": "section-03"}})
+
+    def test_independent_sections_are_not_chained(self):
+        """Sections only wait for the sections they depend on."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, compaction_after=set()
+        )
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, self.SECTIONS, section_dependencies=self.DEPENDENCIES)
+
+        core_tail = str(by_id["section-01-core:record_completion"])
+        assert graph[by_id["section-02-api:implement"]][1] == [core_tail]
+        assert graph[by_id["section-03-cli:implement"]][1] == [core_tail]
+        assert graph[by_id["section-04-docs:implement"]][1] == []
+
+    def test_finalization_waits_for_every_lane_tail(self):
+        """Finalization should be blocked by each lane's last task."""
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES, compaction_after=set()
+        )
+        by_id = {t.semantic_id: t.position for t in tasks}
+
+        graph = build_impl_dependency_graph(tasks, self.SECTIONS, section_dependencies=self.DEPENDENCIES)
+
+        assert graph[by_id["finalization"]][1] == sorted(
+            str(by_id[f"{s}:record_completion"]) for s in ["section-02-api", "section-03-cli", "section-04-docs"]
+        )
+
+
+class TestPipelinedReview:
+    """Tests for overlapping a section's review with the next implementation."""
+
+    SECTIONS = ["section-01-core", "section-02-api", "section-03-docs"]
+    PROFILES = {"section-03-docs": "docs"}
+
+    def _plan(self, breaks=None):
+        tasks = generate_implementation_tasks(
+            self.SECTIONS, [], None, None, CONTEXT_VALUES,
+            compaction_after=set(), section_profiles=self.PROFILES, pipelined=True,
+        )
+        by_id = {t.semantic_id: t.position for t in tasks}
+        graph = build_impl_dependency_graph(tasks, self.SECTIONS, pipeline_breaks=breaks)
+        return tasks, by_id, graph
+
+    def test_capture_step_only_for_reviewed_sections(self):
+        """capture_diff follows implement, but not for profiles without review."""
+        tasks, by_id, _ = self._plan()
+
+        assert by_id["section-01-core:capture_diff"] == by_id["section-01-core:implement"] + 1
+        assert "section-03-docs:capture_diff" not in by_id
+
+    def test_next_section_starts_after_capture(self):
+        """The next implement waits for the capture, its commit for the previous tail."""
+        _, by_id, graph = self._plan()
+
+        assert graph[by_id["section-02-api:implement"]][1] == [str(by_id["section-01-core:capture_diff"])]
+        assert graph[by_id["section-02-api:commit"]][1] == sorted([
+            str(by_id["section-02-api:update_docs"]),
+            str(by_id["section-01-core:record_completion"]),
+        ])
+        assert graph[by_id["section-03-docs:implement"]][1] == [str(by_id["section-02-api:capture_diff"])]
+
+    def test_break_falls_back_to_serial(self):
+        """A section in pipeline_breaks waits for the whole previous section."""
+        _, by_id, graph = self._plan(breaks={"section-02-api"})
+
+        assert graph[by_id["section-02-api:implement"]][1] == [str(by_id["section-01-core:record_completion"])]
+        assert graph[by_id["section-02-api:commit"]][1] == [str(by_id["section-02-api:update_docs"])]
+
+    def test_parallel_plan_has_no_capture_steps(self):
+        """Lanes have no pipelining edges, so capture_diff would only add work."""
+        options = TaskOptions.from_project_config({"pipelined_review": "true"})
+        dependencies = {"section-01-core": [], "section-02-api": ["section-01-core"], "section-03-docs": []}
+
+        tasks, _ = plan_session_tasks(
+            self.SECTIONS, {"completed_sections": []}, CONTEXT_VALUES, options,
+            config=None, store=None, compaction_after=set(),
+            section_dependencies=dependencies,
+        )
+
+        assert not any(t.semantic_id.endswith(":capture_diff") for t in tasks)
+
+    def test_breaks_from_conflicting_neighbours(self):
+        """Only conflicts between consecutive sections break the pipeline."""
+        report = {"pairs": [
+            {"sections": ["section-01-core", "section-03-docs"], "files": ["README.md"]},
+            {"sections": ["section-02-api", "section-03-docs"], "files": []},
+        ]}
+
+        assert pipeline_breaks(self.SECTIONS, report) == {"section-03-docs"}
+
+    def test_unknown_sections_break_the_pipeline(self):
+        """A section with unknown files breaks the pipeline on both sides."""
+        report = {"pairs": [], "unknown": ["section-02-api"]}
+
+        assert pipeline_breaks(self.SECTIONS, report) == {"section-02-api", "section-03-docs"}
+        assert pipeline_breaks(self.SECTIONS, None) == set()
+
 
 class TestSessionIdHandling:
     """Tests for --session-id argument and diagnostic output."""
@@ -449,6 +1030,7 @@ class TestSessionIdHandling:
         plugin_root: Path,
         session_id: str | None = None,
         env_session_id: str | None = None,
+        extra_args: list[str] | None = None,
     ) -> dict:
         """Run setup script and return parsed JSON output."""
         import os
@@ -462,6 +1044,8 @@ class TestSessionIdHandling:
         ]
         if session_id:
             cmd.extend(["--session-id", session_id])
+        if extra_args:
+            cmd.extend(extra_args)
 
         env = os.environ.copy()
         # Clear any existing session vars
@@ -567,3 +1151,255 @@ class TestSessionIdHandling:
         assert output["success"] is True
         assert output["tasks_written"] > 0
         assert output["task_write_error"] is None
+
+    def test_tasks_written_under_tasks_root(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """--tasks-root should redirect task files away from ~/.claude/tasks."""
+        plugin_root = Path(__file__).parent.parent
+        tasks_root = tmp_path / "tasks-root"
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=plugin_root,
+            session_id="rooted-session",
+            extra_args=["--tasks-root", str(tasks_root)],
+        )
+
+        assert output["success"] is True
+        assert output["tasks_dir"] == str(tasks_root / "rooted-session")
+        assert (tasks_root / "rooted-session" / "1.json").exists()
+
+    def test_declared_dependencies_report_lanes(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """depends= annotations should put setup into parallel lane mode."""
+        index = mock_sections_dir / "index.md"
+        index.write_text(index.read_text().replace(
+            "section-02-models\n", "section-02-models: depends=section-01\n", 1
+        ))
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="lanes-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks")],
+        )
+
+        assert output["success"] is True
+        assert output["section_dependencies"]["section-02-models"] == ["section-01-foundation"]
+        assert output["parallel_lanes"] == [["section-01-foundation", "section-02-models"]]
+
+    def test_invalid_dependency_fails_setup(self, mock_sections_dir, mock_git_repo):
+        """An unknown dependency should be reported as a setup error."""
+        index = mock_sections_dir / "index.md"
+        index.write_text(index.read_text().replace(
+            "section-02-models\n", "section-02-models: depends=section-07\n", 1
+        ))
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+        )
+
+        assert output["success"] is False
+        assert "section-07" in output["error"]
+
+    def test_infer_dependencies_from_file_overlap(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """infer_dependencies should run non-overlapping sections in separate lanes."""
+        index = mock_sections_dir / "index.md"
+        index.write_text(index.read_text().replace(
+            "test_command: uv run pytest\n", "test_command: uv run pytest\ninfer_dependencies: true\n", 1
+        ))
+        (mock_sections_dir / "section-01-foundation.md").write_text("| src/base.py | new |")
+        (mock_sections_dir / "section-02-models.md").write_text("| src/models.py | new |")
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="conflict-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks")],
+        )
+
+        assert output["success"] is True
+        assert output["conflict_groups"] == [["section-01-foundation", "section-02-models"]]
+        assert output["parallel_lanes"] == [["section-01-foundation"], ["section-02-models"]]
+        assert Path(output["conflict_report"]).exists()
+
+    def test_conflict_analysis_skipped_when_unused(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """Without infer_dependencies, pipelined_review or lanes no report is written."""
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="no-conflict-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks")],
+        )
+
+        assert output["success"] is True
+        assert output["conflict_report"] is None
+        assert output["conflict_groups"] is None
+        assert not (Path(output["state_dir"]) / "section_conflicts.json").exists()
+
+    def test_concurrent_setup_reports_in_progress(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """A held task list lock should make setup fail fast and clearly."""
+        tasks_dir = tmp_path / "tasks" / "locked-session"
+        acquire_lease(tasks_dir, TASK_LIST_LOCK_NAME, "other-host:1", ttl=600)
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="locked-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks"), "--lock-wait", "0.2"],
+        )
+
+        assert output["success"] is False
+        assert output["setup_in_progress"] is True
+        assert "other-host:1" in output["error"]
+        assert not (tasks_dir / "1.json").exists()
+
+    def test_stale_setup_lock_is_reclaimed(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """A lock left behind by a crashed run should not block setup."""
+        tasks_dir = tmp_path / "tasks" / "stale-session"
+        acquire_lease(tasks_dir, TASK_LIST_LOCK_NAME, "crashed:1", ttl=1, now=0)
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="stale-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks"), "--lock-wait", "0"],
+        )
+
+        assert output["success"] is True
+        assert (tasks_dir / "1.json").exists()
+        assert read_lease(tasks_dir, TASK_LIST_LOCK_NAME) is None
+
+    def test_refresh_rewrites_only_changed_tasks(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """A refresh with nothing new should leave every task file untouched."""
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="refresh-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks")],
+        )
+        tasks_dir = tmp_path / "tasks" / "refresh-session"
+        before = {p.name: p.stat().st_mtime_ns for p in tasks_dir.glob("*.json")}
+
+        result = refresh_session_tasks(Path(output["state_dir"]))
+
+        assert result.success is True
+        assert result.tasks_unchanged == result.tasks_written
+        assert {p.name: p.stat().st_mtime_ns for p in tasks_dir.glob("*.json")} == before
+
+    def test_schedule_balances_lanes(self, mock_sections_dir, mock_git_repo, tmp_path):
+        """lanes: N should schedule independent sections across N lanes."""
+        index = mock_sections_dir / "index.md"
+        index.write_text(index.read_text().replace(
+            "test_command: uv run pytest\n", "test_command: uv run pytest\ninfer_dependencies: true\nlanes: 2\n", 1
+        ))
+        (mock_sections_dir / "section-01-foundation.md").write_text("| src/base.py | new |")
+        (mock_sections_dir / "section-02-models.md").write_text("| src/models.py | new |\n" + "x" * 5000)
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="schedule-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks")],
+        )
+
+        assert output["success"] is True
+        schedule = output["schedule"]
+        assert schedule["lanes"] == 2
+        assert schedule["unit"] == "units"
+        assert schedule["order"] == ["section-02-models", "section-01-foundation"]
+        assert schedule["makespan"] < schedule["serial_total"]
+
+    def test_schedule_skipped_for_sequential_plan(self, mock_sections_dir, mock_git_repo, tmp_path):
+        """One lane and no parallel dependencies need no schedule."""
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            session_id="sequential-session",
+            extra_args=["--tasks-root", str(tmp_path / "tasks")],
+        )
+
+        assert output["success"] is True
+        assert output["schedule"] is None
+
+    def test_lane_worktrees_provisioned_per_lane(
+        self, mock_sections_dir, mock_git_repo, tmp_path
+    ):
+        """--lane-worktrees should create one worktree per lane and record it."""
+        index = mock_sections_dir / "index.md"
+        index.write_text(index.read_text().replace(
+            "test_command: uv run pytest\n", "test_command: uv run pytest\ninfer_dependencies: true\n", 1
+        ))
+        (mock_sections_dir / "section-01-foundation.md").write_text("| src/base.py | new |")
+        (mock_sections_dir / "section-02-models.md").write_text("| src/models.py | new |")
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            extra_args=["--lane-worktrees"],
+        )
+
+        assert output["success"] is True
+        assert [lane["sections"] for lane in output["lane_worktrees"]] == [
+            ["section-01-foundation"], ["section-02-models"],
+        ]
+        assert all(Path(lane["worktree"]).is_dir() for lane in output["lane_worktrees"])
+        config = json.loads((Path(output["state_dir"]) / "deep_implement_config.json").read_text())
+        assert config["lanes"] == output["lane_worktrees"]
+
+    def test_profile_pre_commit_records_timings(self, mock_sections_dir, mock_git_repo):
+        """--profile-pre-commit should time the hooks and save the profile."""
+        hook = mock_git_repo / ".git" / "hooks" / "pre-commit"
+        hook.parent.mkdir(parents=True, exist_ok=True)
+        hook.write_text("#!/bin/sh\nexit 0\n")
+        hook.chmod(0o755)
+
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            extra_args=["--profile-pre-commit"],
+        )
+
+        assert output["success"] is True
+        profile = output["pre_commit"]["profile"]
+        assert profile["tool"] == "native-hook"
+        assert profile["hooks"][0]["status"] == "passed"
+        config = json.loads((Path(output["state_dir"]) / "deep_implement_config.json").read_text())
+        assert config["pre_commit"]["profile"] == profile
+
+    def test_lane_worktrees_require_lanes(self, mock_sections_dir, mock_git_repo):
+        """--lane-worktrees on a sequential plan should fail clearly."""
+        output = self._run_setup_script(
+            sections_dir=mock_sections_dir,
+            target_dir=mock_git_repo,
+            plugin_root=Path(__file__).parent.parent,
+            extra_args=["--lane-worktrees"],
+        )
+
+        assert output["success"] is False
+        assert "--lane-worktrees" in output["error"]
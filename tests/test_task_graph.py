@@ -0,0 +1,157 @@
+"""Tests for the dependency graph engine."""
+
+import random
+
+import pytest
+
+from scripts.lib.task_graph import (
+    DependencyGraph,
+    DependencyGraphError,
+    chain_lanes,
+)
+
+
+class TestDependencyGraph:
+    """Tests for DependencyGraph."""
+
+    def test_deduplicates_edges(self):
+        """Adding the same dependency twice should yield one edge."""
+        graph = DependencyGraph(["a", "b"])
+        graph.add_dependency("b", "a")
+        graph.add_dependency("b", "a")
+
+        assert graph.blocked_by("b") == {"a"}
+        assert graph.blocks("a") == {"b"}
+
+    def test_topological_order(self):
+        """Nodes should come after their dependencies."""
+        graph = DependencyGraph(["c", "b", "a"])
+        graph.add_dependency("c", "b")
+        graph.add_dependency("b", "a")
+
+        assert graph.topological_order() == ["a", "b", "c"]
+
+    def test_topological_order_is_stable(self):
+        """Independent nodes keep insertion order."""
+        graph = DependencyGraph(["root", "x", "y", "z"])
+        for node in ("z", "y", "x"):
+            graph.add_dependency(node, "root")
+
+        assert graph.topological_order() == ["root", "x", "y", "z"]
+
+    def test_reports_cycle(self):
+        """Cycles should be reported with their members."""
+        graph = DependencyGraph(["a", "b", "c", "d"])
+        graph.add_dependency("b", "a")
+        graph.add_dependency("c", "b")
+        graph.add_dependency("a", "c")
+        graph.add_dependency("d", "a")
+
+        validation = graph.validate()
+
+        assert validation.valid is False
+        assert len(validation.cycles) == 1
+        assert set(validation.cycles[0]) == {"a", "b", "c"}
+        with pytest.raises(DependencyGraphError, match="cycle"):
+            graph.topological_order()
+
+    def test_reports_dangling_references(self):
+        """References to unknown nodes should be reported, not added."""
+        graph = DependencyGraph(["a"])
+        graph.add_dependency("a", "ghost")
+        graph.add_dependency("phantom", "a")
+
+        validation = graph.validate()
+
+        assert validation.dangling == (("a", "ghost"), ("phantom", "a"))
+        assert graph.blocked_by("a") == set()
+
+    def test_check_strict_and_lenient(self):
+        """Dangling references only raise in strict mode."""
+        graph = DependencyGraph(["a"])
+        graph.add_dependency("a", "ghost")
+
+        graph.check(strict=False)
+        with pytest.raises(DependencyGraphError) as exc_info:
+            graph.check(strict=True)
+        assert exc_info.value.validation.dangling == (("a", "ghost"),)
+
+    def test_transitive_reduction(self):
+        """Edges implied by longer paths should be removed."""
+        graph = DependencyGraph(["a", "b", "c", "d"])
+        graph.add_dependency("b", "a")
+        graph.add_dependency("c", "b")
+        graph.add_dependency("c", "a")  # implied by c -> b -> a
+        graph.add_dependency("d", "c")
+        graph.add_dependency("d", "a")  # implied by d -> c -> b -> a
+
+        graph.transitive_reduction()
+
+        assert graph.blocked_by("c") == {"b"}
+        assert graph.blocked_by("d") == {"c"}
+        assert graph.blocks("a") == {"b"}
+
+    def test_transitive_reduction_keeps_diamond(self):
+        """Parallel branches are not redundant."""
+        graph = DependencyGraph(["top", "left", "right", "bottom"])
+        graph.add_dependency("left", "top")
+        graph.add_dependency("right", "top")
+        graph.add_dependency("bottom", "left")
+        graph.add_dependency("bottom", "right")
+
+        graph.transitive_reduction()
+
+        assert graph.blocked_by("bottom") == {"left", "right"}
+
+    def test_transitive_reduction_matches_reachability(self):
+        """An edge survives exactly when no longer path connects its endpoints."""
+        rng = random.Random(7)
+        nodes = [f"n{i}" for i in range(40)]
+        edges = {(nodes[j], nodes[i]) for j in range(40) for i in range(j) if rng.random() < 0.15}
+        graph = DependencyGraph(nodes)
+        for node, dependency in edges:
+            graph.add_dependency(node, dependency)
+        blocks = {node: {n for n, d in edges if d == node} for node in nodes}
+
+        def reaches_indirectly(dependency, node):
+            stack = [n for n in blocks[dependency] if n != node]
+            seen = set(stack)
+            while stack:
+                current = stack.pop()
+                if current == node:
+                    return True
+                for nxt in blocks[current] - seen:
+                    seen.add(nxt)
+                    stack.append(nxt)
+            return False
+
+        graph.transitive_reduction()
+
+        for node, dependency in edges:
+            kept = dependency in graph.blocked_by(node)
+            assert kept is not reaches_indirectly(dependency, node)
+
+    def test_to_position_graph_sorts_numerically(self):
+        """Position lists should be numerically sorted strings."""
+        graph = DependencyGraph(["a", "b", "c"])
+        graph.add_dependency("b", "a")
+        graph.add_dependency("c", "a")
+
+        result = graph.to_position_graph({"a": 2, "b": 10, "c": 9}, positions=[1])
+
+        assert result[1] == ([], [])
+        assert result[2] == (["9", "10"], [])
+        assert result[10] == ([], ["2"])
+
+
+class TestChainLanes:
+    """Tests for chain_lanes."""
+
+    def test_independent_nodes_get_separate_lanes(self):
+        assert chain_lanes(["a", "b", "c"], {}) == [["a"], ["b"], ["c"]]
+
+    def test_chains_follow_dependencies(self):
+        """A node extends its dependency's lane only while that dependency is the tail."""
+        dependencies = {"b": ["a"], "c": ["a"], "d": ["b", "c"]}
+
+        assert chain_lanes(["a", "b", "c", "d"], dependencies) == [["a", "b", "d"], ["c"]]
@@ -4,6 +4,7 @@ import json
 import pytest
 from pathlib import Path
 
+from scripts.lib.task_graph import DependencyGraphError
 from scripts.lib.task_storage import (
     TaskToWrite,
     TaskWriteResult,
@@ -11,6 +12,12 @@ from scripts.lib.task_storage import (
     write_tasks,
     get_tasks_dir,
     build_dependency_graph,
+    load_tasks_manifest,
+    MANIFEST_FILENAME,
+    FileTaskStore,
+    InMemoryTaskStore,
+    assign_stable_positions,
+    load_position_map,
 )
 
 
@@ -196,6 +203,229 @@ class TestWriteTasks:
         assert (tmp_path / ".claude" / "tasks" / "new-session").is_dir()
 
 
+class TestObsoleteManifest:
+    """Tests for the high-water-mark manifest used by obsolete marking."""
+
+    @staticmethod
+    def _tasks(count: int) -> list[TaskToWrite]:
+        return [
+            TaskToWrite(position=i, subject=f"Task {i}", status=TaskStatus.PENDING)
+            for i in range(1, count + 1)
+        ]
+
+    def test_writes_manifest(self, tmp_path, monkeypatch):
+        """Should record max written position and high-water mark."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        write_tasks("test-id", self._tasks(5))
+        result = write_tasks("test-id", self._tasks(3))
+
+        manifest = load_tasks_manifest(FileTaskStore(result.tasks_dir))
+        assert manifest["max_written_position"] == 3
+        assert manifest["high_water_mark"] == 5
+        assert manifest["obsolete"] == [[4, 5]]
+
+    def test_manifest_is_not_a_task_file(self, tmp_path, monkeypatch):
+        """Manifest must not look like a task file to Claude Code."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        result = write_tasks("test-id", self._tasks(2))
+
+        assert (result.tasks_dir / MANIFEST_FILENAME).exists()
+        assert not MANIFEST_FILENAME.endswith(".json")
+
+    def test_skips_already_obsolete_positions(self, tmp_path, monkeypatch):
+        """Positions recorded as obsolete should not be read again."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        write_tasks("test-id", self._tasks(10))
+        result = write_tasks("test-id", self._tasks(4))
+
+        # Corrupt an already-obsolete file: it would fail to parse if touched
+        (result.tasks_dir / "8.json").write_text("not json")
+        write_tasks("test-id", self._tasks(2))
+
+        assert (result.tasks_dir / "8.json").read_text() == "not json"
+        task3 = json.loads((result.tasks_dir / "3.json").read_text())
+        assert task3["subject"] == "[obsolete]"
+
+    def test_growing_list_revives_positions(self, tmp_path, monkeypatch):
+        """Positions rewritten by a longer list are no longer obsolete."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        write_tasks("test-id", self._tasks(6))
+        write_tasks("test-id", self._tasks(2))
+        result = write_tasks("test-id", self._tasks(4))
+
+        manifest = load_tasks_manifest(FileTaskStore(result.tasks_dir))
+        assert manifest["obsolete"] == [[5, 6]]
+        task4 = json.loads((result.tasks_dir / "4.json").read_text())
+        assert task4["subject"] == "Task 4"
+
+    def test_marks_tasks_appended_past_high_water_mark(self, tmp_path, monkeypatch):
+        """Tasks created after the last run should still be marked obsolete."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        result = write_tasks("test-id", self._tasks(3))
+        (result.tasks_dir / "4.json").write_text(
+            json.dumps({"id": "4", "subject": "Agent task", "status": "pending"})
+        )
+
+        write_tasks("test-id", self._tasks(3))
+
+        task4 = json.loads((result.tasks_dir / "4.json").read_text())
+        assert task4["subject"] == "[obsolete]"
+        assert load_tasks_manifest(FileTaskStore(result.tasks_dir))["high_water_mark"] == 4
+
+    def test_growing_list_is_not_marked_obsolete(self, tmp_path, monkeypatch):
+        """Positions written past the old high-water mark are live, not appended."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        write_tasks("test-id", self._tasks(2))
+        result = write_tasks("test-id", self._tasks(5))
+
+        task5 = json.loads((result.tasks_dir / "5.json").read_text())
+        assert task5["subject"] == "Task 5"
+        assert load_tasks_manifest(FileTaskStore(result.tasks_dir))["obsolete"] == []
+
+    def test_corrupt_manifest_falls_back_to_scan(self, tmp_path, monkeypatch):
+        """An unreadable manifest should trigger a full scan."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        result = write_tasks("test-id", self._tasks(5))
+        (result.tasks_dir / MANIFEST_FILENAME).write_text("{broken")
+
+        write_tasks("test-id", self._tasks(2))
+
+        task5 = json.loads((result.tasks_dir / "5.json").read_text())
+        assert task5["subject"] == "[obsolete]"
+        assert load_tasks_manifest(FileTaskStore(result.tasks_dir))["obsolete"] == [[3, 5]]
+
+
+class TestTaskStores:
+    """Tests for pluggable task store backends."""
+
+    def test_in_memory_store_round_trip(self):
+        """write_tasks should run entirely against an in-memory store."""
+        store = InMemoryTaskStore(task_list_id="bench")
+        tasks = [
+            TaskToWrite(position=1, subject="Task 1", status=TaskStatus.PENDING),
+            TaskToWrite(position=2, subject="Task 2", status=TaskStatus.COMPLETED),
+        ]
+
+        result = write_tasks("bench", tasks, store=store)
+
+        assert result.success is True
+        assert result.tasks_written == 2
+        assert store.read_task(2)["status"] == "completed"
+        assert store.writes == 2
+
+    def test_in_memory_store_marks_obsolete(self):
+        """Obsolete marking should use the store, not the file system."""
+        store = InMemoryTaskStore()
+        tasks = [
+            TaskToWrite(position=i, subject=f"Task {i}", status=TaskStatus.PENDING)
+            for i in range(1, 5)
+        ]
+
+        write_tasks("memory", tasks, store=store)
+        write_tasks("memory", tasks[:2], store=store)
+
+        assert store.read_task(4)["subject"] == "[obsolete]"
+        assert load_tasks_manifest(store)["obsolete"] == [[3, 4]]
+
+    def test_in_memory_matches_file_bytes(self, tmp_path):
+        """Both backends should serialize tasks identically."""
+        memory = InMemoryTaskStore()
+        files = FileTaskStore(tmp_path / "tasks")
+        tasks = [TaskToWrite(position=1, subject="Task", status=TaskStatus.PENDING)]
+
+        write_tasks("x", tasks, store=memory)
+        write_tasks("x", tasks, store=files)
+
+        assert memory.files[1] == (tmp_path / "tasks" / "1.json").read_text()
+
+    def test_file_store_alternative_root(self, tmp_path):
+        """Should write under an alternative tasks root."""
+        store = FileTaskStore.for_task_list("ci-run", root=tmp_path / "tmpfs")
+        tasks = [TaskToWrite(position=1, subject="Task", status=TaskStatus.PENDING)]
+
+        result = write_tasks("ci-run", tasks, store=store)
+
+        assert result.tasks_dir == tmp_path / "tmpfs" / "ci-run"
+        assert (tmp_path / "tmpfs" / "ci-run" / "1.json").exists()
+
+
+class TestStablePositions:
+    """Tests for semantic ID -> position persistence."""
+
+    @staticmethod
+    def _tasks(*semantic_ids: str) -> list[TaskToWrite]:
+        return [
+            TaskToWrite(
+                position=i,
+                subject=f"Task {semantic_id}",
+                status=TaskStatus.PENDING,
+                semantic_id=semantic_id,
+            )
+            for i, semantic_id in enumerate(semantic_ids, start=1)
+        ]
+
+    def test_persists_position_map(self):
+        """write_tasks should record where each semantic ID was written."""
+        store = InMemoryTaskStore()
+
+        write_tasks("x", self._tasks("a", "b", "c"), store=store)
+
+        assert load_position_map(store) == {"a": 1, "b": 2, "c": 3}
+
+    def test_first_run_keeps_sequential_positions(self):
+        """Without a persisted map, positions are left as generated."""
+        tasks = self._tasks("a", "b")
+
+        assert assign_stable_positions(tasks, InMemoryTaskStore()) == tasks
+
+    def test_known_ids_keep_positions_and_new_ids_append(self):
+        """Inserted IDs go past the high-water mark; existing IDs stay put."""
+        store = InMemoryTaskStore()
+        write_tasks("x", self._tasks("a", "b", "c"), store=store)
+
+        tasks = assign_stable_positions(self._tasks("a", "new", "b", "c"), store)
+
+        assert [(t.semantic_id, t.position) for t in tasks] == [
+            ("a", 1), ("new", 4), ("b", 2), ("c", 3),
+        ]
+
+    def test_removed_id_is_marked_obsolete(self):
+        """A position no longer written should be marked obsolete even below the max."""
+        store = InMemoryTaskStore()
+        write_tasks("x", self._tasks("a", "b", "c"), store=store)
+
+        tasks = assign_stable_positions(self._tasks("a", "c"), store)
+        write_tasks("x", tasks, store=store)
+
+        assert store.read_task(2)["subject"] == "[obsolete]"
+        assert store.read_task(3)["subject"] == "Task c"
+        assert load_tasks_manifest(store)["obsolete"] == [[2, 2]]
+        assert load_position_map(store) == {"a": 1, "c": 3}
+
+    def test_skip_unchanged_leaves_files_alone(self):
+        """Identical task files should not be rewritten."""
+        store = InMemoryTaskStore()
+        write_tasks("x", self._tasks("a", "b", "c"), store=store)
+        writes_before = store.writes
+
+        tasks = self._tasks("a", "b", "c")
+        tasks[1] = TaskToWrite(
+            position=2, subject="Task b", status=TaskStatus.COMPLETED, semantic_id="b"
+        )
+        result = write_tasks("x", tasks, store=store, skip_unchanged=True)
+
+        assert store.writes == writes_before + 1
+        assert result.tasks_unchanged == 2
+        assert store.read_task(2)["status"] == "completed"
+
+
 class TestBuildDependencyGraph:
     """Tests for build_dependency_graph function."""
 
@@ -245,6 +475,48 @@ class TestBuildDependencyGraph:
 
         assert result[1] == ([], [])
 
+    def test_strict_rejects_missing_semantic_ids(self):
+        """Strict mode should report dangling references."""
+        tasks = [TaskToWrite(position=1, subject="Task 1", status=TaskStatus.PENDING)]
+
+        with pytest.raises(DependencyGraphError, match="ghost"):
+            build_dependency_graph(
+                tasks, {"task-1": ["ghost"]}, {"task-1": 1}, strict=True
+            )
+
+    def test_rejects_cycles(self):
+        """Cyclic dependencies should raise instead of deadlocking the task list."""
+        tasks = [
+            TaskToWrite(position=1, subject="Task 1", status=TaskStatus.PENDING),
+            TaskToWrite(position=2, subject="Task 2", status=TaskStatus.PENDING),
+        ]
+
+        with pytest.raises(DependencyGraphError, match="cycle"):
+            build_dependency_graph(
+                tasks,
+                {"task-1": ["task-2"], "task-2": ["task-1"]},
+                {"task-1": 1, "task-2": 2},
+            )
+
+    def test_deduplicates_and_reduces(self):
+        """Duplicate and implied edges should not reach the task files."""
+        tasks = [
+            TaskToWrite(position=i, subject=f"Task {i}", status=TaskStatus.PENDING)
+            for i in (1, 2, 3)
+        ]
+        semantic_deps = {
+            "task-2": ["task-1", "task-1"],
+            "task-3": ["task-2", "task-1"],
+        }
+        semantic_to_position = {"task-1": 1, "task-2": 2, "task-3": 3}
+
+        result = build_dependency_graph(
+            tasks, semantic_deps, semantic_to_position, reduce=True
+        )
+
+        assert result[2] == (["3"], ["1"])
+        assert result[3] == ([], ["2"])
+
 
 class TestGetTasksDir:
     """Tests for get_tasks_dir function."""
@@ -256,3 +528,9 @@ class TestGetTasksDir:
         result = get_tasks_dir("my-session-id")
 
         assert result == Path("/Users/test/.claude/tasks/my-session-id")
+
+    def test_alternative_root(self):
+        """Should place the task list under an alternative root."""
+        result = get_tasks_dir("my-session-id", root=Path("/tmp/tasks"))
+
+        assert result == Path("/tmp/tasks/my-session-id")
@@ -0,0 +1,101 @@
+"""Tests for lane worktree management."""
+
+import subprocess
+
+import pytest
+
+from scripts.lib.worktrees import (
+    lane_dependencies,
+    lane_for_section,
+    merge_lane,
+    provision_lane_worktrees,
+    registered_worktrees,
+)
+
+
+def _commit(cwd, filename, content, message):
+    (cwd / filename).write_text(content)
+    subprocess.run(["git", "add", filename], cwd=cwd, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", message], cwd=cwd, capture_output=True, check=True)
+
+
+LANES = [["section-01-core", "section-02-api"], ["section-03-cli"]]
+
+
+class TestProvisionLaneWorktrees:
+    """Tests for provision_lane_worktrees function."""
+
+    def test_creates_worktree_and_branch_per_lane(self, mock_git_repo, temp_dir):
+        """Each lane should get its own worktree on its own branch."""
+        lanes = provision_lane_worktrees(mock_git_repo, temp_dir / "implementation", LANES)
+
+        assert [lane["branch"] for lane in lanes] == ["deep-implement/lane-01", "deep-implement/lane-02"]
+        registered = registered_worktrees(mock_git_repo)
+        for lane in lanes:
+            assert (temp_dir / "implementation" / "worktrees" / f"lane-{lane['lane']:02d}" / "README.md").exists()
+            assert any(branch == lane["branch"] for branch in registered.values())
+
+    def test_rerun_reuses_worktrees(self, mock_git_repo, temp_dir):
+        """Provisioning twice should not fail or create new worktrees."""
+        provision_lane_worktrees(mock_git_repo, temp_dir / "implementation", LANES)
+        count = len(registered_worktrees(mock_git_repo))
+
+        provision_lane_worktrees(mock_git_repo, temp_dir / "implementation", LANES)
+
+        assert len(registered_worktrees(mock_git_repo)) == count
+
+    def test_worktrees_inside_repo_are_ignored(self, mock_git_repo):
+        """Worktrees under a state dir inside the repo should not dirty git status."""
+        provision_lane_worktrees(mock_git_repo, mock_git_repo / "implementation", LANES)
+
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=mock_git_repo, capture_output=True, text=True
+        )
+        assert "worktrees" not in status.stdout
+
+
+class TestLaneHelpers:
+    """Tests for lane lookup helpers."""
+
+    LANES = [
+        {"lane": 1, "worktree": "/wt/1", "branch": "b1", "sections": ["section-01-core", "section-02-api"]},
+        {"lane": 2, "worktree": "/wt/2", "branch": "b2", "sections": ["section-03-cli"]},
+    ]
+
+    def test_lane_for_section(self):
+        assert lane_for_section(self.LANES, "section-03-cli")["lane"] == 2
+        assert lane_for_section(self.LANES, "section-09-x") is None
+
+    def test_lane_dependencies(self):
+        """A lane needs lanes owning sections its sections depend on."""
+        dependencies = {"section-02-api": ["section-01-core"], "section-03-cli": ["section-02-api"]}
+
+        assert lane_dependencies(self.LANES, dependencies) == {1: [], 2: [1]}
+
+
+class TestMergeLane:
+    """Tests for merge_lane function."""
+
+    def test_merges_lane_commits(self, mock_git_repo, temp_dir):
+        """A lane's commits should land on the main branch."""
+        lanes = provision_lane_worktrees(mock_git_repo, temp_dir / "implementation", LANES[:1])
+        worktree = temp_dir / "implementation" / "worktrees" / "lane-01"
+        _commit(worktree, "core.py", "x = 1\n", "Add core")
+
+        result = merge_lane(mock_git_repo, lanes[0]["branch"])
+
+        assert result["merged"] is True
+        assert (mock_git_repo / "core.py").exists()
+
+    def test_conflict_is_aborted(self, mock_git_repo, temp_dir):
+        """A conflicting merge should be aborted and reported."""
+        lanes = provision_lane_worktrees(mock_git_repo, temp_dir / "implementation", LANES[:1])
+        worktree = temp_dir / "implementation" / "worktrees" / "lane-01"
+        _commit(worktree, "README.md", "lane\n", "Lane edit")
+        _commit(mock_git_repo, "README.md", "main\n", "Main edit")
+
+        result = merge_lane(mock_git_repo, lanes[0]["branch"])
+
+        assert result["merged"] is False
+        assert result["error"]
+        assert (mock_git_repo / "README.md").read_text() == "main\n"
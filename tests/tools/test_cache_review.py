@@ -0,0 +1,63 @@
+"""Tests for cache_review CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "cache_review.py"
+
+
+def _run(state_dir: Path, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), "--section", "section-01-foundation", *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestCacheReviewCLI:
+    """Tests for cache_review.py CLI script."""
+
+    def _setup(self, state_dir, sample_config, temp_dir):
+        sections_dir = temp_dir / "sections"
+        sections_dir.mkdir()
+        (sections_dir / "section-01-foundation.md").write_text("# Foundation")
+        sample_config["sections_dir"] = str(sections_dir)
+        (state_dir / "deep_implement_config.json").write_text(json.dumps(sample_config))
+        code_review = state_dir / "code_review"
+        code_review.mkdir()
+        (code_review / "section-01-diff.md").write_text("diff --git a/x b/x\n+x\n")
+        return code_review
+
+    def test_store_then_lookup(self, mock_implementation_dir, sample_config, temp_dir):
+        code_review = self._setup(mock_implementation_dir, sample_config, temp_dir)
+        (code_review / "section-01-review.md").write_text("# Review")
+
+        stored = _run(mock_implementation_dir, "--store")
+        assert stored.returncode == 0
+        (code_review / "section-01-review.md").unlink()
+
+        result = _run(mock_implementation_dir, "--lookup")
+
+        output = json.loads(result.stdout)
+        assert output["hit"] is True
+        assert output["key"] == json.loads(stored.stdout)["key"]
+        assert (code_review / "section-01-review.md").read_text() == "# Review"
+
+    def test_lookup_miss(self, mock_implementation_dir, sample_config, temp_dir):
+        code_review = self._setup(mock_implementation_dir, sample_config, temp_dir)
+
+        result = _run(mock_implementation_dir, "--lookup")
+
+        assert json.loads(result.stdout)["hit"] is False
+        assert not (code_review / "section-01-review.md").exists()
+
+    def test_store_without_review(self, mock_implementation_dir, sample_config, temp_dir):
+        self._setup(mock_implementation_dir, sample_config, temp_dir)
+
+        result = _run(mock_implementation_dir, "--store")
+
+        assert result.returncode == 1
+        assert "needs a diff" in result.stdout
@@ -0,0 +1,59 @@
+"""Tests for chunk_review_diff CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "chunk_review_diff.py"
+
+DIFF = "".join(
+    f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -0,0 +1,50 @@\n"
+    + "".join(f"+value_{i} = {i}\n" for i in range(50))
+    for path in ["src/api.py", "src/models.py", "tests/test_api.py"]
+)
+
+
+def _run(state_dir: Path, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), "--section", "section-01-foundation", *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestChunkReviewDiffCLI:
+    """Tests for chunk_review_diff.py CLI script."""
+
+    def test_chunk_then_merge(self, mock_implementation_dir):
+        code_review = mock_implementation_dir / "code_review"
+        code_review.mkdir()
+        (code_review / "section-01-diff.md").write_text(DIFF)
+
+        result = _run(mock_implementation_dir, "--max-tokens", "300", "--group-by", "file")
+
+        assert result.returncode == 0
+        manifest = json.loads(result.stdout)
+        assert [c["files"] for c in manifest["chunks"]] == [["src/api.py"], ["src/models.py"], ["tests/test_api.py"]]
+        for chunk in manifest["chunks"]:
+            assert Path(chunk["diff"]).read_text().startswith(f"diff --git a/{chunk['files'][0]}")
+            Path(chunk["review"]).write_text(json.dumps({"section": "section-01-foundation", "review": "Looks fine"}))
+
+        merged = _run(mock_implementation_dir, "--merge")
+
+        assert merged.returncode == 0
+        review = (code_review / "section-01-review.md").read_text()
+        assert review.count("Looks fine") == 3
+
+    def test_missing_diff(self, mock_implementation_dir):
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 1
+        assert "No diff found" in result.stdout
+
+    def test_merge_without_manifest(self, mock_implementation_dir):
+        result = _run(mock_implementation_dir, "--merge")
+
+        assert result.returncode == 1
+        assert "No readable chunk manifest" in result.stdout
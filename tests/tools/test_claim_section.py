@@ -0,0 +1,117 @@
+"""Tests for claim_section CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "claim_section.py"
+SETUP_SCRIPT = PLUGIN_ROOT / "scripts" / "checks" / "setup_implementation_session.py"
+
+
+def _claim(state_dir: Path, owner: str, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), "--owner", owner, *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestClaimSectionCLI:
+    """Tests for claim_section.py CLI script."""
+
+    def _setup(self, temp_dir: Path, mock_git_repo: Path) -> Path:
+        """Plan with two independent sections and one depending on both."""
+        sections_dir = temp_dir / "sections"
+        sections_dir.mkdir()
+        (sections_dir / "index.md").write_text(
+            "<!-- PROJECT_CONFIG\nruntime: python-uv\ntest_command: uv run pytest\nEND_PROJECT_CONFIG -->\n\n"
+            "<!-- SECTION_MANIFEST\nsection-01-core\nsection-02-cli\n"
+            "section-03-docs: depends=section-01,section-02\nEND_MANIFEST -->\n"
+        )
+        for section in ["section-01-core", "section-02-cli", "section-03-docs"]:
+            (sections_dir / f"{section}.md").write_text(f"# {section}\n")
+        (sections_dir / "section-02-cli.md").write_text("# CLI\n\n" + "x" * 4000)
+
+        subprocess.run(
+            [
+                sys.executable, str(SETUP_SCRIPT),
+                "--sections-dir", str(sections_dir),
+                "--target-dir", str(mock_git_repo),
+                "--plugin-root", str(PLUGIN_ROOT),
+                "--session-id", "shared-list",
+                "--tasks-root", str(temp_dir / "tasks"),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return temp_dir / "implementation"
+
+    def _owners(self, temp_dir: Path) -> dict[str, str]:
+        owners = {}
+        for path in (temp_dir / "tasks" / "shared-list").glob("*.json"):
+            task = json.loads(path.read_text())
+            if task.get("owner"):
+                owners[task["subject"]] = task["owner"]
+        return owners
+
+    def test_agents_claim_different_sections(self, temp_dir, mock_git_repo):
+        """Two agents should get different ready sections, most work first."""
+        state_dir = self._setup(temp_dir, mock_git_repo)
+
+        first = _claim(state_dir, "agent-a")
+        second = _claim(state_dir, "agent-b")
+        third = _claim(state_dir, "agent-c")
+
+        assert "Claimed section-02-cli" in first.stdout
+        assert "Claimed section-01-core" in second.stdout
+        assert "No section to claim" in third.stdout
+        owners = self._owners(temp_dir)
+        assert owners["Implement section-02-cli"] == "agent-a"
+        assert owners["Commit section-01-core"] == "agent-b"
+
+    def test_claiming_unready_section_fails(self, temp_dir, mock_git_repo):
+        state_dir = self._setup(temp_dir, mock_git_repo)
+
+        result = _claim(state_dir, "agent-a", "--section", "section-03-docs")
+
+        assert result.returncode == 1
+        assert "not ready" in result.stdout
+
+    def test_heartbeat_and_release(self, temp_dir, mock_git_repo):
+        state_dir = self._setup(temp_dir, mock_git_repo)
+        _claim(state_dir, "agent-a", "--section", "section-01-core")
+
+        assert _claim(state_dir, "agent-b", "--section", "section-01-core", "--heartbeat").returncode == 1
+        assert _claim(state_dir, "agent-a", "--section", "section-01-core", "--heartbeat").returncode == 0
+
+        released = _claim(state_dir, "agent-a", "--section", "section-01-core", "--release")
+
+        assert released.returncode == 0
+        assert "Implement section-01-core" not in self._owners(temp_dir)
+
+    def test_claim_keeps_other_sections_statuses(self, temp_dir, mock_git_repo):
+        """A claim should only touch the claimed section's owners, not other sessions' progress."""
+        state_dir = self._setup(temp_dir, mock_git_repo)
+        tasks_dir = temp_dir / "tasks" / "shared-list"
+        _claim(state_dir, "agent-a", "--section", "section-01-core")
+        progress = {"Implement section-01-core": "completed", "Commit section-01-core": "in_progress"}
+        for path in tasks_dir.glob("*.json"):
+            task = json.loads(path.read_text())
+            if task["subject"] in progress:
+                task["status"] = progress[task["subject"]]
+                path.write_text(json.dumps(task, indent=2))
+
+        result = _claim(state_dir, "agent-b", "--section", "section-02-cli")
+
+        assert result.returncode == 0
+        statuses = {}
+        for path in tasks_dir.glob("*.json"):
+            task = json.loads(path.read_text())
+            statuses[task["subject"]] = task["status"]
+        assert {subject: statuses[subject] for subject in progress} == progress
+        owners = self._owners(temp_dir)
+        assert owners["Commit section-01-core"] == "agent-a"
+        assert owners["Implement section-02-cli"] == "agent-b"
@@ -0,0 +1,158 @@
+"""Tests for generate_review_diff CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from scripts.lib.worktrees import provision_lane_worktrees
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "generate_review_diff.py"
+SETUP_SCRIPT = PLUGIN_ROOT / "scripts" / "checks" / "setup_implementation_session.py"
+
+
+def _run(state_dir: Path, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), "--section", "section-01-foundation", *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestGenerateReviewDiffCLI:
+    """Tests for generate_review_diff.py CLI script."""
+
+    def _setup(self, state_dir, repo, sample_config, temp_dir, project_config=""):
+        sections_dir = temp_dir / "sections"
+        sections_dir.mkdir()
+        (sections_dir / "index.md").write_text(
+            f"<!-- PROJECT_CONFIG\nruntime: python-uv\ntest_command: uv run pytest\n{project_config}END_PROJECT_CONFIG -->\n"
+        )
+        sample_config["git_root"] = str(repo)
+        sample_config["sections_dir"] = str(sections_dir)
+        (state_dir / "deep_implement_config.json").write_text(json.dumps(sample_config))
+        (repo / "src").mkdir()
+        (repo / "src" / "app.py").write_text("print('hi')\n")
+        (repo / "package-lock.json").write_text("{}\n")
+        (repo / "api.generated.md").write_text("generated\n")
+        subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+
+    def test_writes_diff_and_records_metrics(
+        self, mock_implementation_dir, mock_git_repo, sample_config, temp_dir
+    ):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, temp_dir, "review_excludes: *.md\n")
+
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 0, result.stdout
+        output = json.loads(result.stdout)
+        assert output["has_reviewable_changes"] is True
+        assert output["files_reviewed"] == 1
+        diff = (mock_implementation_dir / "code_review" / "section-01-diff.md").read_text()
+        assert diff.startswith("# Review diff: section-01-foundation\n")
+        assert "diff --git a/src/app.py b/src/app.py" in diff
+        assert "diff --git a/package-lock.json" not in diff
+
+        config = json.loads((mock_implementation_dir / "deep_implement_config.json").read_text())
+        recorded = config["sections_state"]["section-01-foundation"]["review_diff"]
+        assert recorded["omitted"] == {
+            "api.generated.md": "excluded (*.generated.*)",
+            "package-lock.json": "excluded (package-lock.json)",
+        }
+        assert recorded["bytes"] == len(diff.encode())
+
+    def test_no_default_excludes(self, mock_implementation_dir, mock_git_repo, sample_config, temp_dir):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, temp_dir)
+
+        result = _run(mock_implementation_dir, "--no-default-excludes", "--exclude", "src/*")
+
+        output = json.loads(result.stdout)
+        assert output["omitted"] == {"src/app.py": "excluded (src/*)"}
+        assert output["files_reviewed"] == 2
+
+    def test_missing_config(self, mock_implementation_dir):
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 1
+        assert "No config found" in result.stdout
+
+    def test_delta_after_fixes(self, mock_implementation_dir, mock_git_repo, sample_config, temp_dir):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, temp_dir)
+        first = json.loads(_run(mock_implementation_dir).stdout)
+        (mock_git_repo / "src" / "app.py").write_text("print('fixed')\n")
+        subprocess.run(["git", "add", "-u"], cwd=mock_git_repo, check=True)
+
+        result = _run(mock_implementation_dir, "--delta")
+
+        assert result.returncode == 0, result.stdout
+        output = json.loads(result.stdout)
+        assert output["files"] == 1
+        assert output["reviewed_tree"] != first["reviewed_tree"]
+        delta = (mock_implementation_dir / "code_review" / "section-01-delta.md").read_text()
+        assert "-print('hi')\n+print('fixed')" in delta
+        assert "package-lock.json" not in delta
+        state = json.loads((mock_implementation_dir / "deep_implement_config.json").read_text())
+        section = state["sections_state"]["section-01-foundation"]
+        assert section["reviewed_tree"] == output["reviewed_tree"]
+        assert section["review_delta"]["files_reviewed"] == 1
+        assert section["review_diff"]["files"] == 3
+
+    def test_delta_after_setup_rerun(self, mock_implementation_dir, mock_git_repo, temp_dir):
+        """Re-running setup before the first commit should keep the recorded reviewed tree."""
+        sections_dir = temp_dir / "sections"
+        sections_dir.mkdir()
+        (sections_dir / "index.md").write_text(
+            "<!-- PROJECT_CONFIG\nruntime: python-uv\ntest_command: uv run pytest\nEND_PROJECT_CONFIG -->\n\n"
+            "<!-- SECTION_MANIFEST\nsection-01-foundation\nEND_MANIFEST -->\n"
+        )
+        (sections_dir / "section-01-foundation.md").write_text("# Foundation\n")
+        setup = [
+            sys.executable, str(SETUP_SCRIPT),
+            "--sections-dir", str(sections_dir),
+            "--target-dir", str(mock_git_repo),
+            "--plugin-root", str(PLUGIN_ROOT),
+        ]
+        subprocess.run(setup, capture_output=True, text=True, check=True)
+        (mock_git_repo / "app.py").write_text("print('hi')\n")
+        subprocess.run(["git", "add", "app.py"], cwd=mock_git_repo, check=True)
+        assert _run(mock_implementation_dir).returncode == 0
+
+        rerun = subprocess.run(setup, capture_output=True, text=True, check=True)
+        (mock_git_repo / "app.py").write_text("print('fixed')\n")
+        subprocess.run(["git", "add", "app.py"], cwd=mock_git_repo, check=True)
+        result = _run(mock_implementation_dir, "--delta")
+
+        assert json.loads(rerun.stdout)["mode"] == "new"
+        assert result.returncode == 0, result.stdout
+        assert "+print('fixed')" in (mock_implementation_dir / "code_review" / "section-01-delta.md").read_text()
+
+    def test_delta_needs_reviewed_tree(self, mock_implementation_dir, mock_git_repo, sample_config, temp_dir):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, temp_dir)
+
+        result = _run(mock_implementation_dir, "--delta")
+
+        assert result.returncode == 1
+        assert "No reviewed tree recorded" in result.stdout
+
+    def test_diffs_the_lane_worktree(self, mock_implementation_dir, mock_git_repo, sample_config, temp_dir):
+        """In lane mode the section's work is staged in its lane worktree, not the main checkout."""
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, temp_dir)
+        subprocess.run(["git", "commit", "-qm", "base"], cwd=mock_git_repo, check=True)
+        lanes = provision_lane_worktrees(
+            mock_git_repo, mock_implementation_dir, [["section-01-foundation"]]
+        )
+        config = json.loads((mock_implementation_dir / "deep_implement_config.json").read_text())
+        config["lanes"] = lanes
+        (mock_implementation_dir / "deep_implement_config.json").write_text(json.dumps(config))
+        worktree = Path(lanes[0]["worktree"])
+        (worktree / "a.py").write_text("x = 1\n")
+        subprocess.run(["git", "add", "a.py"], cwd=worktree, check=True)
+
+        result = _run(mock_implementation_dir)
+
+        output = json.loads(result.stdout)
+        assert output["has_reviewable_changes"] is True
+        assert output["files"] == 1
+        diff = (mock_implementation_dir / "code_review" / "section-01-diff.md").read_text()
+        assert "diff --git a/a.py b/a.py" in diff
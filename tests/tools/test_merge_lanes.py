@@ -0,0 +1,91 @@
+"""Tests for merge_lanes CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from scripts.lib.config import save_session_config
+from scripts.lib.worktrees import provision_lane_worktrees
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "merge_lanes.py"
+
+
+def _run(state_dir: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir)],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestMergeLanesCLI:
+    """Tests for merge_lanes.py CLI script."""
+
+    def _setup(self, mock_git_repo, temp_dir, sample_config):
+        state_dir = temp_dir / "implementation"
+        lanes = provision_lane_worktrees(
+            mock_git_repo, state_dir, [["section-01-foundation"], ["section-02-models"]]
+        )
+        for lane, filename in zip(lanes, ["a.py", "b.py"]):
+            worktree = Path(lane["worktree"])
+            (worktree / filename).write_text("pass\n")
+            subprocess.run(["git", "add", filename], cwd=worktree, capture_output=True, check=True)
+            subprocess.run(["git", "commit", "-m", filename], cwd=worktree, capture_output=True, check=True)
+        sample_config["git_root"] = str(mock_git_repo)
+        sample_config["lanes"] = lanes
+        save_session_config(state_dir, sample_config)
+        return state_dir
+
+    def test_merges_completed_lanes_in_order(self, mock_git_repo, temp_dir, sample_config):
+        """Completed lanes should be merged and their merge commits recorded."""
+        sample_config["sections_state"] = {
+            "section-01-foundation": {"status": "complete"},
+            "section-02-models": {"status": "complete"},
+        }
+        state_dir = self._setup(mock_git_repo, temp_dir, sample_config)
+
+        result = _run(state_dir)
+
+        assert result.returncode == 0
+        assert "All lanes merged" in result.stdout
+        assert (mock_git_repo / "a.py").exists() and (mock_git_repo / "b.py").exists()
+        config = json.loads((state_dir / "deep_implement_config.json").read_text())
+        assert all(lane.get("merged_commit") for lane in config["lanes"])
+
+    def test_stops_at_unfinished_lane(self, mock_git_repo, temp_dir, sample_config):
+        """Merging should stop at the first lane with pending sections."""
+        sample_config["sections_state"] = {"section-02-models": {"status": "complete"}}
+        state_dir = self._setup(mock_git_repo, temp_dir, sample_config)
+
+        result = _run(state_dir)
+
+        assert result.returncode == 0
+        assert "unfinished sections section-01-foundation" in result.stdout
+        assert not (mock_git_repo / "b.py").exists()
+
+    def test_config_removed_during_merge(self, mock_git_repo, temp_dir, sample_config):
+        """A config that disappears mid-merge should be reported, not crash."""
+        sample_config["sections_state"] = {
+            "section-01-foundation": {"status": "complete"},
+            "section-02-models": {"status": "complete"},
+        }
+        state_dir = self._setup(mock_git_repo, temp_dir, sample_config)
+        hook = mock_git_repo / ".git" / "hooks" / "post-merge"
+        hook.write_text(f"#!/bin/sh\nrm -f '{state_dir / 'deep_implement_config.json'}'\n")
+        hook.chmod(0o755)
+
+        result = _run(state_dir)
+
+        assert result.returncode == 1
+        assert "No config found" in result.stdout
+        assert "Traceback" not in result.stderr
+
+    def test_requires_lanes(self, mock_implementation_dir, sample_config):
+        save_session_config(mock_implementation_dir, sample_config)
+
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 1
+        assert "No lanes recorded" in result.stdout
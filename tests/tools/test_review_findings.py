@@ -0,0 +1,83 @@
+"""Tests for review_findings CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "review_findings.py"
+
+REVIEWER_OUTPUT = {
+    "section": "section-01-foundation",
+    "review": "The config loader ignores missing keys.",
+    "findings": [
+        {"severity": "medium", "file": "src/config.py", "line": 12, "category": "correctness", "summary": "Missing keys ignored"},
+        {"severity": "high", "file": "src/config.py", "line": 30, "category": "security", "summary": "Secrets logged"},
+    ],
+}
+
+
+def _run(state_dir: Path, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestReviewFindingsCLI:
+    """Tests for review_findings.py CLI script."""
+
+    def _record(self, state_dir: Path, temp_dir: Path) -> subprocess.CompletedProcess:
+        output = temp_dir / "reviewer.json"
+        output.write_text(json.dumps(REVIEWER_OUTPUT))
+        return _run(state_dir, "--section", "section-01-foundation", "--record", str(output))
+
+    def test_record_writes_review_and_findings(self, mock_implementation_dir, temp_dir):
+        result = self._record(mock_implementation_dir, temp_dir)
+
+        assert result.returncode == 0, result.stdout
+        assert json.loads(result.stdout)["findings"] == 2
+        review = (mock_implementation_dir / "code_review" / "section-01-review.md").read_text()
+        assert review == "# Code Review: Section 01 - Foundation\n\nThe config loader ignores missing keys.\n"
+
+    def test_triage_flow(self, mock_implementation_dir, temp_dir):
+        self._record(mock_implementation_dir, temp_dir)
+
+        high = json.loads(_run(
+            mock_implementation_dir, "--section", "section-01-foundation", "--list", "--min-severity", "high"
+        ).stdout)
+        assert [f["summary"] for f in high] == ["Secrets logged"]
+
+        resolved = _run(
+            mock_implementation_dir, "--section", "section-01-foundation",
+            "--resolve", high[0]["id"], "--status", "fixed", "--note", "Redacted",
+        )
+        assert resolved.returncode == 0
+
+        remaining = json.loads(_run(
+            mock_implementation_dir, "--section", "section-01-foundation", "--list", "--open"
+        ).stdout)
+        assert [f["id"] for f in remaining] == ["F1"]
+
+        index = json.loads(_run(mock_implementation_dir, "--index").stdout)
+        assert index["section-01-foundation"]["open"] == 1
+
+    def test_invalid_reviewer_output(self, mock_implementation_dir, temp_dir):
+        output = temp_dir / "reviewer.json"
+        output.write_text(json.dumps({"review": "x", "findings": [{"severity": "urgent", "summary": "x"}]}))
+
+        result = _run(mock_implementation_dir, "--section", "section-01-foundation", "--record", str(output))
+
+        assert result.returncode == 1
+        assert "Invalid reviewer output" in result.stdout
+        assert not (mock_implementation_dir / "code_review" / "section-01-review.md").exists()
+
+    def test_resolve_needs_status(self, mock_implementation_dir, temp_dir):
+        self._record(mock_implementation_dir, temp_dir)
+
+        result = _run(mock_implementation_dir, "--section", "section-01-foundation", "--resolve", "F1")
+
+        assert result.returncode == 1
+        assert "--status" in result.stdout
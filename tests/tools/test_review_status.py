@@ -0,0 +1,56 @@
+"""Tests for review_status CLI tool."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "review_status.py"
+
+
+def _run(state_dir: Path, *extra: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), *extra],
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestReviewStatusCLI:
+    """Tests for review_status.py CLI script."""
+
+    def _setup(self, state_dir: Path, git_root: Path, sample_config: dict) -> None:
+        sample_config["git_root"] = str(git_root)
+        (state_dir / "deep_implement_config.json").write_text(json.dumps(sample_config))
+        code_review = state_dir / "code_review"
+        code_review.mkdir()
+        (code_review / "section-01-diff.md").write_text("x" * 2048)
+        (code_review / "section-01-review.md").write_text("findings")
+
+    def test_json_status(self, mock_implementation_dir, mock_git_repo, sample_config):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config)
+
+        result = _run(mock_implementation_dir, "--json")
+
+        assert result.returncode == 0
+        status = json.loads(result.stdout)
+        assert status["section-01-foundation"]["status"] == "in_review"
+        assert status["section-01-foundation"]["resume_step"] == "interview"
+        assert status["section-02-models"]["status"] == "pending"
+
+    def test_table_status(self, mock_implementation_dir, mock_git_repo, sample_config):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config)
+
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 0
+        first, second = result.stdout.splitlines()
+        assert "in_review" in first and "diff 2.0 KiB" in first and "(resume: interview)" in first
+        assert second.split() == ["section-02-models", "pending"]
+
+    def test_missing_config(self, mock_implementation_dir):
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 1
+        assert "No config found" in result.stdout
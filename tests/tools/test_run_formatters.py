@@ -0,0 +1,108 @@
+"""Tests for run_formatters CLI tool."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from scripts.lib.worktrees import provision_lane_worktrees
+
+PLUGIN_ROOT = Path(__file__).parent.parent.parent
+SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "run_formatters.py"
+
+
+def _run(state_dir: Path, *extra: str, path: str | None = None) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    if path is not None:
+        env["PATH"] = f"{path}:{env['PATH']}"
+    return subprocess.run(
+        [sys.executable, str(SCRIPT_PATH), "--state-dir", str(state_dir), "--section", "section-01-foundation", *extra],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+class TestRunFormattersCLI:
+    """Tests for run_formatters.py CLI script."""
+
+    def _setup(self, state_dir, repo, sample_config, formatters, hook_type="pre-commit-framework"):
+        sample_config["git_root"] = str(repo)
+        sample_config["pre_commit"] = {
+            "present": True,
+            "type": hook_type,
+            "may_modify_files": bool(formatters),
+            "detected_formatters": formatters,
+        }
+        (state_dir / "deep_implement_config.json").write_text(json.dumps(sample_config))
+        for name in ("a.py", "b.py"):
+            (repo / name).write_text(f"{name} = 1\n")
+        subprocess.run(["git", "add", "a.py", "b.py"], cwd=repo, check=True)
+
+    def test_formats_staged_section_files(
+        self, mock_implementation_dir, mock_git_repo, sample_config, fake_pre_commit_bin
+    ):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, ["upper"])
+
+        result = _run(mock_implementation_dir, "a.py", path=str(fake_pre_commit_bin))
+
+        assert result.returncode == 0, result.stdout
+        assert json.loads(result.stdout)["formatted_files"] == ["a.py"]
+        assert (mock_git_repo / "b.py").read_text() == "b.py = 1\n"
+        config = json.loads((mock_implementation_dir / "deep_implement_config.json").read_text())
+        assert config["sections_state"]["section-01-foundation"]["preformat"] == {
+            "hooks": ["upper"], "formatted_files": ["a.py"],
+        }
+
+    def test_skips_without_formatters(self, mock_implementation_dir, mock_git_repo, sample_config):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, [])
+
+        result = _run(mock_implementation_dir)
+
+        assert result.returncode == 0
+        assert json.loads(result.stdout)["skipped"] == "No formatter hooks detected"
+
+    def test_skips_native_hook(self, mock_implementation_dir, mock_git_repo, sample_config):
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, ["black"], hook_type="native-hook")
+
+        result = _run(mock_implementation_dir)
+
+        assert "native hook" in json.loads(result.stdout)["skipped"]
+
+    def test_reports_failed_restage(
+        self, mock_implementation_dir, mock_git_repo, sample_config, fake_pre_commit_bin
+    ):
+        """A git add that fails after the hooks ran should be an error, not a traceback."""
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, ["lock-index"])
+
+        result = _run(mock_implementation_dir, path=str(fake_pre_commit_bin))
+
+        assert result.returncode == 1
+        assert result.stdout.startswith("Error: Could not re-stage formatted files:")
+        assert "index.lock" in result.stdout
+        assert "Traceback" not in result.stderr
+
+    def test_formats_the_lane_worktree(
+        self, mock_implementation_dir, mock_git_repo, sample_config, fake_pre_commit_bin
+    ):
+        """In lane mode the section's files are staged in its lane worktree, not the main checkout."""
+        self._setup(mock_implementation_dir, mock_git_repo, sample_config, ["upper"])
+        subprocess.run(["git", "commit", "-qm", "base"], cwd=mock_git_repo, check=True)
+        config = json.loads((mock_implementation_dir / "deep_implement_config.json").read_text())
+        config["lanes"] = provision_lane_worktrees(
+            mock_git_repo, mock_implementation_dir, [["section-01-foundation"]]
+        )
+        (mock_implementation_dir / "deep_implement_config.json").write_text(json.dumps(config))
+        worktree = Path(config["lanes"][0]["worktree"])
+        (worktree / "c.py").write_text("c = 1\n")
+        subprocess.run(["git", "add", "c.py"], cwd=worktree, check=True)
+
+        result = _run(mock_implementation_dir, path=str(fake_pre_commit_bin))
+
+        assert result.returncode == 0, result.stdout
+        assert json.loads(result.stdout)["formatted_files"] == ["c.py"]
+        staged = subprocess.run(
+            ["git", "show", ":c.py"], cwd=worktree, capture_output=True, text=True, check=True
+        ).stdout
+        assert staged == "C = 1\n"
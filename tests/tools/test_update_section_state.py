@@ -7,9 +7,12 @@ from pathlib import Path
 
 import pytest
 
+from scripts.lib.leases import acquire_lease, leases_dir, section_claims
+
 # Get the plugin root for running the script
 PLUGIN_ROOT = Path(__file__).parent.parent.parent
 SCRIPT_PATH = PLUGIN_ROOT / "scripts" / "tools" / "update_section_state.py"
+SETUP_SCRIPT = PLUGIN_ROOT / "scripts" / "checks" / "setup_implementation_session.py"
 
 
 class TestUpdateSectionStateCLI:
@@ -186,3 +189,173 @@ class TestUpdateSectionStateCLI:
 
         assert result.returncode != 0
         assert "required" in result.stderr.lower()
+
+
+class TestTaskWindowAdvance:
+    """Tests for advancing the task window when a completion is recorded."""
+
+    def _write_plan(self, sections_dir: Path, section_count: int) -> list[str]:
+        sections = [f"section-{i:02d}-part" for i in range(1, section_count + 1)]
+        sections_dir.mkdir()
+        (sections_dir / "index.md").write_text(
+            "<!-- PROJECT_CONFIG\nruntime: python-uv\ntest_command: uv run pytest\n"
+            "task_window: 0\nEND_PROJECT_CONFIG -->\n\n"
+            "<!-- SECTION_MANIFEST\n" + "\n".join(sections) + "\nEND_MANIFEST -->\n"
+        )
+        for section in sections:
+            (sections_dir / f"{section}.md").write_text(f"# {section}\n\nDo work.")
+        return sections
+
+    def _subjects(self, tasks_dir: Path) -> list[str]:
+        files = sorted(tasks_dir.glob("*.json"), key=lambda p: int(p.stem))
+        return [json.loads(f.read_text())["subject"] for f in files]
+
+    def test_recording_completion_advances_window(self, temp_dir, mock_git_repo):
+        """The next section should be materialized after recording completion."""
+        sections_dir = temp_dir / "sections"
+        self._write_plan(sections_dir, 3)
+        tasks_root = temp_dir / "tasks"
+
+        setup = subprocess.run(
+            [
+                sys.executable, str(SETUP_SCRIPT),
+                "--sections-dir", str(sections_dir),
+                "--target-dir", str(mock_git_repo),
+                "--plugin-root", str(PLUGIN_ROOT),
+                "--session-id", "window-session",
+                "--tasks-root", str(tasks_root),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        output = json.loads(setup.stdout)
+        assert output["deferred_sections"] == ["section-02-part", "section-03-part"]
+
+        tasks_dir = tasks_root / "window-session"
+        assert "Implement section-02-part" not in self._subjects(tasks_dir)
+
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=mock_git_repo, capture_output=True, text=True
+        ).stdout.strip()
+        result = subprocess.run(
+            [
+                sys.executable, str(SCRIPT_PATH),
+                "--state-dir", str(temp_dir / "implementation"),
+                "--section", "section-01-part",
+                "--commit-hash", head,
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert "Advanced task window" in result.stdout
+        subjects = self._subjects(tasks_dir)
+        assert "Implement section-02-part" in subjects
+        assert "Implement section-03-part" not in subjects
+        assert any("remaining 1 sections" in s for s in subjects)
+
+    def test_no_refresh_without_window(self, mock_implementation_dir, sample_config):
+        """Plans without task_window should not rewrite the task list."""
+        sample_config["task_list_id"] = "some-session"
+        config_path = mock_implementation_dir / "deep_implement_config.json"
+        config_path.write_text(json.dumps(sample_config))
+
+        result = subprocess.run(
+            [
+                sys.executable, str(SCRIPT_PATH),
+                "--state-dir", str(mock_implementation_dir),
+                "--section", "section-01-foundation",
+                "--commit-hash", "abc1234",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert "task window" not in result.stdout
+
+
+    def test_refresh_failure_is_a_warning(self, temp_dir, mock_implementation_dir, sample_config):
+        """A task list that cannot be refreshed should not fail the recorded completion."""
+        sections_dir = temp_dir / "sections"
+        self._write_plan(sections_dir, 2)
+        sample_config.update(sections_dir=str(sections_dir), task_list_id="window-session")
+        del sample_config["plugin_root"]
+        config_path = mock_implementation_dir / "deep_implement_config.json"
+        config_path.write_text(json.dumps(sample_config))
+
+        result = subprocess.run(
+            [
+                sys.executable, str(SCRIPT_PATH),
+                "--state-dir", str(mock_implementation_dir),
+                "--section", "section-01-part",
+                "--commit-hash", "abc1234",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert "Warning: could not advance task window" in result.stdout
+        assert "Traceback" not in result.stderr
+        state = json.loads(config_path.read_text())["sections_state"]["section-01-part"]
+        assert state["commit_hash"] == "abc1234"
+
+
+class TestLaneSectionState:
+    """Tests for lane-aware section state."""
+
+    def test_records_lane_worktree_and_keeps_fields(self, mock_implementation_dir, sample_config):
+        """Lane sections should record their worktree; existing fields survive."""
+        sample_config["lanes"] = [{
+            "lane": 2,
+            "worktree": "/state/worktrees/lane-02",
+            "branch": "deep-implement/lane-02",
+            "sections": ["section-02-models"],
+        }]
+        sample_config["sections_state"] = {"section-02-models": {"status": "in_progress", "notes": "keep"}}
+        config_path = mock_implementation_dir / "deep_implement_config.json"
+        config_path.write_text(json.dumps(sample_config))
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT_PATH),
+                "--state-dir", str(mock_implementation_dir),
+                "--section", "section-02-models",
+                "--commit-hash", "fff0001",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        state = json.loads(config_path.read_text())["sections_state"]["section-02-models"]
+        assert state["worktree"] == "/state/worktrees/lane-02"
+        assert state["branch"] == "deep-implement/lane-02"
+        assert state["commit_hash"] == "fff0001"
+        assert state["notes"] == "keep"
+
+
+class TestSectionClaimRelease:
+    """Tests for releasing a section's claim on completion."""
+
+    def test_completion_releases_claim(self, mock_implementation_dir, sample_config):
+        (mock_implementation_dir / "deep_implement_config.json").write_text(json.dumps(sample_config))
+        acquire_lease(leases_dir(mock_implementation_dir), "section-01-foundation", "agent-a")
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT_PATH),
+                "--state-dir", str(mock_implementation_dir),
+                "--section", "section-01-foundation",
+                "--commit-hash", "abc1234",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0
+        assert section_claims(mock_implementation_dir) == {}